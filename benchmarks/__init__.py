@@ -0,0 +1,5 @@
+"""
+Personal CPA 성능 측정 스크립트 모음.
+
+각 모듈은 저장소 루트에서 `PYTHONPATH=./src python -m benchmarks.<module>` 으로 실행합니다.
+"""
@@ -0,0 +1,112 @@
+"""
+계정과목 잔액 갱신(rollup) 벤치마크.
+
+3단계 계정과목 1,110개(최상위 10개, 하위 10개씩)를 가진 유저가 말단 계정과목 사이의 두 줄짜리 분개
+200,000개를 요청 하나에 1,000개씩 기표하는 처리량을 잔액 갱신을 끈 경우와 켠 경우로 비교합니다.
+잔액 갱신을 켠 데이터베이스에서 최상위 계정과목 잔액 조회(`get_balance`)와 같은 값을 분개 줄에서 직접
+합하는 하위 트리 합계 쿼리, 그리고 전체 잔액 정합성 검사(`check_balances`) 시간을 측정합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_balance_rollup
+"""
+
+import random
+
+from sqlalchemy import Select, func, or_, select
+
+from benchmarks.bench_journal_posting import build_batch
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database, synthetic_chart_of_accounts
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.model.journal import JournalLineEntity
+from personal_cpa.adapter.outbound.database.repository.balance import AccountBalanceRepository
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository
+from personal_cpa.application.service.balance import AccountBalanceService
+from personal_cpa.application.service.journal import JournalService
+from personal_cpa.domain.balance import ALL_PERIODS
+
+ACCOUNTS = 1_110
+ENTRIES = 200_000
+BATCH = 1_000
+ROOT_CODES = [str(index) for index in range(1, 11)]
+REPEAT = 10
+
+
+def post_all(rollup_balances: bool) -> tuple[list[Measurement], tuple[int, int]]:
+    """
+    새 데이터베이스에 분개를 모두 기표하고, 잔액 갱신을 켠 경우에는 잔액 조회와 정합성 검사도 측정합니다.
+
+    Args:
+        rollup_balances: 기표 시 계정과목 잔액 갱신 여부
+
+    Returns:
+        (측정 결과 목록, 첫 최상위 계정과목의 (잔액 조회 결과, 하위 트리 합계 결과))
+    """
+    rng = random.Random(0)
+    label = "on" if rollup_balances else "off"
+    with sqlite_database() as (engine, session_factory):
+        accounts = ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+            synthetic_chart_of_accounts(ACCOUNTS)
+        )
+        leaf_ids = [account.id for account in accounts if account.depth == 2]
+        service = JournalService(JournalRepository(session_factory), rollup_balances=rollup_balances)
+
+        batches = [build_batch(rng, leaf_ids, BATCH) for _ in range(ENTRIES // BATCH)]
+        with measure(f"post_journal_entries (rollup {label})", ENTRIES * 2, engine) as posting:
+            for batch in batches:
+                service.post_journal_entries(1, batch)
+        print(f"rollup {label}: posted lines/s: {posting.size / posting.seconds:,.0f}")  # noqa: T201
+
+        if not rollup_balances:
+            return [posting], (0, 0)
+
+        balance_service = AccountBalanceService(AccountBalanceRepository(session_factory))
+        with measure("get_balance (root, all periods)", REPEAT * len(ROOT_CODES), engine) as lookup:
+            for _ in range(REPEAT):
+                balances = [balance_service.get_balance(1, code, ALL_PERIODS) for code in ROOT_CODES]
+
+        with (
+            measure("subtree SUM over journal_line (root)", len(ROOT_CODES), engine) as subtree,
+            session_factory() as session,
+        ):
+            sums = [session.execute(_select_subtree_sum(code)).one() for code in ROOT_CODES]
+
+        with measure("check_balances", 1, engine) as checking:
+            result = balance_service.check_balances(1, repair=False)
+        print(f"checked balances: {result.checked:,}, mismatches: {len(result.mismatches)}")  # noqa: T201
+
+    return [posting, lookup, subtree, checking], (balances[0].debit, sums[0][0])
+
+
+def _select_subtree_sum(code: str) -> Select[tuple[int, int]]:
+    """
+    Args:
+        code: 기준 계정과목 코드
+
+    Returns:
+        기준 계정과목과 모든 하위 계정과목의 분개 줄 차변/대변 합계 쿼리 (잔액 테이블 없이 계산하는 비교 기준)
+    """
+    return (
+        select(func.sum(JournalLineEntity.debit), func.sum(JournalLineEntity.credit))
+        .join(ChartOfAccountEntity, ChartOfAccountEntity.id == JournalLineEntity.chart_of_account_id)
+        .where(ChartOfAccountEntity.user_id == 1)
+        .where(
+            or_(ChartOfAccountEntity.code == code, ChartOfAccountEntity.code.startswith(f"{code}_", autoescape=True))
+        )
+    )
+
+
+def run() -> list[Measurement]:
+    """
+    잔액 갱신을 끈 경우와 켠 경우의 기표 처리량, 잔액 조회, 정합성 검사를 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    without_rollup, _ = post_all(rollup_balances=False)
+    with_rollup, (balance_debit, subtree_debit) = post_all(rollup_balances=True)
+    assert balance_debit == subtree_debit, (balance_debit, subtree_debit)
+    return without_rollup + with_rollup
+
+
+if __name__ == "__main__":
+    print_measurements(run())
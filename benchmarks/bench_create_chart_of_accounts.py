@@ -0,0 +1,123 @@
+"""
+계정과목 일괄 생성 벤치마크.
+
+`ChartOfAccountService.create_chart_of_accounts`의 일괄 검증 경로와,
+명령마다 코드/상위 코드를 개별 조회하던 기존 방식(legacy)을 비교합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_create_chart_of_accounts
+"""
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.port.input.command.chart_of_account import CreateChartOfAccountCommand
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SIZES = (10, 1_000, 10_000)
+ROOT_COUNT = 5
+
+
+def build_commands(size: int) -> list[CreateChartOfAccountCommand]:
+    """
+    최상위 계정과목 5개와 그 하위 계정과목으로 구성된 생성 명령을 만듭니다.
+
+    Args:
+        size: 생성할 하위 계정과목 수
+
+    Returns:
+        생성 명령 목록
+    """
+    roots = [
+        CreateChartOfAccountCommand(
+            code=str(index), name=f"root {index}", category=AccountType.ASSET, description=None, parent_code=None
+        )
+        for index in range(1, ROOT_COUNT + 1)
+    ]
+    children = [
+        CreateChartOfAccountCommand(
+            code=f"{index % ROOT_COUNT + 1}_{index}",
+            name=f"child {index}",
+            category=AccountType.ASSET,
+            description=None,
+            parent_code=str(index % ROOT_COUNT + 1),
+        )
+        for index in range(size)
+    ]
+    return roots + children
+
+
+def legacy_create(repository: ChartOfAccountRepository, user_id: int, commands: list[CreateChartOfAccountCommand]):
+    """
+    명령마다 중복 검사와 상위 계정과목 조회를 개별로 수행하던 기존 방식
+
+    Args:
+        repository: 계정과목 저장소
+        user_id: 유저 ID
+        commands: 생성 명령 목록
+
+    Returns:
+        계정과목 목록
+    """
+    chart_of_accounts = []
+    for command in commands:
+        repository.find_chart_of_account_by_code(user_id, command.code)
+        parent_id = None
+        if command.parent_code:
+            parent = repository.find_chart_of_account_by_code(user_id, command.parent_code)
+            parent_id = parent.id if parent else None
+        chart_of_accounts.append(
+            ChartOfAccount(
+                user_id=user_id,
+                code=command.code,
+                name=command.name,
+                category=command.category,
+                description=command.description,
+                parent_chart_of_account_id=parent_id,
+            )
+        )
+    return repository.save_chart_of_accounts(chart_of_accounts)
+
+
+def run() -> list[Measurement]:
+    """
+    배치 크기별로 기존 방식과 일괄 검증 방식을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    measurements = []
+    for size in SIZES:
+        commands = build_commands(size)
+
+        with sqlite_database() as (engine, session_factory):
+            repository = ChartOfAccountRepository(session_factory)
+            # 상위 계정과목은 미리 저장해 두어 기존 방식에서도 상위 계정과목 조회가 성공하도록 합니다.
+            repository.save_chart_of_accounts(
+                [
+                    ChartOfAccount(
+                        user_id=1,
+                        code=command.code,
+                        name=command.name,
+                        category=command.category,
+                        description=None,
+                        parent_chart_of_account_id=None,
+                    )
+                    for command in commands[:ROOT_COUNT]
+                ]
+            )
+            with measure("legacy", size, engine) as measurement:
+                legacy_create(repository, 1, commands[ROOT_COUNT:])
+            measurements.append(measurement)
+
+        with sqlite_database() as (engine, session_factory):
+            service = ChartOfAccountService(ChartOfAccountRepository(session_factory))
+            with measure("bulk", size, engine) as measurement:
+                service.create_chart_of_accounts(1, commands)
+            measurements.append(measurement)
+
+    return measurements
+
+
+if __name__ == "__main__":
+    print_measurements(run())
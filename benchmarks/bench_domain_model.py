@@ -0,0 +1,189 @@
+"""
+계정과목 도메인 모델 메모리/생성 시간 벤치마크.
+
+계정과목 100,000개를 기준으로 다음을 비교합니다.
+
+- legacy: 인스턴스마다 `__dict__`를 가지고, 생성할 때마다 code 를 한 글자씩 검사하던 이전 모델
+- validated: 슬롯 기반 불변 모델의 일반 생성자 (정규식 한 번으로 code 검사)
+- trusted: 저장소 조회 결과 변환(`ChartOfAccountMapper.to_domain` / `row_to_domain`)에서 쓰는 검사 생략 생성자
+
+메모리는 인스턴스만 담은 목록을 만드는 동안 늘어난 할당량(tracemalloc)이고, 시간은 5회 중 최소값입니다.
+hydration 은 ORM 엔티티와 Core 조회 행을 도메인 모델로 바꾸는 시간입니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_domain_model
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+import tracemalloc
+from typing import Any
+
+from benchmarks.support import synthetic_chart_of_accounts
+from personal_cpa.adapter.outbound.database.mapper.chart_of_account import ChartOfAccountMapper
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SIZE = 100_000
+
+ROUNDS = 5
+
+
+@dataclass
+class _LegacyChartOfAccount:
+    """
+    이전 계정과목 도메인 모델 (비교용)
+    """
+
+    user_id: int
+    code: str
+    name: str
+    category: AccountType
+    description: str | None
+    parent_chart_of_account_id: int | None
+    is_hidden: bool = False
+    id: int | None = None
+
+    _VALID_CODE_CHARACTER = "01234567890_"
+
+    def __post_init__(self):
+        if not self.name.strip():
+            raise ValueError("name is not empty.")
+        if not self.code.strip():
+            raise ValueError("code is not empty.")
+        if any(c not in self._VALID_CODE_CHARACTER for c in self.code):
+            raise ValueError(f"code can only be a number OR '_'. (Currently: {self.code})")
+        if self.code.endswith("_"):
+            raise ValueError(f"code must not end with '_'. (Currently: {self.code})")
+        if not isinstance(self.category, AccountType):
+            raise TypeError(f"type must be an AccountType enum. (Currently: {type(self.category)})")
+
+
+def _best_seconds(build: Callable[[], object]) -> float:
+    """
+    Args:
+        build: 측정 대상
+
+    Returns:
+        `ROUNDS`회 중 최소 실행 시간(초)
+    """
+    durations = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        build()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def _allocated_bytes(build: Callable[[], list[Any]]) -> int:
+    """
+    Args:
+        build: 인스턴스 목록을 만드는 함수
+
+    Returns:
+        목록을 만드는 동안 늘어난 할당량(바이트)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = build()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return allocated
+
+
+def run() -> list[dict[str, Any]]:
+    """
+    생성 방식별 메모리와 생성/hydration 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    accounts = synthetic_chart_of_accounts(SIZE, with_ids=True)
+    values = [
+        (
+            account.user_id,
+            account.code,
+            account.name,
+            account.category,
+            account.description,
+            account.parent_chart_of_account_id,
+            account.is_hidden,
+            account.id,
+        )
+        for account in accounts
+    ]
+    entities = [ChartOfAccountMapper.to_entity(account) for account in accounts]
+    rows = [{"id": account.id, **ChartOfAccountMapper.to_row(account)} for account in accounts]
+    constructors: dict[str, Callable[..., Any]] = {
+        "legacy": _LegacyChartOfAccount,
+        "validated": ChartOfAccount,
+        "trusted": ChartOfAccount.trusted,
+    }
+
+    results = []
+    for name, constructor in constructors.items():
+
+        def build(constructor: Callable[..., Any] = constructor) -> list[Any]:
+            return [constructor(*value) for value in values]
+
+        results.append(
+            {
+                "name": name,
+                "bytes_per_100k": _allocated_bytes(build) * 100_000 // SIZE,
+                "construct_seconds": _best_seconds(build),
+            }
+        )
+
+    def legacy_hydrate() -> list[Any]:
+        return [
+            _LegacyChartOfAccount(
+                user_id=entity.user_id,
+                code=entity.code,
+                name=entity.name,
+                category=AccountType(entity.category),
+                is_hidden=entity.is_hidden,
+                description=entity.description,
+                parent_chart_of_account_id=entity.parent_chart_of_account_id,
+                id=entity.id,
+            )
+            for entity in entities
+        ]
+
+    def legacy_row_hydrate() -> list[Any]:
+        return [
+            _LegacyChartOfAccount(
+                user_id=row["user_id"],
+                code=row["code"],
+                name=row["name"],
+                category=AccountType(row["category"]),
+                is_hidden=row["is_hidden"],
+                description=row["description"],
+                parent_chart_of_account_id=row["parent_chart_of_account_id"],
+                id=row["id"],
+            )
+            for row in rows
+        ]
+
+    results[0]["hydrate_seconds"] = _best_seconds(legacy_hydrate)
+    results[0]["row_hydrate_seconds"] = _best_seconds(legacy_row_hydrate)
+    results[-1]["hydrate_seconds"] = _best_seconds(
+        lambda: [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+    )
+    results[-1]["row_hydrate_seconds"] = _best_seconds(
+        lambda: [ChartOfAccountMapper.row_to_domain(row) for row in rows]
+    )
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'constructor':<12}{'MB/100k':>10}{'construct ms':>15}{'to_domain ms':>15}{'row_to_domain ms':>18}")  # noqa: T201
+    for result in run():
+        hydrate = result.get("hydrate_seconds")
+        row_hydrate = result.get("row_hydrate_seconds")
+        print(  # noqa: T201
+            f"{result['name']:<12}{result['bytes_per_100k'] / 1024 / 1024:>10.1f}"
+            f"{result['construct_seconds'] * 1000:>15.1f}"
+            f"{'-' if hydrate is None else f'{hydrate * 1000:.1f}':>15}"
+            f"{'-' if row_hydrate is None else f'{row_hydrate * 1000:.1f}':>18}"
+        )
@@ -0,0 +1,133 @@
+"""
+재무 보고서(시산표/손익계산서/재무상태표) 벤치마크.
+
+계정과목 10,000개(너비 우선 fan-out 10 트리)를 가진 유저의 말단 계정과목 사이에 두 줄짜리 분개
+2,500,000개(분개 줄 5,000,000개)를 2년에 걸쳐 저장하고, 월별 잔액을 분개 줄로 다시 계산해 채운 뒤
+앞뒤로 걸친 달이 있는 기간의 보고서 조회 시간을 월별 잔액을 사용하는 경우와 분개 줄로만 계산하는 경우로 비교합니다.
+이어서 `CLOSE_PERIOD`를 마감하고, 마감 잔액과 그 이후 변동분만 읽는 재무상태표 조회 시간을 같은 두 경우로 측정합니다.
+분개는 기표 경로 대신 SQL 일괄 저장으로 채웁니다. (기표 처리량은 `bench_journal_posting`, `bench_balance_rollup` 참고)
+
+    PYTHONPATH=./src python -m benchmarks.bench_financial_reports
+"""
+
+from datetime import date, timedelta
+import random
+
+from sqlalchemy import Engine, insert
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database, synthetic_chart_of_accounts
+from personal_cpa.adapter.outbound.database.model.journal import JournalEntryEntity, JournalLineEntity
+from personal_cpa.adapter.outbound.database.repository.balance import AccountBalanceRepository
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.period_close import PeriodCloseRepository
+from personal_cpa.adapter.outbound.database.repository.report import FinancialReportRepository
+from personal_cpa.application.service.balance import AccountBalanceService
+from personal_cpa.application.service.period_close import PeriodCloseService
+from personal_cpa.application.service.report import FinancialReportService
+
+ACCOUNTS = 10_000
+ENTRIES = 2_500_000
+CHUNK = 100_000
+FIRST_DATE = date(2025, 1, 1)
+DAYS = 730
+START_DATE, END_DATE = date(2025, 3, 15), date(2026, 11, 10)
+CLOSE_PERIOD = 202609
+REPEAT = 5
+
+
+def fill_journal(engine: Engine, leaf_ids: list[int]) -> None:
+    """
+    거래일 순서로 임의의 두 말단 계정과목 사이의 분개와 분개 줄을 일괄 저장합니다.
+
+    Args:
+        engine: SQLite 엔진
+        leaf_ids: 말단 계정과목 ID 목록
+    """
+    rng = random.Random(0)
+    entries_per_day = ENTRIES / DAYS
+    with engine.begin() as connection:
+        for first_id in range(1, ENTRIES + 1, CHUNK):
+            entry_rows, line_rows = [], []
+            for entry_id in range(first_id, min(first_id + CHUNK, ENTRIES + 1)):
+                entry_date = FIRST_DATE + timedelta(days=int((entry_id - 1) / entries_per_day))
+                debit_id, credit_id = rng.sample(leaf_ids, 2)
+                amount = rng.randrange(100, 1_000_000)
+                entry_rows.append({"id": entry_id, "user_id": 1, "entry_date": entry_date, "description": None})
+                for chart_of_account_id, debit, credit in ((debit_id, amount, 0), (credit_id, 0, amount)):
+                    line_rows.append(
+                        {
+                            "journal_entry_id": entry_id,
+                            "user_id": 1,
+                            "chart_of_account_id": chart_of_account_id,
+                            "entry_date": entry_date,
+                            "debit": debit,
+                            "credit": credit,
+                            "description": None,
+                        }
+                    )
+            connection.execute(insert(JournalEntryEntity.__table__), entry_rows)
+            connection.execute(insert(JournalLineEntity.__table__), line_rows)
+
+
+def run() -> list[Measurement]:
+    """
+    월별 잔액 사용 여부별 재무 보고서 조회 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    with sqlite_database() as (engine, session_factory):
+        accounts = ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+            synthetic_chart_of_accounts(ACCOUNTS)
+        )
+        parent_ids = {account.parent_chart_of_account_id for account in accounts}
+        leaf_ids = [account.id for account in accounts if account.id not in parent_ids]
+
+        with measure("fill journal lines", ENTRIES * 2, engine) as filling:
+            fill_journal(engine, leaf_ids)
+        with measure("check_balances (repair)", ENTRIES * 2, engine) as rebuilding:
+            AccountBalanceService(AccountBalanceRepository(session_factory)).check_balances(1, repair=True)
+
+        measurements = [filling, rebuilding]
+        balance_sheets = {}
+        for use_balances in (True, False):
+            service = FinancialReportService(FinancialReportRepository(session_factory), use_balances=use_balances)
+            label = "balances" if use_balances else "lines"
+            repeat = REPEAT if use_balances else 1
+            with measure(f"trial_balance ({label})", repeat, engine) as trial:
+                for _ in range(repeat):
+                    trial_balance = service.get_trial_balance(1, START_DATE, END_DATE)
+            with measure(f"income_statement ({label})", repeat, engine) as income:
+                for _ in range(repeat):
+                    income_statement = service.get_income_statement(1, START_DATE, END_DATE)
+            with measure(f"balance_sheet ({label})", repeat, engine) as balance:
+                for _ in range(repeat):
+                    balance_sheet = service.get_balance_sheet(1, END_DATE)
+            measurements += [trial, income, balance]
+            print(  # noqa: T201
+                f"{label}: trial balance lines: {len(trial_balance.lines):,}, "
+                f"debit = credit: {trial_balance.total_debit == trial_balance.total_credit}, "
+                f"net income: {income_statement.net_income:,}, balanced: {balance_sheet.balanced}"
+            )
+            balance_sheets[use_balances] = balance_sheet
+
+        close_service = PeriodCloseService(
+            PeriodCloseRepository(session_factory), FinancialReportRepository(session_factory)
+        )
+        with measure(f"period close {CLOSE_PERIOD} (1 user)", 1, engine) as closing:
+            close_service.run_period_close(CLOSE_PERIOD)
+        measurements.append(closing)
+        for use_balances in (True, False):
+            service = FinancialReportService(FinancialReportRepository(session_factory), use_balances=use_balances)
+            label = "balances" if use_balances else "lines"
+            with measure(f"balance_sheet (snapshot + {label})", REPEAT, engine) as balance:
+                for _ in range(REPEAT):
+                    balance_sheet = service.get_balance_sheet(1, END_DATE)
+            measurements.append(balance)
+            print(f"snapshot + {label}: same balance sheet: {balance_sheet == balance_sheets[use_balances]}")  # noqa: T201
+
+    return measurements
+
+
+if __name__ == "__main__":
+    print_measurements(run())
@@ -0,0 +1,150 @@
+"""
+환율 조회/환산 벤치마크.
+
+10년치 일별 환율(통화쌍 3개, 약 11,000건)을 기준으로 다음을 비교합니다.
+
+- lookup: 임의 기준일 100,000개의 환율 조회 - 고시일 목록 선형 탐색 vs 환율 조회 구조의 이진 탐색(`FxRateTable.rate`)
+- convert: 4개 통화 금액 1,000,000개를 원화로 환산 - 금액마다 `FxRateTable.convert` vs `FxRateTable.convert_many`
+
+시간은 3회 중 최소값입니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_fx_conversion
+"""
+
+from collections.abc import Callable
+from datetime import date, timedelta
+from decimal import Decimal
+import random
+import time
+from typing import Any
+
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+AMOUNTS = 1_000_000
+
+LOOKUPS = 100_000
+
+DAYS = 3650
+
+ROUNDS = 3
+
+_START = date(2016, 1, 1)
+
+_QUOTES = {"USD": Decimal(1300), "EUR": Decimal(1450), "JPY": Decimal("9.5")}
+
+
+def _fx_rates(rng: random.Random) -> list[FxRate]:
+    """
+    Args:
+        rng: 난수 생성기
+
+    Returns:
+        통화쌍별 일별 환율 목록
+    """
+    return [
+        FxRate(
+            currency,
+            "KRW",
+            _START + timedelta(days=offset),
+            (base * Decimal(rng.uniform(0.9, 1.1))).quantize(Decimal("1e-4")),
+        )
+        for currency, base in _QUOTES.items()
+        for offset in range(DAYS)
+    ]
+
+
+def _best_seconds(run: Callable[[], object]) -> float:
+    """
+    Args:
+        run: 측정 대상
+
+    Returns:
+        `ROUNDS`회 중 최소 실행 시간(초)
+    """
+    durations = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+def _linear_rate(fx_rates: list[FxRate], base_currency: str, day: date) -> Decimal:
+    """
+    Args:
+        fx_rates: 환율 목록
+        base_currency: 기준 통화 코드
+        day: 기준일
+
+    Returns:
+        기준일 이전의 가장 최근 고시일 환율 (전체 목록 선형 탐색, 비교용)
+    """
+    latest = None
+    for fx_rate in fx_rates:
+        if (
+            fx_rate.base_currency == base_currency
+            and fx_rate.rate_date <= day
+            and (latest is None or fx_rate.rate_date > latest.rate_date)
+        ):
+            latest = fx_rate
+    if latest is None:
+        raise ValueError(f"no {base_currency}/KRW fx rate on or before {day}.")
+    return latest.rate
+
+
+def run() -> list[dict[str, Any]]:
+    """
+    환율 조회와 환산 방식별 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    rng = random.Random(42)
+    fx_rates = _fx_rates(rng)
+    started = time.perf_counter()
+    table = FxRateTable(fx_rates)
+    build_seconds = time.perf_counter() - started
+
+    lookup_days = [_START + timedelta(days=rng.randrange(DAYS)) for _ in range(LOOKUPS)]
+    lookup_currencies = [rng.choice(list(_QUOTES)) for _ in range(LOOKUPS)]
+    # 선형 탐색은 너무 느리므로 1/100 만 측정해 환산
+    sample = LOOKUPS // 100
+    linear_seconds = (
+        _best_seconds(
+            lambda: [
+                _linear_rate(fx_rates, currency, day)
+                for currency, day in zip(lookup_currencies[:sample], lookup_days[:sample], strict=True)
+            ]
+        )
+        * 100
+    )
+    bisect_seconds = _best_seconds(
+        lambda: [table.rate(currency, "KRW", day) for currency, day in zip(lookup_currencies, lookup_days, strict=True)]
+    )
+
+    day = _START + timedelta(days=DAYS - 1)
+    currencies = [rng.choice(("KRW", "USD", "EUR", "JPY")) for _ in range(AMOUNTS)]
+    amounts = [rng.randrange(-(10**9), 10**9) for _ in range(AMOUNTS)]
+    per_amount_seconds = _best_seconds(
+        lambda: [
+            table.convert(amount, currency, "KRW", day) for amount, currency in zip(amounts, currencies, strict=True)
+        ]
+    )
+    bulk_seconds = _best_seconds(lambda: table.convert_many(amounts, currencies, "KRW", day))
+
+    return [
+        {"name": "build table", "size": len(fx_rates), "seconds": build_seconds},
+        {"name": "lookup linear", "size": LOOKUPS, "seconds": linear_seconds},
+        {"name": "lookup bisect", "size": LOOKUPS, "seconds": bisect_seconds},
+        {"name": "convert each", "size": AMOUNTS, "seconds": per_amount_seconds},
+        {"name": "convert_many", "size": AMOUNTS, "seconds": bulk_seconds},
+    ]
+
+
+if __name__ == "__main__":
+    print(f"{'case':<16}{'size':>12}{'ms':>12}{'ns/item':>12}")  # noqa: T201
+    for result in run():
+        print(  # noqa: T201
+            f"{result['name']:<16}{result['size']:>12,}{result['seconds'] * 1000:>12.1f}"
+            f"{result['seconds'] * 1e9 / result['size']:>12.0f}"
+        )
@@ -0,0 +1,100 @@
+"""
+계정과목 가져오기 벤치마크.
+
+순서를 섞은 50,000행 NDJSON 파일을 64KB 조각으로 나누어 파서에 흘려보내고,
+`ChartOfAccountService.import_chart_of_accounts`로 묶음 크기별 저장 시간과 SQL 문 개수를 측정합니다.
+(목표: 50,000행 10초 미만)
+
+    PYTHONPATH=./src python -m benchmarks.bench_import_chart_of_accounts
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+import json
+import random
+import time
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database
+from personal_cpa.adapter.inbound.api.parser.chart_of_account import parse_import_rows
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+
+ROOTS = 5
+CHILDREN = 100
+GRANDCHILDREN = 99
+CHUNK_SIZES = (1_000, 5_000)
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+def build_import_file() -> bytes:
+    """
+    최상위 계정과목 5개 x 하위 100개 x 그 하위 99개(총 50,005행)를 무작위 순서로 담은 NDJSON 파일을 만듭니다.
+
+    Returns:
+        NDJSON 본문
+    """
+    codes = [str(root) for root in range(1, ROOTS + 1)]
+    codes += [f"{root}_{child}" for root in range(1, ROOTS + 1) for child in range(CHILDREN)]
+    codes += [
+        f"{root}_{child}_{grandchild}"
+        for root in range(1, ROOTS + 1)
+        for child in range(CHILDREN)
+        for grandchild in range(GRANDCHILDREN)
+    ]
+    random.Random(0).shuffle(codes)
+
+    return b"".join(
+        json.dumps(
+            {
+                "code": code,
+                "name": f"account {code}",
+                "category": "ASSET",
+                "description": None,
+                "parent_code": code.rpartition("_")[0] or None,
+            }
+        ).encode()
+        + b"\n"
+        for code in codes
+    )
+
+
+async def _upload(body: bytes) -> AsyncIterator[bytes]:
+    """
+    Args:
+        body: 요청 본문
+
+    Yields:
+        `UPLOAD_CHUNK_BYTES` 크기의 본문 조각
+    """
+    for start in range(0, len(body), UPLOAD_CHUNK_BYTES):
+        yield body[start : start + UPLOAD_CHUNK_BYTES]
+
+
+def run() -> list[Measurement]:
+    """
+    파싱 시간과 묶음 크기별 가져오기(파싱 포함) 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    body = build_import_file()
+    measurements = []
+
+    started = time.perf_counter()
+    rows = asyncio.run(parse_import_rows(_upload(body), "ndjson"))
+    measurements.append(Measurement("parse (ndjson)", len(rows), 0, time.perf_counter() - started))
+
+    for chunk_size in CHUNK_SIZES:
+        with sqlite_database() as (engine, session_factory):
+            service = ChartOfAccountService(ChartOfAccountRepository(session_factory), import_chunk_size=chunk_size)
+            with measure(f"import (chunk={chunk_size})", len(rows), engine) as measurement:
+                result = service.import_chart_of_accounts(1, asyncio.run(parse_import_rows(_upload(body), "ndjson")))
+            measurements.append(measurement)
+
+        assert (result.created, result.failed) == (len(rows), 0)
+
+    return measurements
+
+
+if __name__ == "__main__":
+    print_measurements(run())
@@ -0,0 +1,99 @@
+"""
+분개 기표/원장 조회 벤치마크.
+
+계정과목 100개를 가진 유저가 두 줄짜리 분개 500,000개(분개 줄 1,000,000개)를 요청 하나에 1,000개씩
+`JournalService.post_journal_entries`로 기표하는 시간과 SQL 문 개수를 측정하고,
+기표가 끝난 뒤 계정과목 하나의 한 달 원장(`get_ledger`) 조회 시간과 쿼리 계획을 출력합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_journal_posting
+"""
+
+from datetime import date, timedelta
+import random
+
+from sqlalchemy import text
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database, synthetic_chart_of_accounts
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository, _select_ledger
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.journal import JournalService
+
+ACCOUNTS = 100
+ENTRIES = 500_000
+BATCH = 1_000
+FIRST_DATE = date(2025, 1, 1)
+DAYS = 365
+REPEAT = 20
+
+
+def build_batch(rng: random.Random, account_ids: list[int], size: int) -> list[PostJournalEntryCommand]:
+    """
+    임의의 두 계정과목 사이의 두 줄짜리 분개 기표 명령을 만듭니다.
+
+    Args:
+        rng: 난수 생성기
+        account_ids: 계정과목 ID 목록
+        size: 분개 수
+
+    Returns:
+        분개 기표 명령 목록
+    """
+    commands = []
+    for _ in range(size):
+        debit_id, credit_id = rng.sample(account_ids, 2)
+        amount = rng.randrange(100, 1_000_000)
+        commands.append(
+            PostJournalEntryCommand(
+                entry_date=FIRST_DATE + timedelta(days=rng.randrange(DAYS)),
+                description=None,
+                lines=[
+                    PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+                    PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+                ],
+            )
+        )
+    return commands
+
+
+def run() -> tuple[list[Measurement], list[str]]:
+    """
+    분개 기표와 원장 조회를 측정합니다.
+
+    Returns:
+        (측정 결과 목록, 원장 조회 쿼리 계획)
+    """
+    rng = random.Random(0)
+    with sqlite_database() as (engine, session_factory):
+        account_ids = [
+            account.id
+            for account in ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+                synthetic_chart_of_accounts(ACCOUNTS)
+            )
+        ]
+        service = JournalService(JournalRepository(session_factory))
+
+        batches = [build_batch(rng, account_ids, BATCH) for _ in range(ENTRIES // BATCH)]
+        with measure("post_journal_entries", ENTRIES * 2, engine) as posting:
+            for batch in batches:
+                service.post_journal_entries(1, batch)
+
+        start_date, end_date = date(2025, 6, 1), date(2025, 6, 30)
+        with measure("get_ledger (1 month)", REPEAT, engine) as ledger:
+            for account_id in account_ids[:REPEAT]:
+                lines = service.get_ledger(1, account_id, start_date, end_date, 10_000)
+
+        statement = _select_ledger(1, account_ids[0], start_date, end_date, 10_000).compile(
+            engine, compile_kwargs={"literal_binds": True}
+        )
+        with engine.connect() as connection:
+            plan = [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {statement}"))]
+
+    print(f"posted lines/s: {posting.size / posting.seconds:,.0f}, ledger lines per query: {len(lines)}")  # noqa: T201
+    return [posting, ledger], plan
+
+
+if __name__ == "__main__":
+    measurements, plan = run()
+    print_measurements(measurements)
+    print("ledger query plan:", *plan, sep="\n  ")  # noqa: T201
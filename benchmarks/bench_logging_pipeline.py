@@ -0,0 +1,148 @@
+"""
+로깅 파이프라인 벤치마크.
+
+계정과목 상세 조회(`GET /api/v1/chart_of_accounts/{code}`, 캐시 없음)를 순차 호출하여 로깅 설정별 초당 요청 수를 비교합니다.
+
+- legacy: 기존 설정과 같이 stdout/파일에 동기로 쓰고 DEBUG 레벨, SQL 문 로그 포함
+- queue: 같은 로그 양을 `QueueHandler`/`QueueListener`로 넘김
+- queue + sampling: INFO 레벨, SQL 문 로그 제외, 요청 로그 10% 샘플링, JSON 형식
+
+stdout 은 바로 버리는 출력(fast)과 flush 마다 0.2ms 씩 막히는 출력(slow: 느린 로그 수집기나 디스크로의 파이프)
+두 가지로 측정하며, 로그 파일은 임시 디렉터리에 씁니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_logging_pipeline
+"""
+
+import asyncio
+import contextlib
+import io
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+from dependency_injector import providers
+import httpx
+
+from benchmarks.bench_save_chart_of_accounts import build_chart_of_accounts
+from benchmarks.support import sqlite_database
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.config import AppSettings
+from personal_cpa.logger import setup_logging, stop_logging
+
+REQUESTS = 500
+
+SINK_DELAYS = {"fast": 0.0, "slow": 0.0002}
+
+PIPELINES: dict[str, dict[str, Any]] = {
+    "legacy (sync, DEBUG)": {"LOG_ASYNC": False, "LOG_LEVEL": "DEBUG", "DB_ECHO_LEVEL": "INFO"},
+    "queue (DEBUG)": {"LOG_ASYNC": True, "LOG_LEVEL": "DEBUG", "DB_ECHO_LEVEL": "INFO"},
+    "queue + sampling (INFO)": {
+        "LOG_ASYNC": True,
+        "LOG_LEVEL": "INFO",
+        "DB_ECHO_LEVEL": "WARNING",
+        "LOG_REQUEST_SAMPLE_RATE": 0.1,
+        "LOG_FORMAT": "json",
+    },
+}
+
+
+class _SinkStream(io.TextIOBase):
+    """
+    출력을 버리고 flush 마다 지정한 시간만큼 막히는 stdout
+    """
+
+    def __init__(self, flush_delay: float):
+        """
+        초기화
+
+        Args:
+            flush_delay: flush 마다 막히는 시간(초)
+        """
+        self.flush_delay = flush_delay
+
+    def write(self, text: str) -> int:
+        """
+        Args:
+            text: 출력할 문자열
+
+        Returns:
+            출력한 문자 수
+        """
+        return len(text)
+
+    def flush(self) -> None:
+        """
+        출력 비우기 (지연만 발생)
+        """
+        if self.flush_delay:
+            time.sleep(self.flush_delay)
+
+
+async def _requests_per_second(app: Any) -> float:
+    """
+    계정과목 상세 조회를 `REQUESTS`회 순차 호출하여 초당 요청 수를 계산합니다.
+
+    Args:
+        app: ASGI 애플리케이션
+
+    Returns:
+        초당 요청 수
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as http:
+        (await http.get("/api/v1/chart_of_accounts/1")).raise_for_status()
+        started = time.perf_counter()
+        for index in range(REQUESTS):
+            (await http.get(f"/api/v1/chart_of_accounts/1_{index % 1_000}")).raise_for_status()
+        return REQUESTS / (time.perf_counter() - started)
+
+
+def run() -> list[dict[str, Any]]:
+    """
+    로깅 설정별 초당 요청 수와 로그 파일 크기를 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    import personal_cpa.main as main
+
+    results = []
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    with sqlite_database() as (engine, session_factory):
+        ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(build_chart_of_accounts(1_000))
+        log_dir = Path(str(engine.url.database)).parent
+
+        for sink, flush_delay in SINK_DELAYS.items():
+            for name, overrides in PIPELINES.items():
+                log_file = log_dir / f"{len(results)}.log"
+                settings = AppSettings(
+                    DB_TYPE="sqlite",
+                    DB_DATABASE=str(engine.url.database),
+                    CHART_OF_ACCOUNT_CACHE_MAX_SIZE=0,
+                    LOG_FILE=str(log_file),
+                    **overrides,
+                )
+                main.container.app_settings.override(providers.Object(settings))
+                main.container.reset_singletons()
+                main.settings = settings
+
+                with contextlib.redirect_stdout(_SinkStream(flush_delay)):
+                    setup_logging(settings)
+                    for logger_name in ("httpx", "httpcore"):
+                        logging.getLogger(logger_name).setLevel(logging.WARNING)
+                    rps = asyncio.run(_requests_per_second(main.app))
+                    stop_logging()
+
+                results.append({"sink": sink, "pipeline": name, "rps": rps, "log_bytes": log_file.stat().st_size})
+
+        main.container.app_settings.reset_override()
+
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'sink':<6}{'pipeline':<26}{'req/s':>10}{'log KB':>10}")  # noqa: T201
+    for result in run():
+        print(  # noqa: T201
+            f"{result['sink']:<6}{result['pipeline']:<26}{result['rps']:>10.1f}{result['log_bytes'] / 1024:>10.1f}"
+        )
@@ -0,0 +1,113 @@
+"""
+요청 지표 미들웨어 오버헤드 벤치마크.
+
+라우트 매칭을 흉내 내는 최소 ASGI 앱을 `MetricsMiddleware`로 감싼 경우와 감싸지 않은 경우를
+같은 이벤트 루프에서 직접 호출하여, HTTP 클라이언트 비용 없이 요청당 추가 시간만 측정합니다. (목표: 50µs 미만)
+
+    PYTHONPATH=./src python -m benchmarks.bench_metrics_overhead
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from personal_cpa.adapter.inbound.api.metrics import HttpMetrics, MetricsMiddleware
+
+REQUESTS = 100_000
+ROUTES = 20
+
+
+class _Route:
+    """
+    라우트 템플릿만 가진 라우트
+    """
+
+    def __init__(self, path: str):
+        """
+        초기화
+
+        Args:
+            path: 라우트 템플릿
+        """
+        self.path = path
+
+
+_ROUTES = [_Route(f"/api/v1/resource_{index}/{{code}}") for index in range(ROUTES)]
+
+
+async def _endpoint(scope: dict[str, Any], receive: Any, send: Any) -> None:
+    """
+    라우터처럼 `scope["route"]`를 채우고 빈 200 응답을 보내는 ASGI 앱
+    """
+    scope["route"] = _ROUTES[scope["index"] % ROUTES]
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(_: dict[str, Any]) -> None:
+    return None
+
+
+async def _seconds_per_request(app: Any) -> float:
+    """
+    Args:
+        app: ASGI 앱
+
+    Returns:
+        요청당 평균 처리 시간(초)
+    """
+    started = time.perf_counter()
+    for index in range(REQUESTS):
+        await app({"type": "http", "method": "GET", "index": index}, _receive, _send)
+    return (time.perf_counter() - started) / REQUESTS
+
+
+async def _measure() -> dict[str, float]:
+    """
+    Returns:
+        측정 항목별 요청당 시간(µs)
+    """
+    metrics = HttpMetrics()
+    instrumented = MetricsMiddleware(_endpoint, metrics=lambda: metrics)
+
+    await _seconds_per_request(_endpoint)
+    await _seconds_per_request(instrumented)
+    baseline = await _seconds_per_request(_endpoint)
+    with_metrics = await _seconds_per_request(instrumented)
+
+    started = time.perf_counter()
+    for index in range(REQUESTS):
+        metrics.observe("GET", _ROUTES[index % ROUTES].path, 200, 0.003)
+    observe = (time.perf_counter() - started) / REQUESTS
+
+    started = time.perf_counter()
+    metrics.render()
+    render = time.perf_counter() - started
+
+    return {
+        "baseline request": baseline * 1e6,
+        "with metrics": with_metrics * 1e6,
+        "middleware overhead": (with_metrics - baseline) * 1e6,
+        "observe()": observe * 1e6,
+        f"render() ({ROUTES} routes)": render * 1e6,
+    }
+
+
+def run() -> dict[str, float]:
+    """
+    미들웨어 유무에 따른 요청당 시간과 지표 기록/출력 시간을 측정합니다.
+
+    Returns:
+        측정 항목별 시간(µs)
+    """
+    return asyncio.run(_measure())
+
+
+if __name__ == "__main__":
+    print(f"{'name':<28}{'µs':>10}")  # noqa: T201
+    for name, micros in run().items():
+        print(f"{name:<28}{micros:>10.2f}")  # noqa: T201
@@ -0,0 +1,171 @@
+"""
+동기/스레드 풀/비동기 DB 모드 동시 요청 부하 테스트.
+
+SQLite 파일 DB 위에서 `DB_MODE=sync`(PyMySQL처럼 이벤트 루프에서 블로킹),
+`DB_MODE=sync` + `DB_SYNC_EXECUTION_MODE=threadpool`(커넥션 풀 크기의 스레드 풀에서 실행),
+`DB_MODE=async`(aiosqlite/aiomysql) 모드로 `GET /api/v1/chart_of_accounts/{code}`를 호출하고
+동시 클라이언트 50/200명일 때 p50/p99 지연 시간을 비교합니다.
+DB 왕복 시간은 SQLite trace callback 으로 문장마다 `--latency-ms` 만큼 지연시켜 흉내 냅니다.
+(trace callback 은 문장을 실행하는 스레드에서 호출되므로 aiosqlite 에서는 이벤트 루프를 막지 않습니다.)
+
+    PYTHONPATH=./src python -m benchmarks.bench_route_concurrency --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any
+
+from dependency_injector import providers
+import httpx
+from sqlalchemy import Engine, event
+
+from benchmarks.bench_save_chart_of_accounts import build_chart_of_accounts
+from benchmarks.support import sqlite_database
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.config import AppSettings
+
+CLIENTS = (50, 200)
+MODES = {"sync": ("sync", "inline"), "threadpool": ("sync", "threadpool"), "async": ("async", "inline")}
+REQUESTS_PER_CLIENT = 10
+
+
+def _add_latency(engine: Engine, latency_seconds: float) -> None:
+    """
+    SQLite 연결마다 문장 실행 시 지연을 추가합니다.
+
+    Args:
+        engine: 동기 엔진 (비동기 엔진은 sync_engine)
+        latency_seconds: 문장당 지연 시간(초)
+    """
+
+    def trace(_: str) -> None:
+        time.sleep(latency_seconds)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection: Any, _: Any) -> None:
+        if hasattr(dbapi_connection, "run_async"):
+            dbapi_connection.run_async(lambda connection: connection.set_trace_callback(trace))
+        else:
+            dbapi_connection.set_trace_callback(trace)
+
+
+async def _load(app: Any, clients: int) -> list[float]:
+    """
+    동시 클라이언트가 각각 순차적으로 요청을 보내고 요청별 지연 시간을 수집합니다.
+
+    Args:
+        app: ASGI 애플리케이션
+        clients: 동시 클라이언트 수
+
+    Returns:
+        요청별 지연 시간(초) 목록
+    """
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async def client(index: int) -> None:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+            for request in range(REQUESTS_PER_CLIENT):
+                started = time.perf_counter()
+                response = await http.get(f"/api/v1/chart_of_accounts/1_{(index + request) % 1_000}")
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+    await asyncio.gather(*(client(index) for index in range(clients)))
+    return latencies
+
+
+async def _measure(app: Any, mode: str, database: Any) -> list[dict[str, Any]]:
+    """
+    하나의 이벤트 루프에서 동시 클라이언트 수별 지연 시간 분포를 측정합니다.
+
+    비동기 엔진의 연결은 생성된 이벤트 루프에 묶이므로 측정이 끝나면 같은 루프에서 정리합니다.
+
+    Args:
+        app: ASGI 애플리케이션
+        mode: 측정 모드 (sync | threadpool | async)
+        database: 측정 대상 데이터베이스
+
+    Returns:
+        측정 결과 목록
+    """
+    results = []
+    for clients in CLIENTS:
+        started = time.perf_counter()
+        latencies = await _load(app, clients)
+        elapsed = time.perf_counter() - started
+        quantiles = statistics.quantiles(latencies, n=100)
+        results.append(
+            {
+                "mode": mode,
+                "clients": clients,
+                "requests": len(latencies),
+                "p50_ms": quantiles[49] * 1000,
+                "p99_ms": quantiles[98] * 1000,
+                "rps": len(latencies) / elapsed,
+            }
+        )
+
+    if mode == "async":
+        await database.dispose()
+
+    return results
+
+
+def run(latency_ms: float) -> list[dict[str, Any]]:
+    """
+    DB 모드와 동시 클라이언트 수별로 지연 시간 분포를 측정합니다.
+
+    Args:
+        latency_ms: 문장당 모의 DB 지연 시간(ms)
+
+    Returns:
+        측정 결과 목록
+    """
+    from personal_cpa.main import app, container, settings
+
+    logging.getLogger(settings.APP_NAME).setLevel(logging.WARNING)
+    logging.getLogger("aiosqlite").setLevel(logging.WARNING)
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = []
+
+    with sqlite_database() as (engine, session_factory):
+        ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(build_chart_of_accounts(1_000))
+
+        for mode, (db_mode, execution_mode) in MODES.items():
+            app_settings = AppSettings(
+                DB_TYPE="sqlite",
+                DB_DATABASE=str(engine.url.database),
+                DB_MODE=db_mode,
+                DB_SYNC_EXECUTION_MODE=execution_mode,
+                CHART_OF_ACCOUNT_CACHE_MAX_SIZE=0,
+            )
+            container.app_settings.override(providers.Object(app_settings))
+            container.reset_singletons()
+            database = container.database() if db_mode == "sync" else container.async_database()
+            sync_engine = database._engine if db_mode == "sync" else database._engine.sync_engine
+            _add_latency(sync_engine, latency_ms / 1000)
+
+            results.extend(asyncio.run(_measure(app, mode, database)))
+            container.use_case_executor().shutdown()
+
+        container.app_settings.reset_override()
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="문장당 모의 DB 지연 시간(ms)")
+    arguments = parser.parse_args()
+
+    print(f"{'mode':<12}{'clients':>8}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}{'rps':>10}")  # noqa: T201
+    for result in run(arguments.latency_ms):
+        print(  # noqa: T201
+            f"{result['mode']:<12}{result['clients']:>8}{result['requests']:>10}"
+            f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['rps']:>10.1f}"
+        )
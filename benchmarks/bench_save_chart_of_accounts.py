@@ -0,0 +1,68 @@
+"""
+계정과목 저장 벤치마크.
+
+ORM 기반 `save_chart_of_accounts`와 INSERT 문을 직접 사용하는 `bulk_insert_chart_of_accounts`의
+SQL 문 개수와 경과 시간을 비교합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_save_chart_of_accounts
+"""
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SIZES = (10, 1_000, 10_000)
+
+
+def build_chart_of_accounts(size: int) -> list[ChartOfAccount]:
+    """
+    최상위 계정과목 1개와 그 하위 계정과목으로 구성된 목록을 만듭니다.
+
+    Args:
+        size: 하위 계정과목 수
+
+    Returns:
+        계정과목 목록
+    """
+    return [
+        ChartOfAccount(
+            user_id=1,
+            code=code,
+            name=f"account {code}",
+            category=AccountType.ASSET,
+            description=None,
+            parent_chart_of_account_id=None,
+        )
+        for code in ["1", *(f"1_{index}" for index in range(size))]
+    ]
+
+
+def run() -> list[Measurement]:
+    """
+    배치 크기별로 두 저장 경로를 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    measurements = []
+    for size in SIZES:
+        chart_of_accounts = build_chart_of_accounts(size)
+
+        with sqlite_database() as (engine, session_factory):
+            repository = ChartOfAccountRepository(session_factory)
+            with measure("save (orm)", size, engine) as measurement:
+                repository.save_chart_of_accounts(chart_of_accounts)
+            measurements.append(measurement)
+
+        with sqlite_database() as (engine, session_factory):
+            repository = ChartOfAccountRepository(session_factory)
+            with measure("bulk_insert", size, engine) as measurement:
+                repository.bulk_insert_chart_of_accounts(chart_of_accounts)
+            measurements.append(measurement)
+
+    return measurements
+
+
+if __name__ == "__main__":
+    print_measurements(run())
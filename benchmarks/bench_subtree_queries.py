@@ -0,0 +1,118 @@
+"""
+하위/상위 계정과목 조회 벤치마크.
+
+계정과목 50,000개를 가진 유저에 대해 "1_2 아래 전체" 조회를
+전체 목록을 읽어 Python 에서 트리를 탐색하는 방식과 코드 경로 인덱스 범위 조회
+(`find_chart_of_account_subtree`)로 비교하고, 상위 계정과목 조회도 함께 측정합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_subtree_queries
+"""
+
+from collections import defaultdict
+
+from benchmarks.support import Measurement, measure, print_measurements, sqlite_database
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+ROOTS = 5
+CHILDREN = 100
+GRANDCHILDREN = 100
+REPEAT = 20
+
+
+def build_chart_of_accounts() -> list[ChartOfAccount]:
+    """
+    최상위 계정과목 5개 x 하위 100개 x 그 하위 100개로 구성된 목록을 만듭니다.
+
+    Returns:
+        계정과목 목록 (상위 계정과목이 하위 계정과목보다 앞에 위치)
+    """
+    codes = [str(root) for root in range(1, ROOTS + 1)]
+    codes += [f"{root}_{child}" for root in range(1, ROOTS + 1) for child in range(CHILDREN)]
+    codes += [
+        f"{root}_{child}_{grandchild}"
+        for root in range(1, ROOTS + 1)
+        for child in range(CHILDREN)
+        for grandchild in range(GRANDCHILDREN)
+    ]
+    return [
+        ChartOfAccount(
+            user_id=1,
+            code=code,
+            name=f"account {code}",
+            category=AccountType.ASSET,
+            description=None,
+            parent_chart_of_account_id=None,
+        )
+        for code in codes
+    ]
+
+
+def walk_subtree(chart_of_accounts: list[ChartOfAccount], code: str) -> list[ChartOfAccount]:
+    """
+    전체 계정과목 목록에서 상위 계정과목 ID를 따라 하위 계정과목을 찾습니다. (기존 방식)
+
+    Args:
+        chart_of_accounts: 유저의 전체 계정과목 목록
+        code: 기준 계정과목 코드
+
+    Returns:
+        계정과목 목록
+    """
+    children = defaultdict(list)
+    root = None
+    for chart_of_account in chart_of_accounts:
+        children[chart_of_account.parent_chart_of_account_id].append(chart_of_account)
+        if chart_of_account.code == code:
+            root = chart_of_account
+    if root is None:
+        return []
+
+    subtree, stack = [], [root]
+    while stack:
+        chart_of_account = stack.pop()
+        subtree.append(chart_of_account)
+        stack.extend(children[chart_of_account.id])
+
+    return subtree
+
+
+def run() -> list[Measurement]:
+    """
+    조회 방식별로 `REPEAT`회 반복 조회한 SQL 문 개수와 경과 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    chart_of_accounts = build_chart_of_accounts()
+    size = len(chart_of_accounts)
+    measurements = []
+
+    with sqlite_database() as (engine, session_factory):
+        repository = ChartOfAccountRepository(session_factory)
+        repository.bulk_insert_chart_of_accounts(chart_of_accounts)
+
+        with measure("subtree (load + walk)", size, engine) as measurement:
+            for _ in range(REPEAT):
+                walked = walk_subtree(repository.find_chart_of_accounts(1), "1_2")
+        measurements.append(measurement)
+
+        with measure("subtree (path range)", size, engine) as measurement:
+            for _ in range(REPEAT):
+                subtree = repository.find_chart_of_account_subtree(1, "1_2")
+        measurements.append(measurement)
+
+        with measure("ancestors (code IN)", size, engine) as measurement:
+            for _ in range(REPEAT):
+                ancestors = repository.find_chart_of_account_ancestors(1, "1_2_3")
+        measurements.append(measurement)
+
+    assert {coa.code for coa in walked} == {coa.code for coa in subtree}
+    assert [coa.code for coa in ancestors] == ["1", "1_2"]
+
+    return measurements
+
+
+if __name__ == "__main__":
+    print_measurements(run())
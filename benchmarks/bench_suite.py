@@ -0,0 +1,430 @@
+"""
+계정과목 주요 경로 벤치마크 모음.
+
+계정과목 수(기본 100 ~ 100,000, 너비 우선 fan-out 10 트리)별로 다음 경로의 회차별 시간을 측정하고
+결과를 JSON 파일로 저장합니다. `--compare`로 이전 커밋의 결과 파일을 주면 (이름, 백엔드, 크기)가 같은
+항목의 중앙값을 비교하고, `--threshold`보다 느려진 항목이 있으면 0이 아닌 코드로 종료합니다.
+
+- domain: `ChartOfAccount.__post_init__` 유효성 검사 (계정과목 생성)
+- service: `_build_account_tree` 트리 구성
+- mapper: `ChartOfAccountMapper.to_entity` / `to_domain`
+- repository: 일괄 저장(회차마다 새 사용자), 전체 조회, 코드로 단건 조회
+- http: FastAPI 앱을 통한 목록 조회, 상세 조회, 계정과목 생성 (캐시 없음)
+
+백엔드는 두 가지입니다.
+
+- sqlite: 크기마다 새 SQLite 파일 DB (가능하면 메모리 기반 /dev/shm 에 생성).
+  `Database`는 커넥션 풀을 사용하므로 커넥션마다 별도 DB가 되는 `:memory:` 대신 메모리 기반 파일을 사용합니다.
+- mysql: config.yml(local)의 docker-compose MySQL (`task db-start`로 실행 및 마이그레이션).
+  라우트가 사용자 ID 1을 사용하므로 측정 전후로 사용자 1과 일괄 저장 측정용 사용자의 계정과목을 모두 삭제합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_suite --sizes 100,1000
+    PYTHONPATH=./src python -m benchmarks.bench_suite --backend mysql --compare benchmarks/results/<commit>-mysql.json
+"""
+
+import argparse
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any, cast
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, or_
+
+from benchmarks.harness import (
+    RESULTS_DIR,
+    BenchmarkResult,
+    compare_results,
+    environment,
+    load_results,
+    save_results,
+    summarize,
+    time_rounds,
+)
+from benchmarks.support import synthetic_chart_of_accounts
+from personal_cpa.adapter.outbound.database.mapper.chart_of_account import ChartOfAccountMapper
+from personal_cpa.adapter.outbound.database.model.base import Base
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import Database
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+SEED_USER_ID = 1
+
+WRITE_USER_ID_BASE = 1_000_000
+
+CREATE_CODE_BASE = 10_000_000
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    측정 함수가 사용하는 크기별 준비 데이터
+
+    Args:
+        backend: 데이터베이스 백엔드
+        size: 계정과목 수
+        chart_of_accounts: 저장하지 않은 합성 계정과목 목록 (ID/상위 계정과목 ID 포함)
+        database: 사용자 1의 계정과목이 저장된 데이터베이스
+        client: 같은 데이터베이스를 사용하는 애플리케이션 테스트 클라이언트
+    """
+
+    backend: str
+    size: int
+    chart_of_accounts: list[ChartOfAccount]
+    database: Database
+    client: TestClient
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    측정 항목
+
+    Args:
+        name: 측정 이름
+        group: 측정 그룹
+        uses_database: 데이터베이스 사용 여부 (사용하지 않으면 결과의 백엔드를 "none"으로 기록)
+        prepare: 준비 데이터를 받아 회차 번호로 한 번 실행하는 함수를 돌려주는 함수
+    """
+
+    name: str
+    group: str
+    uses_database: bool
+    prepare: Callable[[BenchmarkContext], Callable[[int], object]]
+
+
+CASES: list[Case] = []
+
+
+def benchmark(
+    group: str, uses_database: bool = False
+) -> Callable[[Callable[[BenchmarkContext], Callable[[int], object]]], Callable[[BenchmarkContext], Any]]:
+    """
+    측정 항목으로 등록하는 데코레이터. 측정 이름은 "그룹.함수 이름"입니다.
+
+    Args:
+        group: 측정 그룹
+        uses_database: 데이터베이스 사용 여부
+
+    Returns:
+        등록 데코레이터
+    """
+
+    def register(prepare: Callable[[BenchmarkContext], Callable[[int], object]]) -> Callable[[BenchmarkContext], Any]:
+        CASES.append(Case(f"{group}.{prepare.__name__}", group, uses_database, prepare))
+        return prepare
+
+    return register
+
+
+@benchmark("domain")
+def post_init(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    계정과목 생성 시 `__post_init__` 유효성 검사
+    """
+    fields = [
+        (account.code, account.name, account.category, account.parent_chart_of_account_id)
+        for account in context.chart_of_accounts
+    ]
+
+    def run(_: int) -> object:
+        return [
+            ChartOfAccount(
+                user_id=SEED_USER_ID,
+                code=code,
+                name=name,
+                category=category,
+                description=None,
+                parent_chart_of_account_id=parent_id,
+            )
+            for code, name, category, parent_id in fields
+        ]
+
+    return run
+
+
+@benchmark("service")
+def build_account_tree(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    계정과목 목록으로 트리 구성
+    """
+    service = ChartOfAccountService(cast(Any, None))
+    return lambda _: service._build_account_tree(context.chart_of_accounts)
+
+
+@benchmark("mapper")
+def to_entity(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    도메인 모델을 ORM 엔티티로 변환
+    """
+    return lambda _: [ChartOfAccountMapper.to_entity(account) for account in context.chart_of_accounts]
+
+
+@benchmark("mapper")
+def to_domain(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    ORM 엔티티를 도메인 모델로 변환
+    """
+    entities = [ChartOfAccountMapper.to_entity(account) for account in context.chart_of_accounts]
+    for entity, account in zip(entities, context.chart_of_accounts, strict=True):
+        entity.id = account.id
+    return lambda _: [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+
+@benchmark("repository", uses_database=True)
+def bulk_insert(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    회차마다 새 사용자의 계정과목 전체 일괄 저장
+    """
+    repository = ChartOfAccountRepository(context.database.session)
+
+    def run(round_index: int) -> object:
+        user_id = WRITE_USER_ID_BASE + round_index
+        return repository.bulk_insert_chart_of_accounts(synthetic_chart_of_accounts(context.size, user_id=user_id))
+
+    return run
+
+
+@benchmark("repository", uses_database=True)
+def find_chart_of_accounts(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    사용자의 계정과목 전체 조회
+    """
+    repository = ChartOfAccountRepository(context.database.session)
+    return lambda _: repository.find_chart_of_accounts(SEED_USER_ID)
+
+
+@benchmark("repository", uses_database=True)
+def find_chart_of_account_by_code(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    코드로 가장 깊은 계정과목 단건 조회
+    """
+    repository = ChartOfAccountRepository(context.database.session)
+    code = context.chart_of_accounts[-1].code
+    return lambda _: repository.find_chart_of_account_by_code(SEED_USER_ID, code)
+
+
+@benchmark("http", uses_database=True)
+def list_chart_of_accounts(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    GET /api/v1/chart_of_accounts/ (계정과목 트리 전체)
+    """
+    return lambda _: context.client.get("/api/v1/chart_of_accounts/").raise_for_status()
+
+
+@benchmark("http", uses_database=True)
+def get_chart_of_account(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    GET /api/v1/chart_of_accounts/{code}
+    """
+    code = context.chart_of_accounts[-1].code
+    return lambda _: context.client.get(f"/api/v1/chart_of_accounts/{code}").raise_for_status()
+
+
+@benchmark("http", uses_database=True)
+def create_chart_of_account(context: BenchmarkContext) -> Callable[[int], object]:
+    """
+    POST /api/v1/chart_of_accounts/ (최상위 계정과목 "1" 아래에 하위 계정과목 1개 생성)
+    """
+
+    def run(round_index: int) -> object:
+        body = [
+            {
+                "code": f"1_{CREATE_CODE_BASE + round_index}",
+                "name": "benchmark",
+                "category": context.chart_of_accounts[0].category.value,
+                "description": None,
+                "parent_code": "1",
+            }
+        ]
+        return context.client.post("/api/v1/chart_of_accounts/", json=body).raise_for_status()
+
+    return run
+
+
+@contextmanager
+def _settings(backend: str) -> Iterator[AppSettings]:
+    """
+    Args:
+        backend: 데이터베이스 백엔드 (sqlite | mysql)
+
+    Yields:
+        백엔드에 연결하는 애플리케이션 설정 (캐시 없음, 경고 이상만 로그)
+    """
+    overrides: dict[str, Any] = {
+        "CHART_OF_ACCOUNT_CACHE_MAX_SIZE": 0,
+        "LOG_LEVEL": "WARNING",
+        "DB_ECHO_LEVEL": "WARNING",
+    }
+    if backend == "mysql":
+        yield AppSettings(DB_TYPE="mysql", **overrides)
+        return
+
+    shared_memory = Path("/dev/shm")
+    with tempfile.TemporaryDirectory(dir=shared_memory if shared_memory.is_dir() else None) as directory:
+        yield AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(Path(directory) / "benchmark.db"), **overrides)
+
+
+def _delete_benchmark_users(database: Database) -> None:
+    """
+    사용자 1과 일괄 저장 측정용 사용자의 계정과목을 삭제합니다.
+
+    Args:
+        database: 데이터베이스
+    """
+    with database.session() as session:
+        session.execute(
+            delete(ChartOfAccountEntity).where(
+                or_(ChartOfAccountEntity.user_id == SEED_USER_ID, ChartOfAccountEntity.user_id >= WRITE_USER_ID_BASE)
+            )
+        )
+
+
+@contextmanager
+def _context(backend: str, size: int) -> Iterator[BenchmarkContext]:
+    """
+    사용자 1의 계정과목 `size`개를 저장하고, 애플리케이션 컨테이너가 같은 데이터베이스를 사용하도록 바꿉니다.
+
+    Args:
+        backend: 데이터베이스 백엔드
+        size: 계정과목 수
+
+    Yields:
+        측정 준비 데이터
+    """
+    import personal_cpa.main as main
+
+    with _settings(backend) as settings:
+        main.container.app_settings.override(providers.Object(settings))
+        main.container.reset_singletons()
+        database = main.container.database()
+        if backend == "sqlite":
+            Base.metadata.create_all(database._engine)
+        _delete_benchmark_users(database)
+        ChartOfAccountRepository(database.session).bulk_insert_chart_of_accounts(
+            synthetic_chart_of_accounts(size, user_id=SEED_USER_ID)
+        )
+        try:
+            yield BenchmarkContext(
+                backend=backend,
+                size=size,
+                chart_of_accounts=synthetic_chart_of_accounts(size, user_id=SEED_USER_ID, with_ids=True),
+                database=database,
+                client=TestClient(main.app),
+            )
+        finally:
+            _delete_benchmark_users(database)
+            database._engine.dispose()
+            main.container.app_settings.reset_override()
+            main.container.reset_singletons()
+
+
+def run(
+    backend: str, sizes: list[int], name_filter: str | None = None, min_seconds: float = 0.5
+) -> list[BenchmarkResult]:
+    """
+    크기별로 측정 항목을 실행합니다.
+
+    Args:
+        backend: 데이터베이스 백엔드 (sqlite | mysql)
+        sizes: 계정과목 수 목록
+        name_filter: 측정 이름에 포함되어야 하는 문자열 (없으면 전체)
+        min_seconds: 측정 항목별 최소 누적 측정 시간(초)
+
+    Returns:
+        측정 결과 목록
+    """
+    cases = [case for case in CASES if not name_filter or name_filter in case.name]
+    logging.disable(logging.CRITICAL)
+    results = []
+    try:
+        for size in sizes:
+            with _context(backend, size) as context:
+                for case in cases:
+                    durations = time_rounds(case.prepare(context), min_seconds=min_seconds)
+                    result = summarize(
+                        case.name, case.group, backend if case.uses_database else "none", size, durations
+                    )
+                    results.append(result)
+                    _print_result(result)
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    """
+    Args:
+        result: 측정 결과
+    """
+    print(  # noqa: T201
+        f"{result.name:<46}{result.backend:>8}{result.size:>9}{result.rounds:>8}"
+        f"{result.median_seconds * 1000:>12.3f}{result.stddev_seconds * 1000:>12.3f}"
+    )
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """
+    Args:
+        argv: 명령행 인자
+
+    Returns:
+        파싱된 인자
+    """
+    parser = argparse.ArgumentParser(description="Chart of accounts benchmark suite")
+    parser.add_argument("--backend", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES), help="comma separated sizes")
+    parser.add_argument("--filter", dest="name_filter", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.5, help="minimum measured seconds per benchmark")
+    parser.add_argument("--output", type=Path, help="result file (default: benchmarks/results/<commit>-<backend>.json)")
+    parser.add_argument("--compare", type=Path, help="baseline result file to compare medians against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed median slowdown ratio (0.1 = 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    """
+    측정 후 결과를 저장하고, 기준 결과가 주어지면 비교합니다.
+
+    Args:
+        argv: 명령행 인자
+
+    Returns:
+        종료 코드 (기준보다 느려진 항목이 있으면 1)
+    """
+    args = _parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    metadata = environment() | {"backend": args.backend, "sizes": sizes, "min_time": args.min_time}
+
+    print(f"{'name':<46}{'backend':>8}{'size':>9}{'rounds':>8}{'median ms':>12}{'stddev ms':>12}")  # noqa: T201
+    results = run(args.backend, sizes, args.name_filter, args.min_time)
+    output = args.output or RESULTS_DIR / f"{metadata['commit']}-{args.backend}.json"
+    save_results(output, results, metadata)
+    print(f"saved {len(results)} results to {output}")  # noqa: T201
+
+    if not args.compare:
+        return 0
+    comparisons = compare_results(load_results(args.compare), results, args.threshold)
+    print(f"\n{'name':<46}{'backend':>8}{'size':>9}{'base ms':>12}{'now ms':>12}{'ratio':>8}")  # noqa: T201
+    for comparison in comparisons:
+        current = comparison.current
+        print(  # noqa: T201
+            f"{current.name:<46}{current.backend:>8}{current.size:>9}"
+            f"{comparison.baseline.median_seconds * 1000:>12.3f}{current.median_seconds * 1000:>12.3f}"
+            f"{comparison.ratio:>8.2f}{'  REGRESSED' if comparison.regressed else ''}"
+        )
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
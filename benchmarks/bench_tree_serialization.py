@@ -0,0 +1,140 @@
+"""
+계정과목 트리 응답 직렬화 벤치마크.
+
+`GET /api/v1/chart_of_accounts/`가 1,000 / 10,000 노드 트리를 반환할 때
+`response_model` 검증 경로(기본)와 빠른 JSON 경로(`API_FAST_JSON_RESPONSE`)의 초당 요청 수를 비교합니다.
+DB 비용을 빼기 위해 서비스는 미리 만든 트리를 반환하는 객체로 대체합니다.
+
+    PYTHONPATH=./src python -m benchmarks.bench_tree_serialization
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from dependency_injector import providers
+import httpx
+
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import ChartOfAccountPresenter
+from personal_cpa.domain.chart_of_account import ChartOfAccountTree
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SIZES = (1_000, 10_000)
+REQUESTS = 20
+
+
+class PrebuiltTreeService:
+    """
+    미리 만든 트리를 반환하는 조회 서비스
+    """
+
+    def __init__(self, trees: list[ChartOfAccountTree]):
+        """
+        초기화
+
+        Args:
+            trees: 반환할 계정과목 트리 목록
+        """
+        self.trees = trees
+
+    def get_chart_of_accounts(self, user_id: int) -> list[ChartOfAccountTree]:
+        """
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 트리 목록
+        """
+        return self.trees
+
+
+def build_trees(size: int) -> list[ChartOfAccountTree]:
+    """
+    최상위 계정과목 10개 x 하위 9개 x 말단 계정과목으로 구성된 `size`개 노드의 트리를 만듭니다.
+
+    Args:
+        size: 노드 수 (100 + 90의 배수)
+
+    Returns:
+        계정과목 트리 목록
+    """
+
+    def node(code: str, children: list[ChartOfAccountTree]) -> ChartOfAccountTree:
+        return ChartOfAccountTree(
+            user_id=1,
+            code=code,
+            name=f"account {code}",
+            category=AccountType.ASSET,
+            children=children,
+            description=None,
+            parent_chart_of_account_id=None,
+            child_count=len(children),
+        )
+
+    leaves_per_child = (size - 100) // 90
+    return [
+        node(
+            str(root),
+            [
+                node(f"{root}_{child}", [node(f"{root}_{child}_{leaf}", []) for leaf in range(leaves_per_child)])
+                for child in range(9)
+            ],
+        )
+        for root in range(1, 11)
+    ]
+
+
+async def _requests_per_second(app: Any) -> float:
+    """
+    트리 목록 조회를 `REQUESTS`회 순차 호출하여 초당 요청 수를 계산합니다.
+
+    Args:
+        app: ASGI 애플리케이션
+
+    Returns:
+        초당 요청 수
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as http:
+        (await http.get("/api/v1/chart_of_accounts/")).raise_for_status()
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            (await http.get("/api/v1/chart_of_accounts/")).raise_for_status()
+        return REQUESTS / (time.perf_counter() - started)
+
+
+def run() -> list[dict[str, Any]]:
+    """
+    트리 크기와 직렬화 경로별 초당 요청 수를 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    from personal_cpa.main import app, container, settings
+
+    logging.getLogger(settings.APP_NAME).setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = []
+
+    for size in SIZES:
+        trees = build_trees(size)
+        container.chart_of_account_service.override(providers.Object(PrebuiltTreeService(trees)))
+        for fast_json in (False, True):
+            container.chart_of_account_presenter.override(providers.Object(ChartOfAccountPresenter(fast_json)))
+            results.append(
+                {
+                    "path": "fast json" if fast_json else "response_model",
+                    "nodes": size,
+                    "rps": asyncio.run(_requests_per_second(app)),
+                }
+            )
+
+    container.chart_of_account_service.reset_override()
+    container.chart_of_account_presenter.reset_override()
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'path':<18}{'nodes':>8}{'req/s':>10}")  # noqa: T201
+    for result in run():
+        print(f"{result['path']:<18}{result['nodes']:>8}{result['rps']:>10.1f}")  # noqa: T201
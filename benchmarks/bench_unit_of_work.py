@@ -0,0 +1,186 @@
+"""
+요청 단위 작업(unit of work) 벤치마크.
+
+애플리케이션 라우터를 `UnitOfWorkMiddleware` 없이(저장소 호출마다 세션/커넥션) 또는 함께(요청마다 세션 하나)
+구성하고, 라우트별 요청당 커넥션 체크아웃 수와 커밋 수, 평균 처리 시간을 비교합니다.
+가져오기는 1,000행을 100행 묶음으로 나누어 저장합니다. (SQLite 파일 DB, 캐시 없음)
+
+    PYTHONPATH=./src python -m benchmarks.bench_unit_of_work
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from dependency_injector import providers
+from fastapi import FastAPI
+import httpx
+from sqlalchemy import event
+
+from benchmarks.support import sqlite_database
+from personal_cpa.adapter.inbound.api import error_handler
+from personal_cpa.adapter.inbound.api.routes import chart_of_account, health, metrics
+from personal_cpa.adapter.inbound.api.unit_of_work import UnitOfWorkMiddleware
+from personal_cpa.config import AppSettings
+
+REQUESTS = 200
+
+IMPORT_ROWS = 1_000
+
+IMPORT_CHUNK_SIZE = 100
+
+
+def _build_app(container: Any, unit_of_work: bool) -> FastAPI:
+    """
+    Args:
+        container: 라우트가 연결된 의존성 주입 컨테이너
+        unit_of_work: 요청 단위 작업 미들웨어 사용 여부
+
+    Returns:
+        애플리케이션 라우터를 포함한 FastAPI 앱
+    """
+    app = FastAPI()
+    if unit_of_work:
+        app.add_middleware(
+            UnitOfWorkMiddleware, database=container.active_database, executor=container.use_case_executor
+        )
+    error_handler.add_error_handlers(app)
+    for module in (health, metrics, chart_of_account):
+        app.include_router(module.router, prefix="/api/v1")
+    return app
+
+
+def _import_body() -> bytes:
+    """
+    Returns:
+        상위 계정과목 10개와 하위 계정과목으로 이루어진 `IMPORT_ROWS`행의 CSV
+    """
+    lines = ["code,name,category,description,parent_code"]
+    lines += [f"9{parent},parent {parent},ASSET,," for parent in range(10)]
+    lines += [f"9{index % 10}_{index},child {index},ASSET,,9{index % 10}" for index in range(IMPORT_ROWS - 10)]
+    return "\n".join(lines).encode()
+
+
+async def _scenarios(app: FastAPI) -> dict[str, tuple[int, Any]]:
+    """
+    Args:
+        app: FastAPI 앱
+
+    Returns:
+        라우트별 (요청 수, 요청 함수)
+    """
+    import_body = _import_body()
+    counter = iter(range(1_000_000))
+
+    def create(http: httpx.AsyncClient) -> Any:
+        index = next(counter)
+        return http.post(
+            "/api/v1/chart_of_accounts/",
+            json=[
+                {"code": f"1_{index}", "name": "parent", "category": 1, "description": None, "parent_code": "1"},
+                {
+                    "code": f"1_{index}_1",
+                    "name": "child",
+                    "category": 1,
+                    "description": None,
+                    "parent_code": f"1_{index}",
+                },
+            ],
+        )
+
+    return {
+        "POST / (2 accounts)": (REQUESTS, create),
+        "GET /{code}": (REQUESTS, lambda http: http.get("/api/v1/chart_of_accounts/1")),
+        "GET /{code}/tree": (REQUESTS, lambda http: http.get("/api/v1/chart_of_accounts/1/tree")),
+        f"POST /import ({IMPORT_ROWS} rows)": (
+            1,
+            lambda http: http.post("/api/v1/chart_of_accounts/import?format=csv", content=import_body),
+        ),
+    }
+
+
+async def _measure(app: FastAPI, engine: Any) -> dict[str, tuple[float, float, float]]:
+    """
+    Args:
+        app: FastAPI 앱
+        engine: 앱이 사용하는 데이터베이스 엔진
+
+    Returns:
+        라우트별 (요청당 체크아웃 수, 요청당 커밋 수, 요청당 평균 시간(ms))
+    """
+    counts = {"checkout": 0, "commit": 0}
+
+    def on_checkout(*_: Any) -> None:
+        counts["checkout"] += 1
+
+    def on_commit(*_: Any) -> None:
+        counts["commit"] += 1
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "commit", on_commit)
+    results = {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as http:
+        root = [{"code": "1", "name": "asset", "category": 1, "description": None, "parent_code": None}]
+        (await http.post("/api/v1/chart_of_accounts/", json=root)).raise_for_status()
+        for name, (requests, request) in (await _scenarios(app)).items():
+            counts.update(checkout=0, commit=0)
+            started = time.perf_counter()
+            for _ in range(requests):
+                (await request(http)).raise_for_status()
+            elapsed = time.perf_counter() - started
+            results[name] = (counts["checkout"] / requests, counts["commit"] / requests, elapsed / requests * 1000)
+    event.remove(engine, "checkout", on_checkout)
+    event.remove(engine, "commit", on_commit)
+    return results
+
+
+def run() -> list[dict[str, Any]]:
+    """
+    요청 단위 작업 미들웨어 유무에 따른 라우트별 체크아웃/커밋 수와 처리 시간을 측정합니다.
+
+    Returns:
+        측정 결과 목록
+    """
+    import personal_cpa.main as main
+
+    logging.disable(logging.CRITICAL)
+    results = []
+    for unit_of_work in (False, True):
+        with sqlite_database() as (engine, _):
+            main.container.app_settings.override(
+                providers.Object(
+                    AppSettings(
+                        DB_TYPE="sqlite",
+                        DB_DATABASE=str(engine.url.database),
+                        CHART_OF_ACCOUNT_CACHE_MAX_SIZE=0,
+                        CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE=IMPORT_CHUNK_SIZE,
+                    )
+                )
+            )
+            main.container.reset_singletons()
+            app = _build_app(main.container, unit_of_work)
+            measured = asyncio.run(_measure(app, main.container.database()._engine))
+            main.container.database()._engine.dispose()
+            for name, (checkouts, commits, milliseconds) in measured.items():
+                results.append(
+                    {
+                        "route": name,
+                        "unit_of_work": unit_of_work,
+                        "checkouts": checkouts,
+                        "commits": commits,
+                        "ms": milliseconds,
+                    }
+                )
+    main.container.app_settings.reset_override()
+    logging.disable(logging.NOTSET)
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'route':<28}{'unit of work':>14}{'checkouts/req':>15}{'commits/req':>13}{'ms/req':>10}")  # noqa: T201
+    for result in run():
+        print(  # noqa: T201
+            f"{result['route']:<28}{'on' if result['unit_of_work'] else 'off':>14}"
+            f"{result['checkouts']:>15.1f}{result['commits']:>13.1f}{result['ms']:>10.2f}"
+        )
@@ -0,0 +1,220 @@
+"""
+벤치마크 실행/기록 도구.
+
+측정 함수를 정해진 최소 횟수와 최소 시간을 채울 때까지 반복 실행하여 회차별 시간 통계를 내고,
+결과를 커밋/환경 정보와 함께 JSON 파일로 저장합니다. 두 결과 파일을 (이름, 백엔드, 크기)로 맞춰
+중앙값을 비교하여 기준보다 느려진 항목을 찾습니다.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    벤치마크 측정 결과
+
+    Args:
+        name: 측정 이름 (예: repository.find_chart_of_accounts)
+        group: 측정 그룹 (domain | service | mapper | repository | http)
+        backend: 데이터베이스 백엔드 (DB를 쓰지 않는 측정은 "none")
+        size: 계정과목 수
+        rounds: 측정 회차 수 (준비 회차 제외)
+        min_seconds: 회차별 최소 시간(초)
+        median_seconds: 회차별 중앙값(초)
+        mean_seconds: 회차별 평균(초)
+        stddev_seconds: 회차별 표준편차(초)
+    """
+
+    name: str
+    group: str
+    backend: str
+    size: int
+    rounds: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    stddev_seconds: float
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        """
+        Returns:
+            결과 비교에 쓰는 (이름, 백엔드, 크기)
+        """
+        return self.name, self.backend, self.size
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            결과 항목별 값
+        """
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    두 측정 결과의 비교
+
+    Args:
+        baseline: 기준 결과
+        current: 현재 결과
+        ratio: 현재 중앙값 / 기준 중앙값
+        regressed: 허용 비율을 넘어 느려졌는지 여부
+    """
+
+    baseline: BenchmarkResult
+    current: BenchmarkResult
+    ratio: float
+    regressed: bool
+
+
+def time_rounds(
+    run: Callable[[int], object], min_rounds: int = 3, min_seconds: float = 0.5, max_rounds: int = 1_000
+) -> list[float]:
+    """
+    준비 회차를 한 번 실행한 뒤, 최소 횟수와 최소 누적 시간을 채울 때까지 반복 실행합니다.
+
+    Args:
+        run: 회차 번호를 받아 측정 대상을 한 번 실행하는 함수 (쓰기 측정은 회차마다 다른 데이터를 사용)
+        min_rounds: 최소 측정 횟수
+        min_seconds: 최소 누적 측정 시간(초)
+        max_rounds: 최대 측정 횟수
+
+    Returns:
+        회차별 실행 시간(초)
+    """
+    run(0)
+    durations: list[float] = []
+    while len(durations) < max_rounds and (len(durations) < min_rounds or sum(durations) < min_seconds):
+        started = time.perf_counter()
+        run(len(durations) + 1)
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def summarize(name: str, group: str, backend: str, size: int, durations: list[float]) -> BenchmarkResult:
+    """
+    Args:
+        name: 측정 이름
+        group: 측정 그룹
+        backend: 데이터베이스 백엔드
+        size: 계정과목 수
+        durations: 회차별 실행 시간(초)
+
+    Returns:
+        측정 결과
+    """
+    return BenchmarkResult(
+        name=name,
+        group=group,
+        backend=backend,
+        size=size,
+        rounds=len(durations),
+        min_seconds=min(durations),
+        median_seconds=statistics.median(durations),
+        mean_seconds=statistics.fmean(durations),
+        stddev_seconds=statistics.stdev(durations) if len(durations) > 1 else 0.0,
+    )
+
+
+def environment() -> dict[str, Any]:
+    """
+    Returns:
+        결과 파일에 함께 기록할 커밋/실행 환경 정보
+    """
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def save_results(path: Path, results: Iterable[BenchmarkResult], metadata: dict[str, Any]) -> None:
+    """
+    측정 결과를 JSON 파일로 저장합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        results: 측정 결과 목록
+        metadata: 커밋/환경/실행 옵션 정보
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {"version": FORMAT_VERSION, "metadata": metadata, "results": [result.to_dict() for result in results]}
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """
+    Args:
+        path: `save_results`로 저장한 파일 경로
+
+    Returns:
+        측정 결과 목록
+
+    Raises:
+        ValueError: 지원하지 않는 형식 버전일 경우 발생
+    """
+    document = json.loads(path.read_text())
+    if document.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark result version: {document.get('version')} ({path})")
+    return [BenchmarkResult(**result) for result in document["results"]]
+
+
+def compare_results(
+    baseline: Iterable[BenchmarkResult], current: Iterable[BenchmarkResult], threshold: float = 0.1
+) -> list[Comparison]:
+    """
+    두 결과에 모두 있는 항목의 중앙값을 비교합니다.
+
+    Args:
+        baseline: 기준 결과 목록
+        current: 현재 결과 목록
+        threshold: 느려짐으로 판단하는 비율 (0.1 이면 중앙값이 10% 넘게 늘어난 경우)
+
+    Returns:
+        현재 결과 순서의 비교 목록
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+    comparisons = []
+    for result in current:
+        previous = baseline_by_key.get(result.key)
+        if previous is None:
+            continue
+        ratio = result.median_seconds / previous.median_seconds if previous.median_seconds else float("inf")
+        comparisons.append(Comparison(previous, result, ratio, ratio > 1 + threshold))
+    return comparisons
+
+
+def _git(*args: str) -> str:
+    """
+    Args:
+        *args: git 명령 인자
+
+    Returns:
+        명령 출력 (git 이 없거나 실패하면 빈 문자열)
+    """
+    try:
+        completed = subprocess.run(
+            ["git", *args], cwd=Path(__file__).parent, capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip()
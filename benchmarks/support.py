@@ -0,0 +1,177 @@
+"""
+벤치마크 공용 유틸리티.
+
+SQLite 파일 기반 데이터베이스, 합성 계정과목 트리, 실행된 SQL 문 개수 측정, 결과 표 출력을 제공합니다.
+"""
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from itertools import cycle
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from personal_cpa.adapter.outbound.database.model import balance, chart_of_account, journal, period_close  # noqa: F401
+from personal_cpa.adapter.outbound.database.model.base import Base
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SessionFactory = Callable[[], AbstractContextManager[Session]]
+
+
+@contextmanager
+def sqlite_database() -> Iterator[tuple[Engine, SessionFactory]]:
+    """
+    테이블이 생성된 임시 SQLite 데이터베이스를 제공합니다.
+
+    Yields:
+        (엔진, `Database.session()`과 같은 방식으로 동작하는 세션 팩토리)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'benchmark.db'}")
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+        @contextmanager
+        def session() -> Generator[Session, None, None]:
+            session = factory()
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+        try:
+            yield engine, session
+        finally:
+            engine.dispose()
+
+
+def synthetic_chart_of_accounts(
+    size: int, user_id: int = 1, fan_out: int = 10, with_ids: bool = False
+) -> list[ChartOfAccount]:
+    """
+    최상위 계정과목 `fan_out`개에서 시작하여 계정과목마다 하위 계정과목을 `fan_out`개씩 너비 우선으로 채운
+    계정과목 트리를 만듭니다. 최상위 계정과목은 계정 유형을 돌아가며 사용하고, 하위 계정과목은 상위 계정과목의
+    유형을 따릅니다. 목록은 상위 계정과목이 항상 하위 계정과목보다 앞에 오는 순서입니다.
+
+    Args:
+        size: 계정과목 수
+        user_id: 사용자 ID
+        fan_out: 최상위 계정과목 수이자 계정과목별 하위 계정과목 수
+        with_ids: 1부터 시작하는 ID와 상위 계정과목 ID를 채울지 여부 (저장하지 않고 트리를 구성하는 측정용)
+
+    Returns:
+        계정과목 목록
+    """
+    chart_of_accounts: list[ChartOfAccount] = []
+    categories = cycle(AccountType)
+    pending: deque[tuple[str, AccountType, int | None]] = deque(
+        (str(index), next(categories), None) for index in range(1, fan_out + 1)
+    )
+    while pending and len(chart_of_accounts) < size:
+        code, category, parent_id = pending.popleft()
+        account_id = len(chart_of_accounts) + 1 if with_ids else None
+        chart_of_accounts.append(
+            ChartOfAccount(
+                user_id=user_id,
+                code=code,
+                name=f"account {code}",
+                category=category,
+                description=None,
+                parent_chart_of_account_id=parent_id,
+                id=account_id,
+            )
+        )
+        pending.extend((f"{code}_{index}", category, account_id) for index in range(1, fan_out + 1))
+    return chart_of_accounts
+
+
+class QueryCounter:
+    """
+    엔진에서 실행된 SQL 문 개수를 셉니다. (executemany 는 1회로 집계)
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        초기화
+
+        Args:
+            engine: 측정 대상 엔진
+        """
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *_: Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        """
+        Returns:
+            QueryCounter: 측정을 시작한 카운터
+        """
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """
+        측정을 종료합니다.
+        """
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+@dataclass
+class Measurement:
+    """
+    벤치마크 측정 결과
+    """
+
+    name: str
+    size: int
+    queries: int
+    seconds: float
+
+
+@contextmanager
+def measure(name: str, size: int, engine: Engine) -> Iterator[Measurement]:
+    """
+    블록 실행 동안의 SQL 문 개수와 경과 시간을 측정합니다.
+
+    Args:
+        name: 측정 이름
+        size: 입력 크기
+        engine: 측정 대상 엔진
+
+    Yields:
+        Measurement: 블록 종료 후 값이 채워지는 측정 결과
+    """
+    measurement = Measurement(name=name, size=size, queries=0, seconds=0.0)
+    with QueryCounter(engine) as counter:
+        started = time.perf_counter()
+        yield measurement
+        measurement.seconds = time.perf_counter() - started
+    measurement.queries = counter.count
+
+
+def print_measurements(measurements: list[Measurement]) -> None:
+    """
+    측정 결과를 표 형태로 출력합니다.
+
+    Args:
+        measurements: 측정 결과 목록
+    """
+    print(f"{'name':<24}{'size':>10}{'queries':>10}{'seconds':>12}")  # noqa: T201
+    for measurement in measurements:
+        print(  # noqa: T201
+            f"{measurement.name:<24}{measurement.size:>10}{measurement.queries:>10}{measurement.seconds:>12.4f}"
+        )
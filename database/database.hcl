@@ -42,6 +42,13 @@ table "chart_of_account" {
     comment = "계정과목 숨김 여부"
   }
 
+  column "currency" {
+    type = char(3)
+    null = false
+    default = "KRW"
+    comment = "계정과목 통화 코드 (ISO 4217, 분개 금액은 이 통화의 최소 단위 정수)"
+  }
+
   column "description" {
     type = text
     null = true
@@ -54,6 +61,13 @@ table "chart_of_account" {
     comment = "상위 계정과목 ID"
   }
 
+  column "depth" {
+    type = int
+    null = false
+    default = 0
+    comment = "계정과목 계층 깊이 (코드의 '_' 개수, 최상위 계정과목: 0)"
+  }
+
   column "created_at" {
     type = timestamp
     null = false
@@ -76,4 +90,338 @@ table "chart_of_account" {
     columns = [column.user_id, column.code]
     unique = true
   }
+
+  index "user_id_code_depth" {
+    columns = [column.user_id, column.code, column.depth]
+  }
+}
+
+table "journal_entry" {
+  schema = schema.personal_cpa
+  comment = "분개"
+
+  column "id" {
+    type = bigint
+    null = false
+    auto_increment = true
+  }
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID"
+  }
+
+  column "entry_date" {
+    type = date
+    null = false
+    comment = "거래일"
+  }
+
+  column "description" {
+    type = text
+    null = true
+    comment = "분개 설명"
+  }
+
+  column "created_at" {
+    type = timestamp
+    null = false
+    default = sql("CURRENT_TIMESTAMP")
+    comment = "생성 시간"
+  }
+
+  primary_key {
+    columns = [column.id]
+  }
+
+  index "journal_entry_user_id_entry_date" {
+    columns = [column.user_id, column.entry_date]
+  }
+}
+
+table "journal_line" {
+  schema = schema.personal_cpa
+  comment = "분개 줄 (차변/대변)"
+
+  column "id" {
+    type = bigint
+    null = false
+    auto_increment = true
+  }
+
+  column "journal_entry_id" {
+    type = bigint
+    null = false
+    comment = "분개 ID"
+  }
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID (분개와 동일, 조인 없는 기간 조회용)"
+  }
+
+  column "chart_of_account_id" {
+    type = int
+    null = false
+    comment = "계정과목 ID"
+  }
+
+  column "entry_date" {
+    type = date
+    null = false
+    comment = "거래일 (분개와 동일, 조인 없는 기간 조회용)"
+  }
+
+  column "debit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "차변 금액 (통화 최소 단위)"
+  }
+
+  column "credit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "대변 금액 (통화 최소 단위)"
+  }
+
+  column "description" {
+    type = text
+    null = true
+    comment = "적요"
+  }
+
+  primary_key {
+    columns = [column.id]
+  }
+
+  index "journal_line_chart_of_account_id_entry_date" {
+    columns = [column.chart_of_account_id, column.entry_date]
+  }
+
+  index "journal_line_user_id_entry_date_chart_of_account_id" {
+    columns = [column.user_id, column.entry_date, column.chart_of_account_id, column.debit, column.credit]
+  }
+
+  index "journal_line_journal_entry_id" {
+    columns = [column.journal_entry_id]
+  }
+}
+
+table "account_balance" {
+  schema = schema.personal_cpa
+  comment = "계정과목 기간별 잔액"
+
+  column "chart_of_account_id" {
+    type = int
+    null = false
+    comment = "계정과목 ID"
+  }
+
+  column "period" {
+    type = int
+    null = false
+    comment = "기간 (YYYYMM, 0 은 전체 기간)"
+  }
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID"
+  }
+
+  column "debit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "차변 합계 (하위 계정과목 포함)"
+  }
+
+  column "credit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "대변 합계 (하위 계정과목 포함)"
+  }
+
+  primary_key {
+    columns = [column.chart_of_account_id, column.period]
+  }
+
+  index "account_balance_user_id_period" {
+    columns = [column.user_id, column.period, column.chart_of_account_id, column.debit, column.credit]
+  }
+}
+
+table "closing_balance" {
+  schema = schema.personal_cpa
+  comment = "계정과목 마감 잔액"
+
+  column "chart_of_account_id" {
+    type = int
+    null = false
+    comment = "계정과목 ID"
+  }
+
+  column "period" {
+    type = int
+    null = false
+    comment = "마감 기간 (YYYYMM)"
+  }
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID"
+  }
+
+  column "debit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "기간 말까지의 차변 누계 (하위 계정과목 포함)"
+  }
+
+  column "credit" {
+    type = bigint
+    null = false
+    default = 0
+    comment = "기간 말까지의 대변 누계 (하위 계정과목 포함)"
+  }
+
+  primary_key {
+    columns = [column.chart_of_account_id, column.period]
+  }
+
+  index "closing_balance_user_id_period" {
+    columns = [column.user_id, column.period, column.chart_of_account_id, column.debit, column.credit]
+  }
+}
+
+table "period_close" {
+  schema = schema.personal_cpa
+  comment = "유저별 마감된 기간"
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID"
+  }
+
+  column "period" {
+    type = int
+    null = false
+    comment = "마감 기간 (YYYYMM)"
+  }
+
+  column "closed_at" {
+    type = timestamp
+    null = false
+    default = sql("CURRENT_TIMESTAMP")
+    comment = "마감 시간"
+  }
+
+  primary_key {
+    columns = [column.user_id, column.period]
+  }
+}
+
+table "period_close_job" {
+  schema = schema.personal_cpa
+  comment = "기간 마감 작업"
+
+  column "period" {
+    type = int
+    null = false
+    comment = "마감 기간 (YYYYMM)"
+  }
+
+  column "status" {
+    type = varchar(16)
+    null = false
+    comment = "진행 상태 (RUNNING, DONE)"
+  }
+
+  column "last_user_id" {
+    type = int
+    null = false
+    default = 0
+    comment = "마지막으로 마감한 사용자 ID"
+  }
+
+  column "closed_users" {
+    type = int
+    null = false
+    default = 0
+    comment = "마감한 사용자 수"
+  }
+
+  column "created_at" {
+    type = timestamp
+    null = false
+    default = sql("CURRENT_TIMESTAMP")
+    comment = "생성 시간"
+  }
+
+  column "updated_at" {
+    type = timestamp
+    null = false
+    default = sql("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")
+    comment = "수정 시간"
+  }
+
+  primary_key {
+    columns = [column.period]
+  }
+}
+
+table "fx_rate" {
+  schema = schema.personal_cpa
+  comment = "환율"
+
+  column "base_currency" {
+    type = char(3)
+    null = false
+    comment = "기준 통화 코드 (e.g. USD)"
+  }
+
+  column "quote_currency" {
+    type = char(3)
+    null = false
+    comment = "표시 통화 코드 (e.g. KRW)"
+  }
+
+  column "rate_date" {
+    type = date
+    null = false
+    comment = "환율 고시일 (다음 고시일 전까지 적용)"
+  }
+
+  column "rate" {
+    type = decimal(24,10)
+    null = false
+    comment = "기준 통화 1 단위의 표시 통화 금액"
+  }
+
+  primary_key {
+    columns = [column.base_currency, column.quote_currency, column.rate_date]
+  }
+}
+
+table "period_close_lock" {
+  schema = schema.personal_cpa
+  comment = "유저별 기간 마감 잠금 (기표 저장과 기간 마감이 함께 잠그는 행)"
+
+  column "user_id" {
+    type = int
+    null = false
+    comment = "사용자 ID"
+  }
+
+  primary_key {
+    columns = [column.user_id]
+  }
 }
\ No newline at end of file
@@ -0,0 +1,4 @@
+-- Modify "chart_of_account" table
+ALTER TABLE `chart_of_account` ADD COLUMN `depth` int NOT NULL DEFAULT 0 COMMENT "계정과목 계층 깊이 (코드의 '_' 개수, 최상위 계정과목: 0)" AFTER `parent_chart_of_account_id`, ADD INDEX `user_id_code_depth` (`user_id`, `code`, `depth`);
+-- Backfill "depth" from the code path
+UPDATE `chart_of_account` SET `depth` = CHAR_LENGTH(`code`) - CHAR_LENGTH(REPLACE(`code`, '_', ''));
@@ -0,0 +1,25 @@
+-- Create "journal_entry" table
+CREATE TABLE `journal_entry` (
+  `id` bigint NOT NULL AUTO_INCREMENT,
+  `user_id` int NOT NULL COMMENT "사용자 ID",
+  `entry_date` date NOT NULL COMMENT "거래일",
+  `description` text NULL COMMENT "분개 설명",
+  `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT "생성 시간",
+  PRIMARY KEY (`id`),
+  INDEX `journal_entry_user_id_entry_date` (`user_id`, `entry_date`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "분개";
+-- Create "journal_line" table
+CREATE TABLE `journal_line` (
+  `id` bigint NOT NULL AUTO_INCREMENT,
+  `journal_entry_id` bigint NOT NULL COMMENT "분개 ID",
+  `user_id` int NOT NULL COMMENT "사용자 ID (분개와 동일, 조인 없는 기간 조회용)",
+  `chart_of_account_id` int NOT NULL COMMENT "계정과목 ID",
+  `entry_date` date NOT NULL COMMENT "거래일 (분개와 동일, 조인 없는 기간 조회용)",
+  `debit` bigint NOT NULL DEFAULT 0 COMMENT "차변 금액 (통화 최소 단위)",
+  `credit` bigint NOT NULL DEFAULT 0 COMMENT "대변 금액 (통화 최소 단위)",
+  `description` text NULL COMMENT "적요",
+  PRIMARY KEY (`id`),
+  INDEX `journal_line_chart_of_account_id_entry_date` (`chart_of_account_id`, `entry_date`),
+  INDEX `journal_line_journal_entry_id` (`journal_entry_id`),
+  INDEX `journal_line_user_id_entry_date_chart_of_account_id` (`user_id`, `entry_date`, `chart_of_account_id`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "분개 줄 (차변/대변)";
@@ -0,0 +1,10 @@
+-- Create "account_balance" table
+CREATE TABLE `account_balance` (
+  `chart_of_account_id` int NOT NULL COMMENT "계정과목 ID",
+  `period` int NOT NULL COMMENT "기간 (YYYYMM, 0 은 전체 기간)",
+  `user_id` int NOT NULL COMMENT "사용자 ID",
+  `debit` bigint NOT NULL DEFAULT 0 COMMENT "차변 합계 (하위 계정과목 포함)",
+  `credit` bigint NOT NULL DEFAULT 0 COMMENT "대변 합계 (하위 계정과목 포함)",
+  PRIMARY KEY (`chart_of_account_id`, `period`),
+  INDEX `account_balance_user_id` (`user_id`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "계정과목 기간별 잔액";
@@ -0,0 +1,4 @@
+-- Modify "journal_line" table
+ALTER TABLE `journal_line` DROP INDEX `journal_line_user_id_entry_date_chart_of_account_id`, ADD INDEX `journal_line_user_id_entry_date_chart_of_account_id` (`user_id`, `entry_date`, `chart_of_account_id`, `debit`, `credit`);
+-- Modify "account_balance" table
+ALTER TABLE `account_balance` DROP INDEX `account_balance_user_id`, ADD INDEX `account_balance_user_id_period` (`user_id`, `period`, `chart_of_account_id`, `debit`, `credit`);
@@ -0,0 +1,27 @@
+-- Create "closing_balance" table
+CREATE TABLE `closing_balance` (
+  `chart_of_account_id` int NOT NULL COMMENT "계정과목 ID",
+  `period` int NOT NULL COMMENT "마감 기간 (YYYYMM)",
+  `user_id` int NOT NULL COMMENT "사용자 ID",
+  `debit` bigint NOT NULL DEFAULT 0 COMMENT "기간 말까지의 차변 누계 (하위 계정과목 포함)",
+  `credit` bigint NOT NULL DEFAULT 0 COMMENT "기간 말까지의 대변 누계 (하위 계정과목 포함)",
+  PRIMARY KEY (`chart_of_account_id`, `period`),
+  INDEX `closing_balance_user_id_period` (`user_id`, `period`, `chart_of_account_id`, `debit`, `credit`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "계정과목 마감 잔액";
+-- Create "period_close" table
+CREATE TABLE `period_close` (
+  `user_id` int NOT NULL COMMENT "사용자 ID",
+  `period` int NOT NULL COMMENT "마감 기간 (YYYYMM)",
+  `closed_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT "마감 시간",
+  PRIMARY KEY (`user_id`, `period`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "유저별 마감된 기간";
+-- Create "period_close_job" table
+CREATE TABLE `period_close_job` (
+  `period` int NOT NULL COMMENT "마감 기간 (YYYYMM)",
+  `status` varchar(16) NOT NULL COMMENT "진행 상태 (RUNNING, DONE)",
+  `last_user_id` int NOT NULL DEFAULT 0 COMMENT "마지막으로 마감한 사용자 ID",
+  `closed_users` int NOT NULL DEFAULT 0 COMMENT "마감한 사용자 수",
+  `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT "생성 시간",
+  `updated_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT "수정 시간",
+  PRIMARY KEY (`period`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "기간 마감 작업";
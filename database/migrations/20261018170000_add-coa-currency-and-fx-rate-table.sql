@@ -0,0 +1,10 @@
+-- Modify "chart_of_account" table
+ALTER TABLE `chart_of_account` ADD COLUMN `currency` char(3) NOT NULL DEFAULT "KRW" COMMENT "계정과목 통화 코드 (ISO 4217, 분개 금액은 이 통화의 최소 단위 정수)" AFTER `is_hidden`;
+-- Create "fx_rate" table
+CREATE TABLE `fx_rate` (
+  `base_currency` char(3) NOT NULL COMMENT "기준 통화 코드 (e.g. USD)",
+  `quote_currency` char(3) NOT NULL COMMENT "표시 통화 코드 (e.g. KRW)",
+  `rate_date` date NOT NULL COMMENT "환율 고시일 (다음 고시일 전까지 적용)",
+  `rate` decimal(24,10) NOT NULL COMMENT "기준 통화 1 단위의 표시 통화 금액",
+  PRIMARY KEY (`base_currency`, `quote_currency`, `rate_date`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "환율";
@@ -0,0 +1,5 @@
+-- Create "period_close_lock" table
+CREATE TABLE `period_close_lock` (
+  `user_id` int NOT NULL COMMENT "사용자 ID",
+  PRIMARY KEY (`user_id`)
+) CHARSET utf8mb4 COLLATE utf8mb4_0900_ai_ci COMMENT "유저별 기간 마감 잠금 (기표 저장과 기간 마감이 함께 잠그는 행)";
@@ -0,0 +1,268 @@
+"""
+유즈케이스 실행기 모듈.
+
+동기 서비스(PyMySQL)를 이벤트 루프에서 그대로 실행하거나(inline),
+DB 커넥션 풀 크기로 제한된 전용 스레드 풀에서 실행합니다(threadpool).
+비동기 서비스(DB_MODE=async)는 모드와 무관하게 이벤트 루프에서 await 합니다.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from dataclasses import asdict, dataclass
+import functools
+import inspect
+import itertools
+import threading
+import time
+from typing import Any, Callable, Literal, TypeVar
+
+T = TypeVar("T")
+
+_END_OF_STREAM = object()
+
+ExecutionMode = Literal["inline", "threadpool"]
+
+
+@dataclass(frozen=True)
+class UseCaseExecutorStats:
+    """
+    유즈케이스 실행기 통계
+
+    Args:
+        mode: 실행 모드 (inline | threadpool)
+        max_workers: 최대 작업 스레드 수 (inline 모드는 0)
+        running: 실행 중인 작업 수
+        queued: 작업 스레드를 기다리는 작업 수
+        max_queued: 관측된 최대 대기 작업 수
+        completed: 완료된 작업 수
+        total_wait_seconds: 작업 스레드를 기다린 누적 시간(초)
+        max_wait_seconds: 작업 스레드를 기다린 최대 시간(초)
+    """
+
+    mode: str
+    max_workers: int = 0
+    running: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    completed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """
+        Returns:
+            작업당 평균 대기 시간(초)
+        """
+        return self.total_wait_seconds / self.completed if self.completed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            통계 항목별 값
+        """
+        return {**asdict(self), "average_wait_seconds": self.average_wait_seconds}
+
+
+class UseCaseExecutor:
+    """
+    유즈케이스 실행기
+
+    threadpool 모드의 작업 스레드 수는 DB 커넥션 풀 크기와 같게 두어
+    풀이 처리할 수 있는 것보다 많은 DB 작업이 동시에 실행되지 않도록 합니다.
+    초과한 작업은 실행기 큐에서 대기하며, 대기 작업 수와 대기 시간을 통계로 노출합니다.
+    """
+
+    def __init__(self, mode: ExecutionMode, max_workers: int):
+        """
+        초기화
+
+        Args:
+            mode: 실행 모드 (inline | threadpool)
+            max_workers: threadpool 모드의 최대 작업 스레드 수
+
+        Raises:
+            ValueError: 지원하지 않는 실행 모드이거나 작업 스레드 수가 1보다 작을 경우 발생
+        """
+        if mode not in ("inline", "threadpool"):
+            raise ValueError(f"Unsupported use case execution mode: {mode}")
+        if mode == "threadpool" and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._mode = mode
+        self._max_workers = max_workers if mode == "threadpool" else 0
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="use-case") if mode == "threadpool" else None
+        )
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        유즈케이스 실행
+
+        Args:
+            func: 유즈케이스 메서드 (동기 또는 비동기)
+            *args: 유즈케이스 인자
+
+        Returns:
+            유즈케이스 결과 값
+        """
+        if self._executor is None or inspect.iscoroutinefunction(func):
+            result = func(*args)
+            if inspect.isawaitable(result):
+                return await result
+            return result
+
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        context = contextvars.copy_context()
+        call = functools.partial(self._call, func, args, time.perf_counter())
+        return await asyncio.get_running_loop().run_in_executor(self._executor, context.run, call)
+
+    async def stream(
+        self, func: Callable[..., Iterable[T] | AsyncIterator[T]], *args: Any, chunk_size: int = 1000
+    ) -> AsyncIterator[list[T]]:
+        """
+        스트리밍 유즈케이스를 `chunk_size`개씩 묶어 순회
+
+        동기 이터레이터는 DB 세션이 스레드에 묶여 있으므로 처음부터 끝까지 하나의 스레드에서 순회해야 합니다.
+        threadpool 모드에서는 작업 스레드 하나가 끝까지 순회하며 크기 2의 큐로 묶음을 넘기고(역압),
+        소비가 중단되면 작업 스레드가 이터레이터를 닫아 연결을 반환합니다.
+
+        Args:
+            func: 이터레이터를 반환하는 유즈케이스 메서드 (동기 또는 비동기)
+            *args: 유즈케이스 인자
+            chunk_size: 묶음 크기
+
+        Yields:
+            항목 묶음
+        """
+        iterable = func(*args)
+        if isinstance(iterable, AsyncIterator):
+            chunk = []
+            async for item in iterable:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+            return
+
+        if self._executor is None:
+            for chunk in _chunked(iterable, chunk_size):
+                yield chunk
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=2)
+        stopped = threading.Event()
+
+        def produce() -> None:
+            iterator = iter(iterable)
+            try:
+                for chunk in _chunked(iterator, chunk_size):
+                    if stopped.is_set():
+                        break
+                    asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+                item = _END_OF_STREAM
+            except Exception as exception:
+                item = exception
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            if not stopped.is_set():
+                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        context = contextvars.copy_context()
+        call = functools.partial(self._call, produce, (), time.perf_counter())
+        producer = loop.run_in_executor(self._executor, context.run, call)
+        try:
+            while (item := await queue.get()) is not _END_OF_STREAM:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+
+    def _call(self, func: Callable[..., T], args: tuple[Any, ...], submitted_at: float) -> T:
+        """
+        작업 스레드에서 유즈케이스를 실행하고 대기 시간을 기록
+
+        Args:
+            func: 유즈케이스 메서드
+            args: 유즈케이스 인자
+            submitted_at: 작업 제출 시각 (perf_counter)
+
+        Returns:
+            유즈케이스 결과 값
+        """
+        wait_seconds = time.perf_counter() - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def stats(self) -> UseCaseExecutorStats:
+        """
+        Returns:
+            실행기 통계
+        """
+        with self._lock:
+            return UseCaseExecutorStats(
+                mode=self._mode,
+                max_workers=self._max_workers,
+                running=self._running,
+                queued=self._queued,
+                max_queued=self._max_queued,
+                completed=self._completed,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+    def shutdown(self) -> None:
+        """
+        작업 스레드 종료 (실행 중인 작업은 완료될 때까지 기다림)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+def _chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """
+    Args:
+        iterable: 항목 이터러블
+        chunk_size: 묶음 크기
+
+    Yields:
+        `chunk_size`개 이하의 항목 묶음
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
@@ -0,0 +1,317 @@
+"""
+요청 지표 모듈.
+
+요청 수, 지연 시간 히스토그램, 처리 중인 요청 수를 라우트 템플릿(예: `/api/v1/chart_of_accounts/{code}`)별로 집계하고
+Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 원래 URL 대신 템플릿을 레이블로 쓰므로 시계열 수가 라우트 수로 제한됩니다.
+
+요청마다 실행한 SQL 문 수와 DB 시간도 함께 집계하여 응답 헤더(`X-DB-Query-Count`, `X-DB-Query-Time-Ms`)와
+라우트별 지표로 내보내고, 설정한 SQL 문 예산을 넘은 요청을 경고하거나 실패시킵니다.
+
+요청 경로의 비용을 줄이기 위해 순수 ASGI 미들웨어로 동작하며, 요청마다 버킷 탐색(bisect) 1회와 dict 갱신만 합니다.
+모든 갱신은 이벤트 루프 스레드에서 일어나므로 잠금을 쓰지 않습니다.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+import logging
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutorStats
+from personal_cpa.database import PoolStats
+from personal_cpa.query_stats import QueryBudgetMode, track_queries
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "personal_cpa"
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _LatencySeries:
+    """
+    라우트별 지연 시간 히스토그램 (버킷별 개수는 누적되지 않은 값으로 보관)
+    """
+
+    __slots__ = ("bucket_counts", "count", "db_seconds", "statements", "total_seconds")
+
+    def __init__(self, bucket_size: int):
+        """
+        초기화
+
+        Args:
+            bucket_size: 버킷 수 (+Inf 버킷 포함)
+        """
+        self.bucket_counts = [0] * bucket_size
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+class HttpMetrics:
+    """
+    HTTP 요청 지표
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        초기화
+
+        Args:
+            buckets: 지연 시간 히스토그램 버킷 상한(초) 목록
+
+        Raises:
+            ValueError: 버킷이 비어 있거나 오름차순이 아닐 경우 발생
+        """
+        self.buckets = tuple(buckets)
+        if not self.buckets or list(self.buckets) != sorted(set(self.buckets)):
+            raise ValueError(f"buckets must be non-empty and strictly increasing, got {self.buckets}")
+
+        self.in_flight = 0
+        self._requests: dict[tuple[str, str, int], int] = {}
+        self._latencies: dict[tuple[str, str], _LatencySeries] = {}
+
+    def observe(
+        self, method: str, route: str, status_code: int, seconds: float, statements: int = 0, db_seconds: float = 0.0
+    ) -> None:
+        """
+        완료된 요청 기록
+
+        Args:
+            method: HTTP 메서드
+            route: 라우트 템플릿
+            status_code: 응답 상태 코드
+            seconds: 처리 시간(초)
+            statements: 실행한 SQL 문 수
+            db_seconds: SQL 실행 시간(초)
+        """
+        request_key = (method, route, status_code)
+        self._requests[request_key] = self._requests.get(request_key, 0) + 1
+
+        latency_key = (method, route)
+        series = self._latencies.get(latency_key)
+        if series is None:
+            series = self._latencies[latency_key] = _LatencySeries(len(self.buckets) + 1)
+        series.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        series.count += 1
+        series.total_seconds += seconds
+        series.statements += statements
+        series.db_seconds += db_seconds
+
+    def render(self) -> str:
+        """
+        Returns:
+            Prometheus 텍스트 형식의 요청 지표
+        """
+        lines = [
+            f"# HELP {METRIC_PREFIX}_http_requests_total Total HTTP requests by route template and status code.",
+            f"# TYPE {METRIC_PREFIX}_http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(self._requests.items()):
+            labels = _labels(method=method, route=route, status=str(status_code))
+            lines.append(f"{METRIC_PREFIX}_http_requests_total{labels} {count}")
+
+        name = f"{METRIC_PREFIX}_http_request_duration_seconds"
+        lines += [f"# HELP {name} HTTP request latency by route template.", f"# TYPE {name} histogram"]
+        upper_bounds = [_format_value(bucket) for bucket in self.buckets] + ["+Inf"]
+        for (method, route), series in sorted(self._latencies.items()):
+            cumulative = 0
+            for upper_bound, bucket_count in zip(upper_bounds, series.bucket_counts, strict=True):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{_labels(method=method, route=route, le=upper_bound)} {cumulative}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"{name}_sum{labels} {_format_value(series.total_seconds)}")
+            lines.append(f"{name}_count{labels} {series.count}")
+
+        for suffix, description, attribute in (
+            ("db_statements_total", "SQL statements executed by route template.", "statements"),
+            ("db_seconds_total", "Time spent executing SQL statements by route template.", "db_seconds"),
+        ):
+            name = f"{METRIC_PREFIX}_http_{suffix}"
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for (method, route), series in sorted(self._latencies.items()):
+                value = _format_value(getattr(series, attribute))
+                lines.append(f"{name}{_labels(method=method, route=route)} {value}")
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_http_requests_in_flight HTTP requests currently being processed.",
+            f"# TYPE {METRIC_PREFIX}_http_requests_in_flight gauge",
+            f"{METRIC_PREFIX}_http_requests_in_flight {self.in_flight}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    요청 지표를 기록하는 ASGI 미들웨어
+
+    응답 본문을 모두 보낼 때까지의 시간을 기록하므로 스트리밍 응답은 전송 시간까지 포함합니다.
+    SQL 문 수 응답 헤더는 응답 시작 시점의 값이므로, 스트리밍 응답에서는 본문 전송 중 실행한 SQL 문이 빠집니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: Callable[[], HttpMetrics],
+        query_budget: int | None = None,
+        query_budget_mode: QueryBudgetMode = "warn",
+    ):
+        """
+        초기화
+
+        Args:
+            app: 다음 ASGI 애플리케이션
+            metrics: 요청 지표 제공자 (컨테이너의 싱글톤 provider)
+            query_budget: 요청당 허용하는 최대 SQL 문 수 (None 이면 제한 없음)
+            query_budget_mode: 예산 초과 시 동작 (warn: 경고 로그, error: 초과하는 SQL 문에서 요청 실패)
+        """
+        self.app = app
+        self.metrics = metrics
+        self.query_budget = query_budget
+        self.query_budget_mode = query_budget_mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Args:
+            scope: ASGI 스코프
+            receive: ASGI receive 채널
+            send: ASGI send 채널
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics()
+        status_code = 500
+
+        with track_queries(self.query_budget, self.query_budget_mode) as query_stats:
+
+            async def send_with_status(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-db-query-count", str(query_stats.statements).encode()),
+                        (b"x-db-query-time-ms", f"{query_stats.seconds * 1000:.3f}".encode()),
+                    ]
+                await send(message)
+
+            metrics.in_flight += 1
+            started = time.perf_counter()
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                seconds = time.perf_counter() - started
+                metrics.in_flight -= 1
+                route = scope.get("route")
+                route_path = route.path if route else UNMATCHED_ROUTE
+                metrics.observe(
+                    scope["method"], route_path, status_code, seconds, query_stats.statements, query_stats.seconds
+                )
+                if query_stats.over_budget:
+                    logger.warning(
+                        f"Query budget exceeded: {scope['method']} {route_path} executed "
+                        f"{query_stats.statements} statements (budget: {query_stats.budget})"
+                    )
+
+
+def render_pool_metrics(stats: PoolStats) -> str:
+    """
+    DB 커넥션 풀 통계를 Prometheus 텍스트 형식으로 변환합니다.
+
+    Args:
+        stats: 커넥션 풀 통계
+
+    Returns:
+        Prometheus 텍스트 형식의 커넥션 풀 지표
+    """
+    gauges = (
+        ("size", "Configured number of pooled connections.", stats.size),
+        ("checked_out", "Connections currently checked out of the pool.", stats.checked_out),
+        ("checked_in", "Idle connections currently in the pool.", stats.checked_in),
+        ("overflow", "Connections opened beyond the pool size.", stats.overflow),
+    )
+    counters = (
+        ("waits_total", "Checkouts that waited for a connection to be returned.", stats.waits),
+        ("wait_seconds_total", "Total time spent waiting for a connection.", stats.wait_seconds),
+        ("timeouts_total", "Checkouts that failed after waiting for the pool timeout.", stats.timeouts),
+    )
+    return _render_stats_metrics("db_pool", gauges, counters)
+
+
+def render_executor_metrics(stats: UseCaseExecutorStats) -> str:
+    """
+    유즈케이스 실행기(스레드 풀) 통계를 Prometheus 텍스트 형식으로 변환합니다.
+
+    Args:
+        stats: 유즈케이스 실행기 통계
+
+    Returns:
+        Prometheus 텍스트 형식의 실행기 지표 (inline 모드는 작업 스레드 수가 0)
+    """
+    gauges = (
+        ("max_workers", "Worker threads available to synchronous use cases.", stats.max_workers),
+        ("running", "Use cases currently running on a worker thread.", stats.running),
+        ("queued", "Use cases currently waiting for a worker thread.", stats.queued),
+        ("max_queued", "Largest number of use cases observed waiting for a worker thread.", stats.max_queued),
+        ("max_wait_seconds", "Longest time a use case waited for a worker thread.", stats.max_wait_seconds),
+    )
+    counters = (
+        ("completed_total", "Use cases completed on a worker thread.", stats.completed),
+        ("wait_seconds_total", "Total time use cases spent waiting for a worker thread.", stats.total_wait_seconds),
+    )
+    return _render_stats_metrics("executor", gauges, counters)
+
+
+def _render_stats_metrics(
+    subsystem: str, gauges: Iterable[tuple[str, str, float]], counters: Iterable[tuple[str, str, float]]
+) -> str:
+    """
+    Args:
+        subsystem: 지표 이름의 하위 시스템 (예: `db_pool`)
+        gauges: (이름 접미사, 설명, 값) 게이지 목록
+        counters: (이름 접미사, 설명, 값) 카운터 목록
+
+    Returns:
+        Prometheus 텍스트 형식의 지표
+    """
+    lines = []
+    for metric_type, metrics in (("gauge", gauges), ("counter", counters)):
+        for suffix, description, value in metrics:
+            name = f"{METRIC_PREFIX}_{subsystem}_{suffix}"
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}", f"{name} {_format_value(value)}"]
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: Any) -> str:
+    """
+    Args:
+        **labels: 레이블 이름별 값
+
+    Returns:
+        Prometheus 레이블 문자열 (예: `{method="GET",route="/"}`)
+    """
+    escaped = (
+        f'{name}="{str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')}"'
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    """
+    Args:
+        value: 지표 값
+
+    Returns:
+        Prometheus 숫자 표기 (정수 값은 소수점 없이)
+    """
+    return str(int(value)) if float(value).is_integer() else repr(value)
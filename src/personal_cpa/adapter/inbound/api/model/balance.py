@@ -0,0 +1,42 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AccountBalanceResponse(BaseModel):
+    """
+    계정과목 잔액 응답 (하위 계정과목 포함)
+    """
+
+    code: str
+    chart_of_account_id: int
+    period: int = Field(description="기간 (YYYYMM, 전체 기간은 0)")
+    debit: int = Field(description="차변 합계")
+    credit: int = Field(description="대변 합계")
+    balance: int = Field(description="잔액 (차변 합계 - 대변 합계)")
+
+
+class AccountBalanceMismatchResponse(BaseModel):
+    """
+    계정과목 잔액 차이 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    chart_of_account_id: int
+    period: int
+    expected_debit: int = Field(description="분개 줄로 계산한 차변 합계")
+    expected_credit: int = Field(description="분개 줄로 계산한 대변 합계")
+    actual_debit: int = Field(description="저장된 차변 합계")
+    actual_credit: int = Field(description="저장된 대변 합계")
+
+
+class AccountBalanceCheckResponse(BaseModel):
+    """
+    계정과목 잔액 정합성 검사 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    checked: int = Field(description="검사한 (계정과목, 기간) 수")
+    consistent: bool = Field(description="저장된 잔액이 분개 줄과 일치하는지 여부")
+    repaired: bool = Field(description="다시 계산한 잔액으로 바꿨는지 여부")
+    mismatches: list[AccountBalanceMismatchResponse]
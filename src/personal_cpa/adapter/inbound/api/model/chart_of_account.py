@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from personal_cpa.domain.currency import DEFAULT_CURRENCY
 from personal_cpa.domain.enum.chart_of_account import AccountType
 
 
@@ -54,6 +55,7 @@ class CreateChartOfAccountRequest(CategoryValidationMixin, BaseModel):
         category: 계정과목 카테고리
         description: 계정과목 설명
         parent_code: 상위 계정과목 코드
+        currency: 계정과목 통화 코드
     """
 
     class Config:
@@ -68,6 +70,7 @@ class CreateChartOfAccountRequest(CategoryValidationMixin, BaseModel):
     category: int
     description: str | None
     parent_code: str | None = None
+    currency: str = Field(DEFAULT_CURRENCY, description="계정과목 통화 코드 (ISO 4217, 분개 금액의 통화)")
 
 
 class ChartOfAccountResponse(BaseModel):
@@ -84,6 +87,7 @@ class ChartOfAccountResponse(BaseModel):
     )
     description: str | None
     parent_chart_of_account_id: int | None
+    currency: str
 
 
 class ChartOfAccountSummaryResponse(BaseModel):
@@ -99,6 +103,33 @@ class ChartOfAccountSummaryResponse(BaseModel):
         description=f"계정과목 카테고리({', '.join([account_type.name for account_type in AccountType])})"
     )
     children: list[ChartOfAccountSummaryResponse] | None
+    child_count: int = Field(0, description="하위 계정과목 수 (깊이 제한으로 children 에 포함되지 않은 계정과목 포함)")
+    has_children: bool = Field(False, description="하위 계정과목 존재 여부 (지연 펼치기용)")
+
+
+class ChartOfAccountImportErrorResponse(BaseModel):
+    """
+    계정과목 가져오기 행 오류 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    line: int = Field(description="파일의 행 번호")
+    code: str | None
+    message: str
+
+
+class ChartOfAccountImportResponse(BaseModel):
+    """
+    계정과목 가져오기 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    created: int = Field(description="생성된 계정과목 수")
+    chunks: int = Field(description="커밋한 묶음 수")
+    failed: int = Field(description="실패한 행 수")
+    errors: list[ChartOfAccountImportErrorResponse]
 
 
 class UpdateChartOfAccountRequest(CategoryValidationMixin, BaseModel):
@@ -0,0 +1,63 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class FxRateResponse(BaseModel):
+    """
+    환율 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    base_currency: str
+    quote_currency: str
+    rate_date: date = Field(description="기준일")
+    rate: Decimal = Field(description="기준 통화 1 단위의 표시 통화 금액")
+
+
+class FxRateImportResponse(BaseModel):
+    """
+    환율 가져오기 응답
+    """
+
+    imported: int = Field(description="저장한 환율 수")
+
+
+class ConvertAmountRequest(BaseModel):
+    """
+    환산할 금액
+
+    Args:
+        amount: 통화 최소 단위 금액
+        currency: 통화 코드
+    """
+
+    amount: int = Field(description="통화 최소 단위 정수 금액")
+    currency: str
+
+
+class ConvertAmountsRequest(BaseModel):
+    """
+    금액 일괄 환산 요청
+
+    Args:
+        to_currency: 환산할 통화 코드
+        on: 기준일
+        amounts: 환산할 금액 목록
+    """
+
+    to_currency: str
+    on: date
+    amounts: list[ConvertAmountRequest]
+
+
+class ConvertAmountsResponse(BaseModel):
+    """
+    금액 일괄 환산 응답
+    """
+
+    currency: str = Field(description="환산한 통화 코드")
+    on: date = Field(description="기준일")
+    amounts: list[int] = Field(description="환산 통화 최소 단위 금액 목록 (요청 순서)")
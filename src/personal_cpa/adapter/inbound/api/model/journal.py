@@ -0,0 +1,88 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PostJournalLineRequest(BaseModel):
+    """
+    분개 줄 기표 요청
+
+    Args:
+        chart_of_account_id: 계정과목 ID
+        debit: 차변 금액
+        credit: 대변 금액
+        description: 적요
+    """
+
+    chart_of_account_id: int
+    debit: int = Field(0, ge=0, description="차변 금액 (통화 최소 단위 정수)")
+    credit: int = Field(0, ge=0, description="대변 금액 (통화 최소 단위 정수)")
+    description: str | None = None
+
+
+class PostJournalEntryRequest(BaseModel):
+    """
+    분개 기표 요청
+
+    Args:
+        entry_date: 거래일
+        description: 분개 설명
+        lines: 분개 줄 기표 요청 목록
+    """
+
+    entry_date: date
+    description: str | None = None
+    lines: list[PostJournalLineRequest]
+
+
+class PostJournalEntriesResponse(BaseModel):
+    """
+    분개 기표 응답
+    """
+
+    posted: int = Field(description="기표한 분개 수")
+    lines: int = Field(description="기표한 분개 줄 수")
+    journal_entry_ids: list[int] = Field(description="기표한 분개 ID 목록 (요청 순서)")
+
+
+class JournalLineResponse(BaseModel):
+    """
+    분개 줄 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    chart_of_account_id: int
+    debit: int
+    credit: int
+    description: str | None
+
+
+class JournalEntryResponse(BaseModel):
+    """
+    분개 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    entry_date: date
+    description: str | None
+    amount: int = Field(description="분개 금액 (차변 합계 = 대변 합계)")
+    lines: list[JournalLineResponse]
+
+
+class LedgerLineResponse(BaseModel):
+    """
+    원장 줄 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    journal_entry_id: int
+    entry_date: date
+    debit: int
+    credit: int
+    description: str | None
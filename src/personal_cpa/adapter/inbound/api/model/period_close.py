@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from personal_cpa.domain.enum.period_close import PeriodCloseStatus
+
+
+class PeriodCloseJobResponse(BaseModel):
+    """
+    기간 마감 작업 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True, json_encoders={PeriodCloseStatus: lambda v: v.name})
+
+    period: int = Field(description="마감 기간 (YYYYMM)")
+    status: PeriodCloseStatus
+    last_user_id: int = Field(description="마지막으로 마감한 유저 ID")
+    closed_users: int = Field(description="마감한 유저 수")
+    done: bool = Field(description="모든 유저의 마감이 끝났는지 여부")
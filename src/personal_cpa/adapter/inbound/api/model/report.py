@@ -0,0 +1,73 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+class ReportLineResponse(BaseModel):
+    """
+    재무 보고서 계정과목 줄 응답 (하위 계정과목 포함)
+    """
+
+    model_config = ConfigDict(from_attributes=True, json_encoders={AccountType: lambda v: v.name})
+
+    chart_of_account_id: int
+    code: str
+    name: str
+    category: AccountType
+    depth: int
+    debit: int = Field(description="차변 합계")
+    credit: int = Field(description="대변 합계")
+    amount: int = Field(description="계정 유형의 증가 방향 기준 금액")
+
+
+class TrialBalanceResponse(BaseModel):
+    """
+    시산표 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start_date: date
+    end_date: date
+    currency: str = Field(description="보고 통화 코드 (금액은 이 통화의 최소 단위 정수)")
+    total_debit: int = Field(description="차변 합계")
+    total_credit: int = Field(description="대변 합계")
+    lines: list[ReportLineResponse]
+
+
+class IncomeStatementResponse(BaseModel):
+    """
+    손익계산서 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start_date: date
+    end_date: date
+    currency: str = Field(description="보고 통화 코드 (금액은 이 통화의 최소 단위 정수)")
+    total_revenue: int = Field(description="수익 합계")
+    total_expense: int = Field(description="비용 합계")
+    net_income: int = Field(description="당기순이익")
+    revenues: list[ReportLineResponse]
+    expenses: list[ReportLineResponse]
+
+
+class BalanceSheetResponse(BaseModel):
+    """
+    재무상태표 응답
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    as_of: date
+    currency: str = Field(description="보고 통화 코드 (금액은 이 통화의 최소 단위 정수)")
+    total_assets: int = Field(description="자산 합계")
+    total_liabilities: int = Field(description="부채 합계")
+    total_equity: int = Field(description="자본 합계 (이익잉여금, 환산 차이 포함)")
+    retained_earnings: int = Field(description="기준일까지의 누적 순이익")
+    translation_adjustment: int = Field(description="계정과목별 환산에서 생긴 환산 차이")
+    assets: list[ReportLineResponse]
+    liabilities: list[ReportLineResponse]
+    equity: list[ReportLineResponse]
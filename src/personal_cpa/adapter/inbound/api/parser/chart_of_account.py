@@ -0,0 +1,204 @@
+"""
+계정과목 가져오기 파서 모듈.
+
+요청 본문을 조각 단위로 받아 행 단위로 나누어 파싱하므로, 업로드 파일 전체를 한 번에 메모리에 올리지 않습니다.
+행마다 `CreateChartOfAccountRequest`로 검증하여 생성 명령을 만들고, 실패한 행은 오류 메시지를 담아 넘깁니다.
+내보내기(`GET /export`) 파일을 그대로 가져올 수 있도록 카테고리는 `AccountType` 이름과 숫자를 모두 받습니다.
+"""
+
+import codecs
+from collections.abc import AsyncIterator
+import csv
+import json
+from typing import Any, Literal
+
+from pydantic import ValidationError
+
+from personal_cpa.adapter.inbound.api.model.chart_of_account import CreateChartOfAccountRequest
+from personal_cpa.application.port.input.command.chart_of_account import (
+    CreateChartOfAccountCommand,
+    ImportChartOfAccountRow,
+)
+from personal_cpa.domain.currency import DEFAULT_CURRENCY
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+ImportFormat = Literal["ndjson", "csv"]
+
+REQUIRED_IMPORT_COLUMNS = ("code", "name", "category")
+
+
+async def parse_import_rows(chunks: AsyncIterator[bytes], import_format: ImportFormat) -> list[ImportChartOfAccountRow]:
+    """
+    가져오기 파일을 계정과목 가져오기 행 목록으로 파싱 (점진적)
+
+    빈 행은 건너뜁니다. CSV 는 첫 행이 헤더여야 하며, 따옴표로 감싼 값 안의 줄바꿈을 허용합니다.
+    (여러 줄에 걸친 행의 행 번호는 시작 줄 번호)
+
+    Args:
+        chunks: 요청 본문 조각 이터레이터
+        import_format: 가져오기 형식 (ndjson | csv)
+
+    Returns:
+        계정과목 가져오기 행 목록 (파일 순서)
+
+    Raises:
+        ValueError: CSV 헤더가 없거나 필수 컬럼이 빠졌을 경우 발생
+    """
+    rows: list[ImportChartOfAccountRow] = []
+    header: list[str] | None = None
+    record, record_line = "", 0
+
+    async for line_number, line in _iter_lines(chunks):
+        if import_format == "ndjson":
+            if line.strip():
+                rows.append(_parse_ndjson_line(line_number, line))
+            continue
+
+        if record:
+            record += "\n" + line
+        elif line.strip():
+            record, record_line = line, line_number
+        else:
+            continue
+
+        if record.count('"') % 2:
+            continue
+
+        values = next(csv.reader([record]))
+        record = ""
+        if header is None:
+            header = _read_header(values)
+        else:
+            rows.append(_to_import_row(record_line, dict(zip(header, values, strict=False))))
+
+    if record:
+        rows.append(ImportChartOfAccountRow(line=record_line, code=None, error="Unterminated quoted field"))
+    if import_format == "csv" and header is None:
+        raise ValueError("CSV header is required")
+
+    return rows
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """
+    Args:
+        chunks: 요청 본문 조각 이터레이터 (UTF-8, BOM 허용)
+
+    Yields:
+        (행 번호, 행 문자열) (줄바꿈 문자 제외)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_number = 0
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.removesuffix("\r")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_number + 1, buffer.removesuffix("\r")
+
+
+def _read_header(values: list[str]) -> list[str]:
+    """
+    Args:
+        values: CSV 첫 행의 값 목록
+
+    Returns:
+        컬럼 이름 목록
+
+    Raises:
+        ValueError: 필수 컬럼이 빠졌을 경우 발생
+    """
+    header = [value.strip() for value in values]
+    missing = [column for column in REQUIRED_IMPORT_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing required columns: {', '.join(missing)}")
+
+    return header
+
+
+def _parse_ndjson_line(line_number: int, line: str) -> ImportChartOfAccountRow:
+    """
+    Args:
+        line_number: 행 번호
+        line: JSON 객체 한 줄
+
+    Returns:
+        계정과목 가져오기 행
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as value_error:
+        return ImportChartOfAccountRow(line=line_number, code=None, error=f"Invalid JSON: {value_error}")
+
+    if not isinstance(record, dict):
+        return ImportChartOfAccountRow(line=line_number, code=None, error="Row must be a JSON object")
+
+    return _to_import_row(line_number, record)
+
+
+def _to_import_row(line_number: int, record: dict[str, Any]) -> ImportChartOfAccountRow:
+    """
+    행 값을 검증하여 계정과목 가져오기 행으로 변환합니다.
+
+    Args:
+        line_number: 행 번호
+        record: 컬럼별 값
+
+    Returns:
+        계정과목 가져오기 행 (검증에 실패하면 오류 메시지를 가짐)
+    """
+    code = record.get("code") if isinstance(record.get("code"), str) else None
+
+    try:
+        request = CreateChartOfAccountRequest.model_validate(
+            {
+                "code": record.get("code"),
+                "name": record.get("name"),
+                "category": _to_category(record.get("category")),
+                "description": record.get("description") or None,
+                "parent_code": record.get("parent_code") or None,
+                "currency": record.get("currency") or DEFAULT_CURRENCY,
+            }
+        )
+        command = CreateChartOfAccountCommand(
+            code=request.code,
+            name=request.name,
+            category=request.get_category_enum(),
+            description=request.description,
+            parent_code=request.parent_code,
+            currency=request.currency,
+        )
+    except ValidationError as validation_error:
+        message = "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in validation_error.errors()
+        )
+        return ImportChartOfAccountRow(line=line_number, code=code, error=message)
+    except ValueError as value_error:
+        return ImportChartOfAccountRow(line=line_number, code=code, error=str(value_error))
+
+    return ImportChartOfAccountRow(line=line_number, code=command.code, command=command)
+
+
+def _to_category(value: Any) -> Any:
+    """
+    Args:
+        value: 카테고리 값 (숫자, 숫자 문자열 또는 `AccountType` 이름)
+
+    Returns:
+        카테고리 숫자 (변환할 수 없으면 원래 값을 그대로 반환하여 요청 검증에서 실패하게 함)
+    """
+    if not isinstance(value, str):
+        return value
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    account_type = AccountType.__members__.get(value.upper())
+    return account_type.value if account_type else value
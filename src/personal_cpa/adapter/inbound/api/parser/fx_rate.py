@@ -0,0 +1,75 @@
+"""
+환율 가져오기 파서 모듈.
+
+오프라인에서 받은 환율 파일(CSV)을 환율 목록으로 파싱합니다. 환율 파일은 통화쌍 수 x 고시일 수 행으로 작으므로
+본문을 모두 읽은 뒤 한 번에 파싱하며, 하나라도 유효하지 않은 행이 있으면 행 번호와 함께 전체를 거부합니다.
+"""
+
+from collections.abc import AsyncIterator
+import csv
+from datetime import date
+from decimal import Decimal, InvalidOperation
+import io
+
+from personal_cpa.domain.fx_rate import FxRate
+
+REQUIRED_FX_RATE_COLUMNS = ("base_currency", "quote_currency", "rate_date", "rate")
+
+
+async def parse_fx_rate_rows(chunks: AsyncIterator[bytes]) -> list[FxRate]:
+    """
+    환율 CSV 파일을 환율 목록으로 파싱
+
+    첫 행은 헤더여야 하며 빈 행은 건너뜁니다. 고시일은 ISO 8601 날짜(YYYY-MM-DD)입니다.
+
+    Args:
+        chunks: 요청 본문 조각 이터레이터 (UTF-8, BOM 허용)
+
+    Returns:
+        환율 목록 (파일 순서)
+
+    Raises:
+        ValueError: 헤더가 없거나 필수 컬럼이 빠졌거나, 유효하지 않은 행이 있을 경우 발생
+    """
+    body = b"".join([chunk async for chunk in chunks]).decode("utf-8-sig")
+    reader = csv.DictReader(io.StringIO(body))
+    header = [column.strip() for column in reader.fieldnames or []]
+    missing = [column for column in REQUIRED_FX_RATE_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing required columns: {', '.join(missing)}")
+    reader.fieldnames = header
+
+    fx_rates = []
+    for record in reader:
+        if not any((value or "").strip() for value in record.values()):
+            continue
+        try:
+            fx_rates.append(_to_fx_rate(record))
+        except ValueError as value_error:
+            raise ValueError(f"line {reader.line_num}: {value_error}") from value_error
+
+    return fx_rates
+
+
+def _to_fx_rate(record: dict[str, str | None]) -> FxRate:
+    """
+    Args:
+        record: 컬럼별 값
+
+    Returns:
+        환율
+
+    Raises:
+        ValueError: 값이 유효하지 않을 경우 발생
+    """
+    try:
+        rate = Decimal((record["rate"] or "").strip())
+    except InvalidOperation as invalid_operation:
+        raise ValueError(f"rate must be a decimal number. (Currently: {record['rate']})") from invalid_operation
+
+    return FxRate(
+        base_currency=(record["base_currency"] or "").strip().upper(),
+        quote_currency=(record["quote_currency"] or "").strip().upper(),
+        rate_date=date.fromisoformat((record["rate_date"] or "").strip()),
+        rate=rate,
+    )
@@ -0,0 +1,163 @@
+"""
+계정과목 응답 프레젠터 모듈.
+
+기본 경로는 도메인 객체를 그대로 반환하여 FastAPI 가 `response_model`로 검증/직렬화합니다.
+빠른 경로(`API_FAST_JSON_RESPONSE`)는 도메인 트리를 응답 스키마와 같은 모양의 dict 로 바로 변환한 뒤
+pydantic-core 의 JSON 직렬화기로 인코딩하여, 노드마다 pydantic 모델을 다시 검증하는 비용을 건너뜁니다.
+"""
+
+from collections.abc import AsyncIterator
+import csv
+import io
+from typing import Any, Literal
+
+from fastapi.responses import JSONResponse
+import pydantic_core
+
+from personal_cpa.domain.chart_of_account import ChartOfAccount, ChartOfAccountTree
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_COLUMNS = ("code", "name", "category", "description", "parent_code", "is_hidden", "currency")
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic-core 직렬화기를 사용하는 JSON 응답
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Args:
+            content: JSON 으로 변환할 값 (dict, list, str, int 등)
+
+        Returns:
+            UTF-8 JSON 바이트
+        """
+        return pydantic_core.to_json(content)
+
+
+class ChartOfAccountPresenter:
+    """
+    계정과목 트리 응답 프레젠터
+    """
+
+    def __init__(self, fast_json: bool):
+        """
+        초기화
+
+        Args:
+            fast_json: 빠른 JSON 응답 경로 사용 여부
+        """
+        self.fast_json = fast_json
+
+    def trees(self, trees: list[ChartOfAccountTree]) -> list[ChartOfAccountTree] | FastJSONResponse:
+        """
+        계정과목 트리 목록 응답
+
+        Args:
+            trees: 계정과목 트리 목록
+
+        Returns:
+            도메인 객체 그대로 (기본 경로) | 직렬화된 JSON 응답 (빠른 경로)
+        """
+        if not self.fast_json:
+            return trees
+
+        return FastJSONResponse(content=[to_summary(tree) for tree in trees])
+
+    def tree(self, tree: ChartOfAccountTree) -> ChartOfAccountTree | FastJSONResponse:
+        """
+        계정과목 트리 응답
+
+        Args:
+            tree: 계정과목 트리
+
+        Returns:
+            도메인 객체 그대로 (기본 경로) | 직렬화된 JSON 응답 (빠른 경로)
+        """
+        if not self.fast_json:
+            return tree
+
+        return FastJSONResponse(content=to_summary(tree))
+
+    async def export(
+        self, chunks: AsyncIterator[list[ChartOfAccount]], export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        """
+        계정과목 묶음을 내보내기 형식의 바이트 묶음으로 변환 (스트리밍)
+
+        묶음 단위로 인코딩하므로 메모리에는 한 묶음 분량의 계정과목과 본문만 올라갑니다.
+
+        Args:
+            chunks: 계정과목 묶음 이터레이터
+            export_format: 내보내기 형식 (ndjson | csv)
+
+        Yields:
+            응답 본문 조각
+        """
+        if export_format == "csv":
+            yield _to_csv([EXPORT_COLUMNS])
+
+        async for chunk in chunks:
+            rows = [to_export_row(chart_of_account) for chart_of_account in chunk]
+            if export_format == "csv":
+                yield _to_csv([[row[column] for column in EXPORT_COLUMNS] for row in rows])
+            else:
+                yield b"".join(pydantic_core.to_json(row) + b"\n" for row in rows)
+
+
+def to_summary(tree: ChartOfAccountTree) -> dict[str, Any]:
+    """
+    계정과목 트리를 `ChartOfAccountSummaryResponse`와 같은 모양의 dict 로 변환합니다.
+
+    Args:
+        tree: 계정과목 트리
+
+    Returns:
+        응답 dict (카테고리는 `AccountType` 이름)
+    """
+    return {
+        "code": tree.code,
+        "name": tree.name,
+        "category": tree.category.name,
+        "children": [to_summary(child) for child in tree.children],
+        "child_count": tree.child_count,
+        "has_children": tree.child_count > 0,
+    }
+
+
+def to_export_row(chart_of_account: ChartOfAccount) -> dict[str, Any]:
+    """
+    계정과목을 내보내기 행으로 변환합니다. (계정과목 생성 요청과 같은 필드에 숨김 여부를 더함)
+
+    Args:
+        chart_of_account: 계정과목
+
+    Returns:
+        `EXPORT_COLUMNS` 순서의 dict (카테고리는 `AccountType` 이름)
+    """
+    return {
+        "code": chart_of_account.code,
+        "name": chart_of_account.name,
+        "category": chart_of_account.category.name,
+        "description": chart_of_account.description,
+        "parent_code": chart_of_account.parent_code,
+        "is_hidden": chart_of_account.is_hidden,
+        "currency": chart_of_account.currency,
+    }
+
+
+def _to_csv(rows: list[Any]) -> bytes:
+    """
+    Args:
+        rows: CSV 행 목록
+
+    Returns:
+        UTF-8 CSV 바이트
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
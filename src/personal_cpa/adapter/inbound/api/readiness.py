@@ -0,0 +1,131 @@
+"""
+준비 상태(readiness) 확인 모듈.
+
+데이터베이스에 `SELECT 1`을 실행해 요청을 받을 수 있는지 확인합니다.
+로드 밸런서/오케스트레이터의 프로브가 몰려도 커넥션 풀을 소모하지 않도록 결과(실패 포함)를 짧게 캐시하고,
+동시에 들어온 프로브는 진행 중인 한 번의 확인 결과를 함께 사용합니다.
+동기 데이터베이스의 확인은 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
+"""
+
+import asyncio
+from dataclasses import asdict, dataclass, replace
+import time
+from typing import Any, Callable
+
+from personal_cpa.database import AsyncDatabase, Database
+
+
+@dataclass(frozen=True)
+class ReadinessResult:
+    """
+    준비 상태 확인 결과
+
+    Args:
+        ready: 데이터베이스 확인 성공 여부
+        latency_seconds: `SELECT 1` 확인에 걸린 시간(초)
+        error: 실패 사유 (성공 시 None)
+        cached: 캐시된 결과인지 여부
+        age_seconds: 확인한 뒤 지난 시간(초)
+    """
+
+    ready: bool
+    latency_seconds: float
+    error: str | None = None
+    cached: bool = False
+    age_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            결과 항목별 값
+        """
+        return asdict(self)
+
+
+class ReadinessProbe:
+    """
+    데이터베이스 준비 상태 확인기
+    """
+
+    def __init__(
+        self,
+        database: Database | AsyncDatabase,
+        cache_seconds: float,
+        timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            database: 확인할 데이터베이스
+            cache_seconds: 확인 결과를 재사용하는 시간(초)
+            timeout_seconds: 확인이 끝나기를 기다리는 최대 시간(초)
+            clock: 현재 시각 함수 (테스트용)
+
+        Raises:
+            ValueError: 캐시 시간이 음수이거나 대기 시간이 0 이하일 경우 발생
+        """
+        if cache_seconds < 0:
+            raise ValueError("cache_seconds must not be negative")
+        if timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be positive")
+        self._database = database
+        self.cache_seconds = cache_seconds
+        self.timeout_seconds = timeout_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._result: ReadinessResult | None = None
+        self._checked_at = 0.0
+
+    async def check(self) -> ReadinessResult:
+        """
+        캐시가 유효하면 캐시된 결과를, 아니면 데이터베이스를 확인한 결과를 반환합니다.
+
+        Returns:
+            준비 상태 확인 결과
+        """
+        cached = self._cached_result()
+        if cached is not None:
+            return cached
+
+        async with self._lock:
+            cached = self._cached_result()
+            if cached is not None:
+                return cached
+
+            self._result = await self._ping()
+            self._checked_at = self._clock()
+            return self._result
+
+    def _cached_result(self) -> ReadinessResult | None:
+        """
+        Returns:
+            유효한 캐시 결과 (없거나 만료되었으면 None)
+        """
+        if self._result is None:
+            return None
+        age = self._clock() - self._checked_at
+        if age >= self.cache_seconds:
+            return None
+        return replace(self._result, cached=True, age_seconds=age)
+
+    async def _ping(self) -> ReadinessResult:
+        """
+        Returns:
+            데이터베이스에 `SELECT 1`을 실행한 결과
+        """
+        started = time.perf_counter()
+        try:
+            if isinstance(self._database, AsyncDatabase):
+                ping = self._database.ping()
+            else:
+                ping = asyncio.to_thread(self._database.ping)
+            await asyncio.wait_for(ping, timeout=self.timeout_seconds)
+        except TimeoutError:
+            error = f"database check timed out after {self.timeout_seconds}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            error = None
+        return ReadinessResult(ready=error is None, latency_seconds=time.perf_counter() - started, error=error)
@@ -2,36 +2,61 @@ import logging
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.model.balance import AccountBalanceCheckResponse, AccountBalanceResponse
 from personal_cpa.adapter.inbound.api.model.chart_of_account import (
+    ChartOfAccountImportResponse,
     ChartOfAccountResponse,
     ChartOfAccountSummaryResponse,
     CreateChartOfAccountRequest,
     UpdateChartOfAccountRequest,
 )
+from personal_cpa.adapter.inbound.api.parser.chart_of_account import ImportFormat, parse_import_rows
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import (
+    EXPORT_MEDIA_TYPES,
+    ChartOfAccountPresenter,
+    ExportFormat,
+)
 from personal_cpa.application.port.input.command.chart_of_account import (
     CreateChartOfAccountCommand,
     UpdateChartOfAccountCommand,
 )
+from personal_cpa.application.port.input.use_case.balance import (
+    AsyncCheckAccountBalanceUseCase,
+    AsyncSearchAccountBalanceUseCase,
+    CheckAccountBalanceUseCase,
+    SearchAccountBalanceUseCase,
+)
 from personal_cpa.application.port.input.use_case.chart_of_account import (
+    AsyncManageChartOfAccountUseCase,
+    AsyncSearchChartOfAccountUseCase,
     ManageChartOfAccountUseCase,
     SearchChartOfAccountUseCase,
 )
 from personal_cpa.container import Container
+from personal_cpa.database import outside_unit_of_work
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chart_of_accounts", tags=["chart_of_accounts"])
 
+SearchUseCase = SearchChartOfAccountUseCase | AsyncSearchChartOfAccountUseCase
+ManageUseCase = ManageChartOfAccountUseCase | AsyncManageChartOfAccountUseCase
+SearchBalanceUseCase = SearchAccountBalanceUseCase | AsyncSearchAccountBalanceUseCase
+CheckBalanceUseCase = CheckAccountBalanceUseCase | AsyncCheckAccountBalanceUseCase
+
+MAX_TREE_DEPTH = 10
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=list[ChartOfAccountResponse])
 @inject
 async def create_chart_of_account(
     requests: list[CreateChartOfAccountRequest],
-    create_chart_of_account_use_case: Annotated[
-        ManageChartOfAccountUseCase, Depends(Provide[Container.chart_of_account_service])
-    ],
+    create_chart_of_account_use_case: Annotated[ManageUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
 ):
     """
     유저의 계정과목 생성
@@ -39,6 +64,7 @@ async def create_chart_of_account(
     Args:
         requests: 계정과목 생성 요청 목록
         create_chart_of_account_use_case: 계정과목 생성 유즈케이스
+        use_case_executor: 유즈케이스 실행기
 
     Returns:
         계정과목 목록
@@ -57,6 +83,7 @@ async def create_chart_of_account(
                 category=request.get_category_enum(),
                 description=request.description,
                 parent_code=request.parent_code,
+                currency=request.currency,
             )
             for request in requests
         ]
@@ -67,18 +94,60 @@ async def create_chart_of_account(
     user_id = 1
 
     try:
-        chart_of_accounts = create_chart_of_account_use_case.create_chart_of_accounts(user_id, commands)
+        chart_of_accounts = await use_case_executor.run(
+            create_chart_of_account_use_case.create_chart_of_accounts, user_id, commands
+        )
     except ValueError as value_error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
     else:
         return chart_of_accounts
 
 
+@router.post("/import", status_code=status.HTTP_200_OK, response_model=ChartOfAccountImportResponse)
+@inject
+async def import_chart_of_accounts(
+    request: Request,
+    import_chart_of_account_use_case: Annotated[ManageUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    import_format: Annotated[ImportFormat, Query(alias="format", description="가져오기 형식")] = "ndjson",
+):
+    """
+    유저의 계정과목 가져오기 (NDJSON | CSV 업로드)
+
+    요청 본문을 점진적으로 파싱한 뒤 상위 계정과목이 먼저 오도록 정렬하여 묶음 단위로 커밋합니다.
+    묶음마다 커밋하도록 요청 단위 작업 밖에서 실행하므로, 중간에 실패해도 앞 묶음은 저장된 채로 남습니다.
+    유효하지 않은 행은 건너뛰고 행 번호별 오류로 응답합니다.
+
+    Args:
+        request: 요청 (본문은 가져오기 파일)
+        import_chart_of_account_use_case: 계정과목 가져오기 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        import_format: 가져오기 형식 (ndjson | csv)
+
+    Returns:
+        가져오기 결과
+
+    Raises:
+        HTTPException: 가져오기 파일을 읽을 수 없을 경우 발생
+    """
+    try:
+        rows = await parse_import_rows(request.stream(), import_format)
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+    with outside_unit_of_work():
+        return await use_case_executor.run(import_chart_of_account_use_case.import_chart_of_accounts, user_id, rows)
+
+
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[ChartOfAccountSummaryResponse])
 @inject
 async def get_chart_of_accounts(
-    search_chart_of_account_use_case: Annotated[
-        SearchChartOfAccountUseCase, Depends(Provide[Container.chart_of_account_service])
+    search_chart_of_account_use_case: Annotated[SearchUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    chart_of_account_presenter: Annotated[
+        ChartOfAccountPresenter, Depends(Provide[Container.chart_of_account_presenter])
     ],
 ):
     """
@@ -86,22 +155,88 @@ async def get_chart_of_accounts(
 
     Args:
         search_chart_of_account_use_case: 계정과목 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        chart_of_account_presenter: 계정과목 응답 프레젠터
 
     Returns:
         계정과목 트리 목록
     """
     # TODO: user 개발 전까지는 1(master user)로 고정
     user_id = 1
-    return search_chart_of_account_use_case.get_chart_of_accounts(user_id)
+    chart_of_account_trees = await use_case_executor.run(
+        search_chart_of_account_use_case.get_chart_of_accounts, user_id
+    )
+    return chart_of_account_presenter.trees(chart_of_account_trees)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+@inject
+async def export_chart_of_accounts(
+    search_chart_of_account_use_case: Annotated[SearchUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    chart_of_account_presenter: Annotated[
+        ChartOfAccountPresenter, Depends(Provide[Container.chart_of_account_presenter])
+    ],
+    export_format: Annotated[ExportFormat, Query(alias="format", description="내보내기 형식")] = "ndjson",
+):
+    """
+    유저의 계정과목 전체 내보내기 (NDJSON | CSV 스트리밍)
+
+    DB 서버 측 커서로 읽은 계정과목을 묶음 단위로 인코딩하여 바로 흘려보내므로,
+    계정과목 수와 무관하게 메모리 사용량이 일정합니다.
+
+    Args:
+        search_chart_of_account_use_case: 계정과목 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        chart_of_account_presenter: 계정과목 응답 프레젠터
+        export_format: 내보내기 형식 (ndjson | csv)
+
+    Returns:
+        스트리밍 응답
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    chunks = use_case_executor.stream(search_chart_of_account_use_case.export_chart_of_accounts, user_id)
+    return StreamingResponse(
+        chart_of_account_presenter.export(chunks, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="chart_of_accounts.{export_format}"'},
+    )
+
+
+@router.post("/balances/check", status_code=status.HTTP_200_OK, response_model=AccountBalanceCheckResponse)
+@inject
+async def check_account_balances(
+    check_account_balance_use_case: Annotated[CheckBalanceUseCase, Depends(Provide[Container.account_balance_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    repair: Annotated[bool, Query(description="차이가 있으면 분개 줄로 다시 계산한 잔액으로 바꿀지 여부")] = False,
+):
+    """
+    유저의 계정과목 잔액 정합성 검사
+
+    저장된 잔액을 분개 줄로 다시 계산한 잔액과 비교하고, `repair`가 참이면 다시 계산한 잔액으로 바꿉니다.
+
+    Args:
+        check_account_balance_use_case: 계정과목 잔액 정합성 검사 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        repair: 차이가 있으면 다시 계산한 잔액으로 바꿀지 여부
+
+    Returns:
+        정합성 검사 결과
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    return await use_case_executor.run(check_account_balance_use_case.check_balances, user_id, repair)
 
 
 @router.get("/{code}", status_code=status.HTTP_200_OK, response_model=ChartOfAccountResponse)
 @inject
 async def get_chart_of_account_by_code(
     code: str,
-    search_chart_of_account_use_case: Annotated[
-        SearchChartOfAccountUseCase, Depends(Provide[Container.chart_of_account_service])
-    ],
+    search_chart_of_account_use_case: Annotated[SearchUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
 ):
     """
     유저의 계정과목 상세 조회
@@ -109,6 +244,7 @@ async def get_chart_of_account_by_code(
     Args:
         code: 계정과목 코드
         search_chart_of_account_use_case: 계정과목 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
 
     Returns:
         계정과목
@@ -120,7 +256,9 @@ async def get_chart_of_account_by_code(
     user_id = 1
 
     try:
-        chart_of_account = search_chart_of_account_use_case.get_chart_of_account_by_code(user_id, code)
+        chart_of_account = await use_case_executor.run(
+            search_chart_of_account_use_case.get_chart_of_account_by_code, user_id, code
+        )
 
         if not chart_of_account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chart of account not found")
@@ -130,14 +268,104 @@ async def get_chart_of_account_by_code(
         return chart_of_account
 
 
+@router.get("/{code}/tree", status_code=status.HTTP_200_OK, response_model=ChartOfAccountSummaryResponse)
+@inject
+async def get_chart_of_account_subtree(
+    code: str,
+    search_chart_of_account_use_case: Annotated[SearchUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    chart_of_account_presenter: Annotated[
+        ChartOfAccountPresenter, Depends(Provide[Container.chart_of_account_presenter])
+    ],
+    depth: Annotated[int, Query(ge=0, le=MAX_TREE_DEPTH, description="기준 계정과목으로부터 포함할 최대 깊이")] = 1,
+):
+    """
+    유저의 계정과목 하위 트리 조회 (깊이 제한)
+
+    깊이 제한에 걸린 계정과목은 `children`이 비어 있고 `has_children`/`child_count`로 펼칠 수 있는지 알려줍니다.
+
+    Args:
+        code: 기준 계정과목 코드
+        search_chart_of_account_use_case: 계정과목 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        chart_of_account_presenter: 계정과목 응답 프레젠터
+        depth: 기준 계정과목으로부터 포함할 최대 깊이 (0 이면 기준 계정과목만)
+
+    Returns:
+        계정과목 트리
+
+    Raises:
+        HTTPException: 계정과목이 존재하지 않을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    chart_of_account_tree = await use_case_executor.run(
+        search_chart_of_account_use_case.get_chart_of_account_subtree, user_id, code, depth
+    )
+    if not chart_of_account_tree:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chart of account not found")
+
+    return chart_of_account_presenter.tree(chart_of_account_tree)
+
+
+@router.get("/{code}/balance", status_code=status.HTTP_200_OK, response_model=AccountBalanceResponse)
+@inject
+async def get_account_balance(
+    code: str,
+    search_account_balance_use_case: Annotated[
+        SearchBalanceUseCase, Depends(Provide[Container.account_balance_service])
+    ],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    period: Annotated[int, Query(ge=0, description="기간 (YYYYMM, 0 이면 전체 기간)")] = 0,
+):
+    """
+    유저의 계정과목 잔액 조회 (하위 계정과목 포함)
+
+    분개 기표 시 상위 계정과목까지 갱신해 둔 잔액을 읽으므로 하위 계정과목이나 분개 줄 수와 무관하게 한 번의 조회로 끝납니다.
+
+    Args:
+        code: 계정과목 코드
+        search_account_balance_use_case: 계정과목 잔액 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        period: 기간 (YYYYMM, 0 이면 전체 기간)
+
+    Returns:
+        계정과목 잔액
+
+    Raises:
+        HTTPException: 기간이 유효하지 않거나 계정과목이 존재하지 않을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        account_balance = await use_case_executor.run(
+            search_account_balance_use_case.get_balance, user_id, code, period
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+    if not account_balance:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chart of account not found")
+
+    return AccountBalanceResponse(
+        code=code,
+        chart_of_account_id=account_balance.chart_of_account_id,
+        period=account_balance.period,
+        debit=account_balance.debit,
+        credit=account_balance.credit,
+        balance=account_balance.balance,
+    )
+
+
 @router.put("/{code}")
 @inject
 async def update_chart_of_account(
     code: str,
     request: UpdateChartOfAccountRequest,
-    update_chart_of_account_use_case: Annotated[
-        ManageChartOfAccountUseCase, Depends(Provide[Container.chart_of_account_service])
-    ],
+    update_chart_of_account_use_case: Annotated[ManageUseCase, Depends(Provide[Container.chart_of_account_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
 ):
     """
     유저의 계정과목 수정
@@ -146,6 +374,7 @@ async def update_chart_of_account(
         code: 계정과목 코드
         request: 계정과목 수정 요청
         update_chart_of_account_use_case: 계정과목 수정 유즈케이스
+        use_case_executor: 유즈케이스 실행기
 
     Returns:
         계정과목
@@ -165,4 +394,4 @@ async def update_chart_of_account(
 
     # TODO: user 개발 전까지는 1(master user)로 고정
     user_id = 1
-    return update_chart_of_account_use_case.update_chart_of_account(user_id, code, command)
+    return await use_case_executor.run(update_chart_of_account_use_case.update_chart_of_account, user_id, code, command)
@@ -0,0 +1,132 @@
+from datetime import date
+import logging
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.model.fx_rate import (
+    ConvertAmountsRequest,
+    ConvertAmountsResponse,
+    FxRateImportResponse,
+    FxRateResponse,
+)
+from personal_cpa.adapter.inbound.api.parser.fx_rate import parse_fx_rate_rows
+from personal_cpa.application.port.input.use_case.fx_rate import AsyncManageFxRateUseCase, ManageFxRateUseCase
+from personal_cpa.container import Container
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/fx_rates", tags=["fx_rates"])
+
+ManageUseCase = ManageFxRateUseCase | AsyncManageFxRateUseCase
+
+MAX_CONVERT_AMOUNTS = 100_000
+
+
+@router.post("/import", status_code=status.HTTP_200_OK, response_model=FxRateImportResponse)
+@inject
+async def import_fx_rates(
+    request: Request,
+    manage_fx_rate_use_case: Annotated[ManageUseCase, Depends(Provide[Container.fx_rate_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    환율 가져오기 (CSV 업로드)
+
+    `base_currency,quote_currency,rate_date,rate` 헤더의 CSV 를 한 트랜잭션으로 저장하며, 같은 통화쌍과 고시일의
+    환율은 덮어씁니다.
+
+    Args:
+        request: 요청 (본문은 환율 CSV 파일)
+        manage_fx_rate_use_case: 환율 관리 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        가져오기 결과
+
+    Raises:
+        HTTPException: 환율 파일이 유효하지 않을 경우 발생
+    """
+    try:
+        fx_rates = await parse_fx_rate_rows(request.stream())
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+    imported = await use_case_executor.run(manage_fx_rate_use_case.import_fx_rates, fx_rates)
+    return FxRateImportResponse(imported=imported)
+
+
+@router.get("/{base_currency}/{quote_currency}", status_code=status.HTTP_200_OK, response_model=FxRateResponse)
+@inject
+async def get_fx_rate(
+    base_currency: str,
+    quote_currency: str,
+    on: date,
+    manage_fx_rate_use_case: Annotated[ManageUseCase, Depends(Provide[Container.fx_rate_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    기준일에 적용되는 환율 조회
+
+    Args:
+        base_currency: 기준 통화 코드
+        quote_currency: 표시 통화 코드
+        on: 기준일
+        manage_fx_rate_use_case: 환율 관리 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        기준일의 환율
+
+    Raises:
+        HTTPException: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+    """
+    try:
+        return await use_case_executor.run(
+            manage_fx_rate_use_case.get_fx_rate, base_currency.upper(), quote_currency.upper(), on
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(value_error)) from value_error
+
+
+@router.post("/convert", status_code=status.HTTP_200_OK, response_model=ConvertAmountsResponse)
+@inject
+async def convert_amounts(
+    request: ConvertAmountsRequest,
+    manage_fx_rate_use_case: Annotated[ManageUseCase, Depends(Provide[Container.fx_rate_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    여러 금액을 기준일 환율로 한 번에 환산
+
+    Args:
+        request: 금액 일괄 환산 요청
+        manage_fx_rate_use_case: 환율 관리 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        환산 결과
+
+    Raises:
+        HTTPException: 금액이 너무 많거나, 지원하지 않는 통화이거나, 환율이 없을 경우 발생
+    """
+    if len(request.amounts) > MAX_CONVERT_AMOUNTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many amounts (max {MAX_CONVERT_AMOUNTS})"
+        )
+
+    to_currency = request.to_currency.upper()
+    try:
+        amounts = await use_case_executor.run(
+            manage_fx_rate_use_case.convert_amounts,
+            [item.amount for item in request.amounts],
+            [item.currency.upper() for item in request.amounts],
+            to_currency,
+            request.on,
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+    return ConvertAmountsResponse(currency=to_currency, on=request.on, amounts=amounts)
@@ -1,25 +1,88 @@
 """
-This module defines the health check endpoint for the Personal CPA application.
+This module defines the health check endpoints for the Personal CPA application.
+
+- `/health/live`: Liveness; the process is serving requests (no dependencies are checked).
+- `/health/ready`: Readiness; the database answers `SELECT 1` (result cached briefly), 503 otherwise.
+- `/health/`: Diagnostic cache, executor and connection pool statistics.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.readiness import ReadinessProbe
+from personal_cpa.application.port.output.cache import CachePort
+from personal_cpa.container import Container
+from personal_cpa.database import AsyncDatabase, Database
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+@router.get("/live", status_code=status.HTTP_200_OK)
+async def liveness():
+    """
+    Liveness endpoint.
+
+    Returns:
+        dict: A dictionary containing the status of the process.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+@inject
+async def readiness(readiness_probe: Annotated[ReadinessProbe, Depends(Provide[Container.readiness_probe])]):
+    """
+    Readiness endpoint.
+
+    Args:
+        readiness_probe: The probe that runs (or reuses a recent) `SELECT 1` against the database.
+
+    Returns:
+        dict: A dictionary containing the readiness status and the database check result with its latency.
+
+    Raises:
+        HTTPException: If the database check failed or timed out.
+    """
+    result = await readiness_probe.check()
+    if not result.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"status": "unavailable", "database": result.to_dict()},
+        )
+    return {"status": "ready", "database": result.to_dict()}
+
+
 @router.get("/", status_code=status.HTTP_200_OK)
-async def health_check():
+@inject
+async def health_check(
+    chart_of_account_cache: Annotated[CachePort, Depends(Provide[Container.chart_of_account_cache])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    database: Annotated[Database | AsyncDatabase, Depends(Provide[Container.active_database])],
+):
     """
     Health check endpoint.
 
+    Args:
+        chart_of_account_cache: The chart of account cache whose hit/miss/eviction counters are reported.
+        use_case_executor: The use case executor whose queue depth and wait times are reported.
+        database: The active database whose connection pool usage, wait and timeout counts are reported.
+
     Returns:
-        dict: A dictionary containing the status of the service.
+        dict: A dictionary containing the status of the service, its cache, executor and connection pool statistics.
 
     Raises:
         HTTPException: If the service is unhealthy.
     """
     try:
-        return {"status": "ok"}
+        return {
+            "status": "ok",
+            "cache": {"chart_of_account": chart_of_account_cache.stats().to_dict()},
+            "executor": use_case_executor.stats().to_dict(),
+            "database": {"pool": database.pool_stats().to_dict()},
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -0,0 +1,168 @@
+from datetime import date
+import logging
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.model.journal import (
+    JournalEntryResponse,
+    LedgerLineResponse,
+    PostJournalEntriesResponse,
+    PostJournalEntryRequest,
+)
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.port.input.use_case.journal import (
+    AsyncPostJournalEntryUseCase,
+    AsyncSearchJournalEntryUseCase,
+    PostJournalEntryUseCase,
+    SearchJournalEntryUseCase,
+)
+from personal_cpa.container import Container
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/journal_entries", tags=["journal_entries"])
+
+PostUseCase = PostJournalEntryUseCase | AsyncPostJournalEntryUseCase
+SearchUseCase = SearchJournalEntryUseCase | AsyncSearchJournalEntryUseCase
+
+MAX_POST_ENTRIES = 10_000
+DEFAULT_LEDGER_LIMIT = 1_000
+MAX_LEDGER_LIMIT = 10_000
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=PostJournalEntriesResponse)
+@inject
+async def post_journal_entries(
+    requests: list[PostJournalEntryRequest],
+    post_journal_entry_use_case: Annotated[PostUseCase, Depends(Provide[Container.journal_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    유저의 분개 기표 (일괄)
+
+    요청의 모든 분개를 검증한 뒤 한 번에 저장하며, 하나라도 유효하지 않으면 아무것도 저장하지 않습니다.
+
+    Args:
+        requests: 분개 기표 요청 목록
+        post_journal_entry_use_case: 분개 기표 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        기표 결과
+
+    Raises:
+        HTTPException: 분개 기표 요청이 유효하지 않을 경우 발생
+    """
+    if not requests:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid request")
+    if len(requests) > MAX_POST_ENTRIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many journal entries (max {MAX_POST_ENTRIES})"
+        )
+
+    commands = [
+        PostJournalEntryCommand(
+            entry_date=request.entry_date,
+            description=request.description,
+            lines=[
+                PostJournalLineCommand(
+                    chart_of_account_id=line.chart_of_account_id,
+                    debit=line.debit,
+                    credit=line.credit,
+                    description=line.description,
+                )
+                for line in request.lines
+            ],
+        )
+        for request in requests
+    ]
+
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        journal_entries = await use_case_executor.run(
+            post_journal_entry_use_case.post_journal_entries, user_id, commands
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+    else:
+        return PostJournalEntriesResponse(
+            posted=len(journal_entries),
+            lines=sum(len(journal_entry.lines) for journal_entry in journal_entries),
+            journal_entry_ids=[journal_entry.id for journal_entry in journal_entries],
+        )
+
+
+@router.get("/ledger/{chart_of_account_id}", status_code=status.HTTP_200_OK, response_model=list[LedgerLineResponse])
+@inject
+async def get_ledger(
+    chart_of_account_id: int,
+    start_date: date,
+    end_date: date,
+    search_journal_entry_use_case: Annotated[SearchUseCase, Depends(Provide[Container.journal_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    limit: Annotated[int, Query(ge=1, le=MAX_LEDGER_LIMIT, description="최대 줄 수")] = DEFAULT_LEDGER_LIMIT,
+):
+    """
+    유저의 계정과목별 원장 조회 (기간)
+
+    Args:
+        chart_of_account_id: 계정과목 ID
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        search_journal_entry_use_case: 분개 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        limit: 최대 줄 수
+
+    Returns:
+        거래일, 기표 순으로 정렬된 원장 줄 목록
+
+    Raises:
+        HTTPException: 조회 기간이 유효하지 않을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        return await use_case_executor.run(
+            search_journal_entry_use_case.get_ledger, user_id, chart_of_account_id, start_date, end_date, limit
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+
+@router.get("/{journal_entry_id}", status_code=status.HTTP_200_OK, response_model=JournalEntryResponse)
+@inject
+async def get_journal_entry(
+    journal_entry_id: int,
+    search_journal_entry_use_case: Annotated[SearchUseCase, Depends(Provide[Container.journal_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    유저의 분개 상세 조회
+
+    Args:
+        journal_entry_id: 분개 ID
+        search_journal_entry_use_case: 분개 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        분개
+
+    Raises:
+        HTTPException: 분개가 존재하지 않을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    journal_entry = await use_case_executor.run(
+        search_journal_entry_use_case.get_journal_entry, user_id, journal_entry_id
+    )
+    if not journal_entry:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Journal entry not found")
+
+    return journal_entry
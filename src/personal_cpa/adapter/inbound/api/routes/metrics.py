@@ -0,0 +1,47 @@
+"""
+This module defines the Prometheus metrics endpoint for the Personal CPA application.
+"""
+
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.metrics import (
+    CONTENT_TYPE,
+    HttpMetrics,
+    render_executor_metrics,
+    render_pool_metrics,
+)
+from personal_cpa.container import Container
+from personal_cpa.database import AsyncDatabase, Database
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+@inject
+async def metrics(
+    http_metrics: Annotated[HttpMetrics, Depends(Provide[Container.http_metrics])],
+    database: Annotated[Database | AsyncDatabase, Depends(Provide[Container.active_database])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    Prometheus metrics endpoint.
+
+    Args:
+        http_metrics: The request counters, per-route latency histograms and in-flight gauge.
+        database: The database in use (by `DB_MODE`) whose connection pool statistics are reported.
+        use_case_executor: The use case executor whose worker thread and queue statistics are reported.
+
+    Returns:
+        PlainTextResponse: The metrics in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(
+        http_metrics.render()
+        + render_pool_metrics(database.pool_stats())
+        + render_executor_metrics(use_case_executor.stats()),
+        media_type=CONTENT_TYPE,
+    )
@@ -0,0 +1,100 @@
+import logging
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.model.period_close import PeriodCloseJobResponse
+from personal_cpa.application.port.input.use_case.period_close import AsyncClosePeriodUseCase, ClosePeriodUseCase
+from personal_cpa.container import Container
+from personal_cpa.database import outside_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/period_closes", tags=["period_closes"])
+
+CloseUseCase = ClosePeriodUseCase | AsyncClosePeriodUseCase
+
+
+@router.post("/{period}", status_code=status.HTTP_202_ACCEPTED, response_model=PeriodCloseJobResponse)
+@inject
+async def start_period_close(
+    period: int,
+    background_tasks: BackgroundTasks,
+    close_period_use_case: Annotated[CloseUseCase, Depends(Provide[Container.period_close_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    기간 마감 작업 시작
+
+    작업을 만든 뒤 응답하고, 유저 묶음별 마감은 응답 후 백그라운드에서 실행합니다.
+    백그라운드 작업은 요청 단위 작업 밖에서 실행하여 묶음마다 커밋하므로, 중간에 실패해도 다시 시작하면
+    마지막으로 커밋한 묶음 다음부터 이어서 처리합니다.
+    이미 있는 작업이면 마지막으로 마감한 유저 다음부터 이어서 실행하고, 완료된 작업이면 다시 실행하지 않습니다.
+
+    Args:
+        period: 마감 기간 (YYYYMM)
+        background_tasks: 백그라운드 작업
+        close_period_use_case: 기간 마감 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        기간 마감 작업
+
+    Raises:
+        HTTPException: 기간이 유효하지 않거나 아직 끝나지 않았을 경우 발생
+    """
+    try:
+        job = await use_case_executor.run(close_period_use_case.start_period_close, period)
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+    if not job.done:
+        background_tasks.add_task(_run_period_close, close_period_use_case, use_case_executor, period)
+    return job
+
+
+@router.get("/{period}", status_code=status.HTTP_200_OK, response_model=PeriodCloseJobResponse)
+@inject
+async def get_period_close(
+    period: int,
+    close_period_use_case: Annotated[CloseUseCase, Depends(Provide[Container.period_close_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+):
+    """
+    기간 마감 작업 진행 상황 조회
+
+    Args:
+        period: 마감 기간 (YYYYMM)
+        close_period_use_case: 기간 마감 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+
+    Returns:
+        기간 마감 작업
+
+    Raises:
+        HTTPException: 기간 마감 작업이 없을 경우 발생
+    """
+    job = await use_case_executor.run(close_period_use_case.get_period_close, period)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Period close not found")
+    return job
+
+
+async def _run_period_close(
+    close_period_use_case: CloseUseCase, use_case_executor: UseCaseExecutor, period: int
+) -> None:
+    """
+    요청 단위 작업 밖에서 기간 마감 작업을 끝까지 실행 (유저 묶음마다 커밋)
+
+    백그라운드 작업은 응답을 보낸 뒤에도 요청의 미들웨어 안에서 실행되므로, 요청 단위 작업에서 벗어나지 않으면
+    모든 묶음이 요청 단위 작업이 끝날 때 한 번에 커밋(실패 시 모두 롤백)됩니다.
+
+    Args:
+        close_period_use_case: 기간 마감 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        period: 마감 기간 (YYYYMM)
+    """
+    with outside_unit_of_work():
+        await use_case_executor.run(close_period_use_case.run_period_close, period)
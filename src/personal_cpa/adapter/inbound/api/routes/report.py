@@ -0,0 +1,134 @@
+from datetime import date
+import logging
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.model.report import (
+    BalanceSheetResponse,
+    IncomeStatementResponse,
+    TrialBalanceResponse,
+)
+from personal_cpa.application.port.input.use_case.report import (
+    AsyncSearchFinancialReportUseCase,
+    SearchFinancialReportUseCase,
+)
+from personal_cpa.container import Container
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+SearchUseCase = SearchFinancialReportUseCase | AsyncSearchFinancialReportUseCase
+
+
+@router.get("/trial_balance", status_code=status.HTTP_200_OK, response_model=TrialBalanceResponse)
+@inject
+async def get_trial_balance(
+    start_date: date,
+    end_date: date,
+    search_financial_report_use_case: Annotated[SearchUseCase, Depends(Provide[Container.financial_report_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    currency: Annotated[str | None, Query(description="보고 통화 코드 (없으면 기본 보고 통화)")] = None,
+):
+    """
+    유저의 기간 시산표 조회
+
+    보고 통화와 다른 통화의 계정과목은 종료일 환율로 환산합니다.
+
+    Args:
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        search_financial_report_use_case: 재무 보고서 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        currency: 보고 통화 코드
+
+    Returns:
+        시산표
+
+    Raises:
+        HTTPException: 조회 기간이 유효하지 않거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        return await use_case_executor.run(
+            search_financial_report_use_case.get_trial_balance, user_id, start_date, end_date, currency
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+
+@router.get("/income_statement", status_code=status.HTTP_200_OK, response_model=IncomeStatementResponse)
+@inject
+async def get_income_statement(
+    start_date: date,
+    end_date: date,
+    search_financial_report_use_case: Annotated[SearchUseCase, Depends(Provide[Container.financial_report_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    currency: Annotated[str | None, Query(description="보고 통화 코드 (없으면 기본 보고 통화)")] = None,
+):
+    """
+    유저의 기간 손익계산서 조회
+
+    보고 통화와 다른 통화의 계정과목은 종료일 환율로 환산합니다.
+
+    Args:
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        search_financial_report_use_case: 재무 보고서 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        currency: 보고 통화 코드
+
+    Returns:
+        손익계산서
+
+    Raises:
+        HTTPException: 조회 기간이 유효하지 않거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        return await use_case_executor.run(
+            search_financial_report_use_case.get_income_statement, user_id, start_date, end_date, currency
+        )
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
+
+
+@router.get("/balance_sheet", status_code=status.HTTP_200_OK, response_model=BalanceSheetResponse)
+@inject
+async def get_balance_sheet(
+    as_of: date,
+    search_financial_report_use_case: Annotated[SearchUseCase, Depends(Provide[Container.financial_report_service])],
+    use_case_executor: Annotated[UseCaseExecutor, Depends(Provide[Container.use_case_executor])],
+    currency: Annotated[str | None, Query(description="보고 통화 코드 (없으면 기본 보고 통화)")] = None,
+):
+    """
+    유저의 기준일 재무상태표 조회
+
+    보고 통화와 다른 통화의 계정과목은 기준일 환율로 환산합니다.
+
+    Args:
+        as_of: 기준일 (포함)
+        search_financial_report_use_case: 재무 보고서 조회 유즈케이스
+        use_case_executor: 유즈케이스 실행기
+        currency: 보고 통화 코드
+
+    Returns:
+        재무상태표
+
+    Raises:
+        HTTPException: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+    """
+    # TODO: user 개발 전까지는 1(master user)로 고정
+    user_id = 1
+
+    try:
+        return await use_case_executor.run(search_financial_report_use_case.get_balance_sheet, user_id, as_of, currency)
+    except ValueError as value_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(value_error)) from value_error
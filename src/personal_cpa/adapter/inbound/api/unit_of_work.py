@@ -0,0 +1,90 @@
+"""
+요청 단위 작업(unit of work) 모듈.
+
+요청마다 데이터베이스의 요청 단위 작업을 열어, 요청 안의 저장소 호출이 세션(과 커넥션)을 함께 쓰도록 합니다.
+변경 사항은 응답을 보내기 직전에 한 번 커밋하므로 클라이언트가 성공 응답을 받은 뒤의 요청은 항상 커밋된 데이터를 봅니다.
+오류 응답(4xx/5xx)이나 처리되지 않은 예외는 롤백합니다.
+캐시 무효화와 읽기 고정은 커밋된 뒤에 적용되며, 묶음마다 커밋해야 하는 대량 작업은 `outside_unit_of_work()`로
+작업 밖에서 실행합니다.
+"""
+
+from collections.abc import Awaitable, Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.database import AsyncDatabase, Database
+
+
+class UnitOfWorkMiddleware:
+    """
+    요청 단위 작업을 여는 ASGI 미들웨어
+
+    세션은 처음 쓸 때 커넥션을 꺼내므로 DB를 쓰지 않는 요청에는 비용이 거의 없습니다.
+    스트리밍 응답은 응답 시작 시점에 커밋한 뒤 본문 전송이 끝날 때 세션을 닫습니다.
+    """
+
+    def __init__(
+        self, app: ASGIApp, database: Callable[[], Database | AsyncDatabase], executor: Callable[[], UseCaseExecutor]
+    ):
+        """
+        초기화
+
+        Args:
+            app: 다음 ASGI 애플리케이션
+            database: 사용 중인 데이터베이스 제공자 (컨테이너의 provider)
+            executor: 동기 데이터베이스의 커밋/롤백을 실행할 유즈케이스 실행기 제공자
+        """
+        self.app = app
+        self.database = database
+        self.executor = executor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Args:
+            scope: ASGI 스코프
+            receive: ASGI receive 채널
+            send: ASGI send 채널
+
+        Raises:
+            Exception: 요청 처리나 커밋 중 오류가 발생할 경우 롤백 후 발생
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        database = self.database()
+        if isinstance(database, AsyncDatabase):
+            async with database.unit_of_work() as async_unit_of_work:
+                await self.app(scope, receive, _finish_before_response(send, async_unit_of_work.finish))
+            return
+
+        # 동기 세션의 커밋/롤백과 닫기는 이벤트 루프를 막지 않도록 실행기에서 하고, 블록이 끝날 때는 다시 하지 않음
+        executor = self.executor()
+        with database.unit_of_work() as unit_of_work:
+            try:
+                await self.app(
+                    scope,
+                    receive,
+                    _finish_before_response(send, lambda commit: executor.run(unit_of_work.finish, commit)),
+                )
+            finally:
+                await executor.run(unit_of_work.close)
+
+
+def _finish_before_response(send: Send, finish: Callable[[bool], Awaitable[None]]) -> Send:
+    """
+    Args:
+        send: ASGI send 채널
+        finish: 응답 직전에 실행할 작업 종료 (성공 응답(2xx/3xx)이면 True 로 커밋, 오류 응답이면 False 로 롤백)
+
+    Returns:
+        응답 시작 메시지를 보내기 전에 트랜잭션을 끝내는 send 채널
+    """
+
+    async def send_after_finishing(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await finish(message["status"] < 400)
+        await send(message)
+
+    return send_after_finishing
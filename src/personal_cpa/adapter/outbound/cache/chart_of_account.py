@@ -0,0 +1,518 @@
+from collections.abc import AsyncIterator, Callable, Iterator
+
+from personal_cpa.adapter.outbound.cache.generation import CacheGenerations
+from personal_cpa.application.port.output.cache import CachePort
+from personal_cpa.application.port.output.chart_of_account import AsyncChartOfAccountPort, ChartOfAccountPort
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+
+
+class CachedChartOfAccountRepository(ChartOfAccountPort):
+    """
+    유저별 계정과목 목록을 캐시하는 계정과목 저장소
+
+    조회는 캐시된 유저의 계정과목 목록에서 처리하고, 생성/수정은 원본 저장소에 위임한 뒤
+    해당 유저의 캐시를 무효화합니다(write-through invalidation).
+    요청 단위 작업 안에서는 쓰기가 요청 끝에 커밋되므로, 무효화는 커밋된 뒤에 하고 커밋 전까지 그 요청의 조회는
+    캐시를 거치지 않습니다. (커밋 전에 무효화하면 동시 요청이 커밋 전 데이터를 TTL 동안 캐시할 수 있음)
+    캐시를 채울 때는 원본을 읽는 동안 무효화가 없었을 때만 저장합니다(유저별 세대 비교).
+    """
+
+    def __init__(
+        self,
+        chart_of_account_port: ChartOfAccountPort,
+        cache: CachePort,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        has_pending_writes: Callable[[], bool] | None = None,
+        generations: CacheGenerations | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            chart_of_account_port: 원본 계정과목 저장소
+            cache: 캐시 저장소
+            after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+            has_pending_writes: 커밋되지 않은 쓰기가 있는지 확인하는 함수 (있으면 캐시를 거치지 않음)
+            generations: 캐시 키별 세대 번호 (같은 캐시를 쓰는 저장소끼리 공유해야 함)
+        """
+        self.chart_of_account_port = chart_of_account_port
+        self.cache = cache
+        self.after_commit = after_commit
+        self.has_pending_writes = has_pending_writes
+        self.generations = generations or CacheGenerations()
+
+    def save_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            계정과목 목록
+        """
+        try:
+            return self.chart_of_account_port.save_chart_of_accounts(chart_of_accounts)
+        finally:
+            self._invalidate({chart_of_account.user_id for chart_of_account in chart_of_accounts})
+
+    def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            ID가 채워진 계정과목 목록
+        """
+        try:
+            return self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+        finally:
+            self._invalidate({chart_of_account.user_id for chart_of_account in chart_of_accounts})
+
+    def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록 조회 (캐시 우선)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 목록
+        """
+        if self._bypasses_cache():
+            return self.chart_of_account_port.find_chart_of_accounts(user_id)
+
+        key = self.cache_key(user_id)
+        chart_of_accounts = self.cache.get(key)
+        if chart_of_accounts is None:
+            generation = self.generations.current(key)
+            chart_of_accounts = self.chart_of_account_port.find_chart_of_accounts(user_id)
+            self.generations.set_if_current(self.cache, key, chart_of_accounts, generation)
+
+        return list(chart_of_accounts)
+
+    def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> Iterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회
+
+        내보내기처럼 한 번만 순회하는 조회이므로 캐시를 거치지 않고 원본 저장소에서 읽습니다.
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Returns:
+            계정과목 이터레이터
+        """
+        return self.chart_of_account_port.stream_chart_of_accounts(user_id, batch_size)
+
+    def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
+
+        return next((chart_of_account for chart_of_account in chart_of_accounts if chart_of_account.code == code), None)
+
+    def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return self.chart_of_account_port.find_chart_of_accounts_by_codes(user_id, codes)
+
+        code_set = set(codes)
+        return [chart_of_account for chart_of_account in chart_of_accounts if chart_of_account.code in code_set]
+
+    def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return self.chart_of_account_port.find_chart_of_account_subtree(user_id, code, max_depth)
+
+        return _filter_subtree(chart_of_accounts, code, max_depth)
+
+    def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return self.chart_of_account_port.find_chart_of_account_ancestors(user_id, code)
+
+        return sorted(
+            (
+                chart_of_account
+                for chart_of_account in chart_of_accounts
+                if code.startswith(f"{chart_of_account.code}_")
+            ),
+            key=lambda chart_of_account: chart_of_account.depth,
+        )
+
+    def modify_chart_of_account(self, user_id: int, code: str, chart_of_account: ChartOfAccount) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정 (비활성화 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            chart_of_account: 계정과목
+
+        Returns:
+            계정과목
+        """
+        try:
+            return self.chart_of_account_port.modify_chart_of_account(user_id, code, chart_of_account)
+        finally:
+            self._invalidate({user_id})
+
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        """
+        유저별 계정과목 목록 캐시 키
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            캐시 키
+        """
+        return f"chart_of_accounts:{user_id}"
+
+    def _cached(self, user_id: int) -> list[ChartOfAccount] | None:
+        """
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            캐시된 유저의 계정과목 목록 | None (없거나 커밋되지 않은 쓰기가 있는 경우)
+        """
+        return None if self._bypasses_cache() else self.cache.get(self.cache_key(user_id))
+
+    def _bypasses_cache(self) -> bool:
+        """
+        Returns:
+            커밋되지 않은 쓰기가 있어 캐시를 읽거나 채우지 않아야 하는지 여부
+        """
+        return self.has_pending_writes is not None and self.has_pending_writes()
+
+    def _invalidate(self, user_ids: set[int]) -> None:
+        """
+        유저별 계정과목 목록 캐시 무효화 (요청 단위 작업 안에서는 커밋된 뒤)
+
+        Args:
+            user_ids: 유저 ID 목록
+        """
+        _after_commit(self.after_commit, lambda: _delete(self.cache, self.generations, user_ids))
+
+
+class AsyncCachedChartOfAccountRepository(AsyncChartOfAccountPort):
+    """
+    유저별 계정과목 목록을 캐시하는 비동기 계정과목 저장소
+
+    캐시 정책은 `CachedChartOfAccountRepository`와 같습니다.
+    """
+
+    def __init__(
+        self,
+        chart_of_account_port: AsyncChartOfAccountPort,
+        cache: CachePort,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        has_pending_writes: Callable[[], bool] | None = None,
+        generations: CacheGenerations | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            chart_of_account_port: 원본 비동기 계정과목 저장소
+            cache: 캐시 저장소
+            after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+            has_pending_writes: 커밋되지 않은 쓰기가 있는지 확인하는 함수 (있으면 캐시를 거치지 않음)
+            generations: 캐시 키별 세대 번호 (같은 캐시를 쓰는 저장소끼리 공유해야 함)
+        """
+        self.chart_of_account_port = chart_of_account_port
+        self.cache = cache
+        self.after_commit = after_commit
+        self.has_pending_writes = has_pending_writes
+        self.generations = generations or CacheGenerations()
+
+    async def save_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            계정과목 목록
+        """
+        try:
+            return await self.chart_of_account_port.save_chart_of_accounts(chart_of_accounts)
+        finally:
+            self._invalidate({chart_of_account.user_id for chart_of_account in chart_of_accounts})
+
+    async def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            ID가 채워진 계정과목 목록
+        """
+        try:
+            return await self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+        finally:
+            self._invalidate({chart_of_account.user_id for chart_of_account in chart_of_accounts})
+
+    async def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록 조회 (캐시 우선)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 목록
+        """
+        if self._bypasses_cache():
+            return await self.chart_of_account_port.find_chart_of_accounts(user_id)
+
+        key = CachedChartOfAccountRepository.cache_key(user_id)
+        chart_of_accounts = self.cache.get(key)
+        if chart_of_accounts is None:
+            generation = self.generations.current(key)
+            chart_of_accounts = await self.chart_of_account_port.find_chart_of_accounts(user_id)
+            self.generations.set_if_current(self.cache, key, chart_of_accounts, generation)
+
+        return list(chart_of_accounts)
+
+    def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> AsyncIterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회
+
+        내보내기처럼 한 번만 순회하는 조회이므로 캐시를 거치지 않고 원본 저장소에서 읽습니다.
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Returns:
+            계정과목 이터레이터
+        """
+        return self.chart_of_account_port.stream_chart_of_accounts(user_id, batch_size)
+
+    async def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return await self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
+
+        return next((chart_of_account for chart_of_account in chart_of_accounts if chart_of_account.code == code), None)
+
+    async def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return await self.chart_of_account_port.find_chart_of_accounts_by_codes(user_id, codes)
+
+        code_set = set(codes)
+        return [chart_of_account for chart_of_account in chart_of_accounts if chart_of_account.code in code_set]
+
+    async def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return await self.chart_of_account_port.find_chart_of_account_subtree(user_id, code, max_depth)
+
+        return _filter_subtree(chart_of_accounts, code, max_depth)
+
+    async def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회 (캐시된 목록이 있으면 캐시에서 조회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+        chart_of_accounts = self._cached(user_id)
+        if chart_of_accounts is None:
+            return await self.chart_of_account_port.find_chart_of_account_ancestors(user_id, code)
+
+        return sorted(
+            (
+                chart_of_account
+                for chart_of_account in chart_of_accounts
+                if code.startswith(f"{chart_of_account.code}_")
+            ),
+            key=lambda chart_of_account: chart_of_account.depth,
+        )
+
+    async def modify_chart_of_account(
+        self, user_id: int, code: str, chart_of_account: ChartOfAccount
+    ) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정 (비활성화 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            chart_of_account: 계정과목
+
+        Returns:
+            계정과목
+        """
+        try:
+            return await self.chart_of_account_port.modify_chart_of_account(user_id, code, chart_of_account)
+        finally:
+            self._invalidate({user_id})
+
+    def _cached(self, user_id: int) -> list[ChartOfAccount] | None:
+        """
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            캐시된 유저의 계정과목 목록 | None (없거나 커밋되지 않은 쓰기가 있는 경우)
+        """
+        return None if self._bypasses_cache() else self.cache.get(CachedChartOfAccountRepository.cache_key(user_id))
+
+    def _bypasses_cache(self) -> bool:
+        """
+        Returns:
+            커밋되지 않은 쓰기가 있어 캐시를 읽거나 채우지 않아야 하는지 여부
+        """
+        return self.has_pending_writes is not None and self.has_pending_writes()
+
+    def _invalidate(self, user_ids: set[int]) -> None:
+        """
+        유저별 계정과목 목록 캐시 무효화 (요청 단위 작업 안에서는 커밋된 뒤)
+
+        Args:
+            user_ids: 유저 ID 목록
+        """
+        _after_commit(self.after_commit, lambda: _delete(self.cache, self.generations, user_ids))
+
+
+def _after_commit(after_commit: Callable[[Callable[[], None]], None] | None, callback: Callable[[], None]) -> None:
+    """
+    Args:
+        after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+        callback: 커밋 후 처리
+    """
+    if after_commit is None:
+        callback()
+    else:
+        after_commit(callback)
+
+
+def _delete(cache: CachePort, generations: CacheGenerations, user_ids: set[int]) -> None:
+    """
+    Args:
+        cache: 캐시 저장소
+        generations: 캐시 키별 세대 번호
+        user_ids: 캐시를 무효화할 유저 ID 목록
+    """
+    for user_id in user_ids:
+        generations.invalidate(cache, CachedChartOfAccountRepository.cache_key(user_id))
+
+
+def _filter_subtree(chart_of_accounts: list[ChartOfAccount], code: str, max_depth: int | None) -> list[ChartOfAccount]:
+    """
+    캐시된 계정과목 목록에서 기준 계정과목과 그 하위 계정과목을 찾습니다.
+
+    Args:
+        chart_of_accounts: 유저의 계정과목 목록
+        code: 기준 계정과목 코드
+        max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+    Returns:
+        계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+    """
+    if not any(chart_of_account.code == code for chart_of_account in chart_of_accounts):
+        return []
+
+    prefix = f"{code}_"
+    depth_limit = None if max_depth is None else code.count("_") + max_depth
+    return sorted(
+        (
+            chart_of_account
+            for chart_of_account in chart_of_accounts
+            if (chart_of_account.code == code or chart_of_account.code.startswith(prefix))
+            and (depth_limit is None or chart_of_account.depth <= depth_limit)
+        ),
+        key=lambda chart_of_account: chart_of_account.code,
+    )
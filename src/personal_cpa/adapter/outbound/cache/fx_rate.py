@@ -0,0 +1,146 @@
+from collections.abc import Callable
+
+from personal_cpa.application.port.output.cache import CachePort
+from personal_cpa.application.port.output.fx_rate import AsyncFxRatePort, FxRatePort
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+# 환율 조회 구조 캐시 키 (환율은 유저와 무관하므로 키 하나)
+FX_RATE_TABLE_CACHE_KEY = "fx_rate_table"
+
+
+class CachedFxRateRepository(FxRatePort):
+    """
+    환율 조회 구조를 캐시하는 환율 저장소
+
+    환율 테이블 전체를 읽어 만든 조회 구조를 캐시하므로 환산할 때마다 데이터베이스를 읽지 않으며,
+    저장은 원본 저장소에 위임한 뒤 캐시를 무효화합니다(write-through invalidation).
+    요청 단위 작업 안에서는 무효화를 커밋된 뒤에 하고, 커밋 전까지 그 요청의 조회는 캐시를 거치지 않습니다.
+    """
+
+    def __init__(
+        self,
+        fx_rate_port: FxRatePort,
+        cache: CachePort,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        has_pending_writes: Callable[[], bool] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            fx_rate_port: 원본 환율 저장소
+            cache: 캐시 저장소
+            after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+            has_pending_writes: 커밋되지 않은 쓰기가 있는지 확인하는 함수 (있으면 캐시를 거치지 않음)
+        """
+        self.fx_rate_port = fx_rate_port
+        self.cache = cache
+        self.after_commit = after_commit
+        self.has_pending_writes = has_pending_writes
+
+    def find_fx_rate_table(self) -> FxRateTable:
+        """
+        환율 조회 구조 조회 (캐시 우선)
+
+        Returns:
+            환율 조회 구조
+        """
+        if self.has_pending_writes is not None and self.has_pending_writes():
+            return self.fx_rate_port.find_fx_rate_table()
+
+        fx_rate_table = self.cache.get(FX_RATE_TABLE_CACHE_KEY)
+        if fx_rate_table is None:
+            fx_rate_table = self.fx_rate_port.find_fx_rate_table()
+            self.cache.set(FX_RATE_TABLE_CACHE_KEY, fx_rate_table)
+
+        return fx_rate_table
+
+    def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        try:
+            return self.fx_rate_port.save_fx_rates(fx_rates)
+        finally:
+            _invalidate(self.cache, self.after_commit)
+
+
+class AsyncCachedFxRateRepository(AsyncFxRatePort):
+    """
+    환율 조회 구조를 캐시하는 비동기 환율 저장소
+
+    캐시 정책은 `CachedFxRateRepository`와 같습니다.
+    """
+
+    def __init__(
+        self,
+        fx_rate_port: AsyncFxRatePort,
+        cache: CachePort,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        has_pending_writes: Callable[[], bool] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            fx_rate_port: 원본 비동기 환율 저장소
+            cache: 캐시 저장소
+            after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+            has_pending_writes: 커밋되지 않은 쓰기가 있는지 확인하는 함수 (있으면 캐시를 거치지 않음)
+        """
+        self.fx_rate_port = fx_rate_port
+        self.cache = cache
+        self.after_commit = after_commit
+        self.has_pending_writes = has_pending_writes
+
+    async def find_fx_rate_table(self) -> FxRateTable:
+        """
+        환율 조회 구조 조회 (캐시 우선)
+
+        Returns:
+            환율 조회 구조
+        """
+        if self.has_pending_writes is not None and self.has_pending_writes():
+            return await self.fx_rate_port.find_fx_rate_table()
+
+        fx_rate_table = self.cache.get(FX_RATE_TABLE_CACHE_KEY)
+        if fx_rate_table is None:
+            fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+            self.cache.set(FX_RATE_TABLE_CACHE_KEY, fx_rate_table)
+
+        return fx_rate_table
+
+    async def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        try:
+            return await self.fx_rate_port.save_fx_rates(fx_rates)
+        finally:
+            _invalidate(self.cache, self.after_commit)
+
+
+def _invalidate(cache: CachePort, after_commit: Callable[[Callable[[], None]], None] | None) -> None:
+    """
+    환율 조회 구조 캐시 무효화 (요청 단위 작업 안에서는 커밋된 뒤)
+
+    Args:
+        cache: 캐시 저장소
+        after_commit: 커밋된 뒤에 실행할 처리를 등록하는 함수 (없으면 바로 실행)
+    """
+    if after_commit is None:
+        cache.delete(FX_RATE_TABLE_CACHE_KEY)
+    else:
+        after_commit(lambda: cache.delete(FX_RATE_TABLE_CACHE_KEY))
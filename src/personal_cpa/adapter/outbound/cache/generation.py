@@ -0,0 +1,62 @@
+import threading
+from typing import Any
+
+from personal_cpa.application.port.output.cache import CachePort
+
+
+class CacheGenerations:
+    """
+    캐시 키별 세대 번호
+
+    캐시 미스 뒤 원본을 읽는 동안 다른 요청이 커밋하고 무효화하면 세대가 바뀌므로, 읽기 전 세대와 비교해
+    오래된 값을 캐시에 다시 저장하지 않습니다. 세대 비교와 저장, 세대 증가와 삭제는 같은 잠금 안에서 수행합니다.
+    """
+
+    def __init__(self) -> None:
+        """
+        초기화
+        """
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def current(self, key: str) -> int:
+        """
+        Args:
+            key: 캐시 키
+
+        Returns:
+            키의 현재 세대 번호 (원본을 읽기 전에 조회)
+        """
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set_if_current(self, cache: CachePort, key: str, value: Any, generation: int) -> bool:
+        """
+        읽기 전 세대가 그대로일 때만 캐시에 저장합니다.
+
+        Args:
+            cache: 캐시 저장소
+            key: 캐시 키
+            value: 저장할 값
+            generation: 원본을 읽기 전에 조회한 세대 번호
+
+        Returns:
+            저장 여부
+        """
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return False
+            cache.set(key, value)
+            return True
+
+    def invalidate(self, cache: CachePort, key: str) -> None:
+        """
+        세대를 올리고 캐시를 삭제합니다.
+
+        Args:
+            cache: 캐시 저장소
+            key: 캐시 키
+        """
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            cache.delete(key)
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable
+
+from personal_cpa.application.port.output.cache import CachePort, CacheStats
+
+
+class LRUCache(CachePort):
+    """
+    TTL과 최대 크기를 가진 인프로세스 LRU 캐시
+
+    스레드 풀에서 동시에 접근할 수 있으므로 모든 연산은 잠금 안에서 수행합니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        초기화
+
+        Args:
+            max_size: 최대 항목 수 (0이면 저장하지 않음)
+            ttl_seconds: 항목 유효 시간(초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Any | None:
+        """
+        캐시 조회 (조회된 항목은 가장 최근 사용으로 이동)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 | None (없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        캐시 저장 (최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        """
+        캐시 삭제 (무효화)
+
+        Args:
+            key: 캐시 키
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        """
+        캐시 사용 통계 조회
+
+        Returns:
+            캐시 사용 통계
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
@@ -0,0 +1,48 @@
+from collections.abc import Mapping
+from typing import Any
+
+from personal_cpa.domain.balance import AccountBalance
+
+
+class AccountBalanceMapper:
+    """
+    계정과목 잔액 매퍼
+    """
+
+    @staticmethod
+    def to_row(domain: AccountBalance) -> dict[str, Any]:
+        """
+        잔액 도메인 모델을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 잔액 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {
+            "chart_of_account_id": domain.chart_of_account_id,
+            "period": domain.period,
+            "user_id": domain.user_id,
+            "debit": domain.debit,
+            "credit": domain.credit,
+        }
+
+    @staticmethod
+    def row_to_domain(row: Mapping[str, Any]) -> AccountBalance:
+        """
+        잔액 테이블 행(Core 조회 결과)을 도메인 모델로 변환합니다.
+
+        Args:
+            row: 컬럼명별 값
+
+        Returns:
+            잔액 도메인 모델
+        """
+        return AccountBalance(
+            user_id=row["user_id"],
+            chart_of_account_id=row["chart_of_account_id"],
+            period=row["period"],
+            debit=row["debit"],
+            credit=row["credit"],
+        )
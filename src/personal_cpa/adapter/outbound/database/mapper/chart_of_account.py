@@ -1,9 +1,14 @@
+from collections.abc import Mapping
+from typing import Any
+
 from attr import dataclass
 
 from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
 from personal_cpa.domain.chart_of_account import ChartOfAccount
 from personal_cpa.domain.enum.chart_of_account import AccountType
 
+_ACCOUNT_TYPES = {account_type.value: account_type for account_type in AccountType}
+
 
 @dataclass
 class ChartOfAccountMapper:
@@ -14,7 +19,7 @@ class ChartOfAccountMapper:
     @staticmethod
     def to_domain(entity: ChartOfAccountEntity) -> ChartOfAccount:
         """
-        계정과목 모델을 도메인 모델로 변환합니다.
+        계정과목 모델을 도메인 모델로 변환합니다. (저장된 값이므로 유효성 검사 생략)
 
         Args:
             entity: 계정과목 모델
@@ -22,17 +27,41 @@ class ChartOfAccountMapper:
         Returns:
             도메인 모델
         """
-        return ChartOfAccount(
+        return ChartOfAccount.trusted(
             user_id=entity.user_id,
             code=entity.code,
             name=entity.name,
-            category=AccountType(entity.category),
+            category=_ACCOUNT_TYPES[entity.category],
             is_hidden=entity.is_hidden,
+            currency=entity.currency,
             description=entity.description,
             parent_chart_of_account_id=entity.parent_chart_of_account_id,
             id=entity.id,
         )
 
+    @staticmethod
+    def row_to_domain(row: Mapping[str, Any]) -> ChartOfAccount:
+        """
+        계정과목 테이블 행(Core 조회 결과)을 도메인 모델로 변환합니다. (저장된 값이므로 유효성 검사 생략)
+
+        Args:
+            row: 컬럼명별 값
+
+        Returns:
+            도메인 모델
+        """
+        return ChartOfAccount.trusted(
+            user_id=row["user_id"],
+            code=row["code"],
+            name=row["name"],
+            category=_ACCOUNT_TYPES[row["category"]],
+            is_hidden=row["is_hidden"],
+            currency=row["currency"],
+            description=row["description"],
+            parent_chart_of_account_id=row["parent_chart_of_account_id"],
+            id=row["id"],
+        )
+
     @staticmethod
     def to_entity(domain: ChartOfAccount) -> ChartOfAccountEntity:
         """
@@ -51,6 +80,31 @@ class ChartOfAccountMapper:
             name=domain.name,
             category=domain.category.value,
             is_hidden=domain.is_hidden,
+            currency=domain.currency,
             description=domain.description,
             parent_chart_of_account_id=domain.parent_chart_of_account_id,
+            depth=domain.depth,
         )
+
+    @staticmethod
+    def to_row(domain: ChartOfAccount) -> dict[str, Any]:
+        """
+        도메인 모델을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {
+            "user_id": domain.user_id,
+            "code": domain.code,
+            "name": domain.name,
+            "category": domain.category.value,
+            "is_hidden": domain.is_hidden,
+            "currency": domain.currency,
+            "description": domain.description,
+            "parent_chart_of_account_id": domain.parent_chart_of_account_id,
+            "depth": domain.depth,
+        }
@@ -0,0 +1,46 @@
+from collections.abc import Mapping
+from typing import Any
+
+from personal_cpa.domain.fx_rate import FxRate
+
+
+class FxRateMapper:
+    """
+    환율 매퍼
+    """
+
+    @staticmethod
+    def row_to_domain(row: Mapping[str, Any]) -> FxRate:
+        """
+        환율 테이블 행(Core 조회 결과)을 도메인 모델로 변환합니다.
+
+        Args:
+            row: 컬럼명별 값
+
+        Returns:
+            도메인 모델
+        """
+        return FxRate(
+            base_currency=row["base_currency"],
+            quote_currency=row["quote_currency"],
+            rate_date=row["rate_date"],
+            rate=row["rate"],
+        )
+
+    @staticmethod
+    def to_row(domain: FxRate) -> dict[str, Any]:
+        """
+        도메인 모델을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {
+            "base_currency": domain.base_currency,
+            "quote_currency": domain.quote_currency,
+            "rate_date": domain.rate_date,
+            "rate": domain.rate,
+        }
@@ -0,0 +1,100 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from personal_cpa.domain.journal import JournalEntry, JournalLine, LedgerLine
+
+
+class JournalMapper:
+    """
+    분개 매퍼
+
+    분개는 Core INSERT/SELECT 로만 저장/조회하므로 ORM 엔티티 대신 행(컬럼명별 값)과 변환합니다.
+    """
+
+    @staticmethod
+    def to_entry_row(domain: JournalEntry) -> dict[str, Any]:
+        """
+        분개 도메인 모델을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 분개 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {"user_id": domain.user_id, "entry_date": domain.entry_date, "description": domain.description}
+
+    @staticmethod
+    def to_line_rows(domain: JournalEntry, journal_entry_id: int) -> list[dict[str, Any]]:
+        """
+        분개의 분개 줄을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 분개 도메인 모델
+            journal_entry_id: 저장된 분개 ID
+
+        Returns:
+            분개 줄별 컬럼명별 값 목록
+        """
+        return [
+            {
+                "journal_entry_id": journal_entry_id,
+                "user_id": domain.user_id,
+                "chart_of_account_id": line.chart_of_account_id,
+                "entry_date": domain.entry_date,
+                "debit": line.debit,
+                "credit": line.credit,
+                "description": line.description,
+            }
+            for line in domain.lines
+        ]
+
+    @staticmethod
+    def rows_to_domain(entry_row: Mapping[str, Any], line_rows: Sequence[Mapping[str, Any]]) -> JournalEntry:
+        """
+        분개 행과 분개 줄 행(Core 조회 결과)을 도메인 모델로 변환합니다.
+
+        Args:
+            entry_row: 분개 컬럼명별 값
+            line_rows: 분개 줄 컬럼명별 값 목록
+
+        Returns:
+            분개 도메인 모델
+        """
+        return JournalEntry(
+            user_id=entry_row["user_id"],
+            entry_date=entry_row["entry_date"],
+            description=entry_row["description"],
+            lines=tuple(
+                JournalLine(
+                    chart_of_account_id=row["chart_of_account_id"],
+                    debit=row["debit"],
+                    credit=row["credit"],
+                    description=row["description"],
+                    id=row["id"],
+                )
+                for row in line_rows
+            ),
+            id=entry_row["id"],
+        )
+
+    @staticmethod
+    def row_to_ledger_line(row: Mapping[str, Any]) -> LedgerLine:
+        """
+        분개 줄 행(Core 조회 결과)을 원장 줄로 변환합니다.
+
+        Args:
+            row: 분개 줄 컬럼명별 값
+
+        Returns:
+            원장 줄
+        """
+        return LedgerLine(
+            id=row["id"],
+            journal_entry_id=row["journal_entry_id"],
+            chart_of_account_id=row["chart_of_account_id"],
+            entry_date=row["entry_date"],
+            debit=row["debit"],
+            credit=row["credit"],
+            description=row["description"],
+        )
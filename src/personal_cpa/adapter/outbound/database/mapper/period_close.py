@@ -0,0 +1,66 @@
+from collections.abc import Mapping
+from typing import Any
+
+from personal_cpa.domain.enum.period_close import PeriodCloseStatus
+from personal_cpa.domain.period_close import ClosingBalance, PeriodCloseJob
+
+
+class PeriodCloseMapper:
+    """
+    기간 마감 매퍼
+    """
+
+    @staticmethod
+    def closing_balance_to_row(domain: ClosingBalance) -> dict[str, Any]:
+        """
+        마감 잔액 도메인 모델을 INSERT 문에 사용할 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 마감 잔액 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {
+            "chart_of_account_id": domain.chart_of_account_id,
+            "period": domain.period,
+            "user_id": domain.user_id,
+            "debit": domain.debit,
+            "credit": domain.credit,
+        }
+
+    @staticmethod
+    def job_to_row(domain: PeriodCloseJob) -> dict[str, Any]:
+        """
+        기간 마감 작업 도메인 모델을 컬럼별 값으로 변환합니다.
+
+        Args:
+            domain: 기간 마감 작업 도메인 모델
+
+        Returns:
+            컬럼명별 값
+        """
+        return {
+            "period": domain.period,
+            "status": domain.status.value,
+            "last_user_id": domain.last_user_id,
+            "closed_users": domain.closed_users,
+        }
+
+    @staticmethod
+    def row_to_job(row: Mapping[str, Any]) -> PeriodCloseJob:
+        """
+        기간 마감 작업 테이블 행(Core 조회 결과)을 도메인 모델로 변환합니다.
+
+        Args:
+            row: 컬럼명별 값
+
+        Returns:
+            기간 마감 작업 도메인 모델
+        """
+        return PeriodCloseJob(
+            period=row["period"],
+            status=PeriodCloseStatus(row["status"]),
+            last_user_id=row["last_user_id"],
+            closed_users=row["closed_users"],
+        )
@@ -0,0 +1,39 @@
+from sqlalchemy import BigInteger, Column, Index, Integer
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+
+
+class AccountBalanceEntity(Base):
+    """
+    계정과목 기간별 잔액 모델
+
+    분개 기표 시 같은 트랜잭션에서 변동분을 더하며, 차변/대변 합계는 하위 계정과목을 포함한 값입니다.
+    기간은 YYYYMM 이고 0 은 전체 기간 누계입니다.
+    """
+
+    __tablename__ = "account_balance"
+    # 기간 범위 합계가 테이블을 읽지 않도록 차변/대변까지 포함한 커버링 인덱스
+    __table_args__ = (
+        Index("account_balance_user_id_period", "user_id", "period", "chart_of_account_id", "debit", "credit"),
+    )
+
+    chart_of_account_id = Column(Integer, primary_key=True, autoincrement=False)
+    period = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    debit = Column(BigInteger, nullable=False, default=0)
+    credit = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<AccountBalance("
+            f"chart_of_account_id={self.chart_of_account_id}, "
+            f"period={self.period}, "
+            f"user_id={self.user_id}, "
+            f"debit={self.debit}, "
+            f"credit={self.credit}"
+            f")>"
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.sql.functions import current_timestamp
 
 from personal_cpa.adapter.outbound.database.model.base import Base
@@ -10,6 +10,10 @@ class ChartOfAccountEntity(Base):
     """
 
     __tablename__ = "chart_of_account"
+    __table_args__ = (
+        Index("user_id_code", "user_id", "code", unique=True),
+        Index("user_id_code_depth", "user_id", "code", "depth"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, nullable=False)
@@ -17,8 +21,10 @@ class ChartOfAccountEntity(Base):
     name = Column(String(255), nullable=False)
     category = Column(Integer, nullable=False)
     is_hidden = Column(Boolean, nullable=False, default=False)
+    currency = Column(String(3), nullable=False, default="KRW", server_default="KRW")
     description = Column(Text, nullable=True)
     parent_chart_of_account_id = Column(Integer, nullable=True)
+    depth = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, server_default=current_timestamp())
     updated_at = Column(DateTime, nullable=False, server_default=current_timestamp(), onupdate=current_timestamp())
 
@@ -35,8 +41,10 @@ class ChartOfAccountEntity(Base):
             f"name={self.name}, "
             f"category={self.category}, "
             f"is_hidden={self.is_hidden}, "
+            f"currency={self.currency}, "
             f"description={self.description}, "
             f"parent_chart_of_account_id={self.parent_chart_of_account_id}, "
+            f"depth={self.depth}, "
             f"created_at={self.created_at}, "
             f"updated_at={self.updated_at}"
             f")>"
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Date, Numeric, String
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+
+
+class FxRateEntity(Base):
+    """
+    환율 모델
+
+    기준 통화 1 단위의 표시 통화 금액을 고시일별로 저장하며, 유저와 무관하게 모든 유저가 함께 사용합니다.
+    """
+
+    __tablename__ = "fx_rate"
+
+    base_currency = Column(String(3), primary_key=True)
+    quote_currency = Column(String(3), primary_key=True)
+    rate_date = Column(Date, primary_key=True)
+    rate = Column(Numeric(24, 10), nullable=False)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<FxRate("
+            f"base_currency={self.base_currency}, "
+            f"quote_currency={self.quote_currency}, "
+            f"rate_date={self.rate_date}, "
+            f"rate={self.rate}"
+            f")>"
+        )
@@ -0,0 +1,88 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, Integer, Text
+from sqlalchemy.sql.functions import current_timestamp
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+
+# 분개 줄은 계정과목 수보다 훨씬 빠르게 늘어나므로 MySQL에서는 BIGINT 를 사용합니다.
+# (SQLite는 INTEGER PRIMARY KEY 만 rowid 자동 증가가 되므로 INTEGER 로 둡니다.)
+_BIG_ID = BigInteger().with_variant(Integer, "sqlite")
+
+
+class JournalEntryEntity(Base):
+    """
+    분개 모델
+    """
+
+    __tablename__ = "journal_entry"
+    __table_args__ = (Index("journal_entry_user_id_entry_date", "user_id", "entry_date"),)
+
+    id = Column(_BIG_ID, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False)
+    entry_date = Column(Date, nullable=False)
+    description = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=current_timestamp())
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<JournalEntry("
+            f"id={self.id}, "
+            f"user_id={self.user_id}, "
+            f"entry_date={self.entry_date}, "
+            f"description={self.description}, "
+            f"created_at={self.created_at}"
+            f")>"
+        )
+
+
+class JournalLineEntity(Base):
+    """
+    분개 줄 모델
+
+    계정과목별 기간 조회(원장)와 유저별 기간 집계가 분개 테이블과 조인하지 않도록 user_id와 entry_date를 함께 저장합니다.
+    """
+
+    __tablename__ = "journal_line"
+    __table_args__ = (
+        Index("journal_line_chart_of_account_id_entry_date", "chart_of_account_id", "entry_date"),
+        # 날짜 범위 합계(재무 보고서)가 테이블을 읽지 않도록 차변/대변까지 포함한 커버링 인덱스
+        Index(
+            "journal_line_user_id_entry_date_chart_of_account_id",
+            "user_id",
+            "entry_date",
+            "chart_of_account_id",
+            "debit",
+            "credit",
+        ),
+        Index("journal_line_journal_entry_id", "journal_entry_id"),
+    )
+
+    id = Column(_BIG_ID, primary_key=True, autoincrement=True)
+    journal_entry_id = Column(_BIG_ID, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    chart_of_account_id = Column(Integer, nullable=False)
+    entry_date = Column(Date, nullable=False)
+    debit = Column(BigInteger, nullable=False, default=0)
+    credit = Column(BigInteger, nullable=False, default=0)
+    description = Column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<JournalLine("
+            f"id={self.id}, "
+            f"journal_entry_id={self.journal_entry_id}, "
+            f"user_id={self.user_id}, "
+            f"chart_of_account_id={self.chart_of_account_id}, "
+            f"entry_date={self.entry_date}, "
+            f"debit={self.debit}, "
+            f"credit={self.credit}, "
+            f"description={self.description}"
+            f")>"
+        )
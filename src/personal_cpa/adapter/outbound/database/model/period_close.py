@@ -0,0 +1,110 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.sql.functions import current_timestamp
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+
+
+class ClosingBalanceEntity(Base):
+    """
+    계정과목 마감 잔액 모델
+
+    기간 마감 시 처음부터 기간의 마지막 날까지의 누계를 저장하며, 차변/대변 합계는 하위 계정과목을 포함한 값입니다.
+    """
+
+    __tablename__ = "closing_balance"
+    # 기준일 누계가 마감 잔액을 테이블을 읽지 않고 가져오도록 차변/대변까지 포함한 커버링 인덱스
+    __table_args__ = (
+        Index("closing_balance_user_id_period", "user_id", "period", "chart_of_account_id", "debit", "credit"),
+    )
+
+    chart_of_account_id = Column(Integer, primary_key=True, autoincrement=False)
+    period = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    debit = Column(BigInteger, nullable=False, default=0)
+    credit = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<ClosingBalance("
+            f"chart_of_account_id={self.chart_of_account_id}, "
+            f"period={self.period}, "
+            f"user_id={self.user_id}, "
+            f"debit={self.debit}, "
+            f"credit={self.credit}"
+            f")>"
+        )
+
+
+class PeriodCloseEntity(Base):
+    """
+    유저별 마감된 기간 모델
+
+    마감 잔액 행이 없는(분개가 없는) 유저도 마감 여부를 알 수 있도록 유저, 기간마다 한 행을 저장합니다.
+    """
+
+    __tablename__ = "period_close"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    period = Column(Integer, primary_key=True, autoincrement=False)
+    closed_at = Column(DateTime, nullable=False, server_default=current_timestamp())
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return f"<PeriodClose(user_id={self.user_id}, period={self.period}, closed_at={self.closed_at})>"
+
+
+class PeriodCloseLockEntity(Base):
+    """
+    유저별 기간 마감 잠금 모델
+
+    기표 저장과 기간 마감이 같은 유저의 행을 잠가(`SELECT ... FOR UPDATE`) 같은 유저에 대해 차례로 실행되도록 합니다.
+    """
+
+    __tablename__ = "period_close_lock"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return f"<PeriodCloseLock(user_id={self.user_id})>"
+
+
+class PeriodCloseJobEntity(Base):
+    """
+    기간 마감 작업 모델
+
+    기간마다 한 행이며, 마지막으로 마감한 유저 ID를 저장해 중단된 작업을 이어서 처리합니다.
+    """
+
+    __tablename__ = "period_close_job"
+
+    period = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(16), nullable=False)
+    last_user_id = Column(Integer, nullable=False, default=0)
+    closed_users = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, server_default=current_timestamp())
+    updated_at = Column(DateTime, nullable=False, server_default=current_timestamp(), onupdate=current_timestamp())
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            객체의 공식적인 문자열
+        """
+        return (
+            f"<PeriodCloseJob("
+            f"period={self.period}, "
+            f"status={self.status}, "
+            f"last_user_id={self.last_user_id}, "
+            f"closed_users={self.closed_users}"
+            f")>"
+        )
@@ -0,0 +1,306 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any, Callable
+
+from sqlalchemy import Delete, Select, and_, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.outbound.database.mapper.balance import AccountBalanceMapper
+from personal_cpa.adapter.outbound.database.model.balance import AccountBalanceEntity
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.model.journal import JournalLineEntity
+from personal_cpa.application.port.output.balance import (
+    AccountBalancePort,
+    AccountBalanceSnapshot,
+    AsyncAccountBalancePort,
+)
+from personal_cpa.domain.balance import AccountBalance
+
+_BALANCE_TABLE = AccountBalanceEntity.__table__
+_CHART_OF_ACCOUNT_TABLE = ChartOfAccountEntity.__table__
+_LINE_TABLE = JournalLineEntity.__table__
+
+
+class AccountBalanceRepository(AccountBalancePort):
+    """
+    계정과목 잔액 저장소
+
+    잔액 조회는 읽기 전용 세션(읽기 복제본)을 사용하고, 정합성 검사와 수정은 분개 줄과 잔액을 같은 시점으로
+    비교해야 하므로 주 데이터베이스 세션 하나에서 수행합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        read_session_factory: Callable[[int], AbstractContextManager[Session]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractContextManager[Session]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def find_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 (기표된 분개가 없으면 0) | None (계정과목이 없을 경우)
+        """
+        with self._read_session(user_id) as session:
+            row = session.execute(_select_balance(user_id, code, period)).mappings().one_or_none()
+            return _to_balance(row, user_id, period)
+
+    def find_balance_snapshot(self, user_id: int) -> AccountBalanceSnapshot:
+        """
+        유저의 계정과목 계층, 일별 분개 줄 합계, 저장된 잔액을 한 트랜잭션에서 조회 (주 데이터베이스)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            잔액 정합성 검사용 데이터
+        """
+        with self.session_factory() as session:
+            parent_ids = dict(session.execute(_select_parent_ids(user_id)).tuples().all())
+            daily_totals = list(session.execute(_select_daily_totals(user_id)).tuples().all())
+            balances = [
+                AccountBalanceMapper.row_to_domain(row) for row in session.execute(_select_balances(user_id)).mappings()
+            ]
+
+        return AccountBalanceSnapshot(parent_ids=parent_ids, daily_totals=daily_totals, balances=balances)
+
+    def replace_balances(self, user_id: int, balances: list[AccountBalance]) -> None:
+        """
+        유저의 저장된 잔액을 모두 지우고 주어진 잔액으로 바꿉니다.
+
+        Args:
+            user_id: 유저 ID
+            balances: 잔액 목록
+        """
+        with self.session_factory() as session:
+            session.execute(_delete_balances(user_id))
+            if balances:
+                session.execute(insert(_BALANCE_TABLE), [AccountBalanceMapper.to_row(balance) for balance in balances])
+
+        if self.write_recorder is not None:
+            self.write_recorder(user_id)
+
+
+class AsyncAccountBalanceRepository(AsyncAccountBalancePort):
+    """
+    비동기 계정과목 잔액 저장소
+
+    잔액 조회는 읽기 전용 세션(읽기 복제본)을 사용하고, 정합성 검사와 수정은 주 데이터베이스 세션 하나에서 수행합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        read_session_factory: Callable[[int], AbstractAsyncContextManager[AsyncSession]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 비동기 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 비동기 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    async def find_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 (기표된 분개가 없으면 0) | None (계정과목이 없을 경우)
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_balance(user_id, code, period))
+            return _to_balance(result.mappings().one_or_none(), user_id, period)
+
+    async def find_balance_snapshot(self, user_id: int) -> AccountBalanceSnapshot:
+        """
+        유저의 계정과목 계층, 일별 분개 줄 합계, 저장된 잔액을 한 트랜잭션에서 조회 (주 데이터베이스)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            잔액 정합성 검사용 데이터
+        """
+        async with self.session_factory() as session:
+            parent_ids = dict((await session.execute(_select_parent_ids(user_id))).tuples().all())
+            daily_totals = list((await session.execute(_select_daily_totals(user_id))).tuples().all())
+            result = await session.execute(_select_balances(user_id))
+            balances = [AccountBalanceMapper.row_to_domain(row) for row in result.mappings()]
+
+        return AccountBalanceSnapshot(parent_ids=parent_ids, daily_totals=daily_totals, balances=balances)
+
+    async def replace_balances(self, user_id: int, balances: list[AccountBalance]) -> None:
+        """
+        유저의 저장된 잔액을 모두 지우고 주어진 잔액으로 바꿉니다.
+
+        Args:
+            user_id: 유저 ID
+            balances: 잔액 목록
+        """
+        async with self.session_factory() as session:
+            await session.execute(_delete_balances(user_id))
+            if balances:
+                await session.execute(
+                    insert(_BALANCE_TABLE), [AccountBalanceMapper.to_row(balance) for balance in balances]
+                )
+
+        if self.write_recorder is not None:
+            self.write_recorder(user_id)
+
+
+def _select_balance(user_id: int, code: str, period: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        code: 계정과목 코드
+        period: 기간
+
+    Returns:
+        (user_id, code) 유니크 인덱스로 계정과목을 찾고 (계정과목 ID, 기간) 기본 키로 잔액을 붙이는 쿼리
+        (잔액 행이 없으면 차변/대변이 NULL)
+    """
+    return (
+        select(
+            _CHART_OF_ACCOUNT_TABLE.c.id.label("chart_of_account_id"), _BALANCE_TABLE.c.debit, _BALANCE_TABLE.c.credit
+        )
+        .select_from(
+            _CHART_OF_ACCOUNT_TABLE.outerjoin(
+                _BALANCE_TABLE,
+                and_(
+                    _BALANCE_TABLE.c.chart_of_account_id == _CHART_OF_ACCOUNT_TABLE.c.id,
+                    _BALANCE_TABLE.c.period == period,
+                ),
+            )
+        )
+        .where(_CHART_OF_ACCOUNT_TABLE.c.user_id == user_id)
+        .where(_CHART_OF_ACCOUNT_TABLE.c.code == code)
+    )
+
+
+def _to_balance(row: Any, user_id: int, period: int) -> AccountBalance | None:
+    """
+    Args:
+        row: 잔액 조회 결과 행 (계정과목이 없으면 None)
+        user_id: 유저 ID
+        period: 기간
+
+    Returns:
+        잔액 | None
+    """
+    if row is None:
+        return None
+    return AccountBalance(
+        user_id=user_id,
+        chart_of_account_id=row["chart_of_account_id"],
+        period=period,
+        debit=row["debit"] or 0,
+        credit=row["credit"] or 0,
+    )
+
+
+def _select_parent_ids(user_id: int) -> Select[tuple[int, int | None]]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        유저의 계정과목 (ID, 상위 계정과목 ID) 조회 쿼리
+    """
+    return select(_CHART_OF_ACCOUNT_TABLE.c.id, _CHART_OF_ACCOUNT_TABLE.c.parent_chart_of_account_id).where(
+        _CHART_OF_ACCOUNT_TABLE.c.user_id == user_id
+    )
+
+
+def _select_daily_totals(user_id: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        (user_id, entry_date, chart_of_account_id) 인덱스 범위의 분개 줄을 (계정과목 ID, 거래일)별로 합하는 쿼리
+    """
+    return (
+        select(
+            _LINE_TABLE.c.chart_of_account_id,
+            _LINE_TABLE.c.entry_date,
+            func.sum(_LINE_TABLE.c.debit),
+            func.sum(_LINE_TABLE.c.credit),
+        )
+        .where(_LINE_TABLE.c.user_id == user_id)
+        .group_by(_LINE_TABLE.c.chart_of_account_id, _LINE_TABLE.c.entry_date)
+    )
+
+
+def _select_balances(user_id: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        유저의 저장된 잔액 조회 쿼리
+    """
+    return select(_BALANCE_TABLE).where(_BALANCE_TABLE.c.user_id == user_id)
+
+
+def _delete_balances(user_id: int) -> Delete:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        유저의 저장된 잔액 삭제 쿼리
+    """
+    return delete(_BALANCE_TABLE).where(_BALANCE_TABLE.c.user_id == user_id)
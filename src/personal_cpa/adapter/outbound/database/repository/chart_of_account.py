@@ -1,33 +1,76 @@
-from contextlib import AbstractContextManager
-from typing import Callable
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import replace
+from typing import Any, Callable
 
-from sqlalchemy import select
+from sqlalchemy import Insert, Select, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from personal_cpa.adapter.outbound.database.mapper.chart_of_account import ChartOfAccountMapper
 from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
-from personal_cpa.application.port.output.chart_of_account import ChartOfAccountPort
+from personal_cpa.application.port.output.chart_of_account import AsyncChartOfAccountPort, ChartOfAccountPort
 from personal_cpa.domain.chart_of_account import ChartOfAccount
 
+_TABLE = ChartOfAccountEntity.__table__
+
 
 class ChartOfAccountRepository(ChartOfAccountPort):
     """
     계정과목 저장소
+
+    조회는 읽기 전용 세션(읽기 복제본), 저장은 주 데이터베이스 세션을 사용하고 저장한 유저를 기록하여
+    직후의 조회가 방금 쓴 데이터를 볼 수 있도록 합니다.
     """
 
-    def __init__(self, session_factory: Callable[[], AbstractContextManager[Session]]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        read_session_factory: Callable[[int], AbstractContextManager[Session]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
         """
         초기화
 
         Args:
-            session_factory: 세션 팩토리
+            session_factory: 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
         """
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractContextManager[Session]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def _record_writes(self, chart_of_accounts: list[ChartOfAccount]) -> None:
+        """
+        Args:
+            chart_of_accounts: 저장한 계정과목 목록
+        """
+        if self.write_recorder is not None:
+            for user_id in {chart_of_account.user_id for chart_of_account in chart_of_accounts}:
+                self.write_recorder(user_id)
 
     def save_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
         """
         유저의 계정과목 생성 (여러 개)
 
+        같은 목록 안에서 먼저 생성되는 상위 계정과목은 상위 계정과목 ID가 비어 있으므로,
+        계층(depth) 순서대로 flush 하여 발급된 ID로 하위 계정과목을 연결합니다.
+        커밋은 세션 팩토리가 컨텍스트 종료 시 한 번만 수행합니다.
+
         Args:
             chart_of_accounts: 계정과목 목록
 
@@ -37,13 +80,47 @@ class ChartOfAccountRepository(ChartOfAccountPort):
         entities = [ChartOfAccountMapper.to_entity(chart_of_account) for chart_of_account in chart_of_accounts]
 
         with self.session_factory() as session:
-            session.add_all(entities)
-            session.commit()
+            saved_entities: dict[tuple[int, str], ChartOfAccountEntity] = {}
+            for level in _group_by_depth(chart_of_accounts):
+                _link_parent_entities(chart_of_accounts, entities, level, saved_entities)
+                session.add_all([entities[index] for index in level])
+                session.flush()
 
-            for entity in entities:
-                session.refresh(entity)
+            saved = [ChartOfAccountMapper.to_domain(entity) for entity in entities]
 
-            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+        self._record_writes(chart_of_accounts)
+        return saved
+
+    def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성
+
+        ORM 객체를 거치지 않고 계층(depth)마다 하나의 INSERT 문(executemany)으로 저장합니다.
+        발급된 ID는 `INSERT ... RETURNING`을 지원하는 dialect에서는 같은 문장으로 돌려받고,
+        지원하지 않는 dialect(MySQL 등)에서는 (user_id, code) 유니크 인덱스를 이용한 한 번의 조회로 읽어옵니다.
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            ID가 채워진 계정과목 목록 (입력 순서 유지)
+        """
+        ids: dict[tuple[int, str], int] = {}
+        parent_ids = [chart_of_account.parent_chart_of_account_id for chart_of_account in chart_of_accounts]
+
+        with self.session_factory() as session:
+            returning = session.get_bind().dialect.insert_executemany_returning
+            for level in _group_by_depth(chart_of_accounts):
+                rows = _build_level_rows(chart_of_accounts, parent_ids, level, ids)
+                if returning:
+                    result = session.execute(_insert_statement(returning=True), rows)
+                else:
+                    session.execute(_insert_statement(returning=False), rows)
+                    result = session.execute(_select_inserted_ids(rows))
+                ids.update({(user_id, code): id_ for id_, user_id, code in result})
+
+        self._record_writes(chart_of_accounts)
+        return _with_ids(chart_of_accounts, parent_ids, ids)
 
     def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
         """
@@ -55,14 +132,31 @@ class ChartOfAccountRepository(ChartOfAccountPort):
         Returns:
             계정과목 목록
         """
-        query = select(ChartOfAccountEntity).where(ChartOfAccountEntity.user_id == user_id)
-
-        with self.session_factory() as session:
-            result = session.execute(query)
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_by_user(user_id))
             entities = result.scalars().all()
 
             return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
 
+    def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> Iterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회
+
+        ORM 엔티티를 만들지 않고 서버 측 커서(`yield_per`)로 `batch_size`개씩 읽은 행을
+        매퍼로 바로 변환하므로, 메모리 사용량이 계정과목 수와 무관하게 일정합니다.
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Yields:
+            계정과목
+        """
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_rows_by_user(user_id).execution_options(yield_per=batch_size))
+            for row in result.mappings():
+                yield ChartOfAccountMapper.row_to_domain(row)
+
     def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
         """
         유저의 계정과목 상세 조회
@@ -74,17 +168,77 @@ class ChartOfAccountRepository(ChartOfAccountPort):
         Returns:
             계정과목 | None
         """
-        query = (
-            select(ChartOfAccountEntity)
-            .where(ChartOfAccountEntity.user_id == user_id)
-            .where(ChartOfAccountEntity.code == code)
-        )
-
-        with self.session_factory() as session:
-            result = session.execute(query)
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_by_code(user_id, code))
             entity = result.scalar_one_or_none()
             return ChartOfAccountMapper.to_domain(entity) if entity else None
 
+    def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+        if not codes:
+            return []
+
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_by_codes(user_id, codes))
+            entities = result.scalars().all()
+
+            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+    def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회
+
+        하위 계정과목 코드는 모두 `code + "_"`로 시작하므로 (user_id, code, depth) 인덱스의
+        범위 조회 한 번으로 찾고, 최대 깊이는 같은 인덱스의 depth 컬럼으로 거릅니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_subtree(user_id, code, max_depth))
+            entities = result.scalars().all()
+
+            return _subtree_or_empty(code, [ChartOfAccountMapper.to_domain(entity) for entity in entities])
+
+    def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회
+
+        상위 계정과목 코드는 코드 규칙으로 계산되므로 (user_id, code) 유니크 인덱스의 `code IN (...)` 조회 한 번으로 찾습니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+        ancestor_codes = _ancestor_codes(code)
+        if not ancestor_codes:
+            return []
+
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_by_codes(user_id, ancestor_codes).order_by(ChartOfAccountEntity.depth))
+            entities = result.scalars().all()
+
+            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
     def modify_chart_of_account(self, user_id: int, code: str, chart_of_account: ChartOfAccount) -> ChartOfAccount:
         """
         유저의 계정과목 수정 (비활성화 포함)
@@ -98,3 +252,437 @@ class ChartOfAccountRepository(ChartOfAccountPort):
             NotImplementedError: 이 기능은 아직 구현되지 않았습니다.
         """
         raise NotImplementedError("This feature is not implemented yet")
+
+
+class AsyncChartOfAccountRepository(AsyncChartOfAccountPort):
+    """
+    비동기 계정과목 저장소
+
+    조회는 읽기 전용 세션(읽기 복제본), 저장은 주 데이터베이스 세션을 사용하고 저장한 유저를 기록하여
+    직후의 조회가 방금 쓴 데이터를 볼 수 있도록 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        read_session_factory: Callable[[int], AbstractAsyncContextManager[AsyncSession]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 비동기 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 비동기 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def _record_writes(self, chart_of_accounts: list[ChartOfAccount]) -> None:
+        """
+        Args:
+            chart_of_accounts: 저장한 계정과목 목록
+        """
+        if self.write_recorder is not None:
+            for user_id in {chart_of_account.user_id for chart_of_account in chart_of_accounts}:
+                self.write_recorder(user_id)
+
+    async def save_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            계정과목 목록
+        """
+        entities = [ChartOfAccountMapper.to_entity(chart_of_account) for chart_of_account in chart_of_accounts]
+
+        async with self.session_factory() as session:
+            saved_entities: dict[tuple[int, str], ChartOfAccountEntity] = {}
+            for level in _group_by_depth(chart_of_accounts):
+                _link_parent_entities(chart_of_accounts, entities, level, saved_entities)
+                session.add_all([entities[index] for index in level])
+                await session.flush()
+
+            saved = [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+        self._record_writes(chart_of_accounts)
+        return saved
+
+    async def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성 (계층마다 INSERT 문 1개)
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            ID가 채워진 계정과목 목록 (입력 순서 유지)
+        """
+        ids: dict[tuple[int, str], int] = {}
+        parent_ids = [chart_of_account.parent_chart_of_account_id for chart_of_account in chart_of_accounts]
+
+        async with self.session_factory() as session:
+            returning = session.get_bind().dialect.insert_executemany_returning
+            for level in _group_by_depth(chart_of_accounts):
+                rows = _build_level_rows(chart_of_accounts, parent_ids, level, ids)
+                if returning:
+                    result = await session.execute(_insert_statement(returning=True), rows)
+                else:
+                    await session.execute(_insert_statement(returning=False), rows)
+                    result = await session.execute(_select_inserted_ids(rows))
+                ids.update({(user_id, code): id_ for id_, user_id, code in result})
+
+        self._record_writes(chart_of_accounts)
+        return _with_ids(chart_of_accounts, parent_ids, ids)
+
+    async def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 목록
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_by_user(user_id))
+            entities = result.scalars().all()
+
+            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+    async def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> AsyncIterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회 (서버 측 커서)
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Yields:
+            계정과목
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.stream(_select_rows_by_user(user_id).execution_options(yield_per=batch_size))
+            async for row in result.mappings():
+                yield ChartOfAccountMapper.row_to_domain(row)
+
+    async def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_by_code(user_id, code))
+            entity = result.scalar_one_or_none()
+            return ChartOfAccountMapper.to_domain(entity) if entity else None
+
+    async def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+        if not codes:
+            return []
+
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_by_codes(user_id, codes))
+            entities = result.scalars().all()
+
+            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+    async def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회 (인덱스 범위 조회 1회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_subtree(user_id, code, max_depth))
+            entities = result.scalars().all()
+
+            return _subtree_or_empty(code, [ChartOfAccountMapper.to_domain(entity) for entity in entities])
+
+    async def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회 (유니크 인덱스 조회 1회)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+        ancestor_codes = _ancestor_codes(code)
+        if not ancestor_codes:
+            return []
+
+        async with self._read_session(user_id) as session:
+            result = await session.execute(
+                _select_by_codes(user_id, ancestor_codes).order_by(ChartOfAccountEntity.depth)
+            )
+            entities = result.scalars().all()
+
+            return [ChartOfAccountMapper.to_domain(entity) for entity in entities]
+
+    async def modify_chart_of_account(
+        self, user_id: int, code: str, chart_of_account: ChartOfAccount
+    ) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정 (비활성화 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            chart_of_account: 계정과목
+
+        Raises:
+            NotImplementedError: 이 기능은 아직 구현되지 않았습니다.
+        """
+        raise NotImplementedError("This feature is not implemented yet")
+
+
+def _select_by_user(user_id: int) -> Select[tuple[ChartOfAccountEntity]]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        유저의 계정과목 조회 쿼리
+    """
+    return select(ChartOfAccountEntity).where(ChartOfAccountEntity.user_id == user_id)
+
+
+def _select_rows_by_user(user_id: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        ORM 엔티티 없이 유저의 계정과목 행을 코드순으로 읽는 조회 쿼리
+    """
+    return select(_TABLE).where(_TABLE.c.user_id == user_id).order_by(_TABLE.c.code)
+
+
+def _select_by_code(user_id: int, code: str) -> Select[tuple[ChartOfAccountEntity]]:
+    """
+    Args:
+        user_id: 유저 ID
+        code: 계정과목 코드
+
+    Returns:
+        유저의 계정과목 상세 조회 쿼리
+    """
+    return _select_by_user(user_id).where(ChartOfAccountEntity.code == code)
+
+
+def _select_by_codes(user_id: int, codes: list[str]) -> Select[tuple[ChartOfAccountEntity]]:
+    """
+    Args:
+        user_id: 유저 ID
+        codes: 계정과목 코드 목록
+
+    Returns:
+        (user_id, code) 유니크 인덱스를 사용하는 `code IN (...)` 조회 쿼리
+    """
+    return _select_by_user(user_id).where(ChartOfAccountEntity.code.in_(codes))
+
+
+def _select_subtree(user_id: int, code: str, max_depth: int | None) -> Select[tuple[ChartOfAccountEntity]]:
+    """
+    Args:
+        user_id: 유저 ID
+        code: 기준 계정과목 코드
+        max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음)
+
+    Returns:
+        기준 계정과목과 `code + "_"`로 시작하는 하위 계정과목을 찾는 인덱스 범위 조회 쿼리
+    """
+    statement = _select_by_user(user_id).where(
+        or_(ChartOfAccountEntity.code == code, ChartOfAccountEntity.code.startswith(f"{code}_", autoescape=True))
+    )
+    if max_depth is not None:
+        statement = statement.where(ChartOfAccountEntity.depth <= code.count("_") + max_depth)
+
+    return statement.order_by(ChartOfAccountEntity.code)
+
+
+def _subtree_or_empty(code: str, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+    """
+    기준 계정과목이 없으면 하위 계정과목이 남아 있더라도 빈 목록을 반환합니다.
+
+    Args:
+        code: 기준 계정과목 코드
+        chart_of_accounts: 조회된 계정과목 목록
+
+    Returns:
+        계정과목 목록
+    """
+    return chart_of_accounts if any(chart_of_account.code == code for chart_of_account in chart_of_accounts) else []
+
+
+def _ancestor_codes(code: str) -> list[str]:
+    """
+    Args:
+        code: 계정과목 코드
+
+    Returns:
+        코드 규칙에 따른 상위 계정과목 코드 목록 (최상위 계정과목부터)
+    """
+    parts = code.split("_")
+    return ["_".join(parts[:index]) for index in range(1, len(parts))]
+
+
+def _insert_statement(returning: bool) -> Insert:
+    """
+    Args:
+        returning: 발급된 ID를 `RETURNING`으로 돌려받을지 여부
+
+    Returns:
+        계정과목 INSERT 문
+    """
+    statement = insert(_TABLE)
+    return statement.returning(_TABLE.c.id, _TABLE.c.user_id, _TABLE.c.code) if returning else statement
+
+
+def _select_inserted_ids(rows: list[dict[str, Any]]) -> Select[tuple[int, int, str]]:
+    """
+    Args:
+        rows: 저장한 계정과목 행 목록
+
+    Returns:
+        저장한 계정과목의 ID를 (user_id, code) 유니크 인덱스로 읽어오는 쿼리
+    """
+    return (
+        select(_TABLE.c.id, _TABLE.c.user_id, _TABLE.c.code)
+        .where(_TABLE.c.user_id.in_({row["user_id"] for row in rows}))
+        .where(_TABLE.c.code.in_([row["code"] for row in rows]))
+    )
+
+
+def _group_by_depth(chart_of_accounts: list[ChartOfAccount]) -> list[list[int]]:
+    """
+    계정과목 코드의 계층(depth) 순서대로 목록의 인덱스를 묶습니다.
+
+    Args:
+        chart_of_accounts: 계정과목 목록
+
+    Returns:
+        상위 계층부터 정렬된 인덱스 묶음 목록
+    """
+    levels: dict[int, list[int]] = defaultdict(list)
+    for index, chart_of_account in enumerate(chart_of_accounts):
+        levels[chart_of_account.depth].append(index)
+
+    return [levels[depth] for depth in sorted(levels)]
+
+
+def _link_parent_entities(
+    chart_of_accounts: list[ChartOfAccount],
+    entities: list[ChartOfAccountEntity],
+    level: list[int],
+    saved_entities: dict[tuple[int, str], ChartOfAccountEntity],
+) -> None:
+    """
+    이미 flush 된 상위 계층의 엔티티 ID로 현재 계층 엔티티의 상위 계정과목 ID를 채웁니다.
+
+    Args:
+        chart_of_accounts: 계정과목 목록
+        entities: 계정과목 엔티티 목록 (계정과목 목록과 같은 순서)
+        level: 현재 계층의 인덱스 목록
+        saved_entities: (유저 ID, 코드)별 flush 된 엔티티 (현재 계층이 추가됨)
+    """
+    for index in level:
+        chart_of_account, entity = chart_of_accounts[index], entities[index]
+        parent_entity = saved_entities.get((chart_of_account.user_id, chart_of_account.parent_code or ""))
+        if entity.parent_chart_of_account_id is None and parent_entity is not None:
+            entity.parent_chart_of_account_id = parent_entity.id
+        saved_entities[(chart_of_account.user_id, chart_of_account.code)] = entity
+
+
+def _build_level_rows(
+    chart_of_accounts: list[ChartOfAccount],
+    parent_ids: list[int | None],
+    level: list[int],
+    ids: dict[tuple[int, str], int],
+) -> list[dict[str, Any]]:
+    """
+    현재 계층의 INSERT 행을 만들고, 같은 목록에서 먼저 저장된 상위 계정과목 ID를 연결합니다.
+
+    Args:
+        chart_of_accounts: 계정과목 목록
+        parent_ids: 계정과목별 상위 계정과목 ID (연결된 값으로 갱신됨)
+        level: 현재 계층의 인덱스 목록
+        ids: (유저 ID, 코드)별 저장된 계정과목 ID
+
+    Returns:
+        계정과목 행 목록
+    """
+    rows = []
+    for index in level:
+        chart_of_account = chart_of_accounts[index]
+        if parent_ids[index] is None and chart_of_account.parent_code:
+            parent_ids[index] = ids.get((chart_of_account.user_id, chart_of_account.parent_code))
+        rows.append({**ChartOfAccountMapper.to_row(chart_of_account), "parent_chart_of_account_id": parent_ids[index]})
+
+    return rows
+
+
+def _with_ids(
+    chart_of_accounts: list[ChartOfAccount], parent_ids: list[int | None], ids: dict[tuple[int, str], int]
+) -> list[ChartOfAccount]:
+    """
+    Args:
+        chart_of_accounts: 계정과목 목록
+        parent_ids: 계정과목별 상위 계정과목 ID
+        ids: (유저 ID, 코드)별 저장된 계정과목 ID
+
+    Returns:
+        ID와 상위 계정과목 ID가 채워진 계정과목 목록
+    """
+    return [
+        replace(
+            chart_of_account,
+            id=ids[(chart_of_account.user_id, chart_of_account.code)],
+            parent_chart_of_account_id=parent_id,
+        )
+        for chart_of_account, parent_id in zip(chart_of_accounts, parent_ids, strict=True)
+    ]
@@ -0,0 +1,144 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any, Callable
+
+from sqlalchemy import Insert, Select, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.outbound.database.mapper.fx_rate import FxRateMapper
+from personal_cpa.adapter.outbound.database.model.fx_rate import FxRateEntity
+from personal_cpa.application.port.output.fx_rate import AsyncFxRatePort, FxRatePort
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+_TABLE = FxRateEntity.__table__
+
+
+class FxRateRepository(FxRatePort):
+    """
+    환율 저장소
+
+    환율은 유저와 무관한 작은 테이블이므로 전체를 한 번에 읽어 환율 조회 구조로 만들고, 저장은 upsert 문
+    1개(executemany)로 같은 통화쌍, 고시일의 환율을 덮어씁니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], AbstractContextManager[Session]]) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리
+        """
+        self.session_factory = session_factory
+
+    def find_fx_rate_table(self) -> FxRateTable:
+        """
+        모든 환율을 고시일 순으로 정렬한 환율 조회 구조 조회
+
+        Returns:
+            환율 조회 구조
+        """
+        with self.session_factory() as session:
+            return FxRateTable(
+                FxRateMapper.row_to_domain(row) for row in session.execute(_select_fx_rates()).mappings()
+            )
+
+    def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        if not fx_rates:
+            return 0
+
+        with self.session_factory() as session:
+            session.execute(
+                _upsert_fx_rates(session.get_bind().dialect.name), [FxRateMapper.to_row(rate) for rate in fx_rates]
+            )
+
+        return len(fx_rates)
+
+
+class AsyncFxRateRepository(AsyncFxRatePort):
+    """
+    비동기 환율 저장소
+    """
+
+    def __init__(self, session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]]) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리
+        """
+        self.session_factory = session_factory
+
+    async def find_fx_rate_table(self) -> FxRateTable:
+        """
+        모든 환율을 고시일 순으로 정렬한 환율 조회 구조 조회
+
+        Returns:
+            환율 조회 구조
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(_select_fx_rates())
+            return FxRateTable(FxRateMapper.row_to_domain(row) for row in result.mappings())
+
+    async def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        if not fx_rates:
+            return 0
+
+        async with self.session_factory() as session:
+            await session.execute(
+                _upsert_fx_rates(session.get_bind().dialect.name), [FxRateMapper.to_row(rate) for rate in fx_rates]
+            )
+
+        return len(fx_rates)
+
+
+def _select_fx_rates() -> Select[Any]:
+    """
+    Returns:
+        모든 환율을 기본 키(통화쌍, 고시일) 순으로 읽는 쿼리
+    """
+    return select(_TABLE).order_by(_TABLE.c.base_currency, _TABLE.c.quote_currency, _TABLE.c.rate_date)
+
+
+def _upsert_fx_rates(dialect_name: str) -> Insert:
+    """
+    환율 행이 없으면 만들고, 있으면 환율을 덮어쓰는 upsert 문을 만듭니다.
+
+    Args:
+        dialect_name: 데이터베이스 dialect 이름
+
+    Returns:
+        환율 upsert 문
+
+    Raises:
+        NotImplementedError: upsert 를 지원하지 않는 dialect 일 경우 발생
+    """
+    if dialect_name == "mysql":
+        mysql_statement = mysql_insert(_TABLE)
+        return mysql_statement.on_duplicate_key_update(rate=mysql_statement.inserted.rate)
+    if dialect_name == "sqlite":
+        sqlite_statement = sqlite_insert(_TABLE)
+        return sqlite_statement.on_conflict_do_update(
+            index_elements=[_TABLE.c.base_currency, _TABLE.c.quote_currency, _TABLE.c.rate_date],
+            set_={"rate": sqlite_statement.excluded.rate},
+        )
+    raise NotImplementedError(f"FX rate upsert is not supported for dialect {dialect_name}")
@@ -0,0 +1,697 @@
+from collections.abc import Iterable, Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import replace
+from datetime import date
+import itertools
+from typing import Any, Callable
+
+from sqlalchemy import Insert, Select, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.outbound.database.mapper.balance import AccountBalanceMapper
+from personal_cpa.adapter.outbound.database.mapper.journal import JournalMapper
+from personal_cpa.adapter.outbound.database.model.balance import AccountBalanceEntity
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.model.journal import JournalEntryEntity, JournalLineEntity
+from personal_cpa.adapter.outbound.database.model.period_close import PeriodCloseEntity
+from personal_cpa.adapter.outbound.database.repository.period_close import (
+    period_close_lock_rows,
+    select_period_close_locks,
+    upsert_period_close_locks,
+)
+from personal_cpa.application.port.output.journal import AsyncJournalPort, JournalPort
+from personal_cpa.domain.balance import AccountBalance, ancestor_chains, validate_open_period
+from personal_cpa.domain.journal import JournalEntry, LedgerLine
+
+_ENTRY_TABLE = JournalEntryEntity.__table__
+_LINE_TABLE = JournalLineEntity.__table__
+_CHART_OF_ACCOUNT_TABLE = ChartOfAccountEntity.__table__
+_BALANCE_TABLE = AccountBalanceEntity.__table__
+_PERIOD_CLOSE_TABLE = PeriodCloseEntity.__table__
+
+# `RETURNING`이 없는 dialect에서 분개를 여러 행 VALUES 하나로 저장할 때 한 문장에 넣을 최대 분개 수
+_MULTI_VALUES_CHUNK_SIZE = 1000
+
+
+class JournalRepository(JournalPort):
+    """
+    분개 저장소
+
+    조회는 읽기 전용 세션(읽기 복제본), 저장은 주 데이터베이스 세션을 사용하고 저장한 유저를 기록하여
+    직후의 조회가 방금 쓴 데이터를 볼 수 있도록 합니다. 저장 전에 확인하는 계정과목과 마감 기간은 복제 지연으로
+    오래된 값을 보지 않도록 주 데이터베이스에서 조회합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        read_session_factory: Callable[[int], AbstractContextManager[Session]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractContextManager[Session]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def _record_writes(self, journal_entries: list[JournalEntry]) -> None:
+        """
+        Args:
+            journal_entries: 저장한 분개 목록
+        """
+        if self.write_recorder is not None:
+            for user_id in {journal_entry.user_id for journal_entry in journal_entries}:
+                self.write_recorder(user_id)
+
+    def find_postable_chart_of_account_ancestors(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, tuple[int, ...]]:
+        """
+        분개할 수 있는 계정과목과 그 상위 계정과목 ID 조회
+
+        기본 키 `IN (...)` 조회로 분개할 계정과목을 읽은 뒤, 아직 모르는 상위 계정과목 ID를 계층마다 한 번씩 조회합니다.
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목이면서 숨김 처리되지 않은 계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+        """
+        ids = set(chart_of_account_ids)
+        if not ids:
+            return {}
+
+        with self.session_factory() as session:
+            postable = dict(session.execute(_select_postable_parent_ids(user_id, ids)).tuples().all())
+            parent_ids: dict[int, int | None] = dict(postable)
+            while frontier := _unknown_parent_ids(parent_ids):
+                rows = session.execute(_select_parent_ids(user_id, frontier)).tuples().all()
+                _merge_parent_ids(parent_ids, frontier, rows)
+
+        return _postable_ancestors(postable, parent_ids)
+
+    def find_chart_of_account_currencies(self, user_id: int, chart_of_account_ids: Iterable[int]) -> dict[int, str]:
+        """
+        계정과목 통화 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목 ID별 통화 코드
+        """
+        ids = set(chart_of_account_ids)
+        if not ids:
+            return {}
+
+        with self.session_factory() as session:
+            return dict(session.execute(_select_currencies(user_id, ids)).tuples().all())
+
+    def find_closed_period(self, user_id: int) -> int | None:
+        """
+        유저의 가장 최근 마감 기간 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+        with self.session_factory() as session:
+            return session.scalar(_select_closed_period(user_id))
+
+    def save_journal_entries(
+        self, journal_entries: list[JournalEntry], balance_changes: list[AccountBalance]
+    ) -> list[JournalEntry]:
+        """
+        분개 일괄 저장
+
+        분개는 `INSERT ... RETURNING`을 지원하는 dialect에서는 INSERT 문 1개(여러 행 VALUES 묶음)로 ID를 돌려받고,
+        지원하지 않는 dialect(MySQL)에서는 여러 행 VALUES 문의 첫 ID(`lastrowid`)부터 연속된 ID를 사용합니다.
+        자동 증가 ID는 VALUES 순서대로 발급되므로 돌려받은 ID를 정렬하면 입력 순서와 대응합니다.
+        (`sort_by_parameter_order`는 SQLite에서 한 행씩 INSERT 하게 되므로 사용하지 않습니다.)
+        분개 줄은 ID를 돌려받을 필요가 없으므로 INSERT 문 1개(executemany)로 저장합니다.
+        잔액 변동분은 같은 트랜잭션에서 upsert 문 1개(executemany)로 기존 잔액에 더합니다.
+        저장 전에 기간 마감과 함께 잡는 유저별 마감 잠금을 잡고 마감 기간을 다시 읽으므로, 기표 전 확인 뒤에
+        마감된 기간으로는 저장하지 않습니다. 커밋은 세션 팩토리가 컨텍스트 종료 시 한 번만 수행합니다.
+
+        Args:
+            journal_entries: 분개 목록
+            balance_changes: 상위 계정과목까지 합산된 (계정과목, 기간)별 잔액 변동분 ((계정과목, 기간)순 정렬)
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 마감 잠금을 잡은 뒤 다시 읽은 마감 기간의 거래일이 있을 경우 발생
+        """
+        if not journal_entries:
+            return []
+
+        entry_rows = [JournalMapper.to_entry_row(journal_entry) for journal_entry in journal_entries]
+        lock_rows = period_close_lock_rows(journal_entry.user_id for journal_entry in journal_entries)
+        user_ids = [row["user_id"] for row in lock_rows]
+        with self.session_factory() as session:
+            session.execute(upsert_period_close_locks(session.get_bind().dialect.name), lock_rows)
+            session.execute(select_period_close_locks(user_ids))
+            _assert_open_periods(journal_entries, session.execute(_select_closed_periods(user_ids)).tuples().all())
+            if session.get_bind().dialect.insert_executemany_returning:
+                ids = sorted(session.execute(_insert_entries_returning(), entry_rows).scalars())
+            else:
+                ids = []
+                for chunk in itertools.batched(entry_rows, _MULTI_VALUES_CHUNK_SIZE, strict=False):
+                    first_id = session.execute(insert(_ENTRY_TABLE).values(chunk)).lastrowid
+                    found = session.scalar(_count_entries_in_range(first_id, len(chunk)))
+                    _assert_consecutive_ids(first_id, len(chunk), found)
+                    ids.extend(range(first_id, first_id + len(chunk)))
+            session.execute(insert(_LINE_TABLE), _build_line_rows(journal_entries, ids))
+            if balance_changes:
+                session.execute(
+                    _upsert_balances(session.get_bind().dialect.name),
+                    [AccountBalanceMapper.to_row(balance) for balance in balance_changes],
+                )
+
+        self._record_writes(journal_entries)
+        return [replace(journal_entry, id=id_) for journal_entry, id_ in zip(journal_entries, ids, strict=True)]
+
+    def find_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+        with self._read_session(user_id) as session:
+            entry_row = session.execute(_select_entry(user_id, journal_entry_id)).mappings().one_or_none()
+            if entry_row is None:
+                return None
+
+            line_rows = session.execute(_select_entry_lines(journal_entry_id)).mappings().all()
+            return JournalMapper.rows_to_domain(entry_row, line_rows)
+
+    def find_ledger_lines(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        계정과목의 기간별 분개 줄 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+        with self._read_session(user_id) as session:
+            result = session.execute(_select_ledger(user_id, chart_of_account_id, start_date, end_date, limit))
+            return [JournalMapper.row_to_ledger_line(row) for row in result.mappings()]
+
+
+class AsyncJournalRepository(AsyncJournalPort):
+    """
+    비동기 분개 저장소
+
+    조회는 읽기 전용 세션(읽기 복제본), 저장은 주 데이터베이스 세션을 사용하고 저장한 유저를 기록하여
+    직후의 조회가 방금 쓴 데이터를 볼 수 있도록 합니다. 저장 전에 확인하는 계정과목과 마감 기간은 복제 지연으로
+    오래된 값을 보지 않도록 주 데이터베이스에서 조회합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        read_session_factory: Callable[[int], AbstractAsyncContextManager[AsyncSession]] | None = None,
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (쓰기, 주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 비동기 세션 팩토리 (None 이면 `session_factory` 사용)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.write_recorder = write_recorder
+
+    def _read_session(self, user_id: int) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 비동기 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def _record_writes(self, journal_entries: list[JournalEntry]) -> None:
+        """
+        Args:
+            journal_entries: 저장한 분개 목록
+        """
+        if self.write_recorder is not None:
+            for user_id in {journal_entry.user_id for journal_entry in journal_entries}:
+                self.write_recorder(user_id)
+
+    async def find_postable_chart_of_account_ancestors(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, tuple[int, ...]]:
+        """
+        분개할 수 있는 계정과목과 그 상위 계정과목 ID 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목이면서 숨김 처리되지 않은 계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+        """
+        ids = set(chart_of_account_ids)
+        if not ids:
+            return {}
+
+        async with self.session_factory() as session:
+            result = await session.execute(_select_postable_parent_ids(user_id, ids))
+            postable = dict(result.tuples().all())
+            parent_ids: dict[int, int | None] = dict(postable)
+            while frontier := _unknown_parent_ids(parent_ids):
+                result = await session.execute(_select_parent_ids(user_id, frontier))
+                _merge_parent_ids(parent_ids, frontier, result.tuples().all())
+
+        return _postable_ancestors(postable, parent_ids)
+
+    async def find_chart_of_account_currencies(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, str]:
+        """
+        계정과목 통화 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목 ID별 통화 코드
+        """
+        ids = set(chart_of_account_ids)
+        if not ids:
+            return {}
+
+        async with self.session_factory() as session:
+            result = await session.execute(_select_currencies(user_id, ids))
+            return dict(result.tuples().all())
+
+    async def find_closed_period(self, user_id: int) -> int | None:
+        """
+        유저의 가장 최근 마감 기간 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+        async with self.session_factory() as session:
+            return await session.scalar(_select_closed_period(user_id))
+
+    async def save_journal_entries(
+        self, journal_entries: list[JournalEntry], balance_changes: list[AccountBalance]
+    ) -> list[JournalEntry]:
+        """
+        분개 일괄 저장 (마감 잠금 후 마감 기간 재확인, 분개 INSERT 문 1개, 분개 줄 INSERT 문 1개, 잔액 upsert 문 1개)
+
+        Args:
+            journal_entries: 분개 목록
+            balance_changes: 상위 계정과목까지 합산된 (계정과목, 기간)별 잔액 변동분 ((계정과목, 기간)순 정렬)
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 마감 잠금을 잡은 뒤 다시 읽은 마감 기간의 거래일이 있을 경우 발생
+        """
+        if not journal_entries:
+            return []
+
+        entry_rows = [JournalMapper.to_entry_row(journal_entry) for journal_entry in journal_entries]
+        lock_rows = period_close_lock_rows(journal_entry.user_id for journal_entry in journal_entries)
+        user_ids = [row["user_id"] for row in lock_rows]
+        async with self.session_factory() as session:
+            await session.execute(upsert_period_close_locks(session.get_bind().dialect.name), lock_rows)
+            await session.execute(select_period_close_locks(user_ids))
+            closed_periods = await session.execute(_select_closed_periods(user_ids))
+            _assert_open_periods(journal_entries, closed_periods.tuples().all())
+            if session.get_bind().dialect.insert_executemany_returning:
+                result = await session.execute(_insert_entries_returning(), entry_rows)
+                ids = sorted(result.scalars())
+            else:
+                ids = []
+                for chunk in itertools.batched(entry_rows, _MULTI_VALUES_CHUNK_SIZE, strict=False):
+                    result = await session.execute(insert(_ENTRY_TABLE).values(chunk))
+                    first_id = result.lastrowid
+                    found = await session.scalar(_count_entries_in_range(first_id, len(chunk)))
+                    _assert_consecutive_ids(first_id, len(chunk), found)
+                    ids.extend(range(first_id, first_id + len(chunk)))
+            await session.execute(insert(_LINE_TABLE), _build_line_rows(journal_entries, ids))
+            if balance_changes:
+                await session.execute(
+                    _upsert_balances(session.get_bind().dialect.name),
+                    [AccountBalanceMapper.to_row(balance) for balance in balance_changes],
+                )
+
+        self._record_writes(journal_entries)
+        return [replace(journal_entry, id=id_) for journal_entry, id_ in zip(journal_entries, ids, strict=True)]
+
+    async def find_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_entry(user_id, journal_entry_id))
+            entry_row = result.mappings().one_or_none()
+            if entry_row is None:
+                return None
+
+            result = await session.execute(_select_entry_lines(journal_entry_id))
+            return JournalMapper.rows_to_domain(entry_row, result.mappings().all())
+
+    async def find_ledger_lines(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        계정과목의 기간별 분개 줄 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_ledger(user_id, chart_of_account_id, start_date, end_date, limit))
+            return [JournalMapper.row_to_ledger_line(row) for row in result.mappings()]
+
+
+def _select_postable_parent_ids(user_id: int, chart_of_account_ids: set[int]) -> Select[tuple[int, int | None]]:
+    """
+    Args:
+        user_id: 유저 ID
+        chart_of_account_ids: 확인할 계정과목 ID 목록
+
+    Returns:
+        유저의 숨김 처리되지 않은 계정과목의 (ID, 상위 계정과목 ID)를 기본 키로 찾는 쿼리
+    """
+    return _select_parent_ids(user_id, chart_of_account_ids).where(_CHART_OF_ACCOUNT_TABLE.c.is_hidden.is_(False))
+
+
+def _select_parent_ids(user_id: int, chart_of_account_ids: set[int]) -> Select[tuple[int, int | None]]:
+    """
+    Args:
+        user_id: 유저 ID
+        chart_of_account_ids: 계정과목 ID 목록
+
+    Returns:
+        유저의 계정과목 (ID, 상위 계정과목 ID)를 기본 키로 찾는 쿼리 (숨김 계정과목 포함)
+    """
+    return (
+        select(_CHART_OF_ACCOUNT_TABLE.c.id, _CHART_OF_ACCOUNT_TABLE.c.parent_chart_of_account_id)
+        .where(_CHART_OF_ACCOUNT_TABLE.c.id.in_(sorted(chart_of_account_ids)))
+        .where(_CHART_OF_ACCOUNT_TABLE.c.user_id == user_id)
+    )
+
+
+def _select_currencies(user_id: int, chart_of_account_ids: set[int]) -> Select[tuple[int, str]]:
+    """
+    Args:
+        user_id: 유저 ID
+        chart_of_account_ids: 계정과목 ID 목록
+
+    Returns:
+        유저의 계정과목 (ID, 통화 코드)를 기본 키로 찾는 쿼리
+    """
+    return (
+        select(_CHART_OF_ACCOUNT_TABLE.c.id, _CHART_OF_ACCOUNT_TABLE.c.currency)
+        .where(_CHART_OF_ACCOUNT_TABLE.c.id.in_(sorted(chart_of_account_ids)))
+        .where(_CHART_OF_ACCOUNT_TABLE.c.user_id == user_id)
+    )
+
+
+def _unknown_parent_ids(parent_ids: dict[int, int | None]) -> set[int]:
+    """
+    Args:
+        parent_ids: 지금까지 조회한 계정과목 ID별 상위 계정과목 ID
+
+    Returns:
+        아직 조회하지 않은 상위 계정과목 ID
+    """
+    return {parent_id for parent_id in parent_ids.values() if parent_id is not None and parent_id not in parent_ids}
+
+
+def _merge_parent_ids(
+    parent_ids: dict[int, int | None], frontier: set[int], rows: Sequence[tuple[int, int | None]]
+) -> None:
+    """
+    조회한 상위 계정과목의 상위 계정과목 ID를 합칩니다. 찾지 못한 계정과목은 최상위로 취급해 다시 조회하지 않습니다.
+
+    Args:
+        parent_ids: 계정과목 ID별 상위 계정과목 ID (조회 결과가 추가됨)
+        frontier: 조회한 계정과목 ID
+        rows: 조회 결과 (ID, 상위 계정과목 ID) 목록
+    """
+    parent_ids.update(dict.fromkeys(frontier))
+    parent_ids.update(rows)
+
+
+def _postable_ancestors(
+    postable: dict[int, int | None], parent_ids: dict[int, int | None]
+) -> dict[int, tuple[int, ...]]:
+    """
+    Args:
+        postable: 분개할 수 있는 계정과목 ID별 상위 계정과목 ID
+        parent_ids: 상위 계정과목을 포함한 계정과목 ID별 상위 계정과목 ID
+
+    Returns:
+        분개할 수 있는 계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+    """
+    chains = ancestor_chains(parent_ids)
+    return {chart_of_account_id: chains[chart_of_account_id] for chart_of_account_id in postable}
+
+
+def _select_closed_period(user_id: int) -> Select[tuple[int | None]]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        (user_id, period) 기본 키로 유저의 가장 최근 마감 기간을 찾는 쿼리
+    """
+    return select(func.max(_PERIOD_CLOSE_TABLE.c.period)).where(_PERIOD_CLOSE_TABLE.c.user_id == user_id)
+
+
+def _select_closed_periods(user_ids: list[int]) -> Select[tuple[int, int]]:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+
+    Returns:
+        (user_id, period) 기본 키로 유저별 가장 최근 마감 기간을 찾는 쿼리 (마감된 기간이 없는 유저는 제외)
+    """
+    return (
+        select(_PERIOD_CLOSE_TABLE.c.user_id, func.max(_PERIOD_CLOSE_TABLE.c.period))
+        .where(_PERIOD_CLOSE_TABLE.c.user_id.in_(user_ids))
+        .group_by(_PERIOD_CLOSE_TABLE.c.user_id)
+    )
+
+
+def _assert_open_periods(journal_entries: list[JournalEntry], closed_periods: Iterable[tuple[int, int]]) -> None:
+    """
+    Args:
+        journal_entries: 저장할 분개 목록
+        closed_periods: 마감 잠금을 잡은 뒤 읽은 (유저 ID, 가장 최근 마감 기간) 목록
+
+    Raises:
+        ValueError: 마감된 기간의 거래일이 있을 경우 발생 (기표 전 확인 뒤 기간이 마감된 경우)
+    """
+    closed_through = dict(closed_periods)
+    for index, journal_entry in enumerate(journal_entries):
+        try:
+            validate_open_period(journal_entry.entry_date, closed_through.get(journal_entry.user_id))
+        except ValueError as error:
+            raise ValueError(f"entries[{index}]: {error}") from error
+
+
+def _upsert_balances(dialect_name: str) -> Insert:
+    """
+    잔액 행이 없으면 만들고, 있으면 변동분을 더하는 upsert 문을 만듭니다.
+
+    (계정과목 ID, 기간) 기본 키에서 행 안의 덧셈으로 처리하므로 동시 기표도 변동분을 잃지 않으며,
+    변동분을 (계정과목 ID, 기간)순으로 넘기면 트랜잭션끼리 같은 순서로 행을 잠급니다.
+
+    Args:
+        dialect_name: 데이터베이스 dialect 이름
+
+    Returns:
+        잔액 upsert 문
+
+    Raises:
+        NotImplementedError: upsert 를 지원하지 않는 dialect 일 경우 발생
+    """
+    if dialect_name == "mysql":
+        mysql_statement = mysql_insert(_BALANCE_TABLE)
+        return mysql_statement.on_duplicate_key_update(
+            debit=_BALANCE_TABLE.c.debit + mysql_statement.inserted.debit,
+            credit=_BALANCE_TABLE.c.credit + mysql_statement.inserted.credit,
+        )
+    if dialect_name == "sqlite":
+        sqlite_statement = sqlite_insert(_BALANCE_TABLE)
+        return sqlite_statement.on_conflict_do_update(
+            index_elements=[_BALANCE_TABLE.c.chart_of_account_id, _BALANCE_TABLE.c.period],
+            set_={
+                "debit": _BALANCE_TABLE.c.debit + sqlite_statement.excluded.debit,
+                "credit": _BALANCE_TABLE.c.credit + sqlite_statement.excluded.credit,
+            },
+        )
+    raise NotImplementedError(f"Balance upsert is not supported for dialect {dialect_name}")
+
+
+def _insert_entries_returning() -> Insert:
+    """
+    Returns:
+        발급된 분개 ID를 돌려받는 분개 INSERT 문
+    """
+    return insert(_ENTRY_TABLE).returning(_ENTRY_TABLE.c.id)
+
+
+def _count_entries_in_range(first_id: int, count: int) -> Select[tuple[int]]:
+    """
+    Args:
+        first_id: 여러 행 VALUES 문의 첫 ID
+        count: 저장한 분개 수
+
+    Returns:
+        `first_id`부터 `count`개의 ID 범위에 있는 분개 수를 기본 키 범위 조회로 세는 쿼리
+    """
+    return select(func.count()).where(_ENTRY_TABLE.c.id.between(first_id, first_id + count - 1))
+
+
+def _assert_consecutive_ids(first_id: int, count: int, found: int | None) -> None:
+    """
+    InnoDB는 행 수를 미리 아는 INSERT(여러 행 VALUES 포함)에 연속된 AUTO_INCREMENT 값을 한 번에 할당하지만,
+    이 가정이 깨지면 분개 줄이 다른 분개에 연결되므로 저장 전에 확인합니다.
+
+    Args:
+        first_id: 여러 행 VALUES 문의 첫 ID
+        count: 저장한 분개 수
+        found: ID 범위에서 찾은 분개 수
+
+    Raises:
+        RuntimeError: ID가 연속이 아닐 경우 발생
+    """
+    if found != count:
+        raise RuntimeError(
+            f"Journal entry ids are not consecutive. (first id: {first_id}, expected: {count}, found: {found})"
+        )
+
+
+def _build_line_rows(journal_entries: list[JournalEntry], ids: list[int]) -> list[dict[str, Any]]:
+    """
+    Args:
+        journal_entries: 분개 목록
+        ids: 분개별 저장된 분개 ID (분개 목록과 같은 순서)
+
+    Returns:
+        분개 줄 행 목록
+    """
+    rows = []
+    for journal_entry, id_ in zip(journal_entries, ids, strict=True):
+        rows.extend(JournalMapper.to_line_rows(journal_entry, id_))
+    return rows
+
+
+def _select_entry(user_id: int, journal_entry_id: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        journal_entry_id: 분개 ID
+
+    Returns:
+        유저의 분개를 기본 키로 찾는 쿼리
+    """
+    return select(_ENTRY_TABLE).where(_ENTRY_TABLE.c.id == journal_entry_id).where(_ENTRY_TABLE.c.user_id == user_id)
+
+
+def _select_entry_lines(journal_entry_id: int) -> Select[Any]:
+    """
+    Args:
+        journal_entry_id: 분개 ID
+
+    Returns:
+        (journal_entry_id) 인덱스로 분개 줄을 기표 순으로 찾는 쿼리
+    """
+    return select(_LINE_TABLE).where(_LINE_TABLE.c.journal_entry_id == journal_entry_id).order_by(_LINE_TABLE.c.id)
+
+
+def _select_ledger(user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        chart_of_account_id: 계정과목 ID
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+        limit: 최대 줄 수
+
+    Returns:
+        (chart_of_account_id, entry_date) 인덱스 범위 조회 쿼리
+        (보조 인덱스는 기본 키를 포함하므로 거래일, ID 순 정렬에 별도 정렬이 필요 없음)
+    """
+    return (
+        select(_LINE_TABLE)
+        .where(_LINE_TABLE.c.chart_of_account_id == chart_of_account_id)
+        .where(_LINE_TABLE.c.entry_date.between(start_date, end_date))
+        .where(_LINE_TABLE.c.user_id == user_id)
+        .order_by(_LINE_TABLE.c.entry_date, _LINE_TABLE.c.id)
+        .limit(limit)
+    )
@@ -0,0 +1,395 @@
+from collections.abc import Awaitable, Iterable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any, Callable
+
+from sqlalchemy import Delete, Insert, Select, Update, delete, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.outbound.database.mapper.period_close import PeriodCloseMapper
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.model.period_close import (
+    ClosingBalanceEntity,
+    PeriodCloseEntity,
+    PeriodCloseJobEntity,
+    PeriodCloseLockEntity,
+)
+from personal_cpa.application.port.output.period_close import AsyncPeriodClosePort, PeriodClosePort
+from personal_cpa.domain.period_close import ClosingBalance, PeriodCloseJob
+
+_CHART_OF_ACCOUNT_TABLE = ChartOfAccountEntity.__table__
+_CLOSING_BALANCE_TABLE = ClosingBalanceEntity.__table__
+_PERIOD_CLOSE_TABLE = PeriodCloseEntity.__table__
+_JOB_TABLE = PeriodCloseJobEntity.__table__
+_LOCK_TABLE = PeriodCloseLockEntity.__table__
+
+
+class PeriodCloseRepository(PeriodClosePort):
+    """
+    기간 마감 저장소
+
+    마감 작업은 방금 기표된 분개까지 반영해야 하므로 조회와 저장 모두 주 데이터베이스 세션을 사용하고,
+    마감한 유저를 기록하여 직후의 조회(기표 시 마감 기간 확인 포함)가 마감 결과를 볼 수 있도록 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리 (주 데이터베이스)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.write_recorder = write_recorder
+
+    def find_period_close_job(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+        with self.session_factory() as session:
+            row = session.execute(_select_job(period)).mappings().one_or_none()
+            return None if row is None else PeriodCloseMapper.row_to_job(row)
+
+    def create_period_close_job(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        기간 마감 작업 생성 (같은 기간의 작업이 이미 있으면 그 작업을 그대로 사용)
+
+        Args:
+            job: 새 기간 마감 작업
+
+        Returns:
+            저장된 기간 마감 작업
+        """
+        with self.session_factory() as session:
+            row = session.execute(_select_job(job.period)).mappings().one_or_none()
+            if row is not None:
+                return PeriodCloseMapper.row_to_job(row)
+            session.execute(insert(_JOB_TABLE).values(PeriodCloseMapper.job_to_row(job)))
+
+        return job
+
+    def find_user_ids(self, after_user_id: int, limit: int) -> list[int]:
+        """
+        계정과목이 있는 유저 ID를 오름차순으로 조회
+
+        Args:
+            after_user_id: 이 유저 ID보다 큰 유저만 조회
+            limit: 최대 유저 수
+
+        Returns:
+            유저 ID 목록 (오름차순)
+        """
+        with self.session_factory() as session:
+            return list(session.execute(_select_user_ids(after_user_id, limit)).scalars())
+
+    def close_users(
+        self, job: PeriodCloseJob, user_ids: list[int], close_user: Callable[[int], list[ClosingBalance]]
+    ) -> None:
+        """
+        유저 묶음을 마감하고 마감 결과와 작업 진행 상황을 한 트랜잭션에서 저장
+
+        트랜잭션을 시작하며 유저들의 마감 잠금 행을 잠근 뒤(`SELECT ... FOR UPDATE`) 마감 잔액을 계산하므로, 계산 중인
+        유저의 기표 저장은 이 트랜잭션이 커밋될 때까지 기다렸다가 마감된 기간을 다시 확인합니다. 마감 잔액은 다른
+        세션(커넥션)에서 커밋된 데이터를 읽어도 되므로, 묶음마다 주 데이터베이스 커넥션을 두 개까지 씁니다.
+        마감 잔액과 마감 기간 행은 지운 뒤 INSERT 문 1개(executemany)씩으로 다시 저장하고, 같은 트랜잭션에서
+        작업의 마지막 유저 ID를 갱신하므로 중단되면 묶음 전체가 다시 처리됩니다.
+
+        Args:
+            job: 이번 묶음까지 반영한 기간 마감 작업
+            user_ids: 마감할 유저 ID 목록 (오름차순)
+            close_user: 유저 ID를 받아 그 유저의 마감 잔액 목록을 계산하는 함수
+        """
+        with self.session_factory() as session:
+            session.execute(
+                upsert_period_close_locks(session.get_bind().dialect.name), period_close_lock_rows(user_ids)
+            )
+            session.execute(select_period_close_locks(user_ids))
+            closing_balances = [balance for user_id in user_ids for balance in close_user(user_id)]
+
+            session.execute(_delete_closing_balances(user_ids, job.period))
+            if closing_balances:
+                session.execute(
+                    insert(_CLOSING_BALANCE_TABLE),
+                    [PeriodCloseMapper.closing_balance_to_row(balance) for balance in closing_balances],
+                )
+            session.execute(_delete_period_closes(user_ids, job.period))
+            session.execute(insert(_PERIOD_CLOSE_TABLE), _period_close_rows(user_ids, job.period))
+            session.execute(_update_job(job))
+
+        if self.write_recorder is not None:
+            for user_id in user_ids:
+                self.write_recorder(user_id)
+
+    def save_period_close_job(self, job: PeriodCloseJob) -> None:
+        """
+        기간 마감 작업의 진행 상황 저장
+
+        Args:
+            job: 기간 마감 작업
+        """
+        with self.session_factory() as session:
+            session.execute(_update_job(job))
+
+
+class AsyncPeriodCloseRepository(AsyncPeriodClosePort):
+    """
+    비동기 기간 마감 저장소
+
+    조회와 저장 모두 주 데이터베이스 세션을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        write_recorder: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (주 데이터베이스)
+            write_recorder: 쓰기가 커밋된 유저 ID를 받는 함수 (읽기 고정용)
+        """
+        self.session_factory = session_factory
+        self.write_recorder = write_recorder
+
+    async def find_period_close_job(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(_select_job(period))
+            row = result.mappings().one_or_none()
+            return None if row is None else PeriodCloseMapper.row_to_job(row)
+
+    async def create_period_close_job(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        기간 마감 작업 생성 (같은 기간의 작업이 이미 있으면 그 작업을 그대로 사용)
+
+        Args:
+            job: 새 기간 마감 작업
+
+        Returns:
+            저장된 기간 마감 작업
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(_select_job(job.period))
+            row = result.mappings().one_or_none()
+            if row is not None:
+                return PeriodCloseMapper.row_to_job(row)
+            await session.execute(insert(_JOB_TABLE).values(PeriodCloseMapper.job_to_row(job)))
+
+        return job
+
+    async def find_user_ids(self, after_user_id: int, limit: int) -> list[int]:
+        """
+        계정과목이 있는 유저 ID를 오름차순으로 조회
+
+        Args:
+            after_user_id: 이 유저 ID보다 큰 유저만 조회
+            limit: 최대 유저 수
+
+        Returns:
+            유저 ID 목록 (오름차순)
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(_select_user_ids(after_user_id, limit))
+            return list(result.scalars())
+
+    async def close_users(
+        self, job: PeriodCloseJob, user_ids: list[int], close_user: Callable[[int], Awaitable[list[ClosingBalance]]]
+    ) -> None:
+        """
+        유저 묶음을 마감 잠금 안에서 마감하고 마감 결과와 작업 진행 상황을 한 트랜잭션에서 저장
+
+        Args:
+            job: 이번 묶음까지 반영한 기간 마감 작업
+            user_ids: 마감할 유저 ID 목록 (오름차순)
+            close_user: 유저 ID를 받아 그 유저의 마감 잔액 목록을 계산하는 비동기 함수
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                upsert_period_close_locks(session.get_bind().dialect.name), period_close_lock_rows(user_ids)
+            )
+            await session.execute(select_period_close_locks(user_ids))
+            closing_balances = [balance for user_id in user_ids for balance in await close_user(user_id)]
+
+            await session.execute(_delete_closing_balances(user_ids, job.period))
+            if closing_balances:
+                await session.execute(
+                    insert(_CLOSING_BALANCE_TABLE),
+                    [PeriodCloseMapper.closing_balance_to_row(balance) for balance in closing_balances],
+                )
+            await session.execute(_delete_period_closes(user_ids, job.period))
+            await session.execute(insert(_PERIOD_CLOSE_TABLE), _period_close_rows(user_ids, job.period))
+            await session.execute(_update_job(job))
+
+        if self.write_recorder is not None:
+            for user_id in user_ids:
+                self.write_recorder(user_id)
+
+    async def save_period_close_job(self, job: PeriodCloseJob) -> None:
+        """
+        기간 마감 작업의 진행 상황 저장
+
+        Args:
+            job: 기간 마감 작업
+        """
+        async with self.session_factory() as session:
+            await session.execute(_update_job(job))
+
+
+def _select_job(period: int) -> Select[Any]:
+    """
+    Args:
+        period: 마감 기간
+
+    Returns:
+        기간 마감 작업을 기본 키로 찾는 쿼리
+    """
+    return select(_JOB_TABLE).where(_JOB_TABLE.c.period == period)
+
+
+def _update_job(job: PeriodCloseJob) -> Update:
+    """
+    Args:
+        job: 기간 마감 작업
+
+    Returns:
+        기간 마감 작업의 진행 상황을 기본 키로 갱신하는 쿼리
+    """
+    row = PeriodCloseMapper.job_to_row(job)
+    del row["period"]
+    return update(_JOB_TABLE).where(_JOB_TABLE.c.period == job.period).values(row)
+
+
+def _select_user_ids(after_user_id: int, limit: int) -> Select[tuple[int]]:
+    """
+    Args:
+        after_user_id: 이 유저 ID보다 큰 유저만 조회
+        limit: 최대 유저 수
+
+    Returns:
+        (user_id, code) 유니크 인덱스 범위에서 계정과목이 있는 유저 ID를 오름차순으로 찾는 쿼리
+    """
+    return (
+        select(_CHART_OF_ACCOUNT_TABLE.c.user_id)
+        .where(_CHART_OF_ACCOUNT_TABLE.c.user_id > after_user_id)
+        .group_by(_CHART_OF_ACCOUNT_TABLE.c.user_id)
+        .order_by(_CHART_OF_ACCOUNT_TABLE.c.user_id)
+        .limit(limit)
+    )
+
+
+def _delete_closing_balances(user_ids: list[int], period: int) -> Delete:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+        period: 마감 기간
+
+    Returns:
+        유저들의 기간 마감 잔액 삭제 쿼리
+    """
+    return (
+        delete(_CLOSING_BALANCE_TABLE)
+        .where(_CLOSING_BALANCE_TABLE.c.user_id.in_(user_ids))
+        .where(_CLOSING_BALANCE_TABLE.c.period == period)
+    )
+
+
+def _delete_period_closes(user_ids: list[int], period: int) -> Delete:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+        period: 마감 기간
+
+    Returns:
+        유저들의 마감 기간 행 삭제 쿼리
+    """
+    return (
+        delete(_PERIOD_CLOSE_TABLE)
+        .where(_PERIOD_CLOSE_TABLE.c.user_id.in_(user_ids))
+        .where(_PERIOD_CLOSE_TABLE.c.period == period)
+    )
+
+
+def _period_close_rows(user_ids: list[int], period: int) -> list[dict[str, int]]:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+        period: 마감 기간
+
+    Returns:
+        마감 기간 행 목록
+    """
+    return [{"user_id": user_id, "period": period} for user_id in user_ids]
+
+
+def upsert_period_close_locks(dialect_name: str) -> Insert:
+    """
+    유저별 마감 잠금 행이 없으면 만드는 문을 만듭니다. (이미 있으면 그대로 두며, 잠금은 `select_period_close_locks`로 잡음)
+
+    기표 저장과 기간 마감이 같은 트랜잭션에서 이 문과 `select_period_close_locks`를 차례로 실행해 같은 유저에 대해서는
+    차례로 실행되도록 합니다.
+
+    Args:
+        dialect_name: 데이터베이스 dialect 이름
+
+    Returns:
+        마감 잠금 행 upsert 문
+
+    Raises:
+        NotImplementedError: upsert 를 지원하지 않는 dialect 일 경우 발생
+    """
+    if dialect_name == "mysql":
+        mysql_statement = mysql_insert(_LOCK_TABLE)
+        return mysql_statement.on_duplicate_key_update(user_id=_LOCK_TABLE.c.user_id)
+    if dialect_name == "sqlite":
+        return sqlite_insert(_LOCK_TABLE).on_conflict_do_nothing(index_elements=[_LOCK_TABLE.c.user_id])
+    raise NotImplementedError(f"Period close lock upsert is not supported for dialect {dialect_name}")
+
+
+def select_period_close_locks(user_ids: Iterable[int]) -> Select[tuple[int]]:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+
+    Returns:
+        유저들의 마감 잠금 행을 기본 키 순으로 트랜잭션이 끝날 때까지 잠그는 쿼리 (SQLite 는 쓰기 잠금으로 대신함)
+    """
+    return (
+        select(_LOCK_TABLE.c.user_id)
+        .where(_LOCK_TABLE.c.user_id.in_(user_ids))
+        .order_by(_LOCK_TABLE.c.user_id)
+        .with_for_update()
+    )
+
+
+def period_close_lock_rows(user_ids: Iterable[int]) -> list[dict[str, int]]:
+    """
+    Args:
+        user_ids: 유저 ID 목록
+
+    Returns:
+        유저 ID 순으로 정렬한 마감 잠금 행 목록 (트랜잭션끼리 같은 순서로 잠금)
+    """
+    return [{"user_id": user_id} for user_id in sorted(set(user_ids))]
@@ -0,0 +1,320 @@
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from datetime import date
+from typing import Any, Callable
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.outbound.database.mapper.chart_of_account import ChartOfAccountMapper
+from personal_cpa.adapter.outbound.database.model.balance import AccountBalanceEntity
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.adapter.outbound.database.model.journal import JournalLineEntity
+from personal_cpa.adapter.outbound.database.model.period_close import ClosingBalanceEntity, PeriodCloseEntity
+from personal_cpa.application.port.output.report import (
+    AsyncFinancialReportPort,
+    FinancialReportPort,
+    FinancialReportSource,
+)
+
+_BALANCE_TABLE = AccountBalanceEntity.__table__
+_CLOSING_BALANCE_TABLE = ClosingBalanceEntity.__table__
+_PERIOD_CLOSE_TABLE = PeriodCloseEntity.__table__
+_CHART_OF_ACCOUNT_TABLE = ChartOfAccountEntity.__table__
+_LINE_TABLE = JournalLineEntity.__table__
+
+
+class FinancialReportRepository(FinancialReportPort):
+    """
+    재무 보고서 조회 저장소
+
+    계정과목, 분개 줄 합계, 잔액 합계, 마감 잔액을 읽기 전용 세션(읽기 복제본) 하나에서 같은 시점으로 읽습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        read_session_factory: Callable[[int], AbstractContextManager[Session]] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리 (주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 세션 팩토리 (None 이면 `session_factory` 사용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+
+    def _read_session(self, user_id: int) -> AbstractContextManager[Session]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    def find_closed_period(self, user_id: int, until_period: int) -> int | None:
+        """
+        유저의 마감된 기간 중 `until_period` 이하인 가장 최근 기간 조회
+
+        Args:
+            user_id: 유저 ID
+            until_period: 기간 상한 (포함)
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+        with self._read_session(user_id) as session:
+            return session.scalar(_select_closed_period(user_id, until_period))
+
+    def find_report_source(
+        self,
+        user_id: int,
+        line_ranges: Sequence[tuple[date | None, date]],
+        period_ranges: Sequence[tuple[int, int]],
+        snapshot_period: int | None = None,
+    ) -> FinancialReportSource:
+        """
+        유저의 계정과목과 분개 줄/잔액 합계를 한 트랜잭션에서 조회
+
+        Args:
+            user_id: 유저 ID
+            line_ranges: 분개 줄을 합할 (시작일 (None 이면 처음부터), 종료일) 목록 (서로 겹치지 않음)
+            period_ranges: 잔액을 합할 (첫 기간, 마지막 기간) 목록
+            snapshot_period: 마감 잔액을 읽을 마감 기간 (None 이면 읽지 않음)
+
+        Returns:
+            재무 보고서 작성용 데이터
+        """
+        with self._read_session(user_id) as session:
+            chart_of_accounts = [
+                ChartOfAccountMapper.row_to_domain(row)
+                for row in session.execute(_select_chart_of_accounts(user_id)).mappings()
+            ]
+            line_totals: dict[int, tuple[int, int]] = {}
+            for start_date, end_date in line_ranges:
+                _merge_totals(line_totals, session.execute(_select_line_totals(user_id, start_date, end_date)))
+            period_totals = [
+                dict(_totals(session.execute(_select_period_totals(user_id, first_period, last_period))))
+                for first_period, last_period in period_ranges
+            ]
+            snapshot_totals = (
+                dict(_totals(session.execute(_select_closing_balances(user_id, snapshot_period))))
+                if snapshot_period is not None
+                else {}
+            )
+
+        return FinancialReportSource(
+            chart_of_accounts=chart_of_accounts,
+            line_totals=line_totals,
+            period_totals=period_totals,
+            snapshot_totals=snapshot_totals,
+        )
+
+
+class AsyncFinancialReportRepository(AsyncFinancialReportPort):
+    """
+    비동기 재무 보고서 조회 저장소
+
+    계정과목, 분개 줄 합계, 잔액 합계, 마감 잔액을 읽기 전용 세션(읽기 복제본) 하나에서 같은 시점으로 읽습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        read_session_factory: Callable[[int], AbstractAsyncContextManager[AsyncSession]] | None = None,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (주 데이터베이스)
+            read_session_factory: 유저 ID를 받는 읽기 전용 비동기 세션 팩토리 (None 이면 `session_factory` 사용)
+        """
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+
+    def _read_session(self, user_id: int) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Args:
+            user_id: 조회하는 유저 ID
+
+        Returns:
+            읽기 전용 비동기 세션 컨텍스트 매니저
+        """
+        if self.read_session_factory is None:
+            return self.session_factory()
+        return self.read_session_factory(user_id)
+
+    async def find_closed_period(self, user_id: int, until_period: int) -> int | None:
+        """
+        유저의 마감된 기간 중 `until_period` 이하인 가장 최근 기간 조회
+
+        Args:
+            user_id: 유저 ID
+            until_period: 기간 상한 (포함)
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+        async with self._read_session(user_id) as session:
+            return await session.scalar(_select_closed_period(user_id, until_period))
+
+    async def find_report_source(
+        self,
+        user_id: int,
+        line_ranges: Sequence[tuple[date | None, date]],
+        period_ranges: Sequence[tuple[int, int]],
+        snapshot_period: int | None = None,
+    ) -> FinancialReportSource:
+        """
+        유저의 계정과목과 분개 줄/잔액 합계를 한 트랜잭션에서 조회
+
+        Args:
+            user_id: 유저 ID
+            line_ranges: 분개 줄을 합할 (시작일 (None 이면 처음부터), 종료일) 목록 (서로 겹치지 않음)
+            period_ranges: 잔액을 합할 (첫 기간, 마지막 기간) 목록
+            snapshot_period: 마감 잔액을 읽을 마감 기간 (None 이면 읽지 않음)
+
+        Returns:
+            재무 보고서 작성용 데이터
+        """
+        async with self._read_session(user_id) as session:
+            result = await session.execute(_select_chart_of_accounts(user_id))
+            chart_of_accounts = [ChartOfAccountMapper.row_to_domain(row) for row in result.mappings()]
+            line_totals: dict[int, tuple[int, int]] = {}
+            for start_date, end_date in line_ranges:
+                _merge_totals(line_totals, await session.execute(_select_line_totals(user_id, start_date, end_date)))
+            period_totals = [
+                dict(_totals(await session.execute(_select_period_totals(user_id, first_period, last_period))))
+                for first_period, last_period in period_ranges
+            ]
+            snapshot_totals = (
+                dict(_totals(await session.execute(_select_closing_balances(user_id, snapshot_period))))
+                if snapshot_period is not None
+                else {}
+            )
+
+        return FinancialReportSource(
+            chart_of_accounts=chart_of_accounts,
+            line_totals=line_totals,
+            period_totals=period_totals,
+            snapshot_totals=snapshot_totals,
+        )
+
+
+def _select_chart_of_accounts(user_id: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+
+    Returns:
+        유저의 계정과목 전체 조회 쿼리 (숨김 계정과목 포함)
+    """
+    return select(_CHART_OF_ACCOUNT_TABLE).where(_CHART_OF_ACCOUNT_TABLE.c.user_id == user_id)
+
+
+def _select_line_totals(user_id: int, start_date: date | None, end_date: date) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        start_date: 시작일 (포함, None 이면 처음부터)
+        end_date: 종료일 (포함)
+
+    Returns:
+        (user_id, entry_date, chart_of_account_id) 인덱스 범위의 분개 줄을 계정과목별로 합하는 쿼리
+    """
+    statement = (
+        select(_LINE_TABLE.c.chart_of_account_id, func.sum(_LINE_TABLE.c.debit), func.sum(_LINE_TABLE.c.credit))
+        .where(_LINE_TABLE.c.user_id == user_id)
+        .where(_LINE_TABLE.c.entry_date <= end_date)
+        .group_by(_LINE_TABLE.c.chart_of_account_id)
+    )
+    if start_date is not None:
+        statement = statement.where(_LINE_TABLE.c.entry_date >= start_date)
+    return statement
+
+
+def _select_period_totals(user_id: int, first_period: int, last_period: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        first_period: 첫 기간 (포함)
+        last_period: 마지막 기간 (포함)
+
+    Returns:
+        (user_id, period) 인덱스 범위의 잔액을 계정과목별로 합하는 쿼리
+    """
+    return (
+        select(
+            _BALANCE_TABLE.c.chart_of_account_id, func.sum(_BALANCE_TABLE.c.debit), func.sum(_BALANCE_TABLE.c.credit)
+        )
+        .where(_BALANCE_TABLE.c.user_id == user_id)
+        .where(_BALANCE_TABLE.c.period.between(first_period, last_period))
+        .group_by(_BALANCE_TABLE.c.chart_of_account_id)
+    )
+
+
+def _select_closed_period(user_id: int, until_period: int) -> Select[tuple[int | None]]:
+    """
+    Args:
+        user_id: 유저 ID
+        until_period: 기간 상한 (포함)
+
+    Returns:
+        (user_id, period) 기본 키 범위에서 가장 최근 마감 기간을 찾는 쿼리
+    """
+    return (
+        select(func.max(_PERIOD_CLOSE_TABLE.c.period))
+        .where(_PERIOD_CLOSE_TABLE.c.user_id == user_id)
+        .where(_PERIOD_CLOSE_TABLE.c.period <= until_period)
+    )
+
+
+def _select_closing_balances(user_id: int, period: int) -> Select[Any]:
+    """
+    Args:
+        user_id: 유저 ID
+        period: 마감 기간
+
+    Returns:
+        (user_id, period) 커버링 인덱스로 마감 잔액을 읽는 쿼리 (계정과목별 한 행이므로 묶지 않음)
+    """
+    return (
+        select(
+            _CLOSING_BALANCE_TABLE.c.chart_of_account_id,
+            _CLOSING_BALANCE_TABLE.c.debit,
+            _CLOSING_BALANCE_TABLE.c.credit,
+        )
+        .where(_CLOSING_BALANCE_TABLE.c.user_id == user_id)
+        .where(_CLOSING_BALANCE_TABLE.c.period == period)
+    )
+
+
+def _totals(rows: Iterable[Any]) -> Iterator[tuple[int, tuple[int, int]]]:
+    """
+    Args:
+        rows: (계정과목 ID, 차변 합계, 대변 합계) 조회 결과
+
+    Yields:
+        (계정과목 ID, (차변 합계, 대변 합계))
+    """
+    for chart_of_account_id, debit, credit in rows:
+        yield chart_of_account_id, (int(debit), int(credit))
+
+
+def _merge_totals(totals: dict[int, tuple[int, int]], rows: Iterable[Any]) -> None:
+    """
+    Args:
+        totals: 계정과목 ID별 (차변 합계, 대변 합계) (더한 값으로 갱신됨)
+        rows: (계정과목 ID, 차변 합계, 대변 합계) 조회 결과
+    """
+    for chart_of_account_id, (debit, credit) in _totals(rows):
+        previous_debit, previous_credit = totals.get(chart_of_account_id, (0, 0))
+        totals[chart_of_account_id] = (previous_debit + debit, previous_credit + credit)
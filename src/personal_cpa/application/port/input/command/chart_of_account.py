@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from personal_cpa.domain.currency import DEFAULT_CURRENCY, validate_currency
 from personal_cpa.domain.enum.chart_of_account import AccountType
 
 
@@ -14,6 +15,7 @@ class CreateChartOfAccountCommand:
         category: 계정과목 카테고리
         description: 계정과목 설명
         parent_code: 상위 계정과목 코드
+        currency: 계정과목 통화 코드 (ISO 4217)
     """
 
     code: str
@@ -21,6 +23,7 @@ class CreateChartOfAccountCommand:
     category: AccountType
     description: str | None
     parent_code: str | None
+    currency: str = DEFAULT_CURRENCY
 
     def __post_init__(self) -> None:
         """
@@ -28,10 +31,12 @@ class CreateChartOfAccountCommand:
 
             1. 상위 계정과목 코드가 없을 경우 현재 계정과목 코드에 언더바(_)가 없는지 검사
             2. 현재 계정과목 코드가 상위 계정과목 코드로 시작하는지 검사
+            3. 지원하는 통화 코드인지 검사
 
         Raises:
             ValueError: 상위 계정과목 코드가 없을 경우 발생
             ValueError: 현재 계정과목 코드가 상위 계정과목 코드로 시작하지 않을 경우 발생
+            ValueError: 지원하지 않는 통화 코드일 경우 발생
         """
         if self.parent_code is None and "_" in self.code:
             raise ValueError(f"code must not contain '_' if parent_code is None. (Currently: {self.code})")
@@ -41,6 +46,28 @@ class CreateChartOfAccountCommand:
                 f"Parent chart of account with code {self.parent_code} must be a prefix of the current account's code {self.code}."
             )
 
+        validate_currency(self.currency)
+
+
+@dataclass(frozen=True)
+class ImportChartOfAccountRow:
+    """
+    계정과목 가져오기 행
+
+    파일에서 읽은 행마다 생성 명령 또는 파싱 오류 중 하나를 가집니다.
+
+    Args:
+        line: 파일의 행 번호 (1부터 시작)
+        code: 계정과목 코드 (읽을 수 없으면 None)
+        command: 계정과목 생성 명령 (파싱에 실패하면 None)
+        error: 파싱 오류 메시지 (파싱에 성공하면 None)
+    """
+
+    line: int
+    code: str | None
+    command: CreateChartOfAccountCommand | None = None
+    error: str | None = None
+
 
 @dataclass(frozen=True)
 class UpdateChartOfAccountCommand:
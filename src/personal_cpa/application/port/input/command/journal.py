@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class PostJournalLineCommand:
+    """
+    분개 줄 기표 명령
+
+    Args:
+        chart_of_account_id: 계정과목 ID
+        debit: 차변 금액 (통화 최소 단위)
+        credit: 대변 금액 (통화 최소 단위)
+        description: 적요
+    """
+
+    chart_of_account_id: int
+    debit: int
+    credit: int
+    description: str | None
+
+
+@dataclass(frozen=True)
+class PostJournalEntryCommand:
+    """
+    분개 기표 명령
+
+    Args:
+        entry_date: 거래일
+        description: 분개 설명
+        lines: 분개 줄 기표 명령 목록
+    """
+
+    entry_date: date
+    description: str | None
+    lines: list[PostJournalLineCommand]
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class AccountBalanceMismatch:
+    """
+    저장된 잔액과 분개 줄로 다시 계산한 잔액의 차이
+
+    Args:
+        chart_of_account_id: 계정과목 ID
+        period: 기간 (YYYYMM, 전체 기간은 0)
+        expected_debit: 분개 줄로 계산한 차변 합계
+        expected_credit: 분개 줄로 계산한 대변 합계
+        actual_debit: 저장된 차변 합계
+        actual_credit: 저장된 대변 합계
+    """
+
+    chart_of_account_id: int
+    period: int
+    expected_debit: int
+    expected_credit: int
+    actual_debit: int
+    actual_credit: int
+
+
+@dataclass(frozen=True)
+class AccountBalanceCheckResult:
+    """
+    계정과목 잔액 정합성 검사 결과
+
+    Args:
+        checked: 검사한 (계정과목, 기간) 수
+        repaired: 다시 계산한 잔액으로 바꿨는지 여부
+        mismatches: 차이가 있는 (계정과목, 기간) 목록 ((계정과목, 기간)순)
+    """
+
+    checked: int
+    repaired: bool
+    mismatches: list[AccountBalanceMismatch] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        """
+        Returns:
+            저장된 잔액이 분개 줄과 일치하는지 여부
+        """
+        return not self.mismatches
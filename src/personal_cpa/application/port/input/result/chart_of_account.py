@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ChartOfAccountImportError:
+    """
+    계정과목 가져오기 행 오류
+
+    Args:
+        line: 파일의 행 번호
+        code: 계정과목 코드 (읽을 수 없으면 None)
+        message: 오류 메시지
+    """
+
+    line: int
+    code: str | None
+    message: str
+
+
+@dataclass(frozen=True)
+class ChartOfAccountImportResult:
+    """
+    계정과목 가져오기 결과
+
+    Args:
+        created: 생성된 계정과목 수
+        chunks: 커밋한 묶음 수
+        errors: 실패한 행 목록 (행 번호순)
+    """
+
+    created: int
+    chunks: int
+    errors: list[ChartOfAccountImportError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        """
+        Returns:
+            실패한 행 수
+        """
+        return len(self.errors)
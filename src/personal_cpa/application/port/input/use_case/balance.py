@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+
+from personal_cpa.application.port.input.result.balance import AccountBalanceCheckResult
+from personal_cpa.domain.balance import AccountBalance
+
+
+class SearchAccountBalanceUseCase(ABC):
+    """
+    계정과목 잔액 조회 유즈케이스
+    """
+
+    @abstractmethod
+    def get_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회 (하위 계정과목 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 | None (계정과목이 없을 경우)
+        """
+
+
+class CheckAccountBalanceUseCase(ABC):
+    """
+    계정과목 잔액 정합성 검사 유즈케이스
+    """
+
+    @abstractmethod
+    def check_balances(self, user_id: int, repair: bool) -> AccountBalanceCheckResult:
+        """
+        유저의 저장된 잔액을 분개 줄로 다시 계산한 잔액과 비교
+
+        Args:
+            user_id: 유저 ID
+            repair: 차이가 있으면 다시 계산한 잔액으로 바꿀지 여부
+
+        Returns:
+            정합성 검사 결과
+        """
+
+
+class AsyncSearchAccountBalanceUseCase(ABC):
+    """
+    비동기 계정과목 잔액 조회 유즈케이스
+    """
+
+    @abstractmethod
+    async def get_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회 (하위 계정과목 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 | None (계정과목이 없을 경우)
+        """
+
+
+class AsyncCheckAccountBalanceUseCase(ABC):
+    """
+    비동기 계정과목 잔액 정합성 검사 유즈케이스
+    """
+
+    @abstractmethod
+    async def check_balances(self, user_id: int, repair: bool) -> AccountBalanceCheckResult:
+        """
+        유저의 저장된 잔액을 분개 줄로 다시 계산한 잔액과 비교
+
+        Args:
+            user_id: 유저 ID
+            repair: 차이가 있으면 다시 계산한 잔액으로 바꿀지 여부
+
+        Returns:
+            정합성 검사 결과
+        """
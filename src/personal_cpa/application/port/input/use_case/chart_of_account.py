@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Iterator
 
 from personal_cpa.application.port.input.command.chart_of_account import (
     CreateChartOfAccountCommand,
+    ImportChartOfAccountRow,
     UpdateChartOfAccountCommand,
 )
+from personal_cpa.application.port.input.result.chart_of_account import ChartOfAccountImportResult
 from personal_cpa.domain.chart_of_account import ChartOfAccount, ChartOfAccountTree
 
 
@@ -37,6 +40,32 @@ class SearchChartOfAccountUseCase(ABC):
             계정과목 | None
         """
 
+    @abstractmethod
+    def export_chart_of_accounts(self, user_id: int) -> Iterator[ChartOfAccount]:
+        """
+        유저의 계정과목 전체를 코드순으로 내보내기 (스트리밍)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 이터레이터 (순회하는 동안 DB 연결을 사용)
+        """
+
+    @abstractmethod
+    def get_chart_of_account_subtree(self, user_id: int, code: str, depth: int) -> ChartOfAccountTree | None:
+        """
+        유저의 계정과목 하위 트리 조회 (깊이 제한)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            depth: 기준 계정과목으로부터 포함할 최대 상대 깊이 (0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 트리 | None (기준 계정과목이 없거나 숨겨진 경우)
+        """
+
 
 class ManageChartOfAccountUseCase(ABC):
     """
@@ -58,6 +87,24 @@ class ManageChartOfAccountUseCase(ABC):
             계정과목 목록
         """
 
+    @abstractmethod
+    def import_chart_of_accounts(
+        self, user_id: int, rows: Iterable[ImportChartOfAccountRow]
+    ) -> ChartOfAccountImportResult:
+        """
+        유저의 계정과목 가져오기 (대량)
+
+        상위 계정과목이 하위 계정과목보다 먼저 저장되도록 정렬한 뒤 묶음 단위로 커밋하고,
+        실패한 행은 전체를 중단하지 않고 행별 오류로 보고합니다.
+
+        Args:
+            user_id: 유저 ID
+            rows: 계정과목 가져오기 행 목록 (파일 순서)
+
+        Returns:
+            가져오기 결과
+        """
+
     @abstractmethod
     def update_chart_of_account(self, user_id: int, code: str, command: UpdateChartOfAccountCommand) -> ChartOfAccount:
         """
@@ -71,3 +118,115 @@ class ManageChartOfAccountUseCase(ABC):
         Returns:
             계정과목
         """
+
+
+class AsyncSearchChartOfAccountUseCase(ABC):
+    """
+    비동기 계정과목 조회 유즈케이스
+    """
+
+    @abstractmethod
+    async def get_chart_of_accounts(self, user_id: int) -> list[ChartOfAccountTree]:
+        """
+        유저의 계정과목 목록 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 트리 목록
+        """
+
+    @abstractmethod
+    async def get_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+
+    @abstractmethod
+    def export_chart_of_accounts(self, user_id: int) -> AsyncIterator[ChartOfAccount]:
+        """
+        유저의 계정과목 전체를 코드순으로 내보내기 (스트리밍)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 이터레이터 (순회하는 동안 DB 연결을 사용)
+        """
+
+    @abstractmethod
+    async def get_chart_of_account_subtree(self, user_id: int, code: str, depth: int) -> ChartOfAccountTree | None:
+        """
+        유저의 계정과목 하위 트리 조회 (깊이 제한)
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            depth: 기준 계정과목으로부터 포함할 최대 상대 깊이 (0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 트리 | None (기준 계정과목이 없거나 숨겨진 경우)
+        """
+
+
+class AsyncManageChartOfAccountUseCase(ABC):
+    """
+    비동기 계정과목 관리 유즈케이스
+    """
+
+    @abstractmethod
+    async def create_chart_of_accounts(
+        self, user_id: int, commands: list[CreateChartOfAccountCommand]
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            user_id: 유저 ID
+            commands: 계정과목 생성 Command 목록
+
+        Returns:
+            계정과목 목록
+        """
+
+    @abstractmethod
+    async def import_chart_of_accounts(
+        self, user_id: int, rows: Iterable[ImportChartOfAccountRow]
+    ) -> ChartOfAccountImportResult:
+        """
+        유저의 계정과목 가져오기 (대량)
+
+        상위 계정과목이 하위 계정과목보다 먼저 저장되도록 정렬한 뒤 묶음 단위로 커밋하고,
+        실패한 행은 전체를 중단하지 않고 행별 오류로 보고합니다.
+
+        Args:
+            user_id: 유저 ID
+            rows: 계정과목 가져오기 행 목록 (파일 순서)
+
+        Returns:
+            가져오기 결과
+        """
+
+    @abstractmethod
+    async def update_chart_of_account(
+        self, user_id: int, code: str, command: UpdateChartOfAccountCommand
+    ) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정 (비활성화 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            command: 계정과목 수정 Command
+
+        Returns:
+            계정과목
+        """
@@ -0,0 +1,115 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import date
+
+from personal_cpa.domain.fx_rate import FxRate
+
+
+class ManageFxRateUseCase(ABC):
+    """
+    환율 관리 및 환산 유즈케이스
+    """
+
+    @abstractmethod
+    def import_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 가져오기 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+
+    @abstractmethod
+    def get_fx_rate(self, base_currency: str, quote_currency: str, day: date) -> FxRate:
+        """
+        기준일에 적용되는 환율 조회
+
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            기준일의 환율
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    def convert_amounts(
+        self, amounts: Sequence[int], currencies: Sequence[str], to_currency: str, day: date
+    ) -> list[int]:
+        """
+        여러 금액을 기준일 환율로 한 번에 환산
+
+        Args:
+            amounts: 통화 최소 단위 금액 목록
+            currencies: 금액별 통화 코드 목록
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            환산 통화 최소 단위 금액 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+
+
+class AsyncManageFxRateUseCase(ABC):
+    """
+    비동기 환율 관리 및 환산 유즈케이스
+    """
+
+    @abstractmethod
+    async def import_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 가져오기 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+
+    @abstractmethod
+    async def get_fx_rate(self, base_currency: str, quote_currency: str, day: date) -> FxRate:
+        """
+        기준일에 적용되는 환율 조회
+
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            기준일의 환율
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    async def convert_amounts(
+        self, amounts: Sequence[int], currencies: Sequence[str], to_currency: str, day: date
+    ) -> list[int]:
+        """
+        여러 금액을 기준일 환율로 한 번에 환산
+
+        Args:
+            amounts: 통화 최소 단위 금액 목록
+            currencies: 금액별 통화 코드 목록
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            환산 통화 최소 단위 금액 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
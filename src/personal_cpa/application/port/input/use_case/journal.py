@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand
+from personal_cpa.domain.journal import JournalEntry, LedgerLine
+
+
+class PostJournalEntryUseCase(ABC):
+    """
+    분개 기표 유즈케이스
+    """
+
+    @abstractmethod
+    def post_journal_entries(self, user_id: int, commands: list[PostJournalEntryCommand]) -> list[JournalEntry]:
+        """
+        유저의 분개 기표 (여러 개)
+
+        모든 분개의 대차 평형과 계정과목을 검증한 뒤 한 번에 저장하며, 하나라도 유효하지 않으면 저장하지 않습니다.
+
+        Args:
+            user_id: 유저 ID
+            commands: 분개 기표 Command 목록
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+        """
+
+
+class SearchJournalEntryUseCase(ABC):
+    """
+    분개 조회 유즈케이스
+    """
+
+    @abstractmethod
+    def get_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+
+    @abstractmethod
+    def get_ledger(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        유저의 계정과목별 원장 조회 (기간)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+
+
+class AsyncPostJournalEntryUseCase(ABC):
+    """
+    비동기 분개 기표 유즈케이스
+    """
+
+    @abstractmethod
+    async def post_journal_entries(self, user_id: int, commands: list[PostJournalEntryCommand]) -> list[JournalEntry]:
+        """
+        유저의 분개 기표 (여러 개)
+
+        Args:
+            user_id: 유저 ID
+            commands: 분개 기표 Command 목록
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+        """
+
+
+class AsyncSearchJournalEntryUseCase(ABC):
+    """
+    비동기 분개 조회 유즈케이스
+    """
+
+    @abstractmethod
+    async def get_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+
+    @abstractmethod
+    async def get_ledger(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        유저의 계정과목별 원장 조회 (기간)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+
+from personal_cpa.domain.period_close import PeriodCloseJob
+
+
+class ClosePeriodUseCase(ABC):
+    """
+    기간 마감 유즈케이스
+    """
+
+    @abstractmethod
+    def start_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업 시작 (이미 있는 작업이면 그 작업을 반환)
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+
+    @abstractmethod
+    def run_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업을 마지막으로 마감한 유저 다음부터 끝까지 실행
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            완료된 기간 마감 작업
+        """
+
+    @abstractmethod
+    def get_period_close(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+
+
+class AsyncClosePeriodUseCase(ABC):
+    """
+    비동기 기간 마감 유즈케이스
+    """
+
+    @abstractmethod
+    async def start_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업 시작 (이미 있는 작업이면 그 작업을 반환)
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+
+    @abstractmethod
+    async def run_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업을 마지막으로 마감한 유저 다음부터 끝까지 실행
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            완료된 기간 마감 작업
+        """
+
+    @abstractmethod
+    async def get_period_close(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
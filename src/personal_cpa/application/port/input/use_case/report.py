@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from personal_cpa.domain.report import BalanceSheet, IncomeStatement, TrialBalance
+
+
+class SearchFinancialReportUseCase(ABC):
+    """
+    재무 보고서 조회 유즈케이스
+    """
+
+    @abstractmethod
+    def get_trial_balance(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> TrialBalance:
+        """
+        유저의 기간 시산표 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            시산표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    def get_income_statement(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> IncomeStatement:
+        """
+        유저의 기간 손익계산서 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            손익계산서 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    def get_balance_sheet(self, user_id: int, as_of: date, currency: str | None = None) -> BalanceSheet:
+        """
+        유저의 기준일 재무상태표 조회
+
+        Args:
+            user_id: 유저 ID
+            as_of: 기준일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            재무상태표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+
+
+class AsyncSearchFinancialReportUseCase(ABC):
+    """
+    비동기 재무 보고서 조회 유즈케이스
+    """
+
+    @abstractmethod
+    async def get_trial_balance(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> TrialBalance:
+        """
+        유저의 기간 시산표 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            시산표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    async def get_income_statement(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> IncomeStatement:
+        """
+        유저의 기간 손익계산서 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            손익계산서 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+
+    @abstractmethod
+    async def get_balance_sheet(self, user_id: int, as_of: date, currency: str | None = None) -> BalanceSheet:
+        """
+        유저의 기준일 재무상태표 조회
+
+        Args:
+            user_id: 유저 ID
+            as_of: 기준일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            재무상태표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
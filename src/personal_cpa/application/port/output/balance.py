@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+
+from personal_cpa.domain.balance import AccountBalance
+
+
+@dataclass(frozen=True)
+class AccountBalanceSnapshot:
+    """
+    잔액 정합성 검사에 사용할 한 트랜잭션 안에서 읽은 데이터
+
+    Args:
+        parent_ids: 계정과목 ID별 상위 계정과목 ID
+        daily_totals: (계정과목 ID, 거래일, 차변 합계, 대변 합계) 목록 (계정과목 자신의 분개 줄만)
+        balances: 저장된 잔액 목록
+    """
+
+    parent_ids: dict[int, int | None]
+    daily_totals: list[tuple[int, date, int, int]]
+    balances: list[AccountBalance]
+
+
+class AccountBalancePort(ABC):
+    """
+    계정과목 잔액 저장소 인터페이스
+    """
+
+    @abstractmethod
+    def find_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회
+
+        (user_id, code) 유니크 인덱스와 (계정과목 ID, 기간) 기본 키 조회만으로 읽어야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 (기표된 분개가 없으면 0) | None (계정과목이 없을 경우)
+        """
+
+    @abstractmethod
+    def find_balance_snapshot(self, user_id: int) -> AccountBalanceSnapshot:
+        """
+        유저의 계정과목 계층, 일별 분개 줄 합계, 저장된 잔액을 한 트랜잭션에서 조회 (주 데이터베이스)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            잔액 정합성 검사용 데이터
+        """
+
+    @abstractmethod
+    def replace_balances(self, user_id: int, balances: list[AccountBalance]) -> None:
+        """
+        유저의 저장된 잔액을 모두 지우고 주어진 잔액으로 바꿉니다.
+
+        Args:
+            user_id: 유저 ID
+            balances: 잔액 목록
+        """
+
+
+class AsyncAccountBalancePort(ABC):
+    """
+    비동기 계정과목 잔액 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def find_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 (기표된 분개가 없으면 0) | None (계정과목이 없을 경우)
+        """
+
+    @abstractmethod
+    async def find_balance_snapshot(self, user_id: int) -> AccountBalanceSnapshot:
+        """
+        유저의 계정과목 계층, 일별 분개 줄 합계, 저장된 잔액을 한 트랜잭션에서 조회 (주 데이터베이스)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            잔액 정합성 검사용 데이터
+        """
+
+    @abstractmethod
+    async def replace_balances(self, user_id: int, balances: list[AccountBalance]) -> None:
+        """
+        유저의 저장된 잔액을 모두 지우고 주어진 잔액으로 바꿉니다.
+
+        Args:
+            user_id: 유저 ID
+            balances: 잔액 목록
+        """
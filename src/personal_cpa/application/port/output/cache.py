@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    캐시 사용 통계
+
+    Args:
+        hits: 캐시 적중 횟수
+        misses: 캐시 미스 횟수
+        evictions: 용량 초과로 제거된 항목 수
+        expirations: TTL 만료로 제거된 항목 수
+        size: 현재 저장된 항목 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """
+        Returns:
+            통계 항목별 값
+        """
+        return asdict(self)
+
+
+class CachePort(ABC):
+    """
+    캐시 저장소 인터페이스
+
+    인프로세스 LRU 외에 Redis 같은 외부 저장소도 구현할 수 있도록 문자열 키 기반으로 정의합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 | None (없거나 만료된 경우)
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        캐시 삭제 (무효화)
+
+        Args:
+            key: 캐시 키
+        """
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """
+        캐시 사용 통계 조회
+
+        Returns:
+            캐시 사용 통계
+        """
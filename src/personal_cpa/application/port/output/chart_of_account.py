@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 
 from personal_cpa.domain.chart_of_account import ChartOfAccount
 
@@ -20,6 +21,21 @@ class ChartOfAccountPort(ABC):
             계정과목 목록
         """
 
+    @abstractmethod
+    def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성
+
+        계정과목 수와 무관하게 일정한 수의 문장으로 저장해야 합니다. 같은 목록 안에서 먼저 생성되는
+        상위 계정과목은 코드 규칙(`ChartOfAccount.parent_code`)으로 찾아 하위 계정과목에 연결합니다.
+
+        Args:
+            chart_of_accounts: 계정과목 목록 (상위 계정과목이 하위 계정과목보다 앞에 위치)
+
+        Returns:
+            ID가 채워진 계정과목 목록 (입력 순서 유지)
+        """
+
     @abstractmethod
     def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
         """
@@ -32,6 +48,22 @@ class ChartOfAccountPort(ABC):
             계정과목 목록
         """
 
+    @abstractmethod
+    def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> Iterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회
+
+        전체 목록을 메모리에 올리지 않도록 서버 측 커서로 `batch_size`개씩 읽어야 합니다.
+        연결은 순회가 끝나거나 순회를 닫을 때 반환되므로, 같은 스레드에서 끝까지 순회해야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Yields:
+            계정과목
+        """
+
     @abstractmethod
     def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
         """
@@ -45,6 +77,51 @@ class ChartOfAccountPort(ABC):
             계정과목 | None
         """
 
+    @abstractmethod
+    def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+
+    @abstractmethod
+    def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회
+
+        코드 규칙(상위 계정과목 코드 + "_" + 접미사)을 경로로 사용하여
+        전체 계정과목을 읽지 않고 한 번의 인덱스 범위 조회로 찾아야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음, 0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+
+    @abstractmethod
+    def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+
     @abstractmethod
     def modify_chart_of_account(self, user_id: int, code: str, chart_of_account: ChartOfAccount) -> ChartOfAccount:
         """
@@ -58,3 +135,138 @@ class ChartOfAccountPort(ABC):
         Returns:
             계정과목
         """
+
+
+class AsyncChartOfAccountPort(ABC):
+    """
+    비동기 계정과목 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def save_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            chart_of_accounts: 계정과목 목록
+
+        Returns:
+            계정과목 목록
+        """
+
+    @abstractmethod
+    async def bulk_insert_chart_of_accounts(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 일괄 생성
+
+        계정과목 수와 무관하게 일정한 수의 문장으로 저장해야 합니다. 같은 목록 안에서 먼저 생성되는
+        상위 계정과목은 코드 규칙(`ChartOfAccount.parent_code`)으로 찾아 하위 계정과목에 연결합니다.
+
+        Args:
+            chart_of_accounts: 계정과목 목록 (상위 계정과목이 하위 계정과목보다 앞에 위치)
+
+        Returns:
+            ID가 채워진 계정과목 목록 (입력 순서 유지)
+        """
+
+    @abstractmethod
+    async def find_chart_of_accounts(self, user_id: int) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 목록
+        """
+
+    @abstractmethod
+    def stream_chart_of_accounts(self, user_id: int, batch_size: int = 1000) -> AsyncIterator[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드순으로 스트리밍 조회
+
+        전체 목록을 메모리에 올리지 않도록 서버 측 커서로 `batch_size`개씩 읽어야 합니다.
+        연결은 순회가 끝나거나 순회를 닫을 때 반환되므로, 같은 스레드에서 끝까지 순회해야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            batch_size: 한 번에 읽을 행 수
+
+        Yields:
+            계정과목
+        """
+
+    @abstractmethod
+    async def find_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+
+    @abstractmethod
+    async def find_chart_of_accounts_by_codes(self, user_id: int, codes: list[str]) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 목록을 코드 목록으로 한 번에 조회
+
+        Args:
+            user_id: 유저 ID
+            codes: 계정과목 코드 목록
+
+        Returns:
+            계정과목 목록 (존재하는 코드만 포함)
+        """
+
+    @abstractmethod
+    async def find_chart_of_account_subtree(
+        self, user_id: int, code: str, max_depth: int | None = None
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목과 그 하위 계정과목 전체 조회
+
+        코드 규칙(상위 계정과목 코드 + "_" + 접미사)을 경로로 사용하여
+        전체 계정과목을 읽지 않고 한 번의 인덱스 범위 조회로 찾아야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            max_depth: 기준 계정과목으로부터 조회할 최대 상대 깊이 (None 이면 제한 없음, 0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 목록 (코드순, 기준 계정과목이 없으면 빈 목록)
+        """
+
+    @abstractmethod
+    async def find_chart_of_account_ancestors(self, user_id: int, code: str) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목의 상위 계정과목 전체 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+
+        Returns:
+            상위 계정과목 목록 (최상위 계정과목부터 정렬, 기준 계정과목은 제외)
+        """
+
+    @abstractmethod
+    async def modify_chart_of_account(
+        self, user_id: int, code: str, chart_of_account: ChartOfAccount
+    ) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정 (비활성화 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            chart_of_account: 계정과목
+
+        Returns:
+            계정과목
+        """
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+
+class FxRatePort(ABC):
+    """
+    환율 저장소 인터페이스
+    """
+
+    @abstractmethod
+    def find_fx_rate_table(self) -> FxRateTable:
+        """
+        모든 환율을 고시일 순으로 정렬한 환율 조회 구조 조회
+
+        Returns:
+            환율 조회 구조
+        """
+
+    @abstractmethod
+    def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+
+
+class AsyncFxRatePort(ABC):
+    """
+    비동기 환율 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def find_fx_rate_table(self) -> FxRateTable:
+        """
+        모든 환율을 고시일 순으로 정렬한 환율 조회 구조 조회
+
+        Returns:
+            환율 조회 구조
+        """
+
+    @abstractmethod
+    async def save_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 일괄 저장 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
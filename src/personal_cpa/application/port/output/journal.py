@@ -0,0 +1,206 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import date
+
+from personal_cpa.domain.balance import AccountBalance
+from personal_cpa.domain.journal import JournalEntry, LedgerLine
+
+
+class JournalPort(ABC):
+    """
+    분개 저장소 인터페이스
+    """
+
+    @abstractmethod
+    def find_postable_chart_of_account_ancestors(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, tuple[int, ...]]:
+        """
+        분개할 수 있는 계정과목과 그 상위 계정과목 ID 조회
+
+        상위 계정과목은 `parent_chart_of_account_id`를 따라 계층마다 한 번씩 조회합니다.
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목이면서 숨김 처리되지 않은 계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+        """
+
+    @abstractmethod
+    def find_chart_of_account_currencies(self, user_id: int, chart_of_account_ids: Iterable[int]) -> dict[int, str]:
+        """
+        계정과목 통화 조회 (한 분개의 줄은 모두 같은 통화의 계정과목이어야 함)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목 ID별 통화 코드
+        """
+
+    @abstractmethod
+    def find_closed_period(self, user_id: int) -> int | None:
+        """
+        유저의 가장 최근 마감 기간 조회 (마감된 기간에는 기표할 수 없음)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+
+    @abstractmethod
+    def save_journal_entries(
+        self, journal_entries: list[JournalEntry], balance_changes: list[AccountBalance]
+    ) -> list[JournalEntry]:
+        """
+        분개 일괄 저장
+
+        분개 수와 무관하게 분개 INSERT 문 1개와 분개 줄 INSERT 문 1개(여러 행)로 저장하고,
+        같은 트랜잭션에서 잔액 변동분을 잔액 테이블에 더해야 합니다. 기간 마감과 같은 유저별 잠금을 잡은 뒤
+        마감 기간을 다시 확인하여, `find_closed_period` 확인 뒤에 마감된 기간으로는 저장하지 않아야 합니다.
+
+        Args:
+            journal_entries: 분개 목록
+            balance_changes: 상위 계정과목까지 합산된 (계정과목, 기간)별 잔액 변동분
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 마감된 기간의 거래일이 있을 경우 발생
+        """
+
+    @abstractmethod
+    def find_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+
+    @abstractmethod
+    def find_ledger_lines(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        계정과목의 기간별 분개 줄 조회
+
+        (계정과목 ID, 거래일) 인덱스 범위 조회로 읽어야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+
+
+class AsyncJournalPort(ABC):
+    """
+    비동기 분개 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def find_postable_chart_of_account_ancestors(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, tuple[int, ...]]:
+        """
+        분개할 수 있는 계정과목과 그 상위 계정과목 ID 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목이면서 숨김 처리되지 않은 계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+        """
+
+    @abstractmethod
+    async def find_chart_of_account_currencies(
+        self, user_id: int, chart_of_account_ids: Iterable[int]
+    ) -> dict[int, str]:
+        """
+        계정과목 통화 조회 (한 분개의 줄은 모두 같은 통화의 계정과목이어야 함)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_ids: 확인할 계정과목 ID 목록
+
+        Returns:
+            유저의 계정과목 ID별 통화 코드
+        """
+
+    @abstractmethod
+    async def find_closed_period(self, user_id: int) -> int | None:
+        """
+        유저의 가장 최근 마감 기간 조회 (마감된 기간에는 기표할 수 없음)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+
+    @abstractmethod
+    async def save_journal_entries(
+        self, journal_entries: list[JournalEntry], balance_changes: list[AccountBalance]
+    ) -> list[JournalEntry]:
+        """
+        분개 일괄 저장 (잔액 변동분 포함, 마감 잠금 후 마감 기간 재확인)
+
+        Args:
+            journal_entries: 분개 목록
+            balance_changes: 상위 계정과목까지 합산된 (계정과목, 기간)별 잔액 변동분
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 마감된 기간의 거래일이 있을 경우 발생
+        """
+
+    @abstractmethod
+    async def find_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+
+    @abstractmethod
+    async def find_ledger_lines(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        계정과목의 기간별 분개 줄 조회
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
@@ -0,0 +1,140 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from personal_cpa.domain.period_close import ClosingBalance, PeriodCloseJob
+
+
+class PeriodClosePort(ABC):
+    """
+    기간 마감 저장소 인터페이스
+
+    마감 작업과 마감 잔액은 주 데이터베이스에서 읽고 씁니다.
+    """
+
+    @abstractmethod
+    def find_period_close_job(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+
+    @abstractmethod
+    def create_period_close_job(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        기간 마감 작업 생성 (같은 기간의 작업이 이미 있으면 그 작업을 그대로 사용)
+
+        Args:
+            job: 새 기간 마감 작업
+
+        Returns:
+            저장된 기간 마감 작업
+        """
+
+    @abstractmethod
+    def find_user_ids(self, after_user_id: int, limit: int) -> list[int]:
+        """
+        계정과목이 있는 유저 ID를 오름차순으로 조회
+
+        Args:
+            after_user_id: 이 유저 ID보다 큰 유저만 조회
+            limit: 최대 유저 수
+
+        Returns:
+            유저 ID 목록 (오름차순)
+        """
+
+    @abstractmethod
+    def close_users(
+        self, job: PeriodCloseJob, user_ids: list[int], close_user: Callable[[int], list[ClosingBalance]]
+    ) -> None:
+        """
+        유저 묶음을 마감하고 마감 결과와 작업 진행 상황을 한 트랜잭션에서 저장
+
+        트랜잭션을 시작하며 기표 저장도 잡는 유저별 마감 잠금을 먼저 잡고 그 안에서 마감 잔액을 계산해야 하므로,
+        계산과 저장 사이에 마감할 기간으로 분개가 저장되지 않습니다. 유저들의 해당 기간 마감 잔액을 지우고 다시
+        저장하므로, 중단 후 같은 유저를 다시 마감해도 결과가 같아야 합니다.
+
+        Args:
+            job: 이번 묶음까지 반영한 기간 마감 작업
+            user_ids: 마감할 유저 ID 목록 (오름차순)
+            close_user: 유저 ID를 받아 그 유저의 마감 잔액 목록을 계산하는 함수 (주 데이터베이스에서 읽어야 함)
+        """
+
+    @abstractmethod
+    def save_period_close_job(self, job: PeriodCloseJob) -> None:
+        """
+        기간 마감 작업의 진행 상황 저장
+
+        Args:
+            job: 기간 마감 작업
+        """
+
+
+class AsyncPeriodClosePort(ABC):
+    """
+    비동기 기간 마감 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def find_period_close_job(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+
+    @abstractmethod
+    async def create_period_close_job(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        기간 마감 작업 생성 (같은 기간의 작업이 이미 있으면 그 작업을 그대로 사용)
+
+        Args:
+            job: 새 기간 마감 작업
+
+        Returns:
+            저장된 기간 마감 작업
+        """
+
+    @abstractmethod
+    async def find_user_ids(self, after_user_id: int, limit: int) -> list[int]:
+        """
+        계정과목이 있는 유저 ID를 오름차순으로 조회
+
+        Args:
+            after_user_id: 이 유저 ID보다 큰 유저만 조회
+            limit: 최대 유저 수
+
+        Returns:
+            유저 ID 목록 (오름차순)
+        """
+
+    @abstractmethod
+    async def close_users(
+        self, job: PeriodCloseJob, user_ids: list[int], close_user: Callable[[int], Awaitable[list[ClosingBalance]]]
+    ) -> None:
+        """
+        유저 묶음을 마감 잠금 안에서 마감하고 마감 결과와 작업 진행 상황을 한 트랜잭션에서 저장
+
+        Args:
+            job: 이번 묶음까지 반영한 기간 마감 작업
+            user_ids: 마감할 유저 ID 목록 (오름차순)
+            close_user: 유저 ID를 받아 그 유저의 마감 잔액 목록을 계산하는 비동기 함수
+        """
+
+    @abstractmethod
+    async def save_period_close_job(self, job: PeriodCloseJob) -> None:
+        """
+        기간 마감 작업의 진행 상황 저장
+
+        Args:
+            job: 기간 마감 작업
+        """
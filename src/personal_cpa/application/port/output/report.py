@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date
+
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+
+
+@dataclass(frozen=True)
+class FinancialReportSource:
+    """
+    재무 보고서 작성에 사용할 한 트랜잭션 안에서 읽은 데이터
+
+    Args:
+        chart_of_accounts: 유저의 계정과목 목록 (숨김 계정과목 포함)
+        line_totals: 계정과목 ID별 (차변 합계, 대변 합계) (날짜 범위 전체의 분개 줄, 계정과목 자신의 분개 줄만)
+        period_totals: 기간 범위별 계정과목 ID별 (차변 합계, 대변 합계) (월별 잔액, 하위 계정과목 포함)
+        snapshot_totals: 계정과목 ID별 (차변 누계, 대변 누계) (마감 잔액, 하위 계정과목 포함)
+    """
+
+    chart_of_accounts: list[ChartOfAccount]
+    line_totals: dict[int, tuple[int, int]]
+    period_totals: list[dict[int, tuple[int, int]]]
+    snapshot_totals: dict[int, tuple[int, int]] = field(default_factory=dict)
+
+
+class FinancialReportPort(ABC):
+    """
+    재무 보고서 조회 저장소 인터페이스
+    """
+
+    @abstractmethod
+    def find_closed_period(self, user_id: int, until_period: int) -> int | None:
+        """
+        유저의 마감된 기간 중 `until_period` 이하인 가장 최근 기간 조회
+
+        Args:
+            user_id: 유저 ID
+            until_period: 기간 상한 (포함)
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+
+    @abstractmethod
+    def find_report_source(
+        self,
+        user_id: int,
+        line_ranges: Sequence[tuple[date | None, date]],
+        period_ranges: Sequence[tuple[int, int]],
+        snapshot_period: int | None = None,
+    ) -> FinancialReportSource:
+        """
+        유저의 계정과목과 분개 줄/잔액 합계를 한 트랜잭션에서 조회
+
+        합계는 데이터베이스에서 계정과목별로 묶어(GROUP BY) 계산해야 합니다.
+
+        Args:
+            user_id: 유저 ID
+            line_ranges: 분개 줄을 합할 (시작일 (None 이면 처음부터), 종료일) 목록 (서로 겹치지 않음)
+            period_ranges: 잔액을 합할 (첫 기간, 마지막 기간) 목록
+            snapshot_period: 마감 잔액을 읽을 마감 기간 (None 이면 읽지 않음)
+
+        Returns:
+            재무 보고서 작성용 데이터
+        """
+
+
+class AsyncFinancialReportPort(ABC):
+    """
+    비동기 재무 보고서 조회 저장소 인터페이스
+    """
+
+    @abstractmethod
+    async def find_closed_period(self, user_id: int, until_period: int) -> int | None:
+        """
+        유저의 마감된 기간 중 `until_period` 이하인 가장 최근 기간 조회
+
+        Args:
+            user_id: 유저 ID
+            until_period: 기간 상한 (포함)
+
+        Returns:
+            마감된 기간 (YYYYMM) | None
+        """
+
+    @abstractmethod
+    async def find_report_source(
+        self,
+        user_id: int,
+        line_ranges: Sequence[tuple[date | None, date]],
+        period_ranges: Sequence[tuple[int, int]],
+        snapshot_period: int | None = None,
+    ) -> FinancialReportSource:
+        """
+        유저의 계정과목과 분개 줄/잔액 합계를 한 트랜잭션에서 조회
+
+        Args:
+            user_id: 유저 ID
+            line_ranges: 분개 줄을 합할 (시작일 (None 이면 처음부터), 종료일) 목록 (서로 겹치지 않음)
+            period_ranges: 잔액을 합할 (첫 기간, 마지막 기간) 목록
+            snapshot_period: 마감 잔액을 읽을 마감 기간 (None 이면 읽지 않음)
+
+        Returns:
+            재무 보고서 작성용 데이터
+        """
@@ -0,0 +1,179 @@
+from personal_cpa.application.port.input.result.balance import AccountBalanceCheckResult, AccountBalanceMismatch
+from personal_cpa.application.port.input.use_case.balance import (
+    AsyncCheckAccountBalanceUseCase,
+    AsyncSearchAccountBalanceUseCase,
+    CheckAccountBalanceUseCase,
+    SearchAccountBalanceUseCase,
+)
+from personal_cpa.application.port.output.balance import (
+    AccountBalancePort,
+    AccountBalanceSnapshot,
+    AsyncAccountBalancePort,
+)
+from personal_cpa.domain.balance import (
+    AccountBalance,
+    ancestor_chains,
+    rollup_balances,
+    sum_daily_totals,
+    validate_period,
+)
+
+
+class BaseAccountBalanceService:
+    """
+    동기/비동기 계정과목 잔액 서비스가 공유하는 재계산 및 비교 로직
+    """
+
+    def _recompute_balances(self, user_id: int, snapshot: AccountBalanceSnapshot) -> list[AccountBalance]:
+        """
+        일별 분개 줄 합계를 (계정과목, 월)과 (계정과목, 전체 기간)별로 합친 뒤 계정과목 계층을 따라 상위 계정과목에 더합니다.
+
+        기표 시의 증분 갱신과 달리 저장된 잔액을 전혀 참조하지 않고 분개 줄과 계정과목 계층만으로 계산합니다.
+
+        Args:
+            user_id: 유저 ID
+            snapshot: 잔액 정합성 검사용 데이터
+
+        Returns:
+            (계정과목, 기간)순으로 정렬된 잔액 목록
+        """
+        totals = sum_daily_totals(snapshot.daily_totals)
+        return rollup_balances(user_id, totals, ancestor_chains(snapshot.parent_ids))
+
+    def _compare_balances(
+        self, expected: list[AccountBalance], actual: list[AccountBalance]
+    ) -> list[AccountBalanceMismatch]:
+        """
+        다시 계산한 잔액과 저장된 잔액 비교 (한쪽에만 있는 행은 다른 쪽을 0 으로 간주)
+
+        Args:
+            expected: 분개 줄로 다시 계산한 잔액 목록
+            actual: 저장된 잔액 목록
+
+        Returns:
+            (계정과목, 기간)순으로 정렬된 차이 목록
+        """
+        expected_by_key = {(balance.chart_of_account_id, balance.period): balance for balance in expected}
+        actual_by_key = {(balance.chart_of_account_id, balance.period): balance for balance in actual}
+
+        mismatches = []
+        for chart_of_account_id, period in sorted(expected_by_key.keys() | actual_by_key.keys()):
+            expected_balance = expected_by_key.get((chart_of_account_id, period))
+            actual_balance = actual_by_key.get((chart_of_account_id, period))
+            expected_amounts = (expected_balance.debit, expected_balance.credit) if expected_balance else (0, 0)
+            actual_amounts = (actual_balance.debit, actual_balance.credit) if actual_balance else (0, 0)
+            if expected_amounts != actual_amounts:
+                mismatches.append(
+                    AccountBalanceMismatch(chart_of_account_id, period, *expected_amounts, *actual_amounts)
+                )
+
+        return mismatches
+
+
+class AccountBalanceService(BaseAccountBalanceService, SearchAccountBalanceUseCase, CheckAccountBalanceUseCase):
+    """
+    계정과목 잔액 서비스
+    """
+
+    def __init__(self, account_balance_port: AccountBalancePort):
+        """
+        초기화
+
+        Args:
+            account_balance_port: 계정과목 잔액 저장소
+        """
+        self.account_balance_port = account_balance_port
+
+    def get_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회 (하위 계정과목 포함)
+
+        기표 시 상위 계정과목까지 갱신해 둔 잔액 행 하나를 읽으므로 하위 계정과목이나 분개 줄 수와 무관합니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 | None (계정과목이 없을 경우)
+        """
+        validate_period(period)
+        return self.account_balance_port.find_balance(user_id, code, period)
+
+    def check_balances(self, user_id: int, repair: bool) -> AccountBalanceCheckResult:
+        """
+        유저의 저장된 잔액을 분개 줄로 다시 계산한 잔액과 비교
+
+        수정은 검사 후 별도 트랜잭션에서 잔액을 모두 바꾸므로, 그 사이의 기표가 반영되지 않을 수 있습니다.
+        (기표를 멈춘 상태에서 수정하거나, 수정 후 다시 검사하십시오.)
+
+        Args:
+            user_id: 유저 ID
+            repair: 차이가 있으면 다시 계산한 잔액으로 바꿀지 여부
+
+        Returns:
+            정합성 검사 결과
+        """
+        snapshot = self.account_balance_port.find_balance_snapshot(user_id)
+        expected = self._recompute_balances(user_id, snapshot)
+        mismatches = self._compare_balances(expected, snapshot.balances)
+
+        repaired = repair and bool(mismatches)
+        if repaired:
+            self.account_balance_port.replace_balances(user_id, expected)
+
+        return AccountBalanceCheckResult(checked=len(expected), repaired=repaired, mismatches=mismatches)
+
+
+class AsyncAccountBalanceService(
+    BaseAccountBalanceService, AsyncSearchAccountBalanceUseCase, AsyncCheckAccountBalanceUseCase
+):
+    """
+    비동기 계정과목 잔액 서비스
+    """
+
+    def __init__(self, account_balance_port: AsyncAccountBalancePort):
+        """
+        초기화
+
+        Args:
+            account_balance_port: 비동기 계정과목 잔액 저장소
+        """
+        self.account_balance_port = account_balance_port
+
+    async def get_balance(self, user_id: int, code: str, period: int) -> AccountBalance | None:
+        """
+        유저의 계정과목 잔액 조회 (하위 계정과목 포함)
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            period: 기간 (YYYYMM, 전체 기간은 0)
+
+        Returns:
+            잔액 | None (계정과목이 없을 경우)
+        """
+        validate_period(period)
+        return await self.account_balance_port.find_balance(user_id, code, period)
+
+    async def check_balances(self, user_id: int, repair: bool) -> AccountBalanceCheckResult:
+        """
+        유저의 저장된 잔액을 분개 줄로 다시 계산한 잔액과 비교
+
+        Args:
+            user_id: 유저 ID
+            repair: 차이가 있으면 다시 계산한 잔액으로 바꿀지 여부
+
+        Returns:
+            정합성 검사 결과
+        """
+        snapshot = await self.account_balance_port.find_balance_snapshot(user_id)
+        expected = self._recompute_balances(user_id, snapshot)
+        mismatches = self._compare_balances(expected, snapshot.balances)
+
+        repaired = repair and bool(mismatches)
+        if repaired:
+            await self.account_balance_port.replace_balances(user_id, expected)
+
+        return AccountBalanceCheckResult(checked=len(expected), repaired=repaired, mismatches=mismatches)
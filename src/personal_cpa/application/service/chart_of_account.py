@@ -1,113 +1,167 @@
+from collections.abc import AsyncIterator, Iterable, Iterator
+import itertools
 import logging
+from typing import cast
 
 from personal_cpa.application.port.input.command.chart_of_account import (
     CreateChartOfAccountCommand,
+    ImportChartOfAccountRow,
     UpdateChartOfAccountCommand,
 )
+from personal_cpa.application.port.input.result.chart_of_account import (
+    ChartOfAccountImportError,
+    ChartOfAccountImportResult,
+)
 from personal_cpa.application.port.input.use_case.chart_of_account import (
+    AsyncManageChartOfAccountUseCase,
+    AsyncSearchChartOfAccountUseCase,
     ManageChartOfAccountUseCase,
     SearchChartOfAccountUseCase,
 )
-from personal_cpa.application.port.output.chart_of_account import ChartOfAccountPort
+from personal_cpa.application.port.output.chart_of_account import AsyncChartOfAccountPort, ChartOfAccountPort
 from personal_cpa.domain.chart_of_account import ChartOfAccount, ChartOfAccountTree
 
 logger = logging.getLogger(__name__)
 
 
-class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUseCase):
+class BaseChartOfAccountService:
     """
-    계정과목 서비스
+    동기/비동기 계정과목 서비스가 공유하는 검증 및 트리 구성 로직
     """
 
-    def __init__(self, chart_of_account_port: ChartOfAccountPort):
+    def _collect_codes(self, commands: list[CreateChartOfAccountCommand]) -> list[str]:
         """
-        초기화
+        생성 요청에 포함된 계정과목 코드와 상위 계정과목 코드 수집
 
         Args:
-            chart_of_account_port: 계정과목 저장소
+            commands: 계정과목 생성 Command 목록
+
+        Returns:
+            중복 없이 정렬된 코드 목록
         """
-        self.chart_of_account_port = chart_of_account_port
+        codes = {command.code for command in commands}
+        codes.update(command.parent_code for command in commands if command.parent_code)
+        return sorted(codes)
 
-    def create_chart_of_accounts(
-        self, user_id: int, commands: list[CreateChartOfAccountCommand]
+    def _build_chart_of_accounts(
+        self, user_id: int, commands: list[CreateChartOfAccountCommand], stored_chart_of_accounts: list[ChartOfAccount]
     ) -> list[ChartOfAccount]:
         """
-        유저의 계정과목 생성 (여러 개)
+        생성할 계정과목 목록 구성
+
+        저장된 계정과목과 같은 요청 안에서 먼저 생성되는 상위 계정과목을 메모리에서 검증합니다.
+        같은 요청의 상위 계정과목은 아직 ID가 없으므로 저장소가 코드 규칙으로 연결합니다.
 
         Args:
             user_id: 유저 ID
             commands: 계정과목 생성 Command 목록
+            stored_chart_of_accounts: 요청 코드로 조회한 저장된 계정과목 목록
 
         Returns:
-            계정과목 목록
+            생성할 계정과목 목록
         """
-        chart_of_accounts = []
+        stored_coas = {chart_of_account.code: chart_of_account for chart_of_account in stored_chart_of_accounts}
 
+        pending_coas: dict[str, ChartOfAccount] = {}
         for command in commands:
-            self._assert_chart_of_account_exists(user_id, command.code)
-
-            parent_chart_of_account_id = None
-            if command.parent_code:
-                parent_chart_of_account = self.chart_of_account_port.find_chart_of_account_by_code(
-                    user_id, command.parent_code
-                )
-                self._assert_parent_chart_of_account(command, parent_chart_of_account)
-                if parent_chart_of_account:
-                    parent_chart_of_account_id = parent_chart_of_account.id
-
-            chart_of_accounts.append(
-                ChartOfAccount(
-                    user_id=user_id,
-                    code=command.code,
-                    name=command.name,
-                    category=command.category,
-                    description=command.description,
-                    parent_chart_of_account_id=parent_chart_of_account_id,
-                )
-            )
+            pending_coas[command.code] = self._build_chart_of_account(user_id, command, stored_coas, pending_coas)
 
-        return self.chart_of_account_port.save_chart_of_accounts(chart_of_accounts)
+        return list(pending_coas.values())
 
-    def get_chart_of_accounts(self, user_id: int) -> list[ChartOfAccountTree]:
+    def _build_chart_of_account(
+        self,
+        user_id: int,
+        command: CreateChartOfAccountCommand,
+        stored_coas: dict[str, ChartOfAccount],
+        pending_coas: dict[str, ChartOfAccount],
+    ) -> ChartOfAccount:
         """
-        유저의 계정과목 목록 조회
+        생성할 계정과목 하나를 검증하고 구성
 
         Args:
             user_id: 유저 ID
+            command: 계정과목 생성 Command
+            stored_coas: 저장된 계정과목 (코드별)
+            pending_coas: 같은 요청에서 먼저 생성될 계정과목 (코드별)
 
         Returns:
-            계정과목 트리 목록
-        """
-        chart_of_accounts = self.chart_of_account_port.find_chart_of_accounts(user_id)
-
-        return self._build_account_tree(chart_of_accounts)
+            생성할 계정과목
 
-    def get_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        Raises:
+            ValueError: 계정과목 또는 상위 계정과목이 유효하지 않을 경우 발생
         """
-        유저의 계정과목 상세 조회
+        self._assert_chart_of_account_exists(command.code, stored_coas, pending_coas)
+
+        parent_chart_of_account_id = None
+        if command.parent_code:
+            parent_chart_of_account = stored_coas.get(command.parent_code) or pending_coas.get(command.parent_code)
+            self._assert_parent_chart_of_account(command, parent_chart_of_account)
+            if parent_chart_of_account:
+                parent_chart_of_account_id = parent_chart_of_account.id
+
+        return ChartOfAccount(
+            user_id=user_id,
+            code=command.code,
+            name=command.name,
+            category=command.category,
+            description=command.description,
+            parent_chart_of_account_id=parent_chart_of_account_id,
+            currency=command.currency,
+        )
+
+    def _order_import_rows(
+        self, rows: Iterable[ImportChartOfAccountRow]
+    ) -> tuple[list[ImportChartOfAccountRow], list[ChartOfAccountImportError]]:
+        """
+        가져오기 행을 파싱 오류와 저장할 행으로 나누고, 저장할 행을 위상 정렬
+
+        코드 규칙상 상위 계정과목은 항상 하위 계정과목보다 계층(depth)이 얕으므로,
+        계층순 안정 정렬만으로 상위 계정과목이 하위 계정과목보다 앞에 오도록 정렬됩니다.
 
         Args:
-            user_id: 유저 ID
-            code: 계정과목 코드
+            rows: 계정과목 가져오기 행 목록 (파일 순서)
 
         Returns:
-            계정과목 | None
+            (계층순으로 정렬된 저장할 행 목록, 파싱 오류 목록)
         """
-        return self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
+        ordered_rows, errors = [], []
+        for row in rows:
+            if row.command is None:
+                errors.append(ChartOfAccountImportError(row.line, row.code, row.error or "Invalid row"))
+            else:
+                ordered_rows.append(row)
 
-    def update_chart_of_account(self, user_id: int, code: str, command: UpdateChartOfAccountCommand) -> ChartOfAccount:
+        ordered_rows.sort(key=lambda row: (row.code or "").count("_"))
+        return ordered_rows, errors
+
+    def _build_import_chunk(
+        self, user_id: int, rows: list[ImportChartOfAccountRow], stored_chart_of_accounts: list[ChartOfAccount]
+    ) -> tuple[list[ChartOfAccount], list[ChartOfAccountImportError]]:
         """
-        유저의 계정과목 수정
+        가져오기 묶음의 계정과목 목록 구성 (행별 검증)
+
+        검증에 실패한 행은 건너뛰고 오류로 기록하므로, 그 하위 계정과목은 이후 상위 계정과목 없음 오류가 됩니다.
 
         Args:
             user_id: 유저 ID
-            code: 계정과목 코드
-            command: 계정과목 수정 명령
+            rows: 계층순으로 정렬된 가져오기 행 묶음
+            stored_chart_of_accounts: 묶음 코드로 조회한 저장된 계정과목 목록
 
-        Raises:
-            NotImplementedError: 이 기능은 아직 구현되지 않았습니다.
+        Returns:
+            (생성할 계정과목 목록, 행 오류 목록)
         """
-        raise NotImplementedError("This feature is not implemented yet")
+        stored_coas = {chart_of_account.code: chart_of_account for chart_of_account in stored_chart_of_accounts}
+
+        pending_coas: dict[str, ChartOfAccount] = {}
+        errors = []
+        for row in rows:
+            command = cast(CreateChartOfAccountCommand, row.command)
+            try:
+                pending_coas[command.code] = self._build_chart_of_account(user_id, command, stored_coas, pending_coas)
+            except ValueError as value_error:
+                errors.append(ChartOfAccountImportError(row.line, row.code, str(value_error)))
+
+        return list(pending_coas.values()), errors
 
     def _build_account_tree(self, chart_of_accounts: list[ChartOfAccount]) -> list[ChartOfAccountTree]:
         """
@@ -120,17 +174,7 @@ class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUse
             계정과목 트리 목록
         """
         account_maps = {
-            account.id: ChartOfAccountTree(
-                user_id=account.user_id,
-                code=account.code,
-                name=account.name,
-                category=account.category,
-                description=account.description,
-                parent_chart_of_account_id=account.parent_chart_of_account_id,
-                children=[],
-            )
-            for account in chart_of_accounts
-            if not account.is_hidden
+            account.id: self._to_account_tree(account) for account in chart_of_accounts if not account.is_hidden
         }
 
         roots = []
@@ -141,27 +185,91 @@ class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUse
                 parent = account_maps.get(account.parent_chart_of_account_id, None)
                 if parent:
                     parent.children.append(account)
+                    parent.child_count += 1
 
         return roots
 
-    def _assert_chart_of_account_exists(self, user_id: int, code: str) -> None:
+    def _build_account_subtree(
+        self, code: str, chart_of_accounts: list[ChartOfAccount], depth: int
+    ) -> ChartOfAccountTree | None:
+        """
+        기준 계정과목부터 깊이 제한까지의 계정과목 트리 구축
+
+        계정과목 목록은 기준 계정과목의 하위 트리를 `depth + 1` 깊이까지 조회한 결과입니다.
+        마지막 한 단계는 트리에 넣지 않고 깊이 제한에 걸린 계정과목의 `child_count`를 세는 데만 사용합니다.
+
+        Args:
+            code: 기준 계정과목 코드
+            chart_of_accounts: 기준 계정과목의 하위 트리 계정과목 목록
+            depth: 기준 계정과목으로부터 포함할 최대 상대 깊이
+
+        Returns:
+            계정과목 트리 | None (기준 계정과목이 없거나 숨겨진 경우)
+        """
+        max_depth = code.count("_") + depth
+        visible_accounts = [account for account in chart_of_accounts if not account.is_hidden]
+        account_maps = {
+            account.id: self._to_account_tree(account) for account in visible_accounts if account.depth <= max_depth
+        }
+
+        root = None
+        for account in visible_accounts:
+            if account.code == code:
+                root = account_maps[account.id]
+                continue
+
+            parent = account_maps.get(account.parent_chart_of_account_id)
+            if parent:
+                parent.child_count += 1
+                if account.id in account_maps:
+                    parent.children.append(account_maps[account.id])
+
+        return root
+
+    def _to_account_tree(self, account: ChartOfAccount) -> ChartOfAccountTree:
+        """
+        계정과목을 하위 계정과목이 비어 있는 트리 노드로 변환
+
+        Args:
+            account: 계정과목
+
+        Returns:
+            계정과목 트리
+        """
+        return ChartOfAccountTree(
+            user_id=account.user_id,
+            code=account.code,
+            name=account.name,
+            category=account.category,
+            description=account.description,
+            parent_chart_of_account_id=account.parent_chart_of_account_id,
+            children=[],
+        )
+
+    def _assert_chart_of_account_exists(
+        self, code: str, stored_coas: dict[str, ChartOfAccount], pending_coas: dict[str, ChartOfAccount]
+    ) -> None:
         """
         계정과목 존재 여부 검사
 
         검사항목
-            1. 이미 존재하는 계정과목인지 검사
+            1. 이미 저장된 계정과목인지 검사
+            2. 같은 요청 안에서 중복된 계정과목인지 검사
 
         Args:
-            user_id: 유저 ID
             code: 계정과목 코드
+            stored_coas: 저장된 계정과목 (코드별)
+            pending_coas: 같은 요청에서 먼저 생성될 계정과목 (코드별)
 
         Raises:
-            ValueError: 계정과목이 존재하지 않을 경우 발생
+            ValueError: 계정과목이 이미 존재하거나 요청 안에서 중복될 경우 발생
         """
-        chart_of_account = self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
-        if chart_of_account:
+        if code in stored_coas:
             raise ValueError(f"Chart of account with code {code} already exists.")
 
+        if code in pending_coas:
+            raise ValueError(f"Chart of account with code {code} is duplicated in the request.")
+
     def _assert_parent_chart_of_account(
         self, input_coa: CreateChartOfAccountCommand, stored_coa: ChartOfAccount | None
     ) -> None:
@@ -172,6 +280,7 @@ class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUse
             1. 상위 계정과목 존재 여부 검사
             2. 현재 계정과목 카테고리와 상위 계정과목 카테고리가 일치하는지 검사
             3. 상위 계정과목이 숨겨져 있지 않은지 검사
+            4. 현재 계정과목 통화와 상위 계정과목 통화가 일치하는지 검사 (잔액을 상위 계정과목으로 그대로 합산하므로)
 
         Args:
             input_coa: 입력 계정과목
@@ -181,6 +290,7 @@ class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUse
             ValueError: 상위 계정과목이 존재하지 않을 경우 발생
             ValueError: 상위 계정과목 카테고리와 현재 계정과목 카테고리가 일치하지 않을 경우 발생
             ValueError: 상위 계정과목이 숨겨져 있을 경우 발생
+            ValueError: 상위 계정과목 통화와 현재 계정과목 통화가 일치하지 않을 경우 발생
         """
         if not stored_coa:
             raise ValueError(f"Parent chart of account with code {input_coa.parent_code} not found.")
@@ -192,3 +302,315 @@ class ChartOfAccountService(SearchChartOfAccountUseCase, ManageChartOfAccountUse
 
         if stored_coa.is_hidden:
             raise ValueError(f"Parent chart of account with code {stored_coa.code} is hidden.")
+
+        if input_coa.currency != stored_coa.currency:
+            raise ValueError(
+                f"Parent chart of account with currency {stored_coa.currency} must match the current account's currency {input_coa.currency}."
+            )
+
+
+class ChartOfAccountService(BaseChartOfAccountService, SearchChartOfAccountUseCase, ManageChartOfAccountUseCase):
+    """
+    계정과목 서비스
+    """
+
+    def __init__(self, chart_of_account_port: ChartOfAccountPort, import_chunk_size: int = 1000):
+        """
+        초기화
+
+        Args:
+            chart_of_account_port: 계정과목 저장소
+            import_chunk_size: 가져오기 시 한 번에 커밋할 계정과목 수
+        """
+        self.chart_of_account_port = chart_of_account_port
+        self.import_chunk_size = import_chunk_size
+
+    def create_chart_of_accounts(
+        self, user_id: int, commands: list[CreateChartOfAccountCommand]
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        요청에 포함된 계정과목 코드와 상위 계정과목 코드를 한 번의 조회로 확인한 뒤,
+        같은 요청 안에서 먼저 생성되는 상위 계정과목은 메모리에서 검증하고 한 번에 저장합니다.
+
+        Args:
+            user_id: 유저 ID
+            commands: 계정과목 생성 Command 목록
+
+        Returns:
+            계정과목 목록
+        """
+        stored_chart_of_accounts = self.chart_of_account_port.find_chart_of_accounts_by_codes(
+            user_id, self._collect_codes(commands)
+        )
+        chart_of_accounts = self._build_chart_of_accounts(user_id, commands, stored_chart_of_accounts)
+
+        return self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+
+    def get_chart_of_accounts(self, user_id: int) -> list[ChartOfAccountTree]:
+        """
+        유저의 계정과목 목록 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 트리 목록
+        """
+        chart_of_accounts = self.chart_of_account_port.find_chart_of_accounts(user_id)
+
+        return self._build_account_tree(chart_of_accounts)
+
+    def get_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+        return self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
+
+    def export_chart_of_accounts(self, user_id: int) -> Iterator[ChartOfAccount]:
+        """
+        유저의 계정과목 전체를 코드순으로 내보내기 (스트리밍)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 이터레이터 (순회하는 동안 DB 연결을 사용)
+        """
+        return self.chart_of_account_port.stream_chart_of_accounts(user_id)
+
+    def get_chart_of_account_subtree(self, user_id: int, code: str, depth: int) -> ChartOfAccountTree | None:
+        """
+        유저의 계정과목 하위 트리 조회 (깊이 제한)
+
+        전체 계정과목을 읽지 않고 기준 계정과목의 하위 트리를 한 단계 더 깊게 조회하여
+        요청한 범위만 트리로 만들고, 깊이 제한에 걸린 계정과목의 하위 계정과목 수를 채웁니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            depth: 기준 계정과목으로부터 포함할 최대 상대 깊이 (0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 트리 | None (기준 계정과목이 없거나 숨겨진 경우)
+        """
+        chart_of_accounts = self.chart_of_account_port.find_chart_of_account_subtree(user_id, code, max_depth=depth + 1)
+
+        return self._build_account_subtree(code, chart_of_accounts, depth)
+
+    def import_chart_of_accounts(
+        self, user_id: int, rows: Iterable[ImportChartOfAccountRow]
+    ) -> ChartOfAccountImportResult:
+        """
+        유저의 계정과목 가져오기 (대량)
+
+        상위 계정과목이 먼저 오도록 정렬한 행을 `import_chunk_size`개씩 나누어,
+        묶음마다 코드 조회 1회와 일괄 저장(계층마다 INSERT 1회)을 하나의 트랜잭션으로 커밋합니다.
+        (요청 단위 작업 안에서 실행하면 모든 묶음이 작업 끝에 한 번 커밋되므로, 가져오기 경로는 작업 밖에서 실행합니다)
+        앞 묶음에서 저장된 상위 계정과목은 다음 묶음의 코드 조회에서 찾습니다.
+
+        Args:
+            user_id: 유저 ID
+            rows: 계정과목 가져오기 행 목록 (파일 순서)
+
+        Returns:
+            가져오기 결과
+        """
+        ordered_rows, errors = self._order_import_rows(rows)
+
+        created = chunks = 0
+        for chunk in itertools.batched(ordered_rows, self.import_chunk_size, strict=False):
+            commands = [cast(CreateChartOfAccountCommand, row.command) for row in chunk]
+            stored_chart_of_accounts = self.chart_of_account_port.find_chart_of_accounts_by_codes(
+                user_id, self._collect_codes(commands)
+            )
+            chart_of_accounts, chunk_errors = self._build_import_chunk(user_id, list(chunk), stored_chart_of_accounts)
+            errors.extend(chunk_errors)
+            if chart_of_accounts:
+                self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+                created += len(chart_of_accounts)
+                chunks += 1
+
+        logger.info(
+            f"Imported {created} chart of accounts for user {user_id} in {chunks} chunks ({len(errors)} failed)"
+        )
+        return ChartOfAccountImportResult(
+            created=created, chunks=chunks, errors=sorted(errors, key=lambda error: error.line)
+        )
+
+    def update_chart_of_account(self, user_id: int, code: str, command: UpdateChartOfAccountCommand) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            command: 계정과목 수정 명령
+
+        Raises:
+            NotImplementedError: 이 기능은 아직 구현되지 않았습니다.
+        """
+        raise NotImplementedError("This feature is not implemented yet")
+
+
+class AsyncChartOfAccountService(
+    BaseChartOfAccountService, AsyncSearchChartOfAccountUseCase, AsyncManageChartOfAccountUseCase
+):
+    """
+    비동기 계정과목 서비스
+    """
+
+    def __init__(self, chart_of_account_port: AsyncChartOfAccountPort, import_chunk_size: int = 1000):
+        """
+        초기화
+
+        Args:
+            chart_of_account_port: 비동기 계정과목 저장소
+            import_chunk_size: 가져오기 시 한 번에 커밋할 계정과목 수
+        """
+        self.chart_of_account_port = chart_of_account_port
+        self.import_chunk_size = import_chunk_size
+
+    async def create_chart_of_accounts(
+        self, user_id: int, commands: list[CreateChartOfAccountCommand]
+    ) -> list[ChartOfAccount]:
+        """
+        유저의 계정과목 생성 (여러 개)
+
+        Args:
+            user_id: 유저 ID
+            commands: 계정과목 생성 Command 목록
+
+        Returns:
+            계정과목 목록
+        """
+        stored_chart_of_accounts = await self.chart_of_account_port.find_chart_of_accounts_by_codes(
+            user_id, self._collect_codes(commands)
+        )
+        chart_of_accounts = self._build_chart_of_accounts(user_id, commands, stored_chart_of_accounts)
+
+        return await self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+
+    async def get_chart_of_accounts(self, user_id: int) -> list[ChartOfAccountTree]:
+        """
+        유저의 계정과목 목록 조회
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 트리 목록
+        """
+        chart_of_accounts = await self.chart_of_account_port.find_chart_of_accounts(user_id)
+
+        return self._build_account_tree(chart_of_accounts)
+
+    async def get_chart_of_account_by_code(self, user_id: int, code: str) -> ChartOfAccount | None:
+        """
+        유저의 계정과목 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+
+        Returns:
+            계정과목 | None
+        """
+        return await self.chart_of_account_port.find_chart_of_account_by_code(user_id, code)
+
+    def export_chart_of_accounts(self, user_id: int) -> AsyncIterator[ChartOfAccount]:
+        """
+        유저의 계정과목 전체를 코드순으로 내보내기 (스트리밍)
+
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            계정과목 이터레이터 (순회하는 동안 DB 연결을 사용)
+        """
+        return self.chart_of_account_port.stream_chart_of_accounts(user_id)
+
+    async def get_chart_of_account_subtree(self, user_id: int, code: str, depth: int) -> ChartOfAccountTree | None:
+        """
+        유저의 계정과목 하위 트리 조회 (깊이 제한)
+
+        전체 계정과목을 읽지 않고 기준 계정과목의 하위 트리를 한 단계 더 깊게 조회하여
+        요청한 범위만 트리로 만들고, 깊이 제한에 걸린 계정과목의 하위 계정과목 수를 채웁니다.
+
+        Args:
+            user_id: 유저 ID
+            code: 기준 계정과목 코드
+            depth: 기준 계정과목으로부터 포함할 최대 상대 깊이 (0 이면 기준 계정과목만)
+
+        Returns:
+            계정과목 트리 | None (기준 계정과목이 없거나 숨겨진 경우)
+        """
+        chart_of_accounts = await self.chart_of_account_port.find_chart_of_account_subtree(
+            user_id, code, max_depth=depth + 1
+        )
+
+        return self._build_account_subtree(code, chart_of_accounts, depth)
+
+    async def import_chart_of_accounts(
+        self, user_id: int, rows: Iterable[ImportChartOfAccountRow]
+    ) -> ChartOfAccountImportResult:
+        """
+        유저의 계정과목 가져오기 (대량)
+
+        상위 계정과목이 먼저 오도록 정렬한 행을 `import_chunk_size`개씩 나누어,
+        묶음마다 코드 조회 1회와 일괄 저장(계층마다 INSERT 1회)을 하나의 트랜잭션으로 커밋합니다.
+        (요청 단위 작업 안에서 실행하면 모든 묶음이 작업 끝에 한 번 커밋되므로, 가져오기 경로는 작업 밖에서 실행합니다)
+        앞 묶음에서 저장된 상위 계정과목은 다음 묶음의 코드 조회에서 찾습니다.
+
+        Args:
+            user_id: 유저 ID
+            rows: 계정과목 가져오기 행 목록 (파일 순서)
+
+        Returns:
+            가져오기 결과
+        """
+        ordered_rows, errors = self._order_import_rows(rows)
+
+        created = chunks = 0
+        for chunk in itertools.batched(ordered_rows, self.import_chunk_size, strict=False):
+            commands = [cast(CreateChartOfAccountCommand, row.command) for row in chunk]
+            stored_chart_of_accounts = await self.chart_of_account_port.find_chart_of_accounts_by_codes(
+                user_id, self._collect_codes(commands)
+            )
+            chart_of_accounts, chunk_errors = self._build_import_chunk(user_id, list(chunk), stored_chart_of_accounts)
+            errors.extend(chunk_errors)
+            if chart_of_accounts:
+                await self.chart_of_account_port.bulk_insert_chart_of_accounts(chart_of_accounts)
+                created += len(chart_of_accounts)
+                chunks += 1
+
+        logger.info(
+            f"Imported {created} chart of accounts for user {user_id} in {chunks} chunks ({len(errors)} failed)"
+        )
+        return ChartOfAccountImportResult(
+            created=created, chunks=chunks, errors=sorted(errors, key=lambda error: error.line)
+        )
+
+    async def update_chart_of_account(
+        self, user_id: int, code: str, command: UpdateChartOfAccountCommand
+    ) -> ChartOfAccount:
+        """
+        유저의 계정과목 수정
+
+        Args:
+            user_id: 유저 ID
+            code: 계정과목 코드
+            command: 계정과목 수정 명령
+
+        Raises:
+            NotImplementedError: 이 기능은 아직 구현되지 않았습니다.
+        """
+        raise NotImplementedError("This feature is not implemented yet")
@@ -0,0 +1,168 @@
+from collections.abc import Sequence
+from datetime import date
+from decimal import Decimal
+from fractions import Fraction
+
+from personal_cpa.application.port.input.use_case.fx_rate import AsyncManageFxRateUseCase, ManageFxRateUseCase
+from personal_cpa.application.port.output.fx_rate import AsyncFxRatePort, FxRatePort
+from personal_cpa.domain.currency import validate_currency
+from personal_cpa.domain.fx_rate import FxRate
+
+# 환율 응답의 소수 자릿수 (환율 테이블의 소수 자릿수와 같음)
+_RATE_QUANTUM = Decimal("1e-10")
+
+
+class BaseFxRateService:
+    """
+    동기/비동기 환율 서비스가 공유하는 변환 로직
+    """
+
+    @staticmethod
+    def _to_fx_rate(base_currency: str, quote_currency: str, day: date, rate: Fraction) -> FxRate:
+        """
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+            rate: 기준일 환율 (교차 환율이면 무한소수일 수 있음)
+
+        Returns:
+            환율 테이블과 같은 소수 자릿수로 반올림한 기준일 환율
+        """
+        validate_currency(base_currency)
+        validate_currency(quote_currency)
+        decimal_rate = (Decimal(rate.numerator) / Decimal(rate.denominator)).quantize(_RATE_QUANTUM)
+        return FxRate(base_currency=base_currency, quote_currency=quote_currency, rate_date=day, rate=decimal_rate)
+
+
+class FxRateService(BaseFxRateService, ManageFxRateUseCase):
+    """
+    환율 서비스
+    """
+
+    def __init__(self, fx_rate_port: FxRatePort):
+        """
+        초기화
+
+        Args:
+            fx_rate_port: 환율 저장소 (환율 조회 구조를 캐시하는 저장소 권장)
+        """
+        self.fx_rate_port = fx_rate_port
+
+    def import_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 가져오기 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        return self.fx_rate_port.save_fx_rates(fx_rates)
+
+    def get_fx_rate(self, base_currency: str, quote_currency: str, day: date) -> FxRate:
+        """
+        기준일에 적용되는 환율 조회
+
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            기준일의 환율
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        rate = self.fx_rate_port.find_fx_rate_table().rate(base_currency, quote_currency, day)
+        return self._to_fx_rate(base_currency, quote_currency, day, rate)
+
+    def convert_amounts(
+        self, amounts: Sequence[int], currencies: Sequence[str], to_currency: str, day: date
+    ) -> list[int]:
+        """
+        여러 금액을 기준일 환율로 한 번에 환산
+
+        Args:
+            amounts: 통화 최소 단위 금액 목록
+            currencies: 금액별 통화 코드 목록
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            환산 통화 최소 단위 금액 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        return self.fx_rate_port.find_fx_rate_table().convert_many(amounts, currencies, to_currency, day)
+
+
+class AsyncFxRateService(BaseFxRateService, AsyncManageFxRateUseCase):
+    """
+    비동기 환율 서비스
+    """
+
+    def __init__(self, fx_rate_port: AsyncFxRatePort):
+        """
+        초기화
+
+        Args:
+            fx_rate_port: 비동기 환율 저장소 (환율 조회 구조를 캐시하는 저장소 권장)
+        """
+        self.fx_rate_port = fx_rate_port
+
+    async def import_fx_rates(self, fx_rates: list[FxRate]) -> int:
+        """
+        환율 가져오기 (같은 통화쌍, 고시일의 환율은 덮어씀)
+
+        Args:
+            fx_rates: 환율 목록
+
+        Returns:
+            저장한 환율 수
+        """
+        return await self.fx_rate_port.save_fx_rates(fx_rates)
+
+    async def get_fx_rate(self, base_currency: str, quote_currency: str, day: date) -> FxRate:
+        """
+        기준일에 적용되는 환율 조회
+
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            기준일의 환율
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+        return self._to_fx_rate(
+            base_currency, quote_currency, day, fx_rate_table.rate(base_currency, quote_currency, day)
+        )
+
+    async def convert_amounts(
+        self, amounts: Sequence[int], currencies: Sequence[str], to_currency: str, day: date
+    ) -> list[int]:
+        """
+        여러 금액을 기준일 환율로 한 번에 환산
+
+        Args:
+            amounts: 통화 최소 단위 금액 목록
+            currencies: 금액별 통화 코드 목록
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            환산 통화 최소 단위 금액 목록 (입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+        return fx_rate_table.convert_many(amounts, currencies, to_currency, day)
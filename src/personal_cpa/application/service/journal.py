@@ -0,0 +1,299 @@
+from collections.abc import Container, Mapping
+from datetime import date
+
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand
+from personal_cpa.application.port.input.use_case.journal import (
+    AsyncPostJournalEntryUseCase,
+    AsyncSearchJournalEntryUseCase,
+    PostJournalEntryUseCase,
+    SearchJournalEntryUseCase,
+)
+from personal_cpa.application.port.output.journal import AsyncJournalPort, JournalPort
+from personal_cpa.domain.balance import AccountBalance, rollup_balances, sum_journal_entries, validate_open_period
+from personal_cpa.domain.journal import JournalEntry, JournalLine, LedgerLine
+
+
+class BaseJournalService:
+    """
+    동기/비동기 분개 서비스가 공유하는 검증 및 분개 구성 로직
+    """
+
+    rollup_balances: bool
+
+    def _collect_chart_of_account_ids(self, commands: list[PostJournalEntryCommand]) -> set[int]:
+        """
+        기표 요청에 포함된 계정과목 ID 수집
+
+        Args:
+            commands: 분개 기표 Command 목록
+
+        Returns:
+            중복 없는 계정과목 ID
+        """
+        return {line.chart_of_account_id for command in commands for line in command.lines}
+
+    def _build_journal_entries(
+        self,
+        user_id: int,
+        commands: list[PostJournalEntryCommand],
+        postable_ids: Container[int],
+        closed_period: int | None = None,
+        currencies: Mapping[int, str] | None = None,
+    ) -> list[JournalEntry]:
+        """
+        기표할 분개 목록 구성
+
+        분개마다 도메인 모델이 분개 줄을 한 번 순회하며 대차 평형을 검사하고, 계정과목은 미리 한 번에 조회한
+        분개 가능 계정과목 ID로 메모리에서 검사합니다. 오류 메시지에는 요청 목록에서의 위치를 붙입니다.
+
+        Args:
+            user_id: 유저 ID
+            commands: 분개 기표 Command 목록
+            postable_ids: 분개할 수 있는 계정과목 ID
+            closed_period: 유저의 가장 최근 마감 기간 (이 기간 이하의 거래일은 기표할 수 없음)
+            currencies: 계정과목 ID별 통화 코드 (None 이면 통화를 검사하지 않음)
+
+        Returns:
+            기표할 분개 목록
+
+        Raises:
+            ValueError: 분개가 유효하지 않거나 분개할 수 없는 계정과목, 마감된 기간의 거래일 또는 여러 통화의 계정과목이
+                포함된 경우 발생
+        """
+        journal_entries = []
+        for index, command in enumerate(commands):
+            try:
+                journal_entries.append(
+                    self._build_journal_entry(user_id, command, postable_ids, closed_period, currencies)
+                )
+            except ValueError as error:
+                raise ValueError(f"entries[{index}]: {error}") from error
+
+        return journal_entries
+
+    def _build_journal_entry(
+        self,
+        user_id: int,
+        command: PostJournalEntryCommand,
+        postable_ids: Container[int],
+        closed_period: int | None = None,
+        currencies: Mapping[int, str] | None = None,
+    ) -> JournalEntry:
+        """
+        기표할 분개 하나를 검증하고 구성
+
+        Args:
+            user_id: 유저 ID
+            command: 분개 기표 Command
+            postable_ids: 분개할 수 있는 계정과목 ID
+            closed_period: 유저의 가장 최근 마감 기간
+            currencies: 계정과목 ID별 통화 코드 (None 이면 통화를 검사하지 않음)
+
+        Returns:
+            기표할 분개
+
+        Raises:
+            ValueError: 분개할 수 없는 계정과목이 포함되었거나, 거래일이 마감된 기간이거나, 분개 줄의 통화가 여러 개이거나,
+                분개가 유효하지 않을 경우 발생
+        """
+        validate_open_period(command.entry_date, closed_period)
+
+        lines = []
+        for line in command.lines:
+            if line.chart_of_account_id not in postable_ids:
+                raise ValueError(f"Chart of account with id {line.chart_of_account_id} not found or hidden.")
+            lines.append(
+                JournalLine(
+                    chart_of_account_id=line.chart_of_account_id,
+                    debit=line.debit,
+                    credit=line.credit,
+                    description=line.description,
+                )
+            )
+
+        if currencies is not None:
+            entry_currencies = {currencies[line.chart_of_account_id] for line in lines}
+            if len(entry_currencies) > 1:
+                raise ValueError(f"lines must share one currency. (Currently: {', '.join(sorted(entry_currencies))})")
+
+        return JournalEntry(
+            user_id=user_id, entry_date=command.entry_date, description=command.description, lines=tuple(lines)
+        )
+
+    def _build_balance_changes(
+        self, user_id: int, journal_entries: list[JournalEntry], ancestor_ids: dict[int, tuple[int, ...]]
+    ) -> list[AccountBalance]:
+        """
+        기표할 분개의 잔액 변동분 구성
+
+        분개 줄을 (계정과목, 월)과 (계정과목, 전체 기간)별로 합친 뒤 상위 계정과목 전체에 더하므로,
+        변동분 행 수는 분개 수가 아니라 관련 계정과목 수 x 기간 수에 비례합니다.
+
+        Args:
+            user_id: 유저 ID
+            journal_entries: 기표할 분개 목록
+            ancestor_ids: 계정과목 ID별 상위 계정과목 ID 목록
+
+        Returns:
+            (계정과목, 기간)순으로 정렬된 잔액 변동분 (잔액 집계를 끈 경우 빈 목록)
+        """
+        if not self.rollup_balances:
+            return []
+        return rollup_balances(user_id, sum_journal_entries(journal_entries), ancestor_ids)
+
+    def _assert_period(self, start_date: date, end_date: date) -> None:
+        """
+        조회 기간 유효성 검사
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦을 경우 발생
+        """
+        if start_date > end_date:
+            raise ValueError(f"start_date {start_date} must not be after end_date {end_date}.")
+
+
+class JournalService(BaseJournalService, PostJournalEntryUseCase, SearchJournalEntryUseCase):
+    """
+    분개 서비스
+    """
+
+    def __init__(self, journal_port: JournalPort, rollup_balances: bool = True):
+        """
+        초기화
+
+        Args:
+            journal_port: 분개 저장소
+            rollup_balances: 기표 시 계정과목 잔액(상위 계정과목 포함)을 함께 갱신할지 여부
+        """
+        self.journal_port = journal_port
+        self.rollup_balances = rollup_balances
+
+    def post_journal_entries(self, user_id: int, commands: list[PostJournalEntryCommand]) -> list[JournalEntry]:
+        """
+        유저의 분개 기표 (여러 개)
+
+        요청에 포함된 계정과목 ID와 그 상위 계정과목을 계층마다 한 번씩 조회해 확인하고,
+        마감된 기간의 거래일이나 여러 통화가 섞인 분개가 없는지 포함해 모든 분개를 검증한 뒤 분개와 잔액 변동분을 한 트랜잭션으로 저장합니다.
+
+        Args:
+            user_id: 유저 ID
+            commands: 분개 기표 Command 목록
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+        """
+        ancestor_ids = self.journal_port.find_postable_chart_of_account_ancestors(
+            user_id, self._collect_chart_of_account_ids(commands)
+        )
+        currencies = self.journal_port.find_chart_of_account_currencies(user_id, ancestor_ids)
+        closed_period = self.journal_port.find_closed_period(user_id)
+        journal_entries = self._build_journal_entries(user_id, commands, ancestor_ids, closed_period, currencies)
+        balance_changes = self._build_balance_changes(user_id, journal_entries, ancestor_ids)
+
+        return self.journal_port.save_journal_entries(journal_entries, balance_changes)
+
+    def get_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+        return self.journal_port.find_journal_entry(user_id, journal_entry_id)
+
+    def get_ledger(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        유저의 계정과목별 원장 조회 (기간)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+        self._assert_period(start_date, end_date)
+        return self.journal_port.find_ledger_lines(user_id, chart_of_account_id, start_date, end_date, limit)
+
+
+class AsyncJournalService(BaseJournalService, AsyncPostJournalEntryUseCase, AsyncSearchJournalEntryUseCase):
+    """
+    비동기 분개 서비스
+    """
+
+    def __init__(self, journal_port: AsyncJournalPort, rollup_balances: bool = True):
+        """
+        초기화
+
+        Args:
+            journal_port: 비동기 분개 저장소
+            rollup_balances: 기표 시 계정과목 잔액(상위 계정과목 포함)을 함께 갱신할지 여부
+        """
+        self.journal_port = journal_port
+        self.rollup_balances = rollup_balances
+
+    async def post_journal_entries(self, user_id: int, commands: list[PostJournalEntryCommand]) -> list[JournalEntry]:
+        """
+        유저의 분개 기표 (여러 개)
+
+        Args:
+            user_id: 유저 ID
+            commands: 분개 기표 Command 목록
+
+        Returns:
+            ID가 채워진 분개 목록 (입력 순서 유지)
+        """
+        ancestor_ids = await self.journal_port.find_postable_chart_of_account_ancestors(
+            user_id, self._collect_chart_of_account_ids(commands)
+        )
+        currencies = await self.journal_port.find_chart_of_account_currencies(user_id, ancestor_ids)
+        closed_period = await self.journal_port.find_closed_period(user_id)
+        journal_entries = self._build_journal_entries(user_id, commands, ancestor_ids, closed_period, currencies)
+        balance_changes = self._build_balance_changes(user_id, journal_entries, ancestor_ids)
+
+        return await self.journal_port.save_journal_entries(journal_entries, balance_changes)
+
+    async def get_journal_entry(self, user_id: int, journal_entry_id: int) -> JournalEntry | None:
+        """
+        유저의 분개 상세 조회
+
+        Args:
+            user_id: 유저 ID
+            journal_entry_id: 분개 ID
+
+        Returns:
+            분개 | None
+        """
+        return await self.journal_port.find_journal_entry(user_id, journal_entry_id)
+
+    async def get_ledger(
+        self, user_id: int, chart_of_account_id: int, start_date: date, end_date: date, limit: int
+    ) -> list[LedgerLine]:
+        """
+        유저의 계정과목별 원장 조회 (기간)
+
+        Args:
+            user_id: 유저 ID
+            chart_of_account_id: 계정과목 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            limit: 최대 줄 수
+
+        Returns:
+            거래일, 기표 순으로 정렬된 원장 줄 목록
+        """
+        self._assert_period(start_date, end_date)
+        return await self.journal_port.find_ledger_lines(user_id, chart_of_account_id, start_date, end_date, limit)
@@ -0,0 +1,284 @@
+from datetime import date
+from functools import partial
+
+from personal_cpa.application.port.input.use_case.period_close import AsyncClosePeriodUseCase, ClosePeriodUseCase
+from personal_cpa.application.port.output.period_close import AsyncPeriodClosePort, PeriodClosePort
+from personal_cpa.application.port.output.report import (
+    AsyncFinancialReportPort,
+    FinancialReportPort,
+    FinancialReportSource,
+)
+from personal_cpa.application.service.report import BaseFinancialReportService
+from personal_cpa.domain.balance import ALL_PERIODS, period_end, validate_period
+from personal_cpa.domain.period_close import ClosingBalance, PeriodCloseJob
+
+
+class BasePeriodCloseService(BaseFinancialReportService):
+    """
+    동기/비동기 기간 마감 서비스가 공유하는 검증 및 마감 잔액 계산 로직
+
+    마감 잔액은 재무상태표와 같은 기준일 누계 계획으로 계산하므로, 직전 마감 잔액이 있으면 그 이후의
+    변동분(월별 잔액 또는 분개 줄)만 읽습니다.
+    """
+
+    batch_size: int
+
+    def _validate_closable(self, period: int) -> None:
+        """
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+        if period == ALL_PERIODS:
+            raise ValueError(f"period must be YYYYMM. (Currently: {period})")
+        validate_period(period)
+        if period_end(period) >= date.today():
+            raise ValueError(f"period {period} has not ended yet.")
+
+    def _closing_balances(
+        self, user_id: int, period: int, source: FinancialReportSource, signs: list[int]
+    ) -> list[ClosingBalance]:
+        """
+        Args:
+            user_id: 유저 ID
+            period: 마감 기간
+            source: 기간 말 누계 조회 결과
+            signs: 기간 범위별 부호
+
+        Returns:
+            누계가 있는 계정과목의 마감 잔액 목록 (하위 계정과목 포함)
+        """
+        tree, debits, credits = self._rollup(source, signs)
+        return [
+            ClosingBalance(
+                user_id=user_id, chart_of_account_id=chart_of_account.id, period=period, debit=debit, credit=credit
+            )
+            for chart_of_account, debit, credit in zip(tree.chart_of_accounts, debits, credits, strict=True)
+            if debit or credit
+        ]
+
+
+class PeriodCloseService(BasePeriodCloseService, ClosePeriodUseCase):
+    """
+    기간 마감 서비스
+
+    유저를 ID 순으로 `batch_size`명씩 마감하고, 묶음마다 마감 잔액과 마지막으로 마감한 유저 ID를 한 트랜잭션에서
+    저장합니다. 마감 잔액은 기표 저장과 함께 잡는 유저별 마감 잠금 안에서 계산하므로 마감 중인 유저의 기표는
+    마감이 저장된 뒤 마감된 기간을 다시 확인합니다. 작업이 중단되면 같은 기간으로 다시 실행해 마지막으로 저장한
+    묶음 다음부터 이어서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        period_close_port: PeriodClosePort,
+        financial_report_port: FinancialReportPort,
+        use_balances: bool = True,
+        batch_size: int = 100,
+    ):
+        """
+        초기화
+
+        Args:
+            period_close_port: 기간 마감 저장소
+            financial_report_port: 재무 보고서 조회 저장소 (주 데이터베이스에서 읽어야 함)
+            use_balances: 월 전체가 포함되는 기간을 월별 잔액으로 합할지 여부 (기표 시 잔액을 갱신하는 경우에만 참)
+            batch_size: 한 트랜잭션에서 마감할 유저 수
+        """
+        self.period_close_port = period_close_port
+        self.financial_report_port = financial_report_port
+        self.use_balances = use_balances
+        self.batch_size = batch_size
+
+    def start_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업 시작 (이미 있는 작업이면 그 작업을 반환)
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+        self._validate_closable(period)
+        return self.period_close_port.create_period_close_job(PeriodCloseJob(period=period))
+
+    def run_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업을 마지막으로 마감한 유저 다음부터 끝까지 실행
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            완료된 기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+        job = self.start_period_close(period)
+        while not job.done:
+            job = self.close_next_users(job)
+        return job
+
+    def close_next_users(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        다음 유저 묶음 마감 (남은 유저가 없으면 작업 완료)
+
+        Args:
+            job: 기간 마감 작업
+
+        Returns:
+            진행 상황이 갱신된 기간 마감 작업
+        """
+        user_ids = self.period_close_port.find_user_ids(job.last_user_id, self.batch_size)
+        if not user_ids:
+            job = job.finish()
+            self.period_close_port.save_period_close_job(job)
+            return job
+
+        job = job.advance(user_ids)
+        self.period_close_port.close_users(job, user_ids, partial(self._close_user, period=job.period))
+        return job
+
+    def get_period_close(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+        return self.period_close_port.find_period_close_job(period)
+
+    def _close_user(self, user_id: int, period: int) -> list[ClosingBalance]:
+        """
+        Args:
+            user_id: 유저 ID
+            period: 마감 기간
+
+        Returns:
+            유저의 마감 잔액 목록
+        """
+        # YYYYMM - 1 은 직전 기간 이하의 상한 (1월이면 YYYY00 으로 전년 12월 이하)
+        snapshot_period = self.financial_report_port.find_closed_period(user_id, period - 1)
+        plan = self._plan_cumulative(period_end(period), snapshot_period)
+        source = self.financial_report_port.find_report_source(
+            user_id, plan.line_ranges, plan.period_ranges, plan.snapshot_period
+        )
+        return self._closing_balances(user_id, period, source, plan.signs)
+
+
+class AsyncPeriodCloseService(BasePeriodCloseService, AsyncClosePeriodUseCase):
+    """
+    비동기 기간 마감 서비스
+    """
+
+    def __init__(
+        self,
+        period_close_port: AsyncPeriodClosePort,
+        financial_report_port: AsyncFinancialReportPort,
+        use_balances: bool = True,
+        batch_size: int = 100,
+    ):
+        """
+        초기화
+
+        Args:
+            period_close_port: 비동기 기간 마감 저장소
+            financial_report_port: 비동기 재무 보고서 조회 저장소 (주 데이터베이스에서 읽어야 함)
+            use_balances: 월 전체가 포함되는 기간을 월별 잔액으로 합할지 여부 (기표 시 잔액을 갱신하는 경우에만 참)
+            batch_size: 한 트랜잭션에서 마감할 유저 수
+        """
+        self.period_close_port = period_close_port
+        self.financial_report_port = financial_report_port
+        self.use_balances = use_balances
+        self.batch_size = batch_size
+
+    async def start_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업 시작 (이미 있는 작업이면 그 작업을 반환)
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+        self._validate_closable(period)
+        return await self.period_close_port.create_period_close_job(PeriodCloseJob(period=period))
+
+    async def run_period_close(self, period: int) -> PeriodCloseJob:
+        """
+        기간 마감 작업을 마지막으로 마감한 유저 다음부터 끝까지 실행
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            완료된 기간 마감 작업
+
+        Raises:
+            ValueError: 기간이 YYYYMM 형식이 아니거나 아직 끝나지 않았을 경우 발생
+        """
+        job = await self.start_period_close(period)
+        while not job.done:
+            job = await self.close_next_users(job)
+        return job
+
+    async def close_next_users(self, job: PeriodCloseJob) -> PeriodCloseJob:
+        """
+        다음 유저 묶음 마감 (남은 유저가 없으면 작업 완료)
+
+        Args:
+            job: 기간 마감 작업
+
+        Returns:
+            진행 상황이 갱신된 기간 마감 작업
+        """
+        user_ids = await self.period_close_port.find_user_ids(job.last_user_id, self.batch_size)
+        if not user_ids:
+            job = job.finish()
+            await self.period_close_port.save_period_close_job(job)
+            return job
+
+        job = job.advance(user_ids)
+        await self.period_close_port.close_users(job, user_ids, partial(self._close_user, period=job.period))
+        return job
+
+    async def get_period_close(self, period: int) -> PeriodCloseJob | None:
+        """
+        기간 마감 작업 조회
+
+        Args:
+            period: 마감 기간 (YYYYMM)
+
+        Returns:
+            기간 마감 작업 | None
+        """
+        return await self.period_close_port.find_period_close_job(period)
+
+    async def _close_user(self, user_id: int, period: int) -> list[ClosingBalance]:
+        """
+        Args:
+            user_id: 유저 ID
+            period: 마감 기간
+
+        Returns:
+            유저의 마감 잔액 목록
+        """
+        snapshot_period = await self.financial_report_port.find_closed_period(user_id, period - 1)
+        plan = self._plan_cumulative(period_end(period), snapshot_period)
+        source = await self.financial_report_port.find_report_source(
+            user_id, plan.line_ranges, plan.period_ranges, plan.snapshot_period
+        )
+        return self._closing_balances(user_id, period, source, plan.signs)
@@ -0,0 +1,500 @@
+from collections import defaultdict
+from collections.abc import Container
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import partial
+
+from personal_cpa.application.port.input.use_case.report import (
+    AsyncSearchFinancialReportUseCase,
+    SearchFinancialReportUseCase,
+)
+from personal_cpa.application.port.output.fx_rate import AsyncFxRatePort, FxRatePort
+from personal_cpa.application.port.output.report import (
+    AsyncFinancialReportPort,
+    FinancialReportPort,
+    FinancialReportSource,
+)
+from personal_cpa.domain.balance import (
+    ALL_PERIODS,
+    LAST_PERIOD,
+    last_full_period,
+    next_period,
+    period_end,
+    period_of,
+    split_by_period,
+)
+from personal_cpa.domain.currency import DEFAULT_CURRENCY, validate_currency
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from personal_cpa.domain.fx_rate import FxRateTable
+from personal_cpa.domain.report import AccountTree, BalanceSheet, IncomeStatement, ReportLine, TrialBalance
+
+_INCOME_STATEMENT_TYPES = frozenset({AccountType.REVENUE, AccountType.EXPENSE})
+
+
+@dataclass(frozen=True)
+class ReportPlan:
+    """
+    재무 보고서 조회 계획
+
+    Args:
+        line_ranges: 분개 줄을 합할 (시작일 (None 이면 처음부터), 종료일) 목록
+        period_ranges: 월별 잔액을 합할 (첫 기간, 마지막 기간) 목록
+        signs: 기간 범위별 부호
+        snapshot_period: 마감 잔액을 더할 마감 기간 (None 이면 더하지 않음)
+    """
+
+    line_ranges: list[tuple[date | None, date]]
+    period_ranges: list[tuple[int, int]] = field(default_factory=list)
+    signs: list[int] = field(default_factory=list)
+    snapshot_period: int | None = None
+
+
+class BaseFinancialReportService:
+    """
+    동기/비동기 재무 보고서 서비스가 공유하는 조회 계획 및 보고서 작성 로직
+
+    기표 시 잔액을 갱신하는 경우(`use_balances`) 기간에 전체가 포함되는 달은 월별 잔액(하위 계정과목 포함)으로,
+    나머지 날짜만 분개 줄로 합하므로 읽는 행 수가 분개 줄 수가 아닌 계정과목 수 x 개월 수에 비례합니다.
+    기준일 누계(재무상태표)는 기준일 이전의 가장 최근 마감 잔액에 마감 이후의 변동분만 더합니다.
+    보고서는 보고 통화와 다른 통화의 계정과목이 있을 때만 환율을 읽어 환산합니다. 재무상태표는 기준일 환율로,
+    시산표와 손익계산서는 종료일 환율로 환산합니다.
+    """
+
+    use_balances: bool
+    fx_rate_port: FxRatePort | AsyncFxRatePort | None = None
+    reporting_currency: str = DEFAULT_CURRENCY
+
+    def _resolve_currency(self, currency: str | None) -> str:
+        """
+        Args:
+            currency: 요청한 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            보고 통화 코드
+
+        Raises:
+            ValueError: 지원하지 않는 통화 코드일 경우 발생
+        """
+        currency = currency or self.reporting_currency
+        validate_currency(currency)
+        return currency
+
+    def _needs_translation(self, source: FinancialReportSource, currency: str) -> bool:
+        """
+        Args:
+            source: 재무 보고서 작성용 데이터
+            currency: 보고 통화 코드
+
+        Returns:
+            보고 통화와 다른 통화의 계정과목이 있는지 여부
+
+        Raises:
+            ValueError: 환산이 필요하지만 환율 저장소가 없을 경우 발생
+        """
+        if all(chart_of_account.currency == currency for chart_of_account in source.chart_of_accounts):
+            return False
+        if self.fx_rate_port is None:
+            raise ValueError(f"fx rates are not available to translate into {currency}.")
+        return True
+
+    def _plan_range(self, start_date: date, end_date: date) -> ReportPlan:
+        """
+        Args:
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+
+        Returns:
+            기간 합계 조회 계획
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦을 경우 발생
+        """
+        if start_date > end_date:
+            raise ValueError(f"start_date {start_date} must not be after end_date {end_date}.")
+        if not self.use_balances:
+            return ReportPlan([(start_date, end_date)])
+
+        period_range, line_ranges = split_by_period(start_date, end_date)
+        if period_range is None:
+            return ReportPlan(list(line_ranges))
+        return ReportPlan(list(line_ranges), [period_range], [1])
+
+    def _plan_cumulative(self, as_of: date, snapshot_period: int | None = None) -> ReportPlan:
+        """
+        기준일까지의 누계는 마감 잔액이 있으면 마감 잔액에 마감 이후의 변동분만 더합니다. 마감 잔액이 없으면
+        전체 기간 잔액에서 기준일 이후 달의 잔액을 빼고, 기준일이 달의 중간이면 그 달의 1일부터 기준일까지의
+        분개 줄을 더합니다.
+
+        Args:
+            as_of: 기준일 (포함)
+            snapshot_period: 기준일 이전에 끝난 가장 최근 마감 기간 (None 이면 마감 잔액을 사용하지 않음)
+
+        Returns:
+            누계 조회 계획
+        """
+        if snapshot_period is not None:
+            return self._plan_from_snapshot(as_of, snapshot_period)
+        if not self.use_balances:
+            return ReportPlan([(None, as_of)])
+
+        if (as_of + timedelta(days=1)).day == 1:
+            return ReportPlan([], [(ALL_PERIODS, ALL_PERIODS), (period_of(as_of) + 1, LAST_PERIOD)], [1, -1])
+        return ReportPlan(
+            [(as_of.replace(day=1), as_of)], [(ALL_PERIODS, ALL_PERIODS), (period_of(as_of), LAST_PERIOD)], [1, -1]
+        )
+
+    def _plan_from_snapshot(self, as_of: date, snapshot_period: int) -> ReportPlan:
+        """
+        Args:
+            as_of: 기준일 (포함)
+            snapshot_period: 기준일 이전에 끝난 마감 기간
+
+        Returns:
+            마감 잔액 + 마감 다음 날부터 기준일까지의 변동분 조회 계획
+            (월별 잔액을 쓰면 전체가 지난 달은 월별 잔액으로, 기준일이 속한 달의 나머지만 분개 줄로 합함)
+        """
+        if not self.use_balances:
+            day_after_close = period_end(snapshot_period) + timedelta(days=1)
+            line_ranges = [(day_after_close, as_of)] if day_after_close <= as_of else []
+            return ReportPlan(line_ranges, snapshot_period=snapshot_period)
+
+        full_period = last_full_period(as_of)
+        line_ranges = [] if full_period == period_of(as_of) else [(as_of.replace(day=1), as_of)]
+        if snapshot_period >= full_period:
+            return ReportPlan(line_ranges, snapshot_period=snapshot_period)
+        return ReportPlan(line_ranges, [(next_period(snapshot_period), full_period)], [1], snapshot_period)
+
+    def _rollup(self, source: FinancialReportSource, signs: list[int]) -> tuple[AccountTree, list[int], list[int]]:
+        """
+        Args:
+            source: 재무 보고서 작성용 데이터
+            signs: 기간 범위별 부호
+
+        Returns:
+            (계정과목 트리, 계정과목 위치별 차변 합계 배열, 대변 합계 배열)
+        """
+        rolled_totals: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+        for chart_of_account_id, (debit, credit) in source.snapshot_totals.items():
+            rolled_totals[chart_of_account_id] = [debit, credit]
+        for sign, totals in zip(signs, source.period_totals, strict=True):
+            for chart_of_account_id, (debit, credit) in totals.items():
+                total = rolled_totals[chart_of_account_id]
+                total[0] += sign * debit
+                total[1] += sign * credit
+
+        tree = AccountTree(source.chart_of_accounts)
+        debits, credits = tree.rollup(source.line_totals, rolled_totals)
+        return tree, debits, credits
+
+    def _report_lines(
+        self,
+        source: FinancialReportSource,
+        signs: list[int],
+        day: date,
+        currency: str,
+        fx_rate_table: FxRateTable | None,
+        categories: Container[AccountType] = frozenset(AccountType),
+    ) -> tuple[ReportLine, ...]:
+        """
+        Args:
+            source: 재무 보고서 작성용 데이터
+            signs: 기간 범위별 부호
+            day: 환율을 적용할 날짜
+            currency: 보고 통화 코드
+            fx_rate_table: 환율 조회 구조 (None 이면 환산하지 않음)
+            categories: 포함할 계정 유형
+
+        Returns:
+            보고 통화 금액의 보고서 줄 목록
+
+        Raises:
+            ValueError: 날짜 이전에 고시된 환율이 없는 통화의 계정과목이 있을 경우 발생
+        """
+        tree, debits, credits = self._rollup(source, signs)
+        if fx_rate_table is not None:
+            convert_many = partial(fx_rate_table.convert_many, to_currency=currency, day=day)
+            debits, credits = tree.translate(debits, credits, convert_many)
+        return tree.report_lines(debits, credits, categories)
+
+    def _build_trial_balance(
+        self,
+        start_date: date,
+        end_date: date,
+        source: FinancialReportSource,
+        signs: list[int],
+        currency: str = DEFAULT_CURRENCY,
+        fx_rate_table: FxRateTable | None = None,
+    ) -> TrialBalance:
+        """
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            source: 재무 보고서 작성용 데이터
+            signs: 기간 범위별 부호
+            currency: 보고 통화 코드
+            fx_rate_table: 환율 조회 구조 (None 이면 환산하지 않음, 환산하면 종료일 환율 적용)
+
+        Returns:
+            시산표
+
+        Raises:
+            ValueError: 종료일 이전에 고시된 환율이 없는 통화의 계정과목이 있을 경우 발생
+        """
+        lines = self._report_lines(source, signs, end_date, currency, fx_rate_table)
+        return TrialBalance(start_date=start_date, end_date=end_date, lines=lines, currency=currency)
+
+    def _build_income_statement(
+        self,
+        start_date: date,
+        end_date: date,
+        source: FinancialReportSource,
+        signs: list[int],
+        currency: str = DEFAULT_CURRENCY,
+        fx_rate_table: FxRateTable | None = None,
+    ) -> IncomeStatement:
+        """
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            source: 재무 보고서 작성용 데이터
+            signs: 기간 범위별 부호
+            currency: 보고 통화 코드
+            fx_rate_table: 환율 조회 구조 (None 이면 환산하지 않음, 환산하면 종료일 환율 적용)
+
+        Returns:
+            손익계산서
+
+        Raises:
+            ValueError: 종료일 이전에 고시된 환율이 없는 통화의 계정과목이 있을 경우 발생
+        """
+        lines = self._report_lines(source, signs, end_date, currency, fx_rate_table, _INCOME_STATEMENT_TYPES)
+        return IncomeStatement.from_lines(start_date, end_date, lines, currency)
+
+    def _build_balance_sheet(
+        self,
+        as_of: date,
+        source: FinancialReportSource,
+        signs: list[int],
+        currency: str = DEFAULT_CURRENCY,
+        fx_rate_table: FxRateTable | None = None,
+    ) -> BalanceSheet:
+        """
+        Args:
+            as_of: 기준일
+            source: 재무 보고서 작성용 데이터
+            signs: 기간 범위별 부호
+            currency: 보고 통화 코드
+            fx_rate_table: 환율 조회 구조 (None 이면 환산하지 않음)
+
+        Returns:
+            재무상태표
+
+        Raises:
+            ValueError: 기준일 이전에 고시된 환율이 없는 통화의 계정과목이 있을 경우 발생
+        """
+        lines = self._report_lines(source, signs, as_of, currency, fx_rate_table)
+        return BalanceSheet.from_lines(as_of, lines, currency, translated=fx_rate_table is not None)
+
+
+class FinancialReportService(BaseFinancialReportService, SearchFinancialReportUseCase):
+    """
+    재무 보고서 서비스
+    """
+
+    def __init__(
+        self,
+        financial_report_port: FinancialReportPort,
+        use_balances: bool = True,
+        fx_rate_port: FxRatePort | None = None,
+        reporting_currency: str = DEFAULT_CURRENCY,
+    ):
+        """
+        초기화
+
+        Args:
+            financial_report_port: 재무 보고서 조회 저장소
+            use_balances: 월 전체가 포함되는 기간을 월별 잔액으로 합할지 여부 (기표 시 잔액을 갱신하는 경우에만 참)
+            fx_rate_port: 환율 저장소 (None 이면 보고 통화와 다른 통화의 계정과목을 환산할 수 없음)
+            reporting_currency: 기본 보고 통화 코드
+        """
+        self.financial_report_port = financial_report_port
+        self.use_balances = use_balances
+        self.fx_rate_port = fx_rate_port
+        self.reporting_currency = reporting_currency
+
+    def get_trial_balance(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> TrialBalance:
+        """
+        유저의 기간 시산표 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            시산표 (보고 통화 금액, 다른 통화의 계정과목은 종료일 환율로 환산)
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        plan = self._plan_range(start_date, end_date)
+        source = self.financial_report_port.find_report_source(user_id, plan.line_ranges, plan.period_ranges)
+        fx_rate_table = self.fx_rate_port.find_fx_rate_table() if self._needs_translation(source, currency) else None
+        return self._build_trial_balance(start_date, end_date, source, plan.signs, currency, fx_rate_table)
+
+    def get_income_statement(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> IncomeStatement:
+        """
+        유저의 기간 손익계산서 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            손익계산서 (보고 통화 금액, 다른 통화의 계정과목은 종료일 환율로 환산)
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        plan = self._plan_range(start_date, end_date)
+        source = self.financial_report_port.find_report_source(user_id, plan.line_ranges, plan.period_ranges)
+        fx_rate_table = self.fx_rate_port.find_fx_rate_table() if self._needs_translation(source, currency) else None
+        return self._build_income_statement(start_date, end_date, source, plan.signs, currency, fx_rate_table)
+
+    def get_balance_sheet(self, user_id: int, as_of: date, currency: str | None = None) -> BalanceSheet:
+        """
+        유저의 기준일 재무상태표 조회
+
+        Args:
+            user_id: 유저 ID
+            as_of: 기준일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            재무상태표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        snapshot_period = self.financial_report_port.find_closed_period(user_id, last_full_period(as_of))
+        plan = self._plan_cumulative(as_of, snapshot_period)
+        source = self.financial_report_port.find_report_source(
+            user_id, plan.line_ranges, plan.period_ranges, plan.snapshot_period
+        )
+        fx_rate_table = self.fx_rate_port.find_fx_rate_table() if self._needs_translation(source, currency) else None
+        return self._build_balance_sheet(as_of, source, plan.signs, currency, fx_rate_table)
+
+
+class AsyncFinancialReportService(BaseFinancialReportService, AsyncSearchFinancialReportUseCase):
+    """
+    비동기 재무 보고서 서비스
+    """
+
+    def __init__(
+        self,
+        financial_report_port: AsyncFinancialReportPort,
+        use_balances: bool = True,
+        fx_rate_port: AsyncFxRatePort | None = None,
+        reporting_currency: str = DEFAULT_CURRENCY,
+    ):
+        """
+        초기화
+
+        Args:
+            financial_report_port: 비동기 재무 보고서 조회 저장소
+            use_balances: 월 전체가 포함되는 기간을 월별 잔액으로 합할지 여부 (기표 시 잔액을 갱신하는 경우에만 참)
+            fx_rate_port: 비동기 환율 저장소 (None 이면 보고 통화와 다른 통화의 계정과목을 환산할 수 없음)
+            reporting_currency: 기본 보고 통화 코드
+        """
+        self.financial_report_port = financial_report_port
+        self.use_balances = use_balances
+        self.fx_rate_port = fx_rate_port
+        self.reporting_currency = reporting_currency
+
+    async def get_trial_balance(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> TrialBalance:
+        """
+        유저의 기간 시산표 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            시산표 (보고 통화 금액, 다른 통화의 계정과목은 종료일 환율로 환산)
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        plan = self._plan_range(start_date, end_date)
+        source = await self.financial_report_port.find_report_source(user_id, plan.line_ranges, plan.period_ranges)
+        fx_rate_table = None
+        if self._needs_translation(source, currency):
+            fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+        return self._build_trial_balance(start_date, end_date, source, plan.signs, currency, fx_rate_table)
+
+    async def get_income_statement(
+        self, user_id: int, start_date: date, end_date: date, currency: str | None = None
+    ) -> IncomeStatement:
+        """
+        유저의 기간 손익계산서 조회
+
+        Args:
+            user_id: 유저 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            손익계산서 (보고 통화 금액, 다른 통화의 계정과목은 종료일 환율로 환산)
+
+        Raises:
+            ValueError: 시작일이 종료일보다 늦거나, 보고 통화를 지원하지 않거나, 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        plan = self._plan_range(start_date, end_date)
+        source = await self.financial_report_port.find_report_source(user_id, plan.line_ranges, plan.period_ranges)
+        fx_rate_table = None
+        if self._needs_translation(source, currency):
+            fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+        return self._build_income_statement(start_date, end_date, source, plan.signs, currency, fx_rate_table)
+
+    async def get_balance_sheet(self, user_id: int, as_of: date, currency: str | None = None) -> BalanceSheet:
+        """
+        유저의 기준일 재무상태표 조회
+
+        Args:
+            user_id: 유저 ID
+            as_of: 기준일 (포함)
+            currency: 보고 통화 코드 (None 이면 기본 보고 통화)
+
+        Returns:
+            재무상태표 (보고 통화 금액)
+
+        Raises:
+            ValueError: 보고 통화를 지원하지 않거나 환산할 환율이 없을 경우 발생
+        """
+        currency = self._resolve_currency(currency)
+        snapshot_period = await self.financial_report_port.find_closed_period(user_id, last_full_period(as_of))
+        plan = self._plan_cumulative(as_of, snapshot_period)
+        source = await self.financial_report_port.find_report_source(
+            user_id, plan.line_ranges, plan.period_ranges, plan.snapshot_period
+        )
+        fx_rate_table = None
+        if self._needs_translation(source, currency):
+            fx_rate_table = await self.fx_rate_port.find_fx_rate_table()
+        return self._build_balance_sheet(as_of, source, plan.signs, currency, fx_rate_table)
@@ -6,9 +6,11 @@ This module provides configuration settings for the Personal CPA application.
 from functools import lru_cache
 import os
 from pathlib import Path
+from typing import Any, Literal
 import urllib.parse
 
 from dynaconf import Dynaconf
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic_settings import BaseSettings
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -19,6 +21,72 @@ config = Dynaconf(
 )
 
 
+class DatabasePoolSettings(BaseModel):
+    """
+    Connection pool configuration, validated when the settings are loaded.
+
+    - size: Connections kept open in the pool.
+    - max_overflow: Extra connections opened beyond `size` under load (0 disables overflow).
+    - timeout_seconds: How long a checkout waits for a free connection before failing with `TimeoutError`.
+    - recycle_seconds: Connections older than this are replaced on checkout (-1 disables recycling).
+    - pre_ping: "always" tests each connection with a round-trip on checkout; "never" relies on
+      `recycle_seconds` and SQLAlchemy invalidating the pool when a disconnect error is raised.
+    - use_lifo: Reuse the most recently returned connection so surplus idle connections can expire server-side.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    size: int = Field(10, ge=1)
+    max_overflow: int = Field(0, ge=0)
+    timeout_seconds: float = Field(5.0, gt=0, le=60)
+    recycle_seconds: int = Field(1800, ge=-1)
+    pre_ping: Literal["always", "never"] = "never"
+    use_lifo: bool = True
+
+    @model_validator(mode="after")
+    def _validate_disconnect_handling(self) -> "DatabasePoolSettings":
+        """
+        Returns:
+            DatabasePoolSettings: The validated pool settings.
+
+        Raises:
+            ValueError: If recycling is disabled or zero while stale connections are not pre-pinged.
+        """
+        if self.recycle_seconds == 0:
+            raise ValueError("recycle_seconds must be positive, or -1 to disable recycling")
+        if self.pre_ping == "never" and self.recycle_seconds < 0:
+            raise ValueError("pre_ping='never' requires recycle_seconds so idle connections are replaced")
+        return self
+
+    def engine_options(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: Keyword arguments for `create_engine` / `create_async_engine`.
+        """
+        return {
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout_seconds,
+            "pool_recycle": self.recycle_seconds,
+            "pool_pre_ping": self.pre_ping == "always",
+            "pool_use_lifo": self.use_lifo,
+        }
+
+
+class DatabaseReplicaSettings(BaseModel):
+    """
+    Read replica connection settings; unset fields fall back to the primary's `DB_HOST` / `DB_PORT` / `DB_DATABASE`.
+
+    For SQLite (local testing) `database` is the replica file path.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    host: str | None = None
+    port: int | None = None
+    database: str | None = None
+
+
 class AppSettings(BaseSettings):
     """
     This class defines the application settings for the Personal CPA application.
@@ -35,27 +103,97 @@ class AppSettings(BaseSettings):
 
     LOG_LEVEL: str = config.get("LOG_LEVEL")
     LOG_FILE: str = str(PROJECT_ROOT / config.get("LOG_FILE"))
+    LOG_FORMAT: Literal["text", "json"] = config.get("LOG_FORMAT", "text")
+    LOG_ASYNC: bool = config.get("LOG_ASYNC", True)
+    LOG_REQUEST_SAMPLE_RATE: float = config.get("LOG_REQUEST_SAMPLE_RATE", 1.0)
     DB_TYPE: str = config.get("DB_TYPE")
+    DB_MODE: str = config.get("DB_MODE", "sync")
+    DB_ECHO_LEVEL: str = config.get("DB_ECHO_LEVEL", "WARNING")
+    DB_SYNC_EXECUTION_MODE: str = config.get("DB_SYNC_EXECUTION_MODE", "inline")
     DB_HOST: str = config.get("DB_HOST")
     DB_PORT: int = config.get("DB_PORT")
     DB_DATABASE: str = config.get("DB_DATABASE")
     DB_USERNAME: str = config.get("DB_USERNAME")
     DB_PASSWORD: str = config.get("DB_PASSWORD")
     DB_ROOT_PASSWORD: str = config.get("DB_ROOT_PASSWORD")
-    DB_POOL_CONNECTION_LIMIT: int = config.get("DB_POOL_CONNECTION_LIMIT")
-    DB_POOL_MAX_IDLE: int = config.get("DB_POOL_MAX_IDLE")
-    DB_POOL_IDLE_TIMEOUT: int = config.get("DB_POOL_IDLE_TIMEOUT")
+    DB_POOL: DatabasePoolSettings = DatabasePoolSettings.model_validate(config.get("DB_POOL", {}))
+    DB_REPLICAS: list[DatabaseReplicaSettings] = [
+        DatabaseReplicaSettings.model_validate(replica) for replica in config.get("DB_REPLICAS", [])
+    ]
+    DB_REQUEST_UNIT_OF_WORK: bool = config.get("DB_REQUEST_UNIT_OF_WORK", True)
+    DB_READ_YOUR_WRITES_SECONDS: float = Field(config.get("DB_READ_YOUR_WRITES_SECONDS", 5.0), ge=0)
+    DB_QUERY_BUDGET: int | None = config.get("DB_QUERY_BUDGET", None)
+    DB_QUERY_BUDGET_MODE: Literal["warn", "error"] = config.get("DB_QUERY_BUDGET_MODE", "warn")
+    HEALTH_READINESS_CACHE_SECONDS: float = config.get("HEALTH_READINESS_CACHE_SECONDS", 2.0)
+    HEALTH_READINESS_TIMEOUT_SECONDS: float = config.get("HEALTH_READINESS_TIMEOUT_SECONDS", 1.0)
+    API_FAST_JSON_RESPONSE: bool = config.get("API_FAST_JSON_RESPONSE", False)
+    CHART_OF_ACCOUNT_CACHE_MAX_SIZE: int = config.get("CHART_OF_ACCOUNT_CACHE_MAX_SIZE", 1024)
+    CHART_OF_ACCOUNT_CACHE_TTL_SECONDS: float = config.get("CHART_OF_ACCOUNT_CACHE_TTL_SECONDS", 300)
+    CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE: int = config.get("CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE", 1000)
+    JOURNAL_BALANCE_ROLLUP: bool = config.get("JOURNAL_BALANCE_ROLLUP", True)
+    PERIOD_CLOSE_BATCH_SIZE: int = config.get("PERIOD_CLOSE_BATCH_SIZE", 100)
+    REPORTING_CURRENCY: str = config.get("REPORTING_CURRENCY", "KRW")
+    FX_RATE_CACHE_TTL_SECONDS: float = config.get("FX_RATE_CACHE_TTL_SECONDS", 300)
 
     @property
     def database_url(self) -> str:
         """
+        Returns:
+            str: database url (sync driver)
+        """
+        return self._build_database_url(mysql_driver="pymysql", sqlite_driver="pysqlite")
+
+    @property
+    def async_database_url(self) -> str:
+        """
+        Returns:
+            str: database url (async driver)
+        """
+        return self._build_database_url(mysql_driver="aiomysql", sqlite_driver="aiosqlite")
+
+    @property
+    def replica_database_urls(self) -> list[str]:
+        """
+        Returns:
+            list[str]: read replica database urls (sync driver)
+        """
+        return [
+            self._build_database_url(mysql_driver="pymysql", sqlite_driver="pysqlite", replica=replica)
+            for replica in self.DB_REPLICAS
+        ]
+
+    @property
+    def replica_async_database_urls(self) -> list[str]:
+        """
+        Returns:
+            list[str]: read replica database urls (async driver)
+        """
+        return [
+            self._build_database_url(mysql_driver="aiomysql", sqlite_driver="aiosqlite", replica=replica)
+            for replica in self.DB_REPLICAS
+        ]
+
+    def _build_database_url(
+        self, mysql_driver: str, sqlite_driver: str, replica: DatabaseReplicaSettings | None = None
+    ) -> str:
+        """
+        Args:
+            mysql_driver: MySQL driver name
+            sqlite_driver: SQLite driver name (local testing, DB_DATABASE is the file path)
+            replica: read replica settings (None for the primary)
+
         Returns:
             str: database url
         """
+        replica = replica or DatabaseReplicaSettings()
+        host = replica.host or self.DB_HOST
+        port = replica.port or self.DB_PORT
+        database = replica.database or self.DB_DATABASE
+        if self.DB_TYPE == "sqlite":
+            return f"sqlite+{sqlite_driver}:///{database}"
+
         password = urllib.parse.quote(self.DB_PASSWORD)
-        return (
-            f"{self.DB_TYPE}+pymysql://{self.DB_USERNAME}:{password}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_DATABASE}"
-        )
+        return f"{self.DB_TYPE}+{mysql_driver}://{self.DB_USERNAME}:{password}@{host}:{port}/{database}"
 
 
 @lru_cache
@@ -1,9 +1,42 @@
 from dependency_injector import containers, providers
 
-from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
-from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.metrics import HttpMetrics
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import ChartOfAccountPresenter
+from personal_cpa.adapter.inbound.api.readiness import ReadinessProbe
+from personal_cpa.adapter.outbound.cache.chart_of_account import (
+    AsyncCachedChartOfAccountRepository,
+    CachedChartOfAccountRepository,
+)
+from personal_cpa.adapter.outbound.cache.fx_rate import AsyncCachedFxRateRepository, CachedFxRateRepository
+from personal_cpa.adapter.outbound.cache.generation import CacheGenerations
+from personal_cpa.adapter.outbound.cache.lru import LRUCache
+from personal_cpa.adapter.outbound.database.repository.balance import (
+    AccountBalanceRepository,
+    AsyncAccountBalanceRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import (
+    AsyncChartOfAccountRepository,
+    ChartOfAccountRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.fx_rate import AsyncFxRateRepository, FxRateRepository
+from personal_cpa.adapter.outbound.database.repository.journal import AsyncJournalRepository, JournalRepository
+from personal_cpa.adapter.outbound.database.repository.period_close import (
+    AsyncPeriodCloseRepository,
+    PeriodCloseRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.report import (
+    AsyncFinancialReportRepository,
+    FinancialReportRepository,
+)
+from personal_cpa.application.service.balance import AccountBalanceService, AsyncAccountBalanceService
+from personal_cpa.application.service.chart_of_account import AsyncChartOfAccountService, ChartOfAccountService
+from personal_cpa.application.service.fx_rate import AsyncFxRateService, FxRateService
+from personal_cpa.application.service.journal import AsyncJournalService, JournalService
+from personal_cpa.application.service.period_close import AsyncPeriodCloseService, PeriodCloseService
+from personal_cpa.application.service.report import AsyncFinancialReportService, FinancialReportService
 from personal_cpa.config import AppSettings
-from personal_cpa.database import Database
+from personal_cpa.database import AsyncDatabase, Database
 
 
 class Container(containers.DeclarativeContainer):
@@ -15,8 +48,239 @@ class Container(containers.DeclarativeContainer):
 
     database = providers.Singleton(Database, app_settings=app_settings)
 
-    chart_of_account_repository = providers.Factory(ChartOfAccountRepository, session_factory=database.provided.session)
+    async_database = providers.Singleton(AsyncDatabase, app_settings=app_settings)
 
-    chart_of_account_service = providers.Factory(
-        ChartOfAccountService, chart_of_account_port=chart_of_account_repository
+    # `DB_MODE`("sync" | "async")에 따라 실제로 쓰는 데이터베이스 (커넥션 풀 지표, 준비 상태 확인용)
+    active_database = providers.Selector(app_settings.provided.DB_MODE, sync=database, **{"async": async_database})
+
+    http_metrics = providers.Singleton(HttpMetrics)
+
+    readiness_probe = providers.Singleton(
+        ReadinessProbe,
+        database=active_database,
+        cache_seconds=app_settings.provided.HEALTH_READINESS_CACHE_SECONDS,
+        timeout_seconds=app_settings.provided.HEALTH_READINESS_TIMEOUT_SECONDS,
+    )
+
+    # 동기 서비스를 `DB_SYNC_EXECUTION_MODE`에 따라 이벤트 루프 또는 커넥션 풀 크기의 스레드 풀에서 실행
+    use_case_executor = providers.Singleton(
+        UseCaseExecutor,
+        mode=app_settings.provided.DB_SYNC_EXECUTION_MODE,
+        max_workers=app_settings.provided.DB_POOL.size,
+    )
+
+    chart_of_account_presenter = providers.Singleton(
+        ChartOfAccountPresenter, fast_json=app_settings.provided.API_FAST_JSON_RESPONSE
+    )
+
+    chart_of_account_cache = providers.Singleton(
+        LRUCache,
+        max_size=app_settings.provided.CHART_OF_ACCOUNT_CACHE_MAX_SIZE,
+        ttl_seconds=app_settings.provided.CHART_OF_ACCOUNT_CACHE_TTL_SECONDS,
+    )
+
+    chart_of_account_cache_generations = providers.Singleton(CacheGenerations)
+
+    # 저장소의 조회는 `DB_REPLICAS` 읽기 복제본, 저장은 주 데이터베이스로 보냄
+    chart_of_account_repository = providers.Factory(
+        ChartOfAccountRepository,
+        session_factory=database.provided.session,
+        read_session_factory=database.provided.read_session,
+        write_recorder=database.provided.record_write,
+    )
+
+    cached_chart_of_account_repository = providers.Factory(
+        CachedChartOfAccountRepository,
+        chart_of_account_port=chart_of_account_repository,
+        cache=chart_of_account_cache,
+        after_commit=database.provided.after_commit,
+        has_pending_writes=database.provided.has_pending_writes,
+        generations=chart_of_account_cache_generations,
+    )
+
+    async_chart_of_account_repository = providers.Factory(
+        AsyncChartOfAccountRepository,
+        session_factory=async_database.provided.session,
+        read_session_factory=async_database.provided.read_session,
+        write_recorder=async_database.provided.record_write,
+    )
+
+    async_cached_chart_of_account_repository = providers.Factory(
+        AsyncCachedChartOfAccountRepository,
+        chart_of_account_port=async_chart_of_account_repository,
+        cache=chart_of_account_cache,
+        after_commit=async_database.provided.after_commit,
+        has_pending_writes=async_database.provided.has_pending_writes,
+        generations=chart_of_account_cache_generations,
+    )
+
+    chart_of_account_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(
+            ChartOfAccountService,
+            chart_of_account_port=cached_chart_of_account_repository,
+            import_chunk_size=app_settings.provided.CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE,
+        ),
+        **{
+            "async": providers.Factory(
+                AsyncChartOfAccountService,
+                chart_of_account_port=async_cached_chart_of_account_repository,
+                import_chunk_size=app_settings.provided.CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE,
+            )
+        },
+    )
+
+    journal_repository = providers.Factory(
+        JournalRepository,
+        session_factory=database.provided.session,
+        read_session_factory=database.provided.read_session,
+        write_recorder=database.provided.record_write,
+    )
+
+    async_journal_repository = providers.Factory(
+        AsyncJournalRepository,
+        session_factory=async_database.provided.session,
+        read_session_factory=async_database.provided.read_session,
+        write_recorder=async_database.provided.record_write,
+    )
+
+    journal_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(
+            JournalService,
+            journal_port=journal_repository,
+            rollup_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+        ),
+        **{
+            "async": providers.Factory(
+                AsyncJournalService,
+                journal_port=async_journal_repository,
+                rollup_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+            )
+        },
+    )
+
+    account_balance_repository = providers.Factory(
+        AccountBalanceRepository,
+        session_factory=database.provided.session,
+        read_session_factory=database.provided.read_session,
+        write_recorder=database.provided.record_write,
+    )
+
+    async_account_balance_repository = providers.Factory(
+        AsyncAccountBalanceRepository,
+        session_factory=async_database.provided.session,
+        read_session_factory=async_database.provided.read_session,
+        write_recorder=async_database.provided.record_write,
+    )
+
+    account_balance_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(AccountBalanceService, account_balance_port=account_balance_repository),
+        **{
+            "async": providers.Factory(
+                AsyncAccountBalanceService, account_balance_port=async_account_balance_repository
+            )
+        },
+    )
+
+    financial_report_repository = providers.Factory(
+        FinancialReportRepository,
+        session_factory=database.provided.session,
+        read_session_factory=database.provided.read_session,
+    )
+
+    async_financial_report_repository = providers.Factory(
+        AsyncFinancialReportRepository,
+        session_factory=async_database.provided.session,
+        read_session_factory=async_database.provided.read_session,
+    )
+
+    fx_rate_cache = providers.Singleton(
+        LRUCache, max_size=1, ttl_seconds=app_settings.provided.FX_RATE_CACHE_TTL_SECONDS
+    )
+
+    fx_rate_repository = providers.Factory(FxRateRepository, session_factory=database.provided.session)
+
+    cached_fx_rate_repository = providers.Factory(
+        CachedFxRateRepository,
+        fx_rate_port=fx_rate_repository,
+        cache=fx_rate_cache,
+        after_commit=database.provided.after_commit,
+        has_pending_writes=database.provided.has_pending_writes,
+    )
+
+    async_fx_rate_repository = providers.Factory(AsyncFxRateRepository, session_factory=async_database.provided.session)
+
+    async_cached_fx_rate_repository = providers.Factory(
+        AsyncCachedFxRateRepository,
+        fx_rate_port=async_fx_rate_repository,
+        cache=fx_rate_cache,
+        after_commit=async_database.provided.after_commit,
+        has_pending_writes=async_database.provided.has_pending_writes,
+    )
+
+    fx_rate_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(FxRateService, fx_rate_port=cached_fx_rate_repository),
+        **{"async": providers.Factory(AsyncFxRateService, fx_rate_port=async_cached_fx_rate_repository)},
+    )
+
+    financial_report_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(
+            FinancialReportService,
+            financial_report_port=financial_report_repository,
+            use_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+            fx_rate_port=cached_fx_rate_repository,
+            reporting_currency=app_settings.provided.REPORTING_CURRENCY,
+        ),
+        **{
+            "async": providers.Factory(
+                AsyncFinancialReportService,
+                financial_report_port=async_financial_report_repository,
+                use_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+                fx_rate_port=async_cached_fx_rate_repository,
+                reporting_currency=app_settings.provided.REPORTING_CURRENCY,
+            )
+        },
+    )
+
+    # 기간 마감이 방금 기표된 분개까지 반영하도록 주 데이터베이스에서만 읽음
+    primary_financial_report_repository = providers.Factory(
+        FinancialReportRepository, session_factory=database.provided.session
+    )
+
+    async_primary_financial_report_repository = providers.Factory(
+        AsyncFinancialReportRepository, session_factory=async_database.provided.session
+    )
+
+    period_close_repository = providers.Factory(
+        PeriodCloseRepository, session_factory=database.provided.session, write_recorder=database.provided.record_write
+    )
+
+    async_period_close_repository = providers.Factory(
+        AsyncPeriodCloseRepository,
+        session_factory=async_database.provided.session,
+        write_recorder=async_database.provided.record_write,
+    )
+
+    period_close_service = providers.Selector(
+        app_settings.provided.DB_MODE,
+        sync=providers.Factory(
+            PeriodCloseService,
+            period_close_port=period_close_repository,
+            financial_report_port=primary_financial_report_repository,
+            use_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+            batch_size=app_settings.provided.PERIOD_CLOSE_BATCH_SIZE,
+        ),
+        **{
+            "async": providers.Factory(
+                AsyncPeriodCloseService,
+                period_close_port=async_period_close_repository,
+                financial_report_port=async_primary_financial_report_repository,
+                use_balances=app_settings.provided.JOURNAL_BALANCE_ROLLUP,
+                batch_size=app_settings.provided.PERIOD_CLOSE_BATCH_SIZE,
+            )
+        },
     )
@@ -1,46 +1,492 @@
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import partial
+import itertools
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import Pool, create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
 
 from personal_cpa.config import AppSettings
 
 
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    DB 커넥션 풀 통계
+
+    Args:
+        size: 설정된 풀 크기
+        checked_out: 사용 중인 커넥션 수
+        checked_in: 풀에서 대기 중인 커넥션 수
+        overflow: 풀 크기를 넘어 추가로 연 커넥션 수 (음수면 아직 열지 않은 풀 커넥션 수)
+        waits: 풀이 가득 차 커넥션 반환을 기다린 체크아웃 수
+        wait_seconds: 커넥션 반환을 기다린 누적 시간(초)
+        timeouts: 대기 시간 초과로 실패한 체크아웃 수
+    """
+
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    waits: int = 0
+    wait_seconds: float = 0.0
+    timeouts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            통계 항목별 값
+        """
+        return asdict(self)
+
+
+class _WaitTrackingPoolMixin:
+    """
+    풀이 가득 찬 상태에서의 체크아웃 대기 횟수/시간과 대기 시간 초과 횟수를 세는 QueuePool 확장
+
+    QueuePool 은 대기 통계를 제공하지 않으므로, 커넥션을 꺼내는 `_do_get`을 감싸서 집계합니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        초기화
+
+        Args:
+            *args: QueuePool 위치 인자
+            **kwargs: QueuePool 키워드 인자
+        """
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """
+        Returns:
+            풀에서 꺼낸 커넥션
+
+        Raises:
+            PoolTimeoutError: `pool_timeout` 안에 커넥션이 반환되지 않을 경우 발생
+        """
+        pool: Any = self
+        if pool.checkedin() or pool.overflow() < pool._max_overflow:
+            return super()._do_get()  # type: ignore[misc]
+
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            with self._wait_lock:
+                self.waits += 1
+                self.wait_seconds += time.perf_counter() - started
+                self.timeouts += timed_out
+
+
+class WaitTrackingQueuePool(_WaitTrackingPoolMixin, QueuePool):
+    """
+    대기 통계를 집계하는 동기 엔진용 커넥션 풀
+    """
+
+
+class AsyncWaitTrackingQueuePool(_WaitTrackingPoolMixin, AsyncAdaptedQueuePool):
+    """
+    대기 통계를 집계하는 비동기 엔진용 커넥션 풀
+    """
+
+
+class ReadYourWrites:
+    """
+    유저별 읽기 고정(read-your-writes) 관리
+
+    유저가 쓴 뒤 `window_seconds` 동안은 복제 지연으로 방금 쓴 데이터가 보이지 않는 일이 없도록
+    그 유저의 읽기를 주 데이터베이스로 보냅니다. 상태는 프로세스 메모리에만 있으므로,
+    여러 인스턴스로 운영할 때는 같은 유저의 요청이 같은 인스턴스로 가는 경우에만 보장됩니다.
+    """
+
+    def __init__(self, window_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        초기화
+
+        Args:
+            window_seconds: 쓰기 후 읽기를 주 데이터베이스로 고정하는 시간(초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pinned_until: dict[int, float] = {}
+
+    def record_write(self, user_id: int) -> None:
+        """
+        유저의 쓰기를 기록하여 읽기 고정 시간을 시작합니다.
+
+        Args:
+            user_id: 유저 ID
+        """
+        now = self._clock()
+        with self._lock:
+            if len(self._pinned_until) >= 1024:
+                self._pinned_until = {user: until for user, until in self._pinned_until.items() if until > now}
+            self._pinned_until[user_id] = now + self.window_seconds
+
+    def is_pinned(self, user_id: int) -> bool:
+        """
+        Args:
+            user_id: 유저 ID
+
+        Returns:
+            유저의 읽기를 주 데이터베이스로 보내야 하는지 여부
+        """
+        return self._pinned_until.get(user_id, 0.0) > self._clock()
+
+
+class UnitOfWork:
+    """
+    요청 단위 작업
+
+    `Database.unit_of_work()` 블록 안의 `session()`/`read_session()` 호출이 함께 쓰는 세션을 보관합니다.
+    주 데이터베이스 세션과 복제본 세션은 처음 필요할 때 하나씩 열기 때문에, 요청마다 커넥션을 (종류별로) 한 번만 꺼냅니다.
+    캐시 무효화나 읽기 고정처럼 커밋된 데이터를 전제로 하는 처리는 `on_commit()`으로 등록해 커밋 직후에 실행하고,
+    롤백하면 버립니다.
+    """
+
+    def __init__(self, database: "Database") -> None:
+        """
+        초기화
+
+        Args:
+            database: 세션을 여는 데이터베이스
+        """
+        self.database = database
+        self._session: Session | None = None
+        self._read_session: Session | None = None
+        self._after_commit: list[Callable[[], None]] = []
+        self.finished = False
+
+    def session(self) -> Session:
+        """
+        Returns:
+            주 데이터베이스 세션
+        """
+        if self._session is None:
+            self._session = self.database._session_factory()
+        return self._session
+
+    def read_session(self) -> Session:
+        """
+        Returns:
+            복제본 세션 (요청 안에서는 같은 복제본 사용)
+        """
+        if self._read_session is None:
+            self._read_session = next(self.database._replica_session_factories)()
+        return self._read_session
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """
+        Returns:
+            커밋 후 처리가 등록된(커밋되지 않은 쓰기가 있는) 상태인지 여부
+        """
+        return bool(self._after_commit)
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        다음 커밋 직후에 실행할 처리 등록
+
+        Args:
+            callback: 커밋 후 처리
+        """
+        self._after_commit.append(callback)
+
+    def commit(self) -> None:
+        """
+        주 데이터베이스 세션의 변경 사항 커밋 후 등록된 커밋 후 처리 실행 (이후 호출은 새 트랜잭션으로 시작)
+        """
+        if self._session is not None:
+            self._session.commit()
+        _run_after_commit(self._after_commit)
+
+    def rollback(self) -> None:
+        """
+        열린 세션의 트랜잭션 롤백 (등록된 커밋 후 처리는 버림)
+        """
+        self._after_commit.clear()
+        for session in (self._session, self._read_session):
+            if session is not None:
+                session.rollback()
+
+    def finish(self, commit: bool) -> None:
+        """
+        커밋 또는 롤백으로 작업을 끝내고, 블록이 끝날 때 다시 커밋하지 않도록 표시
+
+        Args:
+            commit: 커밋 여부 (False 면 롤백)
+        """
+        if commit:
+            self.commit()
+        else:
+            self.rollback()
+        self.finished = True
+
+    def close(self) -> None:
+        """
+        열린 세션을 닫고 커넥션을 풀에 반환 (닫은 뒤 다시 호출하면 아무것도 하지 않음)
+        """
+        for session in (self._session, self._read_session):
+            if session is not None:
+                session.close()
+        self._session = self._read_session = None
+
+
+class AsyncUnitOfWork:
+    """
+    비동기 요청 단위 작업 (`UnitOfWork`와 같으며 `AsyncDatabase.unit_of_work()`가 엽니다)
+    """
+
+    def __init__(self, database: "AsyncDatabase") -> None:
+        """
+        초기화
+
+        Args:
+            database: 세션을 여는 비동기 데이터베이스
+        """
+        self.database = database
+        self._session: AsyncSession | None = None
+        self._read_session: AsyncSession | None = None
+        self._after_commit: list[Callable[[], None]] = []
+        self.finished = False
+
+    def session(self) -> AsyncSession:
+        """
+        Returns:
+            주 데이터베이스 세션
+        """
+        if self._session is None:
+            self._session = self.database._session_factory()
+        return self._session
+
+    def read_session(self) -> AsyncSession:
+        """
+        Returns:
+            복제본 세션 (요청 안에서는 같은 복제본 사용)
+        """
+        if self._read_session is None:
+            self._read_session = next(self.database._replica_session_factories)()
+        return self._read_session
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """
+        Returns:
+            커밋 후 처리가 등록된(커밋되지 않은 쓰기가 있는) 상태인지 여부
+        """
+        return bool(self._after_commit)
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        다음 커밋 직후에 실행할 처리 등록
+
+        Args:
+            callback: 커밋 후 처리
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """
+        주 데이터베이스 세션의 변경 사항 커밋 후 등록된 커밋 후 처리 실행 (이후 호출은 새 트랜잭션으로 시작)
+        """
+        if self._session is not None:
+            await self._session.commit()
+        _run_after_commit(self._after_commit)
+
+    async def rollback(self) -> None:
+        """
+        열린 세션의 트랜잭션 롤백 (등록된 커밋 후 처리는 버림)
+        """
+        self._after_commit.clear()
+        for session in (self._session, self._read_session):
+            if session is not None:
+                await session.rollback()
+
+    async def finish(self, commit: bool) -> None:
+        """
+        커밋 또는 롤백으로 작업을 끝내고, 블록이 끝날 때 다시 커밋하지 않도록 표시
+
+        Args:
+            commit: 커밋 여부 (False 면 롤백)
+        """
+        if commit:
+            await self.commit()
+        else:
+            await self.rollback()
+        self.finished = True
+
+    async def close(self) -> None:
+        """
+        열린 세션을 닫고 커넥션을 풀에 반환 (닫은 뒤 다시 호출하면 아무것도 하지 않음)
+        """
+        for session in (self._session, self._read_session):
+            if session is not None:
+                await session.close()
+        self._session = self._read_session = None
+
+
+_current_unit_of_work: ContextVar[UnitOfWork | AsyncUnitOfWork | None] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+@contextmanager
+def outside_unit_of_work() -> Generator[None, None, None]:
+    """
+    요청 단위 작업에서 벗어나 블록 안의 `session()` 호출이 각자 커밋하도록 합니다.
+
+    묶음마다 커밋해야 하는 대량 작업(계정과목 가져오기, 응답 후 백그라운드로 실행하는 기간 마감)에 사용합니다.
+    블록 안의 유즈케이스 실행기 호출에도 컨텍스트가 복사되므로 스레드 풀에서도 같이 적용됩니다.
+
+    Yields:
+        None
+    """
+    token = _current_unit_of_work.set(None)
+    try:
+        yield
+    finally:
+        _current_unit_of_work.reset(token)
+
+
+def _run_after_commit(callbacks: list[Callable[[], None]]) -> None:
+    """
+    Args:
+        callbacks: 커밋 후 처리 목록 (실행 후 비움)
+    """
+    pending = list(callbacks)
+    callbacks.clear()
+    for callback in pending:
+        callback()
+
+
 class Database:
     """
     데이터베이스 연결 관리
+
+    `session()`은 주 데이터베이스, `read_session(user_id)`는 읽기 복제본(`DB_REPLICAS`, 라운드 로빈)을 사용합니다.
+    복제본이 없거나 유저가 최근에 쓴 경우(`DB_READ_YOUR_WRITES_SECONDS`), 요청 단위 작업에 커밋되지 않은 쓰기가 있는
+    경우에는 읽기도 주 데이터베이스를 사용합니다.
+    `unit_of_work()` 블록 안에서는 두 메서드가 요청 단위 작업의 세션을 함께 쓰고 커밋은 블록이 끝날 때 한 번 합니다.
     """
 
-    def __init__(self, app_settings: AppSettings):
+    def __init__(self, app_settings: AppSettings, clock: Callable[[], float] = time.monotonic):
         """
         초기화
 
         Args:
             app_settings: 애플리케이션 설정
+            clock: 현재 시각 함수 (테스트용)
         """
         self._engine = create_engine(
-            app_settings.database_url,
-            echo=True,
-            pool_size=app_settings.DB_POOL_CONNECTION_LIMIT,
-            max_overflow=app_settings.DB_POOL_MAX_IDLE,
-            pool_timeout=app_settings.DB_POOL_IDLE_TIMEOUT,
-            pool_pre_ping=True,
+            app_settings.database_url, poolclass=WaitTrackingQueuePool, **app_settings.DB_POOL.engine_options()
+        )
+        self._session_factory = sessionmaker(
+            bind=self._engine, expire_on_commit=False, autocommit=False, autoflush=False
+        )
+        self._session_scoped = scoped_session(self._session_factory)
+
+        self._replica_engines = [
+            create_engine(url, poolclass=WaitTrackingQueuePool, **app_settings.DB_POOL.engine_options())
+            for url in app_settings.replica_database_urls
+        ]
+        self._replica_session_factories = itertools.cycle(
+            [
+                sessionmaker(bind=engine, expire_on_commit=False, autocommit=False, autoflush=False)
+                for engine in self._replica_engines
+            ]
         )
-        _session_factory = sessionmaker(bind=self._engine, expire_on_commit=False, autocommit=False, autoflush=False)
-        self._session_scoped = scoped_session(_session_factory)
+        self.read_your_writes = ReadYourWrites(app_settings.DB_READ_YOUR_WRITES_SECONDS, clock)
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns:
+            커넥션 풀 통계
+        """
+        return _pool_stats(self._engine.pool)
+
+    def ping(self) -> None:
+        """
+        `SELECT 1`로 데이터베이스 연결을 확인합니다.
+
+        Raises:
+            Exception: 커넥션을 얻지 못하거나 SQL 실행에 실패할 경우 발생
+        """
+        with self._engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    @contextmanager
+    def unit_of_work(self) -> Generator[UnitOfWork, None, None]:
+        """
+        요청 단위 작업 시작 (이미 열려 있으면 그 작업에 참여)
+
+        Yields:
+            UnitOfWork: 요청 단위 작업 (블록 중간에 `commit()`으로 먼저 커밋하거나 `finish()`로 끝낼 수 있음)
+
+        Raises:
+            Exception: 블록 안에서 오류가 발생할 경우 롤백 후 발생
+        """
+        current = self._current_unit_of_work()
+        if current is not None:
+            yield current
+            return
+
+        unit_of_work = UnitOfWork(self)
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+            if not unit_of_work.finished:
+                unit_of_work.commit()
+        except Exception:
+            unit_of_work.rollback()
+            raise
+        finally:
+            unit_of_work.close()
+            _current_unit_of_work.reset(token)
+
+    def _current_unit_of_work(self) -> UnitOfWork | None:
+        """
+        Returns:
+            현재 컨텍스트에서 이 데이터베이스로 열린 요청 단위 작업 (없으면 None)
+        """
+        unit_of_work = _current_unit_of_work.get()
+        return unit_of_work if isinstance(unit_of_work, UnitOfWork) and unit_of_work.database is self else None
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
         """
         세션 생성
 
+        요청 단위 작업 안에서는 그 작업의 세션을 돌려주며, 커밋/롤백은 작업이 끝날 때 합니다.
+
         Yields:
             Session: 세션
 
         Raises:
             Exception: 세션 생성 중 오류가 발생할 경우 발생
         """
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is not None:
+            yield unit_of_work.session()
+            return
+
         session = self._session_scoped()
         try:
             yield session
@@ -50,3 +496,271 @@ class Database:
             raise
         finally:
             self._session_scoped.remove()
+
+    @contextmanager
+    def read_session(self, user_id: int) -> Generator[Session, None, None]:
+        """
+        읽기 전용 세션 생성
+
+        Args:
+            user_id: 조회하는 유저 ID (읽기 고정 여부 판단)
+
+        Yields:
+            Session: 복제본 세션 (복제본이 없거나, 유저가 최근에 썼거나, 요청 단위 작업에 커밋되지 않은 쓰기가 있는
+                경우 주 데이터베이스 세션)
+        """
+        if not self._replica_engines or self.read_your_writes.is_pinned(user_id) or self.has_pending_writes():
+            with self.session() as session:
+                yield session
+            return
+
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is not None:
+            yield unit_of_work.read_session()
+            return
+
+        session = next(self._replica_session_factories)()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        커밋된 뒤에 실행할 처리 등록
+
+        요청 단위 작업 안에서는 작업이 커밋될 때 실행하고(롤백되면 실행하지 않음), 밖에서는 저장소의 세션이 이미
+        커밋된 뒤에 호출되므로 바로 실행합니다.
+
+        Args:
+            callback: 커밋 후 처리
+        """
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is None:
+            callback()
+        else:
+            unit_of_work.on_commit(callback)
+
+    def has_pending_writes(self) -> bool:
+        """
+        Returns:
+            현재 요청 단위 작업에 아직 커밋되지 않은 쓰기가 있는지 여부 (캐시를 채우지 않는 데 사용)
+        """
+        unit_of_work = self._current_unit_of_work()
+        return unit_of_work is not None and unit_of_work.has_pending_writes
+
+    def record_write(self, user_id: int) -> None:
+        """
+        유저의 쓰기를 기록하여 이후 읽기를 잠시 주 데이터베이스로 고정합니다. (요청 단위 작업 안에서는 커밋된 뒤)
+
+        Args:
+            user_id: 유저 ID
+        """
+        self.after_commit(partial(self.read_your_writes.record_write, user_id))
+
+
+class AsyncDatabase:
+    """
+    비동기 데이터베이스 연결 관리
+
+    이벤트 루프를 막지 않도록 비동기 드라이버(aiomysql, 로컬 테스트용 aiosqlite)를 사용합니다.
+    읽기 복제본, 읽기 고정과 요청 단위 작업은 `Database`와 같습니다.
+    """
+
+    def __init__(self, app_settings: AppSettings, clock: Callable[[], float] = time.monotonic):
+        """
+        초기화
+
+        Args:
+            app_settings: 애플리케이션 설정
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self._engine = create_async_engine(
+            app_settings.async_database_url,
+            poolclass=AsyncWaitTrackingQueuePool,
+            **app_settings.DB_POOL.engine_options(),
+        )
+        self._session_factory = async_sessionmaker(bind=self._engine, expire_on_commit=False, autoflush=False)
+
+        self._replica_engines = [
+            create_async_engine(url, poolclass=AsyncWaitTrackingQueuePool, **app_settings.DB_POOL.engine_options())
+            for url in app_settings.replica_async_database_urls
+        ]
+        self._replica_session_factories = itertools.cycle(
+            [
+                async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+                for engine in self._replica_engines
+            ]
+        )
+        self.read_your_writes = ReadYourWrites(app_settings.DB_READ_YOUR_WRITES_SECONDS, clock)
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns:
+            커넥션 풀 통계
+        """
+        return _pool_stats(self._engine.pool)
+
+    async def ping(self) -> None:
+        """
+        `SELECT 1`로 데이터베이스 연결을 확인합니다.
+
+        Raises:
+            Exception: 커넥션을 얻지 못하거나 SQL 실행에 실패할 경우 발생
+        """
+        async with self._engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncGenerator[AsyncUnitOfWork, None]:
+        """
+        요청 단위 작업 시작 (이미 열려 있으면 그 작업에 참여)
+
+        Yields:
+            AsyncUnitOfWork: 요청 단위 작업 (블록 중간에 `commit()`으로 먼저 커밋하거나 `finish()`로 끝낼 수 있음)
+
+        Raises:
+            Exception: 블록 안에서 오류가 발생할 경우 롤백 후 발생
+        """
+        current = self._current_unit_of_work()
+        if current is not None:
+            yield current
+            return
+
+        unit_of_work = AsyncUnitOfWork(self)
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+            if not unit_of_work.finished:
+                await unit_of_work.commit()
+        except Exception:
+            await unit_of_work.rollback()
+            raise
+        finally:
+            await unit_of_work.close()
+            _current_unit_of_work.reset(token)
+
+    def _current_unit_of_work(self) -> AsyncUnitOfWork | None:
+        """
+        Returns:
+            현재 컨텍스트에서 이 데이터베이스로 열린 요청 단위 작업 (없으면 None)
+        """
+        unit_of_work = _current_unit_of_work.get()
+        return unit_of_work if isinstance(unit_of_work, AsyncUnitOfWork) and unit_of_work.database is self else None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        세션 생성
+
+        요청 단위 작업 안에서는 그 작업의 세션을 돌려주며, 커밋/롤백은 작업이 끝날 때 합니다.
+
+        Yields:
+            AsyncSession: 세션
+
+        Raises:
+            Exception: 세션 생성 중 오류가 발생할 경우 발생
+        """
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is not None:
+            yield unit_of_work.session()
+            return
+
+        session = self._session_factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def read_session(self, user_id: int) -> AsyncGenerator[AsyncSession, None]:
+        """
+        읽기 전용 세션 생성
+
+        Args:
+            user_id: 조회하는 유저 ID (읽기 고정 여부 판단)
+
+        Yields:
+            AsyncSession: 복제본 세션 (복제본이 없거나, 유저가 최근에 썼거나, 요청 단위 작업에 커밋되지 않은 쓰기가 있는
+                경우 주 데이터베이스 세션)
+        """
+        if not self._replica_engines or self.read_your_writes.is_pinned(user_id) or self.has_pending_writes():
+            async with self.session() as session:
+                yield session
+            return
+
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is not None:
+            yield unit_of_work.read_session()
+            return
+
+        session = next(self._replica_session_factories)()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        커밋된 뒤에 실행할 처리 등록
+
+        요청 단위 작업 안에서는 작업이 커밋될 때 실행하고(롤백되면 실행하지 않음), 밖에서는 저장소의 세션이 이미
+        커밋된 뒤에 호출되므로 바로 실행합니다.
+
+        Args:
+            callback: 커밋 후 처리
+        """
+        unit_of_work = self._current_unit_of_work()
+        if unit_of_work is None:
+            callback()
+        else:
+            unit_of_work.on_commit(callback)
+
+    def has_pending_writes(self) -> bool:
+        """
+        Returns:
+            현재 요청 단위 작업에 아직 커밋되지 않은 쓰기가 있는지 여부 (캐시를 채우지 않는 데 사용)
+        """
+        unit_of_work = self._current_unit_of_work()
+        return unit_of_work is not None and unit_of_work.has_pending_writes
+
+    def record_write(self, user_id: int) -> None:
+        """
+        유저의 쓰기를 기록하여 이후 읽기를 잠시 주 데이터베이스로 고정합니다. (요청 단위 작업 안에서는 커밋된 뒤)
+
+        Args:
+            user_id: 유저 ID
+        """
+        self.after_commit(partial(self.read_your_writes.record_write, user_id))
+
+    async def dispose(self) -> None:
+        """
+        커넥션 풀 정리
+        """
+        await self._engine.dispose()
+        for engine in self._replica_engines:
+            await engine.dispose()
+
+
+def _pool_stats(pool: Pool) -> PoolStats:
+    """
+    Args:
+        pool: 엔진의 커넥션 풀 (QueuePool 계열, 대기 통계는 `WaitTrackingQueuePool` 계열만 제공)
+
+    Returns:
+        커넥션 풀 통계
+    """
+    queue_pool: Any = pool
+    return PoolStats(
+        size=queue_pool.size(),
+        checked_out=queue_pool.checkedout(),
+        checked_in=queue_pool.checkedin(),
+        overflow=queue_pool.overflow(),
+        waits=getattr(queue_pool, "waits", 0),
+        wait_seconds=getattr(queue_pool, "wait_seconds", 0.0),
+        timeouts=getattr(queue_pool, "timeouts", 0),
+    )
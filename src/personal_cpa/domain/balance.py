@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from personal_cpa.domain.journal import JournalEntry
+
+# 전체 기간 누계 잔액을 저장하는 기간 값 (월별 잔액은 YYYYMM)
+ALL_PERIODS = 0
+# 월별 잔액의 마지막 기간 (기간 범위 조회의 상한)
+LAST_PERIOD = 999912
+
+
+def period_of(day: date) -> int:
+    """
+    Args:
+        day: 거래일
+
+    Returns:
+        거래일이 속한 기간 (YYYYMM)
+    """
+    return day.year * 100 + day.month
+
+
+def split_by_period(start_date: date, end_date: date) -> tuple[tuple[int, int] | None, list[tuple[date, date]]]:
+    """
+    기간(날짜 범위)을 월 전체가 포함되는 기간 범위와 나머지 날짜 범위로 나눕니다.
+
+    월 전체가 포함되는 부분은 월별 잔액으로, 나머지 날짜 범위는 분개 줄로 합할 수 있습니다.
+
+    Args:
+        start_date: 시작일 (포함)
+        end_date: 종료일 (포함)
+
+    Returns:
+        ((첫 기간, 마지막 기간) | None (월 전체가 포함되지 않을 경우), 나머지 (시작일, 종료일) 목록)
+    """
+    first_full_day = start_date if start_date.day == 1 else _first_day_of_next_month(start_date)
+    day_after_end = end_date + timedelta(days=1)
+    after_full_day = day_after_end if day_after_end.day == 1 else end_date.replace(day=1)
+    if first_full_day >= after_full_day:
+        return None, [(start_date, end_date)]
+
+    ranges = []
+    if start_date < first_full_day:
+        ranges.append((start_date, first_full_day - timedelta(days=1)))
+    if after_full_day <= end_date:
+        ranges.append((after_full_day, end_date))
+    return (period_of(first_full_day), period_of(after_full_day - timedelta(days=1))), ranges
+
+
+def _first_day_of_next_month(day: date) -> date:
+    """
+    Args:
+        day: 날짜
+
+    Returns:
+        다음 달 1일
+    """
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def period_end(period: int) -> date:
+    """
+    Args:
+        period: 기간 (YYYYMM)
+
+    Returns:
+        기간의 마지막 날
+    """
+    return _first_day_of_next_month(date(period // 100, period % 100, 1)) - timedelta(days=1)
+
+
+def next_period(period: int) -> int:
+    """
+    Args:
+        period: 기간 (YYYYMM)
+
+    Returns:
+        다음 기간 (YYYYMM)
+    """
+    return period_of(_first_day_of_next_month(date(period // 100, period % 100, 1)))
+
+
+def last_full_period(day: date) -> int:
+    """
+    Args:
+        day: 날짜
+
+    Returns:
+        날짜까지 전체가 지난 마지막 기간 (YYYYMM, 날짜가 달의 마지막 날이면 그 달)
+    """
+    if (day + timedelta(days=1)).day == 1:
+        return period_of(day)
+    return period_of(day.replace(day=1) - timedelta(days=1))
+
+
+def validate_period(period: int) -> None:
+    """
+    기간 유효성 검사
+
+    Args:
+        period: 기간 (YYYYMM, 전체 기간은 `ALL_PERIODS`)
+
+    Raises:
+        ValueError: 기간이 `ALL_PERIODS`도 YYYYMM 형식도 아닐 경우 발생
+    """
+    if period != ALL_PERIODS and not (1 <= period % 100 <= 12 and 1 <= period // 100 <= 9999):
+        raise ValueError(f"period must be YYYYMM or {ALL_PERIODS}. (Currently: {period})")
+
+
+def validate_open_period(entry_date: date, closed_period: int | None) -> None:
+    """
+    거래일이 마감되지 않은 기간인지 검사
+
+    Args:
+        entry_date: 거래일
+        closed_period: 유저의 가장 최근 마감 기간 (None 이면 마감된 기간 없음)
+
+    Raises:
+        ValueError: 거래일이 마감된 기간(마감 기간 이하)일 경우 발생
+    """
+    if closed_period is not None and period_of(entry_date) <= closed_period:
+        raise ValueError(f"entry_date {entry_date} is in a closed period. (closed through: {closed_period})")
+
+
+@dataclass(slots=True, frozen=True)
+class AccountBalance:
+    """
+    계정과목의 기간별 잔액을 표현하는 도메인 모델.
+
+    차변/대변 합계는 계정과목 자신과 모든 하위 계정과목의 분개 줄을 합한 값이다.
+    """
+
+    user_id: int
+    chart_of_account_id: int
+    period: int
+    debit: int
+    credit: int
+
+    @property
+    def balance(self) -> int:
+        """
+        Returns:
+            잔액 (차변 합계 - 대변 합계)
+        """
+        return self.debit - self.credit
+
+
+def sum_journal_entries(journal_entries: Iterable[JournalEntry]) -> dict[tuple[int, int], list[int]]:
+    """
+    분개 줄을 (계정과목 ID, 기간)별 차변/대변 합계로 모읍니다. 월별 기간과 전체 기간에 모두 더합니다.
+
+    Args:
+        journal_entries: 분개 목록
+
+    Returns:
+        (계정과목 ID, 기간)별 [차변 합계, 대변 합계]
+    """
+    return sum_daily_totals(
+        (line.chart_of_account_id, journal_entry.entry_date, line.debit, line.credit)
+        for journal_entry in journal_entries
+        for line in journal_entry.lines
+    )
+
+
+def sum_daily_totals(daily_totals: Iterable[tuple[int, date, int, int]]) -> dict[tuple[int, int], list[int]]:
+    """
+    (계정과목 ID, 거래일)별 차변/대변 금액을 (계정과목 ID, 기간)별 합계로 모읍니다. 월별 기간과 전체 기간에 모두 더합니다.
+
+    Args:
+        daily_totals: (계정과목 ID, 거래일, 차변 금액, 대변 금액) 목록
+
+    Returns:
+        (계정과목 ID, 기간)별 [차변 합계, 대변 합계]
+    """
+    totals: dict[tuple[int, int], list[int]] = defaultdict(lambda: [0, 0])
+    for chart_of_account_id, day, debit, credit in daily_totals:
+        for key in ((chart_of_account_id, period_of(day)), (chart_of_account_id, ALL_PERIODS)):
+            total = totals[key]
+            total[0] += debit
+            total[1] += credit
+    return totals
+
+
+def rollup_balances(
+    user_id: int, totals: Mapping[tuple[int, int], Sequence[int]], ancestor_ids: Mapping[int, Sequence[int]]
+) -> list[AccountBalance]:
+    """
+    계정과목별 합계를 상위 계정과목 전체에 더해 잔액 목록을 만듭니다.
+
+    Args:
+        user_id: 유저 ID
+        totals: (계정과목 ID, 기간)별 [차변 합계, 대변 합계] (계정과목 자신의 분개 줄만)
+        ancestor_ids: 계정과목 ID별 상위 계정과목 ID 목록 (없으면 상위 계정과목이 없는 것으로 봄)
+
+    Returns:
+        (계정과목 ID, 기간)순으로 정렬된 잔액 목록 (동시 기표 시 같은 순서로 행을 잠그도록 정렬)
+    """
+    rolled: dict[tuple[int, int], list[int]] = defaultdict(lambda: [0, 0])
+    for (chart_of_account_id, period), (debit, credit) in totals.items():
+        for account_id in (chart_of_account_id, *ancestor_ids.get(chart_of_account_id, ())):
+            total = rolled[(account_id, period)]
+            total[0] += debit
+            total[1] += credit
+
+    return [
+        AccountBalance(
+            user_id=user_id, chart_of_account_id=chart_of_account_id, period=period, debit=debit, credit=credit
+        )
+        for (chart_of_account_id, period), (debit, credit) in sorted(rolled.items())
+    ]
+
+
+def ancestor_chains(parent_ids: Mapping[int, int | None]) -> dict[int, tuple[int, ...]]:
+    """
+    상위 계정과목 ID 관계로 계정과목별 상위 계정과목 ID 목록을 만듭니다.
+
+    Args:
+        parent_ids: 계정과목 ID별 상위 계정과목 ID
+
+    Returns:
+        계정과목 ID별 상위 계정과목 ID 목록 (가까운 상위 계정과목부터)
+
+    Raises:
+        ValueError: 상위 계정과목 관계에 순환이 있을 경우 발생
+    """
+    chains: dict[int, tuple[int, ...]] = {}
+    for chart_of_account_id in parent_ids:
+        path: list[int] = []
+        current = chart_of_account_id
+        while current not in chains:
+            parent_id = parent_ids.get(current)
+            if parent_id is None:
+                chains[current] = ()
+                break
+            if parent_id in path or parent_id == chart_of_account_id:
+                raise ValueError(f"chart of account hierarchy has a cycle. (id: {chart_of_account_id})")
+            path.append(current)
+            current = parent_id
+
+        # 경로의 아래쪽 계정과목부터 이미 계산된 상위 계정과목 목록을 이어 붙인다.
+        for account_id in reversed(path):
+            parent_id = parent_ids[account_id]
+            chains[account_id] = (parent_id, *chains[parent_id])
+
+    return chains
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import re
 
+from personal_cpa.domain.currency import DEFAULT_CURRENCY, validate_currency
 from personal_cpa.domain.enum.chart_of_account import AccountType
 
+_VALID_CODE_PATTERN = re.compile(r"[0-9_]*[0-9]")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ChartOfAccount:
     """
     사용자의 계정과목을 표현하는 도메인 모델.
 
     복식부기 시스템에서 자산/부채/자본/수익/비용 등의 유형을 가진 계정을 나타내며,
-    계정명, 코드, 상위 계정 정보 등을 포함한다.
+    계정명, 코드, 상위 계정 정보 등을 포함한다. 계정과목의 분개 금액은 계정과목 통화(`currency`)의 최소 단위 정수이다.
+
+    캐시에 담긴 인스턴스를 여러 요청이 함께 읽으므로 불변(frozen)이며, 값을 바꿀 때는 `dataclasses.replace`로
+    새 인스턴스를 만든다. 저장소에서 읽은 이미 검증된 값은 `trusted`로 유효성 검사 없이 생성한다.
     """
 
     user_id: int
@@ -21,10 +28,9 @@ class ChartOfAccount:
     description: str | None
     parent_chart_of_account_id: int | None
     is_hidden: bool = False
+    currency: str = DEFAULT_CURRENCY
     id: int | None = None
 
-    _VALID_CODE_CHARACTER = "01234567890_"
-
     def __post_init__(self):
         """
         생성 후 필드 유효성 검사를 수행합니다.
@@ -33,28 +39,107 @@ class ChartOfAccount:
         - code는 숫자와 언더바(_)만 허용합니다.
         - code는 언더바(_)로 끝나면 안 됩니다.
         - category은 AccountType Enum이어야 합니다.
+        - currency는 지원하는 ISO 4217 통화 코드여야 합니다.
 
         Raises:
             ValueError: name, code가 비어 있거나 code가 허용되지 않은 문자를 포함할 경우,
-                        혹은 상위 계정과 category이 일치하지 않을 경우 발생합니다.
+                        상위 계정과 category이 일치하지 않을 경우, 혹은 currency를 지원하지 않을 경우 발생합니다.
             TypeError: type이 AccountType이 아닌 경우 발생합니다.
         """
         if not self.name.strip():
             raise ValueError("name is not empty.")
+        if _VALID_CODE_PATTERN.fullmatch(self.code) is None:
+            self._raise_invalid_code()
+        if not isinstance(self.category, AccountType):
+            raise TypeError(f"type must be an AccountType enum. (Currently: {type(self.category)})")
+        validate_currency(self.currency)
+
+    def _raise_invalid_code(self) -> None:
+        """
+        유효하지 않은 code 의 위반 사유에 맞는 오류를 발생시킵니다.
+
+        Raises:
+            ValueError: code가 비어 있거나, 허용되지 않은 문자를 포함하거나, 언더바(_)로 끝날 경우 발생합니다.
+        """
         if not self.code.strip():
             raise ValueError("code is not empty.")
-        if any(c not in self._VALID_CODE_CHARACTER for c in self.code):
+        if self.code.strip("0123456789_"):
             raise ValueError(f"code can only be a number OR '_'. (Currently: {self.code})")
-        if self.code.endswith("_"):
-            raise ValueError(f"code must not end with '_'. (Currently: {self.code})")
-        if not isinstance(self.category, AccountType):
-            raise TypeError(f"type must be an AccountType enum. (Currently: {type(self.category)})")
+        raise ValueError(f"code must not end with '_'. (Currently: {self.code})")
 
+    @classmethod
+    def trusted(
+        cls,
+        user_id: int,
+        code: str,
+        name: str,
+        category: AccountType,
+        description: str | None,
+        parent_chart_of_account_id: int | None,
+        is_hidden: bool,
+        id: int | None,
+        currency: str = DEFAULT_CURRENCY,
+    ) -> ChartOfAccount:
+        """
+        유효성 검사 없이 생성합니다.
+
+        저장소에서 읽은 행처럼 저장 전에 이미 검증된 값에만 사용합니다.
 
-@dataclass
+        Args:
+            user_id: 사용자 ID
+            code: 계정과목 코드
+            name: 계정과목명
+            category: 계정 유형
+            description: 설명
+            parent_chart_of_account_id: 상위 계정과목 ID
+            is_hidden: 숨김 여부
+            id: 계정과목 ID
+            currency: 통화 코드
+
+        Returns:
+            계정과목
+        """
+        chart_of_account = object.__new__(cls)
+        set_field = object.__setattr__
+        set_field(chart_of_account, "user_id", user_id)
+        set_field(chart_of_account, "code", code)
+        set_field(chart_of_account, "name", name)
+        set_field(chart_of_account, "category", category)
+        set_field(chart_of_account, "description", description)
+        set_field(chart_of_account, "parent_chart_of_account_id", parent_chart_of_account_id)
+        set_field(chart_of_account, "is_hidden", is_hidden)
+        set_field(chart_of_account, "currency", currency)
+        set_field(chart_of_account, "id", id)
+        return chart_of_account
+
+    @property
+    def parent_code(self) -> str | None:
+        """
+        코드 규칙(상위 계정과목 코드 + "_" + 접미사)에 따라 상위 계정과목 코드를 반환합니다.
+
+        Returns:
+            상위 계정과목 코드 | None (최상위 계정과목인 경우)
+        """
+        return self.code.rpartition("_")[0] or None
+
+    @property
+    def depth(self) -> int:
+        """
+        코드 규칙에 따른 계층 깊이를 반환합니다. (최상위 계정과목은 0)
+
+        Returns:
+            계층 깊이
+        """
+        return self.code.count("_")
+
+
+@dataclass(slots=True)
 class ChartOfAccountTree:
     """
     계정과목 트리를 표현하는 도메인 모델.
+
+    깊이 제한으로 잘린 트리에서도 화면이 하위 계정과목을 나중에 펼칠 수 있도록,
+    `children`에 포함되지 않은 하위 계정과목까지 센 `child_count`를 함께 가진다.
     """
 
     user_id: int
@@ -65,3 +150,14 @@ class ChartOfAccountTree:
     description: str | None
     parent_chart_of_account_id: int | None
     id: int | None = None
+    child_count: int = 0
+
+    @property
+    def has_children(self) -> bool:
+        """
+        하위 계정과목 존재 여부를 반환합니다. (깊이 제한으로 `children`이 비어 있어도 참일 수 있음)
+
+        Returns:
+            하위 계정과목 존재 여부
+        """
+        return self.child_count > 0
@@ -0,0 +1,29 @@
+# 기본 통화 (계정과목 통화와 보고 통화의 기본값)
+DEFAULT_CURRENCY = "KRW"
+
+# ISO 4217 통화 코드별 최소 단위 자릿수 (금액은 통화 최소 단위 정수로 저장)
+MINOR_UNITS: dict[str, int] = {
+    "AUD": 2,
+    "CAD": 2,
+    "CHF": 2,
+    "CNY": 2,
+    "EUR": 2,
+    "GBP": 2,
+    "HKD": 2,
+    "JPY": 0,
+    "KRW": 0,
+    "SGD": 2,
+    "USD": 2,
+}
+
+
+def validate_currency(currency: str) -> None:
+    """
+    Args:
+        currency: 통화 코드
+
+    Raises:
+        ValueError: 지원하지 않는 통화 코드일 경우 발생
+    """
+    if currency not in MINOR_UNITS:
+        raise ValueError(f"currency must be one of {', '.join(MINOR_UNITS)}. (Currently: {currency})")
@@ -0,0 +1,15 @@
+from enum import auto
+
+from personal_cpa.auto_named_enum import AutoNamedEnum
+
+
+class PeriodCloseStatus(AutoNamedEnum):
+    """
+    기간 마감 작업의 진행 상태(Enum)입니다.
+
+    - RUNNING: 마감할 유저가 남아 있는 상태 (중단되었다면 다시 실행하면 이어서 처리)
+    - DONE: 모든 유저의 마감이 끝난 상태
+    """
+
+    RUNNING = auto()
+    DONE = auto()
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from fractions import Fraction
+
+from personal_cpa.domain.currency import MINOR_UNITS, validate_currency
+
+
+@dataclass(slots=True, frozen=True)
+class FxRate:
+    """
+    고시일의 환율을 표현하는 도메인 모델.
+
+    기준 통화 1 단위가 표시 통화 `rate` 단위와 같으며, 고시일부터 같은 통화쌍의 다음 고시일 전날까지 적용한다.
+    """
+
+    base_currency: str
+    quote_currency: str
+    rate_date: date
+    rate: Decimal
+
+    def __post_init__(self):
+        """
+        생성 후 필드 유효성 검사를 수행합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나, 두 통화가 같거나, 환율이 양수가 아닐 경우 발생합니다.
+        """
+        validate_currency(self.base_currency)
+        validate_currency(self.quote_currency)
+        if self.base_currency == self.quote_currency:
+            raise ValueError(f"base_currency and quote_currency must differ. (Currently: {self.base_currency})")
+        if not self.rate > 0:
+            raise ValueError(f"rate must be positive. (Currently: {self.rate})")
+
+
+class FxRateTable:
+    """
+    통화쌍별 환율을 고시일 순으로 정렬해 둔 메모리 조회 구조.
+
+    통화쌍마다 고시일 배열과 환율 배열을 따로 두고, 기준일의 환율은 고시일 배열을 이진 탐색(`bisect`)해
+    기준일 이전의 가장 최근 고시일로 찾습니다. 고시된 통화쌍이 없으면 역방향 통화쌍의 역수를, 그것도 없으면
+    두 통화와 모두 고시된 통화 하나를 거친 교차 환율을 사용합니다.
+    환율은 분수(`Fraction`)로 보관하므로 환산 금액은 통화 최소 단위에서 한 번만 반올림됩니다.
+    """
+
+    __slots__ = ("dates", "rates")
+
+    def __init__(self, fx_rates: Iterable[FxRate]):
+        """
+        초기화
+
+        Args:
+            fx_rates: 환율 목록 (순서 무관)
+        """
+        points: dict[tuple[str, str], list[tuple[date, Fraction]]] = defaultdict(list)
+        for fx_rate in fx_rates:
+            points[(fx_rate.base_currency, fx_rate.quote_currency)].append((fx_rate.rate_date, Fraction(fx_rate.rate)))
+
+        self.dates: dict[tuple[str, str], list[date]] = {}
+        self.rates: dict[tuple[str, str], list[Fraction]] = {}
+        for pair, pair_points in points.items():
+            pair_points.sort()
+            self.dates[pair] = [rate_date for rate_date, _ in pair_points]
+            self.rates[pair] = [rate for _, rate in pair_points]
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            환율 수
+        """
+        return sum(len(dates) for dates in self.dates.values())
+
+    def rate(self, base_currency: str, quote_currency: str, day: date) -> Fraction:
+        """
+        기준일에 적용되는 환율 조회
+
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            기준 통화 1 단위의 표시 통화 금액
+
+        Raises:
+            ValueError: 기준일 이전에 고시된 환율로 두 통화를 잇지 못할 경우 발생
+        """
+        if base_currency == quote_currency:
+            return Fraction(1)
+
+        rate = self._quoted_rate(base_currency, quote_currency, day)
+        if rate is not None:
+            return rate
+
+        currencies = {currency for pair in self.dates for currency in pair} - {base_currency, quote_currency}
+        for pivot in sorted(currencies):
+            first = self._quoted_rate(base_currency, pivot, day)
+            second = self._quoted_rate(pivot, quote_currency, day) if first is not None else None
+            if second is not None:
+                return first * second
+
+        raise ValueError(f"no {base_currency}/{quote_currency} fx rate on or before {day}.")
+
+    def factor(self, from_currency: str, to_currency: str, day: date) -> Fraction:
+        """
+        통화 최소 단위 금액에 곱할 환산 계수
+
+        Args:
+            from_currency: 원래 통화 코드
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            원래 통화 최소 단위 1 의 환산 통화 최소 단위 금액
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        validate_currency(from_currency)
+        validate_currency(to_currency)
+        return self.rate(from_currency, to_currency, day) * Fraction(10) ** (
+            MINOR_UNITS[to_currency] - MINOR_UNITS[from_currency]
+        )
+
+    def convert(self, amount: int, from_currency: str, to_currency: str, day: date) -> int:
+        """
+        금액 하나를 환산
+
+        Args:
+            amount: 원래 통화 최소 단위 금액
+            from_currency: 원래 통화 코드
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            환산 통화 최소 단위 금액 (은행가 반올림)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        factor = self.factor(from_currency, to_currency, day)
+        return _round_half_even(amount * factor.numerator, factor.denominator)
+
+    def convert_many(self, amounts: Sequence[int], currencies: Sequence[str], to_currency: str, day: date) -> list[int]:
+        """
+        여러 금액을 한 번에 환산
+
+        환산 계수는 원래 통화마다 한 번만 구하고, 금액마다 정수 곱셈과 나눗셈 한 번으로 환산합니다.
+
+        Args:
+            amounts: 원래 통화 최소 단위 금액 목록
+            currencies: 금액별 원래 통화 코드 목록
+            to_currency: 환산할 통화 코드
+            day: 기준일
+
+        Returns:
+            금액별 환산 통화 최소 단위 금액 목록 (은행가 반올림, 입력 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 통화이거나 환율이 없을 경우 발생
+        """
+        factors: dict[str, tuple[int, int]] = {}
+        converted = []
+        append = converted.append
+        for amount, currency in zip(amounts, currencies, strict=True):
+            factor = factors.get(currency)
+            if factor is None:
+                fraction = self.factor(currency, to_currency, day)
+                factor = factors[currency] = (fraction.numerator, fraction.denominator)
+
+            numerator, denominator = factor
+            if denominator == 1:
+                append(amount * numerator)
+                continue
+
+            quotient, remainder = divmod(amount * numerator, denominator)
+            doubled = remainder * 2
+            if doubled > denominator or (doubled == denominator and quotient & 1):
+                quotient += 1
+            append(quotient)
+
+        return converted
+
+    def _quoted_rate(self, base_currency: str, quote_currency: str, day: date) -> Fraction | None:
+        """
+        Args:
+            base_currency: 기준 통화 코드
+            quote_currency: 표시 통화 코드
+            day: 기준일
+
+        Returns:
+            고시된 통화쌍 또는 역방향 통화쌍의 기준일 환율 | None (기준일 이전에 고시된 환율이 없을 경우)
+        """
+        rate = self._lookup((base_currency, quote_currency), day)
+        if rate is not None:
+            return rate
+
+        inverse = self._lookup((quote_currency, base_currency), day)
+        return None if inverse is None else 1 / inverse
+
+    def _lookup(self, pair: tuple[str, str], day: date) -> Fraction | None:
+        """
+        Args:
+            pair: (기준 통화 코드, 표시 통화 코드)
+            day: 기준일
+
+        Returns:
+            기준일 이전의 가장 최근 고시일 환율 | None
+        """
+        dates = self.dates.get(pair)
+        if dates is None:
+            return None
+
+        index = bisect_right(dates, day) - 1
+        return self.rates[pair][index] if index >= 0 else None
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """
+    Args:
+        numerator: 분자
+        denominator: 분모 (양수)
+
+    Returns:
+        분수를 가장 가까운 정수로 반올림한 값 (정확히 중간이면 짝수 쪽)
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = remainder * 2
+    if doubled > denominator or (doubled == denominator and quotient & 1):
+        quotient += 1
+    return quotient
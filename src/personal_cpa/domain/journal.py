@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(slots=True, frozen=True)
+class JournalLine:
+    """
+    분개의 한 줄(차변 또는 대변)을 표현하는 도메인 모델.
+
+    금액은 통화의 최소 단위(원화는 원) 정수이며, 차변과 대변 중 정확히 한쪽만 양수여야 한다.
+    """
+
+    chart_of_account_id: int
+    debit: int = 0
+    credit: int = 0
+    description: str | None = None
+    id: int | None = None
+
+    def __post_init__(self):
+        """
+        생성 후 금액 유효성 검사를 수행합니다.
+
+        Raises:
+            ValueError: 금액이 음수이거나, 차변/대변이 모두 0 이거나 모두 양수일 경우 발생합니다.
+        """
+        if self.debit < 0 or self.credit < 0:
+            raise ValueError(f"debit and credit must not be negative. (Currently: {self.debit}, {self.credit})")
+        if (self.debit > 0) == (self.credit > 0):
+            raise ValueError(
+                f"exactly one of debit or credit must be positive. (Currently: {self.debit}, {self.credit})"
+            )
+
+
+@dataclass(slots=True, frozen=True)
+class JournalEntry:
+    """
+    복식부기 분개(전표)를 표현하는 도메인 모델.
+
+    한 거래를 두 줄 이상의 차변/대변으로 기록하며, 차변 합계와 대변 합계가 같아야 한다.
+    """
+
+    user_id: int
+    entry_date: date
+    description: str | None
+    lines: tuple[JournalLine, ...]
+    id: int | None = None
+
+    def __post_init__(self):
+        """
+        분개 줄을 한 번 순회하며 차변/대변 합계를 구해 대차 평형을 검사합니다.
+
+        Raises:
+            ValueError: 분개 줄이 두 줄 미만이거나 차변 합계와 대변 합계가 다를 경우 발생합니다.
+        """
+        if len(self.lines) < 2:
+            raise ValueError(f"journal entry needs at least two lines. (Currently: {len(self.lines)})")
+
+        debit = credit = 0
+        for line in self.lines:
+            debit += line.debit
+            credit += line.credit
+        if debit != credit:
+            raise ValueError(f"journal entry is not balanced. (debit: {debit}, credit: {credit})")
+
+    @property
+    def amount(self) -> int:
+        """
+        Returns:
+            분개 금액 (차변 합계 = 대변 합계)
+        """
+        return sum(line.debit for line in self.lines)
+
+
+@dataclass(slots=True, frozen=True)
+class LedgerLine:
+    """
+    계정과목별 원장(기간 조회)의 한 줄을 표현하는 도메인 모델.
+    """
+
+    id: int
+    journal_entry_id: int
+    chart_of_account_id: int
+    entry_date: date
+    debit: int
+    credit: int
+    description: str | None
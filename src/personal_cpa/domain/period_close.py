@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from personal_cpa.domain.enum.period_close import PeriodCloseStatus
+
+
+@dataclass(slots=True, frozen=True)
+class ClosingBalance:
+    """
+    마감된 기간의 계정과목 마감 잔액을 표현하는 도메인 모델.
+
+    차변/대변 합계는 처음부터 기간의 마지막 날까지의 누계이며, 계정과목 자신과 모든 하위 계정과목의 분개 줄을 합한 값이다.
+    """
+
+    user_id: int
+    chart_of_account_id: int
+    period: int
+    debit: int
+    credit: int
+
+    @property
+    def balance(self) -> int:
+        """
+        Returns:
+            잔액 (차변 합계 - 대변 합계)
+        """
+        return self.debit - self.credit
+
+
+@dataclass(slots=True, frozen=True)
+class PeriodCloseJob:
+    """
+    기간 마감 작업의 진행 상황을 표현하는 도메인 모델.
+
+    유저를 ID 순으로 묶어 마감하며, 묶음을 저장할 때 마지막으로 마감한 유저 ID를 함께 저장하므로
+    중단된 작업은 그 다음 유저부터 이어서 처리한다.
+    """
+
+    period: int
+    status: PeriodCloseStatus = PeriodCloseStatus.RUNNING
+    last_user_id: int = 0
+    closed_users: int = 0
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns:
+            모든 유저의 마감이 끝났는지 여부
+        """
+        return self.status == PeriodCloseStatus.DONE
+
+    def advance(self, user_ids: list[int]) -> PeriodCloseJob:
+        """
+        Args:
+            user_ids: 이번 묶음에서 마감한 유저 ID 목록 (오름차순)
+
+        Returns:
+            마지막으로 마감한 유저 ID와 마감한 유저 수를 갱신한 작업
+        """
+        return replace(self, last_user_id=user_ids[-1], closed_users=self.closed_users + len(user_ids))
+
+    def finish(self) -> PeriodCloseJob:
+        """
+        Returns:
+            완료 상태의 작업
+        """
+        return replace(self, status=PeriodCloseStatus.DONE)
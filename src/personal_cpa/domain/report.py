@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Container, Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from datetime import date
+
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.currency import DEFAULT_CURRENCY
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+# 차변이 증가 방향인 계정 유형 (나머지는 대변이 증가 방향)
+_DEBIT_NORMAL_TYPES = frozenset({AccountType.ASSET, AccountType.EXPENSE})
+
+
+@dataclass(slots=True, frozen=True)
+class ReportLine:
+    """
+    재무 보고서의 계정과목 한 줄을 표현하는 도메인 모델.
+
+    차변/대변 합계는 계정과목 자신과 모든 하위 계정과목의 분개 줄을 합한 값이다.
+    """
+
+    chart_of_account_id: int
+    code: str
+    name: str
+    category: AccountType
+    depth: int
+    debit: int
+    credit: int
+
+    @property
+    def balance(self) -> int:
+        """
+        Returns:
+            잔액 (차변 합계 - 대변 합계)
+        """
+        return self.debit - self.credit
+
+    @property
+    def amount(self) -> int:
+        """
+        Returns:
+            계정 유형의 증가 방향 기준 금액 (자산/비용은 차변 - 대변, 부채/자본/수익은 대변 - 차변)
+        """
+        if self.category in _DEBIT_NORMAL_TYPES:
+            return self.debit - self.credit
+        return self.credit - self.debit
+
+
+def _root_total(lines: Iterable[ReportLine], category: AccountType) -> int:
+    """
+    Args:
+        lines: 보고서 줄 목록
+        category: 계정 유형
+
+    Returns:
+        계정 유형의 최상위 계정과목 금액 합계 (하위 계정과목은 상위 계정과목에 이미 포함되어 있으므로 제외)
+    """
+    return sum(line.amount for line in lines if line.depth == 0 and line.category == category)
+
+
+@dataclass(slots=True, frozen=True)
+class TrialBalance:
+    """
+    기간의 시산표를 표현하는 도메인 모델.
+
+    보고 통화로 환산한 시산표는 계정과목마다 환산하므로 차변 합계와 대변 합계가 반올림만큼 다를 수 있다.
+    """
+
+    start_date: date
+    end_date: date
+    lines: tuple[ReportLine, ...]
+    currency: str = DEFAULT_CURRENCY
+
+    @property
+    def total_debit(self) -> int:
+        """
+        Returns:
+            최상위 계정과목 차변 합계
+        """
+        return sum(line.debit for line in self.lines if line.depth == 0)
+
+    @property
+    def total_credit(self) -> int:
+        """
+        Returns:
+            최상위 계정과목 대변 합계
+        """
+        return sum(line.credit for line in self.lines if line.depth == 0)
+
+
+@dataclass(slots=True, frozen=True)
+class IncomeStatement:
+    """
+    기간의 손익계산서를 표현하는 도메인 모델.
+    """
+
+    start_date: date
+    end_date: date
+    revenues: tuple[ReportLine, ...]
+    expenses: tuple[ReportLine, ...]
+    currency: str = DEFAULT_CURRENCY
+
+    @classmethod
+    def from_lines(
+        cls, start_date: date, end_date: date, lines: Iterable[ReportLine], currency: str = DEFAULT_CURRENCY
+    ) -> IncomeStatement:
+        """
+        보고서 줄 목록에서 수익/비용 계정과목만 골라 손익계산서를 만듭니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            lines: 보고서 줄 목록
+            currency: 보고서 금액의 통화 코드
+
+        Returns:
+            손익계산서
+        """
+        lines = tuple(lines)
+        return cls(
+            start_date=start_date,
+            end_date=end_date,
+            revenues=tuple(line for line in lines if line.category == AccountType.REVENUE),
+            expenses=tuple(line for line in lines if line.category == AccountType.EXPENSE),
+            currency=currency,
+        )
+
+    @property
+    def total_revenue(self) -> int:
+        """
+        Returns:
+            수익 합계
+        """
+        return _root_total(self.revenues, AccountType.REVENUE)
+
+    @property
+    def total_expense(self) -> int:
+        """
+        Returns:
+            비용 합계
+        """
+        return _root_total(self.expenses, AccountType.EXPENSE)
+
+    @property
+    def net_income(self) -> int:
+        """
+        Returns:
+            당기순이익 (수익 합계 - 비용 합계)
+        """
+        return self.total_revenue - self.total_expense
+
+
+@dataclass(slots=True, frozen=True)
+class BalanceSheet:
+    """
+    기준일의 재무상태표를 표현하는 도메인 모델.
+
+    수익/비용 계정은 마감 전이므로 기준일까지의 누적 순이익을 이익잉여금으로 자본에 더한다.
+    보고 통화로 환산한 재무상태표는 계정과목마다 환산하며 생긴 차이를 환산 차이로 자본에 더한다.
+    """
+
+    as_of: date
+    assets: tuple[ReportLine, ...]
+    liabilities: tuple[ReportLine, ...]
+    equity: tuple[ReportLine, ...]
+    retained_earnings: int
+    currency: str = DEFAULT_CURRENCY
+    translation_adjustment: int = 0
+
+    @classmethod
+    def from_lines(
+        cls, as_of: date, lines: Iterable[ReportLine], currency: str = DEFAULT_CURRENCY, translated: bool = False
+    ) -> BalanceSheet:
+        """
+        기준일까지의 누계 보고서 줄 목록으로 재무상태표를 만듭니다. 수익/비용 계정과목은 이익잉여금으로 합칩니다.
+
+        Args:
+            as_of: 기준일
+            lines: 기준일까지의 누계 보고서 줄 목록
+            currency: 보고서 금액의 통화 코드
+            translated: 계정과목 통화에서 환산한 금액인지 여부 (참이면 자산 - 부채 - 자본을 환산 차이로 자본에 더함)
+
+        Returns:
+            재무상태표
+        """
+        lines = tuple(lines)
+        balance_sheet = cls(
+            as_of=as_of,
+            assets=tuple(line for line in lines if line.category == AccountType.ASSET),
+            liabilities=tuple(line for line in lines if line.category == AccountType.LIABILITY),
+            equity=tuple(line for line in lines if line.category == AccountType.EQUITY),
+            retained_earnings=_root_total(lines, AccountType.REVENUE) - _root_total(lines, AccountType.EXPENSE),
+            currency=currency,
+        )
+        if not translated:
+            return balance_sheet
+
+        adjustment = balance_sheet.total_assets - balance_sheet.total_liabilities - balance_sheet.total_equity
+        return replace(balance_sheet, translation_adjustment=adjustment)
+
+    @property
+    def total_assets(self) -> int:
+        """
+        Returns:
+            자산 합계
+        """
+        return _root_total(self.assets, AccountType.ASSET)
+
+    @property
+    def total_liabilities(self) -> int:
+        """
+        Returns:
+            부채 합계
+        """
+        return _root_total(self.liabilities, AccountType.LIABILITY)
+
+    @property
+    def total_equity(self) -> int:
+        """
+        Returns:
+            자본 합계 (이익잉여금, 환산 차이 포함)
+        """
+        return _root_total(self.equity, AccountType.EQUITY) + self.retained_earnings + self.translation_adjustment
+
+    @property
+    def balanced(self) -> bool:
+        """
+        Returns:
+            자산 합계 = 부채 합계 + 자본 합계 여부
+        """
+        return self.total_assets == self.total_liabilities + self.total_equity
+
+
+class AccountTree:
+    """
+    계정과목 트리를 상위 계정과목 위치 배열로 펼친 구조.
+
+    계정과목을 코드 기준 전위 순서(상위 계정과목이 항상 하위 계정과목보다 앞)로 정렬하고, 계정과목마다 상위
+    계정과목의 위치를 배열로 미리 계산해 둡니다. 합계는 계정과목 객체를 재귀로 따라가지 않고 배열을 뒤에서부터
+    한 번 훑으며 각 위치의 값을 상위 계정과목 위치에 더하는 것으로 하위 트리 전체를 합산합니다.
+    """
+
+    __slots__ = ("chart_of_accounts", "index_of", "parent_index")
+
+    def __init__(self, chart_of_accounts: Iterable[ChartOfAccount]):
+        """
+        초기화
+
+        Args:
+            chart_of_accounts: 유저의 계정과목 목록 (ID가 있어야 함)
+        """
+        self.chart_of_accounts: list[ChartOfAccount] = sorted(chart_of_accounts, key=_code_key)
+        self.index_of: dict[int, int] = {
+            chart_of_account.id: index for index, chart_of_account in enumerate(self.chart_of_accounts)
+        }
+        self.parent_index: list[int] = [
+            self.index_of.get(chart_of_account.parent_chart_of_account_id, -1)
+            for chart_of_account in self.chart_of_accounts
+        ]
+
+    def rollup(
+        self, own_totals: Mapping[int, Sequence[int]], rolled_totals: Mapping[int, Sequence[int]] | None = None
+    ) -> tuple[list[int], list[int]]:
+        """
+        계정과목별 합계를 하위 트리 합계로 만듭니다.
+
+        Args:
+            own_totals: 계정과목 ID별 (차변 합계, 대변 합계) (계정과목 자신의 분개 줄만, 상위 계정과목에 더함)
+            rolled_totals: 계정과목 ID별 (차변 합계, 대변 합계) (이미 하위 계정과목을 포함한 값, 그대로 더함)
+
+        Returns:
+            계정과목 위치별 (차변 합계 배열, 대변 합계 배열) (`chart_of_accounts` 순서)
+        """
+        size = len(self.chart_of_accounts)
+        debits = [0] * size
+        credits = [0] * size
+        index_of = self.index_of
+        for chart_of_account_id, (debit, credit) in own_totals.items():
+            index = index_of.get(chart_of_account_id)
+            if index is not None:
+                debits[index] += debit
+                credits[index] += credit
+
+        # 전위 순서의 역순은 하위 계정과목이 항상 상위 계정과목보다 먼저 오므로, 한 번 훑으면 하위 트리 합계가 된다.
+        parent_index = self.parent_index
+        for index in range(size - 1, -1, -1):
+            parent = parent_index[index]
+            if parent >= 0:
+                debits[parent] += debits[index]
+                credits[parent] += credits[index]
+
+        for chart_of_account_id, (debit, credit) in (rolled_totals or {}).items():
+            index = index_of.get(chart_of_account_id)
+            if index is not None:
+                debits[index] += debit
+                credits[index] += credit
+
+        return debits, credits
+
+    def translate(
+        self,
+        debits: Sequence[int],
+        credits: Sequence[int],
+        convert_many: Callable[[Sequence[int], Sequence[str]], list[int]],
+    ) -> tuple[list[int], list[int]]:
+        """
+        하위 트리 합계를 계정과목 통화별로 환산한 하위 트리 합계로 바꿉니다.
+
+        상위 계정과목과 하위 계정과목의 통화가 다르면 하위 트리 합계에 여러 통화의 금액이 섞여 있으므로, 하위
+        계정과목의 하위 트리 합계를 빼서 계정과목 자신의 금액을 구하고 계정과목 통화에서 한 번에 환산한 뒤 다시 합산합니다.
+
+        Args:
+            debits: 계정과목 위치별 차변 합계 (계정과목 통화)
+            credits: 계정과목 위치별 대변 합계 (계정과목 통화)
+            convert_many: (금액 목록, 금액별 통화 코드 목록)을 받아 환산 금액 목록을 돌려주는 함수
+
+        Returns:
+            계정과목 위치별 (환산한 차변 합계 배열, 환산한 대변 합계 배열)
+        """
+        own_debits = list(debits)
+        own_credits = list(credits)
+        parent_index = self.parent_index
+        for index, parent in enumerate(parent_index):
+            if parent >= 0:
+                own_debits[parent] -= debits[index]
+                own_credits[parent] -= credits[index]
+
+        currencies = [chart_of_account.currency for chart_of_account in self.chart_of_accounts]
+        translated_debits = convert_many(own_debits, currencies)
+        translated_credits = convert_many(own_credits, currencies)
+        for index in range(len(parent_index) - 1, -1, -1):
+            parent = parent_index[index]
+            if parent >= 0:
+                translated_debits[parent] += translated_debits[index]
+                translated_credits[parent] += translated_credits[index]
+
+        return translated_debits, translated_credits
+
+    def report_lines(
+        self, debits: Sequence[int], credits: Sequence[int], categories: Container[AccountType] = frozenset(AccountType)
+    ) -> tuple[ReportLine, ...]:
+        """
+        합계가 있는 계정과목의 보고서 줄 목록을 만듭니다.
+
+        Args:
+            debits: 계정과목 위치별 차변 합계
+            credits: 계정과목 위치별 대변 합계
+            categories: 포함할 계정 유형
+
+        Returns:
+            코드 기준 전위 순서의 보고서 줄 목록 (차변/대변 합계가 모두 0 인 계정과목은 제외)
+        """
+        return tuple(
+            ReportLine(
+                chart_of_account_id=chart_of_account.id,
+                code=chart_of_account.code,
+                name=chart_of_account.name,
+                category=chart_of_account.category,
+                depth=chart_of_account.depth,
+                debit=debit,
+                credit=credit,
+            )
+            for chart_of_account, debit, credit in zip(self.chart_of_accounts, debits, credits, strict=True)
+            if (debit or credit) and chart_of_account.category in categories
+        )
+
+
+def _code_key(chart_of_account: ChartOfAccount) -> tuple[int, ...]:
+    """
+    Args:
+        chart_of_account: 계정과목
+
+    Returns:
+        코드 기준 전위 순서 정렬 키 (예: "1_10" 은 "1_2" 뒤)
+    """
+    return tuple(map(int, chart_of_account.code.split("_")))
@@ -8,3 +8,9 @@ class ChartOfAccountAlreadyExistsError(PersonalCPAError):
     """
     계정과목이 이미 존재할 경우 발생하는 예외
     """
+
+
+class QueryBudgetExceededError(PersonalCPAError):
+    """
+    요청(또는 측정 블록)의 SQL 문 수가 예산을 넘었을 경우 발생하는 예외
+    """
@@ -1,13 +1,69 @@
 """
 This module configures the logger for the application using dictConfig.
+
+With `LOG_ASYNC` enabled, loggers only enqueue records through a `QueueHandler`; a `QueueListener` thread
+formats them and writes to stdout and the rotating log file, so the request path never blocks on disk I/O.
+`LOG_FORMAT` selects plain text or one JSON object per line, and `DB_ECHO_LEVEL` sets the level of the
+`sqlalchemy.engine` logger (INFO logs every statement) so SQL logs go through the same pipeline.
 """
 
+import atexit
+from datetime import UTC, datetime
+import json
 import logging.config
+import logging.handlers
 from pathlib import Path
 import sys
 
 from personal_cpa.config import AppSettings
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as a single-line JSON object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Args:
+            record: The log record.
+
+        Returns:
+            str: The JSON line with timestamp, level, logger, message and (if any) exception fields.
+        """
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock `QueueHandler.prepare` formats the record (including tracebacks) on the calling thread.
+    The queue never leaves the process, so only the message arguments are merged here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Args:
+            record: The log record.
+
+        Returns:
+            logging.LogRecord: The record with its message arguments merged.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 def setup_logging(settings: AppSettings) -> None:
     """
@@ -16,27 +72,55 @@ def setup_logging(settings: AppSettings) -> None:
     Args:
         settings: The application settings.
     """
+    stop_logging()
+
     log_dir = Path(settings.LOG_FILE).parent
     if not Path.exists(log_dir):
         Path.mkdir(log_dir)
 
+    formatter = {"()": JsonFormatter} if settings.LOG_FORMAT == "json" else {"format": TEXT_FORMAT}
+    output_handlers = ["console", "file"]
+    handlers: dict = {
+        "console": {"class": "logging.StreamHandler", "stream": sys.stdout, "formatter": "default"},
+        "file": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": settings.LOG_FILE,
+            "maxBytes": 1024 * 1024 * 5,  # 5 MB
+            "backupCount": 5,
+            "formatter": "default",
+        },
+    }
+    if settings.LOG_ASYNC:
+        handlers["queue"] = {
+            "class": f"{__name__}.DeferredFormatQueueHandler",
+            "handlers": output_handlers,
+            "respect_handler_level": True,
+        }
+        output_handlers = ["queue"]
+
     logging_config = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {"default": {"format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"}},
-        "handlers": {
-            "console": {"class": "logging.StreamHandler", "stream": sys.stdout, "formatter": "default"},
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "filename": settings.LOG_FILE,
-                "maxBytes": 1024 * 1024 * 5,  # 5 MB
-                "backupCount": 5,
-                "formatter": "default",
-            },
-        },
+        "formatters": {"default": formatter},
+        "handlers": handlers,
         "loggers": {
-            settings.APP_NAME: {"handlers": ["console", "file"], "level": settings.LOG_LEVEL, "propagate": False}
+            settings.APP_NAME: {"handlers": output_handlers, "level": settings.LOG_LEVEL, "propagate": False},
+            "sqlalchemy.engine": {"level": settings.DB_ECHO_LEVEL},
         },
-        "root": {"handlers": ["console", "file"], "level": settings.LOG_LEVEL},
+        "root": {"handlers": output_handlers, "level": settings.LOG_LEVEL},
     }
     logging.config.dictConfig(logging_config)
+
+    queue_handler = logging.getHandlerByName("queue")
+    if isinstance(queue_handler, logging.handlers.QueueHandler) and queue_handler.listener:
+        queue_handler.listener.start()
+        atexit.register(queue_handler.listener.stop)
+
+
+def stop_logging() -> None:
+    """
+    Stop the queue listener, writing out records still in the queue.
+    """
+    queue_handler = logging.getHandlerByName("queue")
+    if isinstance(queue_handler, logging.handlers.QueueHandler) and queue_handler.listener:
+        queue_handler.listener.stop()
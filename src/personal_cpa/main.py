@@ -2,18 +2,31 @@
 This module defines the FastAPI application.
 """
 
+from contextlib import asynccontextmanager
 import logging
+import random
 import time
+from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from starlette.middleware.base import RequestResponseEndpoint
 
 from personal_cpa.adapter.inbound.api import error_handler
-from personal_cpa.adapter.inbound.api.routes import chart_of_account, health
+from personal_cpa.adapter.inbound.api.metrics import MetricsMiddleware
+from personal_cpa.adapter.inbound.api.routes import (
+    chart_of_account,
+    fx_rate,
+    health,
+    journal,
+    metrics,
+    period_close,
+    report,
+)
+from personal_cpa.adapter.inbound.api.unit_of_work import UnitOfWorkMiddleware
 from personal_cpa.config import get_settings
 from personal_cpa.container import Container
 from personal_cpa.exceptions import PersonalCPAError
-from personal_cpa.logger import setup_logging
+from personal_cpa.logger import setup_logging, stop_logging
 
 settings = get_settings()
 setup_logging(settings)
@@ -28,6 +41,8 @@ async def logging_middleware(request: Request, call_next: RequestResponseEndpoin
     """
     Log the request and response.
 
+    Request/response INFO logs are sampled at `LOG_REQUEST_SAMPLE_RATE` per request; failures are always logged.
+
     Args:
         request: The request object.
         call_next: The next middleware or endpoint to call.
@@ -39,12 +54,15 @@ async def logging_middleware(request: Request, call_next: RequestResponseEndpoin
         PersonalCPAError: 사용자 정의 예외 발생 시 발생
     """
     start_time = time.time()
-    logger.info(f"Request: {request.method} {request.url}")
+    sampled = logger.isEnabledFor(logging.INFO) and random.random() < settings.LOG_REQUEST_SAMPLE_RATE
+    if sampled:
+        logger.info(f"Request: {request.method} {request.url}")
 
     try:
         response = await call_next(request)
         process_time = time.time() - start_time
-        logger.info(f"Response status code: {response.status_code}, Process time: {process_time}")
+        if sampled:
+            logger.info(f"Response status code: {response.status_code}, Process time: {process_time}")
     except PersonalCPAError:
         process_time = time.time() - start_time
         logger.exception(f"Request Failed: {request.method} {request.url} Process time: {process_time}")
@@ -53,11 +71,40 @@ async def logging_middleware(request: Request, call_next: RequestResponseEndpoin
         return response
 
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Release application resources on shutdown.
+
+    Args:
+        _: The FastAPI application.
+
+    Yields:
+        None: Control while the application is serving requests.
+    """
+    yield
+    container.use_case_executor().shutdown()
+    stop_logging()
+
+
+app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
 app.container = container  # pyright: ignore reportAttributeAccessIssue
 
+if settings.DB_REQUEST_UNIT_OF_WORK:
+    app.add_middleware(UnitOfWorkMiddleware, database=container.active_database, executor=container.use_case_executor)
 app.middleware("http")(logging_middleware)
+app.add_middleware(
+    MetricsMiddleware,
+    metrics=container.http_metrics,
+    query_budget=settings.DB_QUERY_BUDGET,
+    query_budget_mode=settings.DB_QUERY_BUDGET_MODE,
+)
 error_handler.add_error_handlers(app)
 
 app.include_router(health.router, prefix="/api/v1")
+app.include_router(metrics.router, prefix="/api/v1")
 app.include_router(chart_of_account.router, prefix="/api/v1")
+app.include_router(journal.router, prefix="/api/v1")
+app.include_router(report.router, prefix="/api/v1")
+app.include_router(period_close.router, prefix="/api/v1")
+app.include_router(fx_rate.router, prefix="/api/v1")
@@ -0,0 +1,119 @@
+"""
+SQL 실행 계측 모듈.
+
+모든 엔진(비동기 엔진의 `sync_engine` 포함)의 커서 실행 이벤트를 받아,
+현재 컨텍스트에 연결된 `QueryStats`에 SQL 문 개수와 DB 시간을 누적합니다.
+요청 미들웨어가 요청마다 `track_queries()`로 집계를 시작하며, 유즈케이스 실행기는 컨텍스트를 복사해
+작업 스레드로 넘기므로 threadpool 모드에서도 같은 요청으로 집계됩니다. (executemany 는 1회로 집계)
+
+테스트에서는 `track_queries(budget=N)`으로 감싸 N+1 쿼리를 바로 실패시킬 수 있습니다.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import time
+from typing import Any, Literal
+
+from sqlalchemy import Engine, event
+
+from personal_cpa.exceptions import QueryBudgetExceededError
+
+QueryBudgetMode = Literal["warn", "error"]
+
+
+@dataclass
+class QueryStats:
+    """
+    SQL 실행 집계
+
+    Args:
+        statements: 실행한 SQL 문 수
+        seconds: SQL 실행에 걸린 누적 시간(초)
+        budget: 허용하는 최대 SQL 문 수 (None 이면 제한 없음)
+        mode: 예산 초과 시 동작 (warn: 집계만 하고 호출자가 경고, error: 초과하는 SQL 문 실행 전에 예외 발생)
+    """
+
+    statements: int = 0
+    seconds: float = 0.0
+    budget: int | None = None
+    mode: QueryBudgetMode = "warn"
+
+    @property
+    def over_budget(self) -> bool:
+        """
+        Returns:
+            SQL 문 수가 예산을 넘었는지 여부
+        """
+        return self.budget is not None and self.statements > self.budget
+
+
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries(budget: int | None = None, mode: QueryBudgetMode = "error") -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행한 SQL 문 수와 DB 시간을 집계합니다.
+
+    Args:
+        budget: 허용하는 최대 SQL 문 수 (None 이면 제한 없음)
+        mode: 예산 초과 시 동작 (warn | error)
+
+    Yields:
+        블록 실행 동안 값이 채워지는 SQL 실행 집계
+
+    Raises:
+        QueryBudgetExceededError: error 모드에서 예산을 넘는 SQL 문을 실행하려 할 경우 발생
+    """
+    stats = QueryStats(budget=budget, mode=mode)
+    token = _current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+    """
+    SQL 문 수를 세고 실행 시작 시각을 기록합니다.
+
+    Raises:
+        QueryBudgetExceededError: error 모드에서 예산을 넘는 SQL 문을 실행하려 할 경우 발생
+    """
+    stats = _current_query_stats.get()
+    if stats is None:
+        return
+
+    stats.statements += 1
+    if stats.mode == "error" and stats.over_budget:
+        raise QueryBudgetExceededError(
+            f"Query budget exceeded: {stats.statements} statements > {stats.budget} (next: {statement[:120]})"
+        )
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn: Any, *_: Any) -> None:
+    """
+    SQL 실행 시간을 누적합니다.
+    """
+    stats = _current_query_stats.get()
+    started_at = conn.info.get("query_started_at")
+    if stats is None or not started_at:
+        return
+
+    stats.seconds += time.perf_counter() - started_at.pop()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    """
+    실패한 SQL 문의 실행 시작 시각을 버려, 풀에 반환된 커넥션에 남지 않도록 합니다.
+    """
+    connection = exception_context.connection
+    started_at = connection.info.get("query_started_at") if connection is not None else None
+    if started_at:
+        started_at.pop()
@@ -0,0 +1,95 @@
+"""
+테스트 공용 fixture 모듈.
+
+MySQL 없이 저장소(repository) 계층을 검증할 수 있도록 SQLite 파일 기반 엔진과
+`Database.session()`과 동일하게 동작하는 세션 팩토리, 그리고 TTL/읽기 고정 시간 검증용 시계를 제공합니다.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from personal_cpa.adapter.outbound.database.model import balance, chart_of_account, fx_rate, journal, period_close
+from personal_cpa.adapter.outbound.database.model.base import Base
+
+# `Base.metadata`에 테이블을 등록하기 위해 불러오는 모델 모듈
+_MODEL_MODULES = (balance, chart_of_account, fx_rate, journal, period_close)
+
+
+class FakeClock:
+    """
+    테스트에서 직접 시각을 옮기는 시계
+    """
+
+    def __init__(self) -> None:
+        """
+        초기화 (0초에서 시작)
+        """
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """
+        Returns:
+            현재 시각(초)
+        """
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """
+    `now`를 바꿔 시간 경과를 흉내 내는 시계를 제공합니다.
+
+    Returns:
+        FakeClock: 0초에서 시작하는 시계
+    """
+    return FakeClock()
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    """
+    테이블이 생성된 SQLite 엔진을 제공합니다.
+
+    Args:
+        tmp_path: pytest 임시 디렉터리
+
+    Yields:
+        Engine: SQLite 엔진
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'personal_cpa.db'}")
+    Base.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    """
+    `Database.session()`과 같은 방식으로 커밋/롤백하는 세션 팩토리를 제공합니다.
+
+    Args:
+        sqlite_engine: SQLite 엔진
+
+    Returns:
+        Callable: 세션 컨텍스트 매니저 팩토리
+    """
+    factory = sessionmaker(bind=sqlite_engine, expire_on_commit=False, autoflush=False)
+
+    @contextmanager
+    def session():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    return session
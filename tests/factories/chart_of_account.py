@@ -0,0 +1,258 @@
+"""
+합성 계정과목 데이터 생성 모듈.
+
+부하 테스트와 대규모(다중 사용자) 데이터 재현을 위해 유효한 계정과목 계층을 만듭니다.
+
+- 코드 규칙: 최상위 계정과목은 "1", "2", ..., 하위 계정과목은 `상위 코드 + "_" + 접미사`
+- 카테고리: 최상위 계정과목은 `AccountType`을 순서대로 돌아가며 사용하고, 하위 계정과목은 상위 계정과목을 따름
+- 순서: 사용자별로 깊이 순(너비 우선)이므로 상위 계정과목이 항상 하위 계정과목보다 앞에 옴
+
+생성한 계정과목은 미리 발급한 ID로 DB에 일괄 INSERT 하거나, 사용자 ID를 더한 내보내기 형식(NDJSON)으로 씁니다.
+
+    PYTHONPATH=./src python -m tests.factories.chart_of_account --users 10000 --fan-out 4 --depth 2 --ndjson coa.ndjson
+    PYTHONPATH=./src python -m tests.factories.chart_of_account --users 10000 --fan-out 4 --depth 2 --database
+"""
+
+import argparse
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from itertools import batched
+from pathlib import Path
+import random
+import sys
+import time
+from typing import TextIO
+
+import pydantic_core
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import to_export_row
+from personal_cpa.adapter.outbound.database.mapper.chart_of_account import ChartOfAccountMapper
+from personal_cpa.adapter.outbound.database.model.chart_of_account import ChartOfAccountEntity
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+SessionFactory = Callable[[], AbstractContextManager[Session]]
+
+CATEGORIES = tuple(AccountType)
+
+
+@dataclass(frozen=True)
+class ChartOfAccountHierarchySpec:
+    """
+    합성 계정과목 계층 설정
+
+    사용자마다 `roots * (1 + fan_out + ... + fan_out ** depth)`개의 계정과목을 만듭니다.
+
+    Args:
+        users: 사용자 수
+        roots: 사용자별 최상위 계정과목 수
+        fan_out: 계정과목별 하위 계정과목 수
+        depth: 최대 깊이 (0이면 최상위 계정과목만)
+        hidden_ratio: 숨김 계정과목 비율 (0 ~ 1)
+        first_user_id: 첫 사용자 ID (사용자 ID는 연속)
+        seed: 숨김 여부 난수 시드
+
+    Raises:
+        ValueError: 개수가 범위를 벗어나거나 숨김 비율이 0 ~ 1이 아닐 경우 발생
+    """
+
+    users: int = 1
+    roots: int = len(CATEGORIES)
+    fan_out: int = 3
+    depth: int = 2
+    hidden_ratio: float = 0.0
+    first_user_id: int = 1
+    seed: int = 0
+
+    def __post_init__(self):
+        """
+        설정 값의 범위를 검사합니다.
+        """
+        if self.users < 1 or self.roots < 1 or self.first_user_id < 1:
+            raise ValueError("users, roots and first_user_id must be at least 1.")
+        if self.fan_out < 0 or self.depth < 0:
+            raise ValueError("fan_out and depth must not be negative.")
+        if not 0 <= self.hidden_ratio <= 1:
+            raise ValueError(f"hidden_ratio must be between 0 and 1. (Currently: {self.hidden_ratio})")
+
+    @property
+    def accounts_per_user(self) -> int:
+        """
+        Returns:
+            사용자별 계정과목 수
+        """
+        return self.roots * sum(self.fan_out**level for level in range(self.depth + 1))
+
+    @property
+    def total_accounts(self) -> int:
+        """
+        Returns:
+            전체 계정과목 수
+        """
+        return self.users * self.accounts_per_user
+
+
+def generate_chart_of_accounts(spec: ChartOfAccountHierarchySpec, first_id: int | None = 1) -> Iterator[ChartOfAccount]:
+    """
+    설정에 따라 사용자 순, 사용자 안에서는 깊이 순으로 계정과목을 생성합니다.
+
+    Args:
+        spec: 계층 설정
+        first_id: 첫 계정과목 ID (연속으로 발급하고 상위 계정과목 ID도 채움) | None (ID 없이 생성)
+
+    Yields:
+        계정과목
+    """
+    rng = random.Random(spec.seed)
+    next_id = first_id
+    for user_id in range(spec.first_user_id, spec.first_user_id + spec.users):
+        level: list[tuple[str, AccountType, int | None]] = [
+            (str(index), CATEGORIES[(index - 1) % len(CATEGORIES)], None) for index in range(1, spec.roots + 1)
+        ]
+        for depth in range(spec.depth + 1):
+            children: list[tuple[str, AccountType, int | None]] = []
+            for code, category, parent_id in level:
+                account_id = next_id
+                if next_id is not None:
+                    next_id += 1
+                yield ChartOfAccount(
+                    user_id=user_id,
+                    code=code,
+                    name=f"account {code}",
+                    category=category,
+                    description=None,
+                    parent_chart_of_account_id=parent_id,
+                    is_hidden=rng.random() < spec.hidden_ratio,
+                    id=account_id,
+                )
+                if depth < spec.depth:
+                    children.extend((f"{code}_{suffix}", category, account_id) for suffix in range(1, spec.fan_out + 1))
+            level = children
+
+
+def next_chart_of_account_id(session_factory: SessionFactory) -> int:
+    """
+    Args:
+        session_factory: 세션 팩토리
+
+    Returns:
+        저장된 계정과목과 겹치지 않는 첫 ID
+    """
+    with session_factory() as session:
+        return (session.scalar(select(func.max(ChartOfAccountEntity.id))) or 0) + 1
+
+
+def insert_chart_of_accounts(
+    session_factory: SessionFactory, chart_of_accounts: Iterable[ChartOfAccount], batch_size: int = 10_000
+) -> int:
+    """
+    ID가 채워진 계정과목을 `batch_size`행씩 INSERT 문(executemany)으로 저장합니다. (한 트랜잭션)
+
+    ORM 객체와 발급 ID 조회를 거치지 않으므로 저장소의 일괄 저장보다 빠르며,
+    ID는 `next_chart_of_account_id`로 구한 값부터 발급해야 합니다.
+
+    Args:
+        session_factory: 세션 팩토리
+        chart_of_accounts: ID가 채워진 계정과목 (상위 계정과목이 하위 계정과목보다 앞에 있어야 함)
+        batch_size: INSERT 문 하나의 행 수
+
+    Returns:
+        저장한 계정과목 수
+
+    Raises:
+        ValueError: ID가 없는 계정과목이 있을 경우 발생
+    """
+    count = 0
+    with session_factory() as session:
+        for batch in batched(chart_of_accounts, batch_size, strict=False):
+            rows = []
+            for chart_of_account in batch:
+                if chart_of_account.id is None:
+                    raise ValueError(f"chart of account id is required. (code: {chart_of_account.code})")
+                rows.append({"id": chart_of_account.id, **ChartOfAccountMapper.to_row(chart_of_account)})
+            session.execute(insert(ChartOfAccountEntity), rows)
+            count += len(rows)
+    return count
+
+
+def write_ndjson(chart_of_accounts: Iterable[ChartOfAccount], stream: TextIO) -> int:
+    """
+    계정과목을 내보내기 형식에 사용자 ID를 더한 JSON 객체로 한 줄씩 씁니다.
+
+    사용자 ID로 나눈 각 부분은 그대로 가져오기(`POST /chart_of_accounts/import`) 본문으로 사용할 수 있습니다.
+
+    Args:
+        chart_of_accounts: 계정과목
+        stream: 출력 스트림
+
+    Returns:
+        쓴 줄 수
+    """
+    count = 0
+    for batch in batched(chart_of_accounts, 10_000, strict=False):
+        stream.write(
+            "".join(
+                pydantic_core.to_json({"user_id": account.user_id, **to_export_row(account)}).decode() + "\n"
+                for account in batch
+            )
+        )
+        count += len(batch)
+    return count
+
+
+def main(argv: list[str]) -> int:
+    """
+    합성 계정과목을 생성하여 NDJSON 파일로 쓰거나 설정(config.yml)의 데이터베이스에 저장합니다.
+
+    Args:
+        argv: 명령행 인자
+
+    Returns:
+        종료 코드
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic chart of account hierarchies")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--roots", type=int, default=len(CATEGORIES))
+    parser.add_argument("--fan-out", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--hidden-ratio", type=float, default=0.0)
+    parser.add_argument("--first-user-id", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--ndjson", type=Path, help="output file ('-' for stdout)")
+    output.add_argument("--database", action="store_true", help="insert into the configured database")
+    args = parser.parse_args(argv)
+
+    spec = ChartOfAccountHierarchySpec(
+        users=args.users,
+        roots=args.roots,
+        fan_out=args.fan_out,
+        depth=args.depth,
+        hidden_ratio=args.hidden_ratio,
+        first_user_id=args.first_user_id,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    if args.database:
+        from personal_cpa.config import get_settings
+        from personal_cpa.database import Database
+
+        database = Database(get_settings())
+        count = insert_chart_of_accounts(
+            database.session, generate_chart_of_accounts(spec, next_chart_of_account_id(database.session))
+        )
+    elif str(args.ndjson) == "-":
+        count = write_ndjson(generate_chart_of_accounts(spec, first_id=None), sys.stdout)
+    else:
+        with args.ndjson.open("w", encoding="utf-8") as stream:
+            count = write_ndjson(generate_chart_of_accounts(spec, first_id=None), stream)
+
+    print(f"{count} chart of accounts in {time.perf_counter() - started:.1f}s", file=sys.stderr)  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
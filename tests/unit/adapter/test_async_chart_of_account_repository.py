@@ -0,0 +1,52 @@
+"""
+비동기 계정과목 저장소 테스트 모듈.
+
+aiosqlite 기반 AsyncDatabase 위에서 비동기 저장소와 서비스가
+동기 구현과 같은 결과를 내는지 검증합니다.
+"""
+
+import asyncio
+
+from sqlalchemy import create_engine
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import AsyncChartOfAccountRepository
+from personal_cpa.application.port.input.command.chart_of_account import CreateChartOfAccountCommand
+from personal_cpa.application.service.chart_of_account import AsyncChartOfAccountService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _command(code: str, parent_code: str | None = None) -> CreateChartOfAccountCommand:
+    return CreateChartOfAccountCommand(
+        code=code, name=f"계정 {code}", category=AccountType.ASSET, description=None, parent_code=parent_code
+    )
+
+
+def test_async_service_creates_and_reads_chart_of_accounts(tmp_path):
+    """
+    Test Case: 비동기 서비스로 생성한 계정과목을 트리/상세 조회
+    """
+    database_path = tmp_path / "personal_cpa.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{database_path}"))
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(database_path))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        service = AsyncChartOfAccountService(AsyncChartOfAccountRepository(database.session))
+        try:
+            created = await service.create_chart_of_accounts(1, [_command("1"), _command("1_1", "1")])
+            trees = await service.get_chart_of_accounts(1)
+            found = await service.get_chart_of_account_by_code(1, "1_1")
+        finally:
+            await database.dispose()
+        return created, trees, found
+
+    created, trees, found = asyncio.run(scenario())
+
+    assert created[1].parent_chart_of_account_id == created[0].id
+    assert [tree.code for tree in trees] == ["1"]
+    assert [child.code for child in trees[0].children] == ["1_1"]
+    assert found is not None
+    assert found.id == created[1].id
@@ -0,0 +1,196 @@
+"""
+AccountBalanceRepository 테스트 모듈.
+
+SQLite 엔진 위에서 분개 기표 시의 잔액 갱신, 잔액 조회, 정합성 검사/수정 동작을 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import event, update
+
+from personal_cpa.adapter.outbound.database.model.balance import AccountBalanceEntity
+from personal_cpa.adapter.outbound.database.repository.balance import (
+    AccountBalanceRepository,
+    AsyncAccountBalanceRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import AsyncJournalRepository, JournalRepository
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.balance import AccountBalanceService, AsyncAccountBalanceService
+from personal_cpa.application.service.journal import AsyncJournalService, JournalService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.balance import ALL_PERIODS
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _chart_of_account(code: str, user_id: int = 1) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=user_id,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+    )
+
+
+def _command(entry_date: date, debit_id: int, credit_id: int, amount: int) -> PostJournalEntryCommand:
+    return PostJournalEntryCommand(
+        entry_date=entry_date,
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+        ],
+    )
+
+
+@pytest.fixture
+def accounts(session_factory):
+    """
+    유저 1의 계정과목 계층 (1 > 1_1 > 1_1_1, 1 > 1_2, 2) 을 저장합니다.
+
+    Returns:
+        코드별 계정과목 ID
+    """
+    saved = ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+        [_chart_of_account(code) for code in ("1", "1_1", "1_1_1", "1_2", "2")]
+    )
+    return {chart_of_account.code: chart_of_account.id for chart_of_account in saved}
+
+
+def _post_sample_entries(session_factory, accounts, rollup_balances: bool = True) -> None:
+    JournalService(JournalRepository(session_factory), rollup_balances=rollup_balances).post_journal_entries(
+        1,
+        [
+            _command(date(2026, 1, 5), accounts["1_1_1"], accounts["2"], 1000),
+            _command(date(2026, 1, 20), accounts["1_2"], accounts["2"], 300),
+            _command(date(2026, 2, 1), accounts["1_1_1"], accounts["1_2"], 50),
+        ],
+    )
+
+
+def test_post_journal_entries_rolls_balances_up_to_ancestors(session_factory, accounts):
+    """
+    Test Case: 기표한 분개 줄을 계정과목 자신과 모든 상위 계정과목의 월별/전체 기간 잔액에 더함
+    """
+    _post_sample_entries(session_factory, accounts)
+    _post_sample_entries(session_factory, accounts)
+    service = AccountBalanceService(AccountBalanceRepository(session_factory))
+
+    root = service.get_balance(1, "1", ALL_PERIODS)
+    assert root is not None
+    assert (root.chart_of_account_id, root.debit, root.credit, root.balance) == (accounts["1"], 2700, 100, 2600)
+
+    child = service.get_balance(1, "1_1", 202601)
+    assert child is not None
+    assert (child.debit, child.credit) == (2000, 0)
+
+    credit_account = service.get_balance(1, "2", 202602)
+    assert credit_account is not None
+    assert (credit_account.debit, credit_account.credit) == (0, 0)
+    assert service.get_balance(1, "2", ALL_PERIODS).balance == -2600
+
+
+def test_get_balance_reads_one_row_and_reports_missing_account(sqlite_engine, session_factory, accounts):
+    """
+    Test Case: 잔액 조회는 하위 계정과목 수와 무관하게 쿼리 1개이며, 없는 계정과목은 None, 잔액 행이 없으면 0
+    """
+    _post_sample_entries(session_factory, accounts)
+    service = AccountBalanceService(AccountBalanceRepository(session_factory))
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        balance = service.get_balance(1, "1", 202602)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert balance is not None
+    assert balance.balance == 0
+    assert service.get_balance(1, "9", ALL_PERIODS) is None
+    assert service.get_balance(2, "1", ALL_PERIODS) is None
+    with pytest.raises(ValueError, match="period must be YYYYMM"):
+        service.get_balance(1, "1", 202613)
+
+
+def test_check_balances_detects_and_repairs_tampered_balance(session_factory, accounts):
+    """
+    Test Case: 분개 줄로 다시 계산한 잔액과 다른 저장된 잔액을 찾고, 수정 요청 시 다시 계산한 잔액으로 바꿈
+    """
+    _post_sample_entries(session_factory, accounts)
+    service = AccountBalanceService(AccountBalanceRepository(session_factory))
+    assert service.check_balances(1, repair=False).consistent
+
+    with session_factory() as session:
+        session.execute(
+            update(AccountBalanceEntity)
+            .where(AccountBalanceEntity.chart_of_account_id == accounts["1_1"])
+            .where(AccountBalanceEntity.period == 202601)
+            .values(debit=1)
+        )
+
+    checked = service.check_balances(1, repair=False)
+    assert not checked.repaired
+    assert [(mismatch.chart_of_account_id, mismatch.period) for mismatch in checked.mismatches] == [
+        (accounts["1_1"], 202601)
+    ]
+    assert (checked.mismatches[0].expected_debit, checked.mismatches[0].actual_debit) == (1000, 1)
+
+    repaired = service.check_balances(1, repair=True)
+    assert repaired.repaired
+    assert service.check_balances(1, repair=False).consistent
+    assert service.get_balance(1, "1_1", 202601).debit == 1000
+
+
+def test_check_balances_rebuilds_balances_posted_without_rollup(session_factory, accounts):
+    """
+    Test Case: 잔액 갱신 없이 기표한 분개를 정합성 검사 수정으로 다시 계산
+    """
+    _post_sample_entries(session_factory, accounts, rollup_balances=False)
+    service = AccountBalanceService(AccountBalanceRepository(session_factory))
+    assert service.get_balance(1, "1", ALL_PERIODS).debit == 0
+
+    checked = service.check_balances(1, repair=True)
+
+    assert checked.repaired
+    assert checked.checked == len(checked.mismatches)
+    assert service.get_balance(1, "1", ALL_PERIODS).debit == 1350
+    assert service.check_balances(1, repair=False).consistent
+
+
+def test_async_service_reads_and_checks_balances(tmp_path, accounts):
+    """
+    Test Case: 비동기 서비스로 기표한 분개의 잔액 조회 및 정합성 검사
+    """
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "personal_cpa.db"))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        journal_service = AsyncJournalService(AsyncJournalRepository(database.session))
+        service = AsyncAccountBalanceService(AsyncAccountBalanceRepository(database.session))
+        try:
+            await journal_service.post_journal_entries(
+                1, [_command(date(2026, 3, 1), accounts["1_1_1"], accounts["2"], 700)]
+            )
+            balance = await service.get_balance(1, "1", 202603)
+            checked = await service.check_balances(1, repair=False)
+        finally:
+            await database.dispose()
+        return balance, checked
+
+    balance, checked = asyncio.run(scenario())
+
+    assert balance is not None
+    assert balance.debit == 700
+    assert checked.consistent
+    assert checked.checked == 8
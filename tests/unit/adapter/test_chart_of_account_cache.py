@@ -0,0 +1,179 @@
+"""
+계정과목 캐시 테스트 모듈.
+
+LRU 캐시의 TTL/용량 정책과, 캐시 저장소가 조회를 캐시에서 처리하고
+쓰기 시 유저별 캐시를 무효화하는지 검증합니다.
+"""
+
+from sqlalchemy import event
+
+from personal_cpa.adapter.outbound.cache.chart_of_account import CachedChartOfAccountRepository
+from personal_cpa.adapter.outbound.cache.generation import CacheGenerations
+from personal_cpa.adapter.outbound.cache.lru import LRUCache
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.port.output.cache import CacheStats
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+class FakeClock:
+    """
+    테스트용 시계
+    """
+
+    def __init__(self):
+        """
+        초기화 (0초에서 시작)
+        """
+        self.now = 0.0
+
+    def __call__(self):
+        """
+        Returns:
+            현재 시각(초)
+        """
+        return self.now
+
+
+def _chart_of_account(code: str, user_id: int = 1) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=user_id,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+    )
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """
+    Test Case: 최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거
+    """
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == CacheStats(hits=3, misses=1, evictions=1, expirations=0, size=2)
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    """
+    Test Case: TTL이 지난 항목은 미스로 처리하고 제거
+    """
+    clock = FakeClock()
+    cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, expirations=1, size=0)
+
+
+def test_lru_cache_with_zero_size_stores_nothing():
+    """
+    Test Case: 최대 크기가 0이면 캐시 비활성화
+    """
+    cache = LRUCache(max_size=0, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_cached_repository_serves_steady_state_reads_without_queries(sqlite_engine, session_factory):
+    """
+    Test Case: 캐시된 유저의 목록/상세 조회는 DB 쿼리 없이 처리
+    """
+    repository = CachedChartOfAccountRepository(
+        ChartOfAccountRepository(session_factory), LRUCache(max_size=10, ttl_seconds=60)
+    )
+    repository.bulk_insert_chart_of_accounts([_chart_of_account("1"), _chart_of_account("2")])
+    repository.find_chart_of_accounts(1)
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(10):
+            assert len(repository.find_chart_of_accounts(1)) == 2
+        assert repository.find_chart_of_account_by_code(1, "2").code == "2"
+        assert [coa.code for coa in repository.find_chart_of_accounts_by_codes(1, ["1", "9"])] == ["1"]
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    assert statements == []
+
+
+def test_cached_repository_invalidates_user_on_write(session_factory):
+    """
+    Test Case: 계정과목 생성 시 해당 유저의 캐시만 무효화
+    """
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+    repository = CachedChartOfAccountRepository(ChartOfAccountRepository(session_factory), cache)
+    repository.bulk_insert_chart_of_accounts([_chart_of_account("1"), _chart_of_account("1", user_id=2)])
+    repository.find_chart_of_accounts(1)
+    repository.find_chart_of_accounts(2)
+
+    repository.save_chart_of_accounts([_chart_of_account("2")])
+
+    assert cache.get(CachedChartOfAccountRepository.cache_key(1)) is None
+    assert cache.get(CachedChartOfAccountRepository.cache_key(2)) is not None
+    assert {coa.code for coa in repository.find_chart_of_accounts(1)} == {"1", "2"}
+
+
+def test_cached_repository_does_not_refill_with_list_read_before_invalidation(session_factory, monkeypatch):
+    """
+    Test Case: 캐시 미스 후 원본을 읽는 동안 다른 요청이 커밋하고 무효화하면, 읽은 목록을 캐시에 저장하지 않음
+    """
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+    generations = CacheGenerations()
+    database_repository = ChartOfAccountRepository(session_factory)
+    reader = CachedChartOfAccountRepository(database_repository, cache, generations=generations)
+    writer = CachedChartOfAccountRepository(ChartOfAccountRepository(session_factory), cache, generations=generations)
+    writer.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+
+    find_chart_of_accounts = database_repository.find_chart_of_accounts
+
+    def find_then_concurrent_write(user_id):
+        stale = find_chart_of_accounts(user_id)
+        writer.save_chart_of_accounts([_chart_of_account("2")])
+        return stale
+
+    monkeypatch.setattr(database_repository, "find_chart_of_accounts", find_then_concurrent_write)
+    assert [coa.code for coa in reader.find_chart_of_accounts(1)] == ["1"]
+    monkeypatch.undo()
+
+    assert cache.get(CachedChartOfAccountRepository.cache_key(1)) is None
+    assert {coa.code for coa in reader.find_chart_of_accounts(1)} == {"1", "2"}
+
+
+def test_cached_repository_subtree_and_ancestors_match_database(session_factory):
+    """
+    Test Case: 캐시에서 처리한 하위/상위 계정과목 조회 결과가 DB 조회 결과와 같음
+    """
+    database_repository = ChartOfAccountRepository(session_factory)
+    repository = CachedChartOfAccountRepository(database_repository, LRUCache(max_size=10, ttl_seconds=60))
+    repository.bulk_insert_chart_of_accounts(
+        [_chart_of_account(code) for code in ["1", "1_1", "1_10", "1_1_1", "1_1_1_1", "2"]]
+    )
+    repository.find_chart_of_accounts(1)
+
+    for code, max_depth in [("1", None), ("1_1", None), ("1_1", 1), ("9", None)]:
+        cached = repository.find_chart_of_account_subtree(1, code, max_depth)
+        stored = database_repository.find_chart_of_account_subtree(1, code, max_depth)
+        assert [coa.code for coa in cached] == [coa.code for coa in stored]
+
+    cached = repository.find_chart_of_account_ancestors(1, "1_1_1_1")
+    assert [coa.code for coa in cached] == ["1", "1_1", "1_1_1"]
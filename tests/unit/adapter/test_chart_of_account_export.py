@@ -0,0 +1,158 @@
+"""
+계정과목 내보내기 테스트 모듈.
+
+서버 측 커서 스트리밍 조회, 실행기의 묶음 스트리밍, 프레젠터의 NDJSON/CSV 인코딩을 함께 사용하여
+100,000개 계정과목을 내보낼 때 메모리 사용량이 일정한지와 중단 시 이터레이터가 닫히는지 검증합니다.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import ChartOfAccountPresenter
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+ROWS = 100_000
+
+
+def _chart_of_account(code: str) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.EXPENSE,
+        description="설명",
+        parent_chart_of_account_id=None,
+    )
+
+
+async def _export(executor: UseCaseExecutor, repository: ChartOfAccountRepository, export_format: str) -> list[bytes]:
+    presenter = ChartOfAccountPresenter(fast_json=False)
+    chunks = executor.stream(repository.stream_chart_of_accounts, 1)
+    return [body async for body in presenter.export(chunks, export_format)]
+
+
+def test_export_streams_100k_rows_in_bounded_memory(session_factory):
+    """
+    Test Case: 100,000개 계정과목(NDJSON 8MB 이상)을 내보내는 동안 최대 메모리 사용량이 4MB 미만으로 유지됨
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    repository.bulk_insert_chart_of_accounts(
+        [_chart_of_account("5"), *(_chart_of_account(f"5_{index}") for index in range(ROWS - 1))]
+    )
+    executor = UseCaseExecutor(mode="threadpool", max_workers=2)
+
+    async def consume() -> tuple[int, int]:
+        lines = size = 0
+        chunks = executor.stream(repository.stream_chart_of_accounts, 1)
+        async for body in ChartOfAccountPresenter(fast_json=False).export(chunks, "ndjson"):
+            lines += body.count(b"\n")
+            size += len(body)
+        return lines, size
+
+    tracemalloc.start()
+    try:
+        lines, size = asyncio.run(consume())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        executor.shutdown()
+
+    assert lines == ROWS
+    assert size > 8_000_000
+    assert peak < 4_000_000
+
+
+def test_export_formats_ndjson_and_csv(session_factory):
+    """
+    Test Case: NDJSON/CSV 내보내기는 코드순으로 생성 요청과 같은 필드를 담음
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    repository.bulk_insert_chart_of_accounts([_chart_of_account("5"), _chart_of_account("5_1")])
+    executor = UseCaseExecutor(mode="inline", max_workers=1)
+
+    ndjson = b"".join(asyncio.run(_export(executor, repository, "ndjson"))).decode()
+    rows = list(csv.DictReader(io.StringIO(b"".join(asyncio.run(_export(executor, repository, "csv"))).decode())))
+
+    assert [json.loads(line) for line in ndjson.splitlines()] == [
+        {
+            "code": "5",
+            "name": "계정 5",
+            "category": "EXPENSE",
+            "description": "설명",
+            "parent_code": None,
+            "is_hidden": False,
+            "currency": "KRW",
+        },
+        {
+            "code": "5_1",
+            "name": "계정 5_1",
+            "category": "EXPENSE",
+            "description": "설명",
+            "parent_code": "5",
+            "is_hidden": False,
+            "currency": "KRW",
+        },
+    ]
+    assert [(row["code"], row["parent_code"], row["category"]) for row in rows] == [
+        ("5", "", "EXPENSE"),
+        ("5_1", "5", "EXPENSE"),
+    ]
+
+
+def test_threadpool_stream_closes_iterator_when_consumer_stops():
+    """
+    Test Case: 소비가 중단되면 작업 스레드가 이터레이터를 닫아 DB 연결을 반환함
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=1)
+    closed = []
+
+    def stream():
+        try:
+            yield from range(100_000)
+        finally:
+            closed.append(True)
+
+    async def consume_first_chunk() -> list[int]:
+        chunks = executor.stream(stream, chunk_size=10)
+        try:
+            return await anext(chunks)
+        finally:
+            await chunks.aclose()
+
+    try:
+        first = asyncio.run(consume_first_chunk())
+    finally:
+        executor.shutdown()
+
+    assert first == list(range(10))
+    assert closed == [True]
+    assert executor.stats().running == 0
+
+
+def test_threadpool_stream_propagates_errors():
+    """
+    Test Case: 작업 스레드에서 발생한 오류는 소비하는 쪽에서 다시 발생
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=1)
+
+    def stream():
+        yield 1
+        raise ValueError("broken stream")
+
+    async def consume() -> None:
+        async for _ in executor.stream(stream):
+            pass
+
+    try:
+        with pytest.raises(ValueError, match="broken stream"):
+            asyncio.run(consume())
+    finally:
+        executor.shutdown()
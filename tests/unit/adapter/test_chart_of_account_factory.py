@@ -0,0 +1,109 @@
+"""
+합성 계정과목 생성기 테스트 모듈.
+
+생성한 계층이 코드 규칙과 카테고리 상속을 지키는지, 미리 발급한 ID로 SQLite 에 일괄 저장한 결과를
+저장소가 그대로 트리로 읽는지, NDJSON 출력을 가져오기 파서가 오류 없이 읽는지 검증합니다.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+import io
+import json
+
+import pytest
+
+from personal_cpa.adapter.inbound.api.parser.chart_of_account import parse_import_rows
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from tests.factories.chart_of_account import (
+    ChartOfAccountHierarchySpec,
+    generate_chart_of_accounts,
+    insert_chart_of_accounts,
+    next_chart_of_account_id,
+    write_ndjson,
+)
+
+
+def test_generated_hierarchy_follows_code_rule_and_inherits_category():
+    """
+    Test Case: 하위 계정과목 코드는 상위 코드 + "_" + 접미사, 카테고리와 상위 ID는 상위 계정과목을 따르고
+    상위 계정과목이 항상 먼저 생성됨
+    """
+    spec = ChartOfAccountHierarchySpec(users=3, roots=6, fan_out=3, depth=3, first_user_id=10)
+    accounts = list(generate_chart_of_accounts(spec, first_id=100))
+
+    assert len(accounts) == spec.total_accounts == 3 * 6 * (1 + 3 + 9 + 27)
+    assert [account.id for account in accounts] == list(range(100, 100 + len(accounts)))
+    assert {account.user_id for account in accounts} == {10, 11, 12}
+
+    seen = {}
+    for account in accounts:
+        if account.parent_code is None:
+            assert account.category == list(AccountType)[(int(account.code) - 1) % len(AccountType)]
+            assert account.parent_chart_of_account_id is None
+        else:
+            parent = seen[account.user_id, account.parent_code]
+            assert account.parent_chart_of_account_id == parent.id
+            assert account.category == parent.category
+        assert account.depth <= spec.depth
+        seen[account.user_id, account.code] = account
+
+
+def test_hidden_ratio_is_seeded_and_spec_is_validated():
+    """
+    Test Case: 숨김 비율은 시드에 따라 재현되고 대략 설정 비율을 따르며, 잘못된 설정은 ValueError
+    """
+    spec = ChartOfAccountHierarchySpec(users=20, fan_out=4, depth=2, hidden_ratio=0.2, seed=7)
+    hidden = [account.is_hidden for account in generate_chart_of_accounts(spec)]
+
+    assert hidden == [account.is_hidden for account in generate_chart_of_accounts(spec)]
+    assert 0.15 < sum(hidden) / len(hidden) < 0.25
+
+    for invalid in ({"users": 0}, {"fan_out": -1}, {"hidden_ratio": 1.5}):
+        with pytest.raises(ValueError):
+            ChartOfAccountHierarchySpec(**invalid)
+
+
+def test_insert_with_preassigned_ids_reads_back_as_tree(session_factory):
+    """
+    Test Case: 미리 발급한 ID로 저장한 계정과목을 저장소가 같은 트리로 읽고, 다음 ID로 다른 사용자를 이어서 저장
+    """
+    spec = ChartOfAccountHierarchySpec(users=2, roots=2, fan_out=2, depth=2)
+    first = insert_chart_of_accounts(session_factory, generate_chart_of_accounts(spec), batch_size=5)
+    more = ChartOfAccountHierarchySpec(users=1, roots=1, fan_out=1, depth=1, first_user_id=3)
+    next_id = next_chart_of_account_id(session_factory)
+    second = insert_chart_of_accounts(session_factory, generate_chart_of_accounts(more, next_id))
+
+    assert (first, second, next_id) == (28, 2, 29)
+
+    service = ChartOfAccountService(ChartOfAccountRepository(session_factory))
+    trees = service.get_chart_of_accounts(2)
+    assert [tree.code for tree in trees] == ["1", "2"]
+    assert [child.code for child in trees[0].children] == ["1_1", "1_2"]
+    assert [child.code for child in trees[0].children[1].children] == ["1_2_1", "1_2_2"]
+    assert [tree.children[0].code for tree in service.get_chart_of_accounts(3)] == ["1_1"]
+
+    with pytest.raises(ValueError, match="id is required"):
+        insert_chart_of_accounts(session_factory, generate_chart_of_accounts(more, first_id=None))
+
+
+def test_ndjson_lines_are_importable_per_user():
+    """
+    Test Case: NDJSON 한 줄은 사용자 ID와 내보내기 형식 필드를 가지며, 가져오기 파서가 오류 없이 읽음
+    """
+    spec = ChartOfAccountHierarchySpec(users=2, fan_out=2, depth=2, hidden_ratio=0.5)
+    stream = io.StringIO()
+    count = write_ndjson(generate_chart_of_accounts(spec, first_id=None), stream)
+
+    lines = stream.getvalue().splitlines()
+    assert count == len(lines) == spec.total_accounts
+    first_user = "\n".join(line for line in lines if json.loads(line)["user_id"] == 1).encode()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield first_user
+
+    rows = asyncio.run(parse_import_rows(chunks(), "ndjson"))
+    assert len(rows) == spec.accounts_per_user
+    assert all(row.error is None for row in rows)
+    assert rows[5].command.parent_code == "1"
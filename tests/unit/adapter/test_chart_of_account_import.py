@@ -0,0 +1,179 @@
+"""
+계정과목 가져오기 테스트 모듈.
+
+조각 단위로 들어오는 NDJSON/CSV 본문의 점진적 파싱(여러 줄 값, 카테고리 이름, 행별 오류)과
+내보내기 파일을 그대로 가져와 SQLite 저장소에 묶음 단위로 저장하는 흐름을 검증합니다.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.parser.chart_of_account import parse_import_rows
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import ChartOfAccountPresenter
+from personal_cpa.adapter.inbound.api.routes import chart_of_account
+from personal_cpa.adapter.inbound.api.unit_of_work import UnitOfWorkMiddleware
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.config import AppSettings
+from personal_cpa.container import Container
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _parse(body: bytes, import_format: str, size: int = 7):
+    return asyncio.run(parse_import_rows(_chunks(body, size), import_format))
+
+
+def test_parse_ndjson_rows_across_chunk_boundaries():
+    """
+    Test Case: 조각 경계와 무관하게 행을 나누고, 빈 행을 건너뛰며, 잘못된 행은 행 번호와 함께 오류로 반환
+    """
+    body = "\n".join(
+        [
+            '{"code": "1", "name": "자산", "category": "ASSET", "description": ""}',
+            "",
+            '{"code": "1_1", "name": "현금", "category": 1, "description": "지갑", "parent_code": "1"}',
+            '{"code": "9", "name": "잘못된 카테고리", "category": "UNKNOWN", "description": null}',
+            "[1, 2]",
+            "{not json",
+        ]
+    ).encode()
+
+    rows = _parse(body, "ndjson")
+
+    assert [(row.line, row.code, row.error is None) for row in rows] == [
+        (1, "1", True),
+        (3, "1_1", True),
+        (4, "9", False),
+        (5, None, False),
+        (6, None, False),
+    ]
+    assert rows[0].command.category is AccountType.ASSET
+    assert rows[0].command.description is None
+    assert rows[1].command.parent_code == "1"
+    assert rows[2].error.startswith("category:")
+
+
+def test_parse_csv_rows_with_quoted_newlines_and_bom():
+    """
+    Test Case: BOM 과 CRLF 를 허용하고, 따옴표 안의 줄바꿈이 있는 행은 시작 줄 번호로 보고
+    """
+    body = (
+        "\ufeffcode,name,category,description,parent_code,is_hidden\r\n"
+        '1,자산,ASSET,"여러 줄\r\n설명",,False\r\n'
+        "1_1,현금,1,,1,False\r\n"
+        "1_2,카드,,,1,False\r\n"
+    ).encode()
+
+    rows = _parse(body, "csv", size=5)
+
+    assert [(row.line, row.code) for row in rows] == [(2, "1"), (4, "1_1"), (5, "1_2")]
+    assert rows[0].command.description == "여러 줄\n설명"
+    assert rows[1].command.description is None
+    assert rows[2].command is None
+    assert rows[2].error
+
+
+def test_parse_csv_requires_header_columns():
+    """
+    Test Case: 필수 컬럼이 빠진 헤더나 빈 본문은 파일 오류
+    """
+    with pytest.raises(ValueError, match="missing required columns: category"):
+        _parse(b"code,name\n1,asset\n", "csv")
+
+    with pytest.raises(ValueError, match="CSV header is required"):
+        _parse(b"", "csv")
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_file_imports_in_shuffled_order(session_factory, export_format):
+    """
+    Test Case: 하위 계정과목이 먼저 나오도록 뒤집은 내보내기 파일을 가져와도 상위 계정과목 ID가 연결됨
+    """
+    source = ChartOfAccountRepository(session_factory)
+    service = ChartOfAccountService(source, import_chunk_size=3)
+    codes = ["1", "1_1", "1_1_1", "1_2", "2", "2_1"]
+    rows = asyncio.run(
+        parse_import_rows(_chunks("\n".join(_ndjson(code) for code in reversed(codes)).encode(), 11), "ndjson")
+    )
+    result = service.import_chart_of_accounts(1, rows)
+    assert (result.created, result.chunks, result.failed) == (6, 2, 0)
+
+    async def export() -> bytes:
+        chunks = UseCaseExecutor(mode="inline", max_workers=0).stream(source.stream_chart_of_accounts, 1)
+        return b"".join([body async for body in ChartOfAccountPresenter(fast_json=False).export(chunks, export_format)])
+
+    exported = asyncio.run(export())
+    lines = exported.splitlines()
+    body = b"\n".join(lines[:1] + lines[:0:-1]) if export_format == "csv" else b"\n".join(reversed(lines))
+
+    result = service.import_chart_of_accounts(2, _parse(body, export_format))
+
+    assert (result.created, result.failed) == (6, 0)
+    stored = {coa.code: coa for coa in source.find_chart_of_accounts(2)}
+    assert stored.keys() == set(codes)
+    assert stored["1_1_1"].parent_chart_of_account_id == stored["1_1"].id
+    assert stored["2_1"].parent_chart_of_account_id == stored["2"].id
+
+
+def _ndjson(code: str) -> str:
+    parent_code = code.rpartition("_")[0]
+    return (
+        f'{{"code": "{code}", "name": "계정 {code}", "category": "EXPENSE", '
+        f'"description": null, "parent_code": "{parent_code}"}}'
+    )
+
+
+def test_import_route_commits_each_chunk_inside_request_unit_of_work(tmp_path, session_factory, monkeypatch):
+    """
+    Test Case: 요청 단위 작업이 켜져 있어도 가져오기는 묶음마다 커밋하여, 중간에 실패해도 앞 묶음은 남음
+    """
+    container = Container()
+    container.app_settings.override(
+        providers.Object(
+            AppSettings(
+                DB_TYPE="sqlite",
+                DB_DATABASE=str(tmp_path / "personal_cpa.db"),
+                DB_REPLICAS=[],
+                CHART_OF_ACCOUNT_IMPORT_CHUNK_SIZE=1,
+            )
+        )
+    )
+    container.wire(modules=[chart_of_account])
+    app = FastAPI()
+    app.include_router(chart_of_account.router)
+    app.add_middleware(UnitOfWorkMiddleware, database=container.active_database, executor=container.use_case_executor)
+
+    bulk_insert = ChartOfAccountRepository.bulk_insert_chart_of_accounts
+    calls = []
+
+    def fail_on_third_chunk(self, chart_of_accounts):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("failed")
+        return bulk_insert(self, chart_of_accounts)
+
+    monkeypatch.setattr(ChartOfAccountRepository, "bulk_insert_chart_of_accounts", fail_on_third_chunk)
+    body = "\n".join([_ndjson("1"), _ndjson("1_1"), _ndjson("1_2")]).encode()
+
+    try:
+        with pytest.raises(RuntimeError):
+            TestClient(app).post("/chart_of_accounts/import", content=body)
+    finally:
+        container.unwire()
+        container.use_case_executor().shutdown()
+
+    assert sorted(coa.code for coa in ChartOfAccountRepository(session_factory).find_chart_of_accounts(1)) == [
+        "1",
+        "1_1",
+    ]
@@ -0,0 +1,54 @@
+"""
+계정과목 응답 프레젠터 테스트 모듈.
+
+빠른 JSON 경로의 응답이 `response_model` 검증 경로와 같은 JSON 을 만드는지 검증합니다.
+"""
+
+import json
+
+from pydantic import TypeAdapter
+
+from personal_cpa.adapter.inbound.api.model.chart_of_account import ChartOfAccountSummaryResponse
+from personal_cpa.adapter.inbound.api.presenter.chart_of_account import ChartOfAccountPresenter, FastJSONResponse
+from personal_cpa.domain.chart_of_account import ChartOfAccountTree
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _tree(code: str, children: list[ChartOfAccountTree], child_count: int | None = None) -> ChartOfAccountTree:
+    return ChartOfAccountTree(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.LIABILITY,
+        children=children,
+        description=None,
+        parent_chart_of_account_id=None,
+        child_count=len(children) if child_count is None else child_count,
+    )
+
+
+def test_fast_json_matches_response_model_serialization():
+    """
+    Test Case: 빠른 경로와 response_model 경로의 JSON 이 같음 (카테고리 이름, 하위 계정과목 수 포함)
+    """
+    trees = [_tree("2", [_tree("2_1", [_tree("2_1_1", [])]), _tree("2_2", [], child_count=3)]), _tree("3", [])]
+    adapter = TypeAdapter(list[ChartOfAccountSummaryResponse])
+    expected = json.loads(adapter.dump_json(adapter.validate_python(trees, from_attributes=True)))
+
+    response = ChartOfAccountPresenter(fast_json=True).trees(trees)
+
+    assert isinstance(response, FastJSONResponse)
+    assert json.loads(response.body) == expected
+    assert expected[0]["category"] == "LIABILITY"
+    assert expected[0]["children"][1]["has_children"] is True
+
+
+def test_default_path_returns_domain_objects():
+    """
+    Test Case: 기본 경로는 도메인 객체를 그대로 반환하여 response_model 검증에 맡김
+    """
+    tree = _tree("1", [])
+    presenter = ChartOfAccountPresenter(fast_json=False)
+
+    assert presenter.tree(tree) is tree
+    assert presenter.trees([tree]) == [tree]
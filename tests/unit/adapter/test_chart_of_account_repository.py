@@ -0,0 +1,140 @@
+"""
+ChartOfAccountRepository 테스트 모듈.
+
+SQLite 엔진 위에서 저장소의 저장/조회 동작을 검증합니다.
+"""
+
+from sqlalchemy import event
+
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _chart_of_account(code: str, parent_chart_of_account_id: int | None = None) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=parent_chart_of_account_id,
+    )
+
+
+def test_save_chart_of_accounts_links_parents_created_in_same_batch(session_factory):
+    """
+    Test Case: 같은 목록에서 생성된 상위 계정과목의 ID로 하위 계정과목 연결
+    """
+    repository = ChartOfAccountRepository(session_factory)
+
+    saved = repository.save_chart_of_accounts(
+        [_chart_of_account("1"), _chart_of_account("1_1"), _chart_of_account("1_1_1"), _chart_of_account("2")]
+    )
+    by_code = {coa.code: coa for coa in saved}
+
+    assert [coa.code for coa in saved] == ["1", "1_1", "1_1_1", "2"]
+    assert by_code["1"].parent_chart_of_account_id is None
+    assert by_code["1_1"].parent_chart_of_account_id == by_code["1"].id
+    assert by_code["1_1_1"].parent_chart_of_account_id == by_code["1_1"].id
+
+
+def test_find_chart_of_accounts_by_codes(session_factory):
+    """
+    Test Case: 코드 목록 조회는 존재하는 코드만 반환
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    repository.save_chart_of_accounts([_chart_of_account("1"), _chart_of_account("2")])
+
+    found = repository.find_chart_of_accounts_by_codes(1, ["1", "3"])
+
+    assert [coa.code for coa in found] == ["1"]
+    assert repository.find_chart_of_accounts_by_codes(1, []) == []
+    assert repository.find_chart_of_accounts_by_codes(2, ["1"]) == []
+
+
+def test_bulk_insert_chart_of_accounts_uses_one_statement_per_depth(sqlite_engine, session_factory):
+    """
+    Test Case: 계정과목 수와 무관하게 계층마다 INSERT 문 1개로 저장하고 ID/상위 ID를 채움
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    chart_of_accounts = [_chart_of_account("1"), _chart_of_account("2")]
+    chart_of_accounts += [_chart_of_account(f"1_{index}") for index in range(50)]
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        saved = repository.bulk_insert_chart_of_accounts(chart_of_accounts)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    assert sum(statement.startswith("INSERT") for statement in statements) == 2
+    assert [coa.code for coa in saved] == [coa.code for coa in chart_of_accounts]
+    assert all(coa.id is not None for coa in saved)
+    assert {coa.parent_chart_of_account_id for coa in saved[2:]} == {saved[0].id}
+    assert {coa.code for coa in repository.find_chart_of_accounts(1)} == {coa.code for coa in chart_of_accounts}
+
+
+def test_bulk_insert_chart_of_accounts_reads_back_ids_without_returning(session_factory, sqlite_engine, monkeypatch):
+    """
+    Test Case: RETURNING 미지원 dialect 에서는 유니크 인덱스 조회로 ID를 읽어옴
+    """
+    monkeypatch.setattr(sqlite_engine.dialect, "insert_executemany_returning", False)
+    repository = ChartOfAccountRepository(session_factory)
+
+    saved = repository.bulk_insert_chart_of_accounts([_chart_of_account("1"), _chart_of_account("1_1")])
+    stored = {coa.code: coa.id for coa in repository.find_chart_of_accounts(1)}
+
+    assert [coa.id for coa in saved] == [stored["1"], stored["1_1"]]
+    assert saved[1].parent_chart_of_account_id == stored["1"]
+
+
+def test_find_chart_of_account_subtree_uses_code_path(sqlite_engine, session_factory):
+    """
+    Test Case: 하위 계정과목을 코드 경로 범위 조회 1회로 찾고, 접두사만 같은 형제 계정과목은 제외
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    repository.bulk_insert_chart_of_accounts(
+        [_chart_of_account(code) for code in ["1", "2", "1_1", "1_2", "1_10", "1_1_1", "1_1_2", "1_10_1", "1_1_1_1"]]
+    )
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        subtree = repository.find_chart_of_account_subtree(1, "1_1")
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [coa.code for coa in subtree] == ["1_1", "1_1_1", "1_1_1_1", "1_1_2"]
+    assert [coa.depth for coa in subtree] == [1, 2, 3, 2]
+    assert [coa.code for coa in repository.find_chart_of_account_subtree(1, "1_1", max_depth=1)] == [
+        "1_1",
+        "1_1_1",
+        "1_1_2",
+    ]
+    assert [coa.code for coa in repository.find_chart_of_account_subtree(1, "1_1", max_depth=0)] == ["1_1"]
+    assert repository.find_chart_of_account_subtree(1, "3") == []
+    assert repository.find_chart_of_account_subtree(2, "1_1") == []
+
+
+def test_find_chart_of_account_ancestors(session_factory):
+    """
+    Test Case: 상위 계정과목을 최상위 계정과목부터 반환
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    repository.bulk_insert_chart_of_accounts(
+        [_chart_of_account(code) for code in ["1", "1_1", "1_1_1", "1_1_1_1", "1_2"]]
+    )
+
+    assert [coa.code for coa in repository.find_chart_of_account_ancestors(1, "1_1_1_1")] == ["1", "1_1", "1_1_1"]
+    assert [coa.code for coa in repository.find_chart_of_account_ancestors(1, "1_1_9")] == ["1", "1_1"]
+    assert repository.find_chart_of_account_ancestors(1, "1") == []
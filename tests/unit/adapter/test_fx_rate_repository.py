@@ -0,0 +1,266 @@
+"""
+FxRateRepository 테스트 모듈.
+
+SQLite 엔진 위에서 환율 upsert, 캐시된 환율 조회 구조의 무효화, 통화가 다른 계정과목이 섞인 재무 보고서의
+보고 통화 환산, 그리고 여러 통화가 섞인 분개의 거부를 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from personal_cpa.adapter.outbound.cache.fx_rate import FX_RATE_TABLE_CACHE_KEY, CachedFxRateRepository
+from personal_cpa.adapter.outbound.cache.lru import LRUCache
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.fx_rate import AsyncFxRateRepository, FxRateRepository
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository
+from personal_cpa.adapter.outbound.database.repository.report import FinancialReportRepository
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.fx_rate import AsyncFxRateService, FxRateService
+from personal_cpa.application.service.journal import JournalService
+from personal_cpa.application.service.report import FinancialReportService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+_FX_RATES = [
+    FxRate("USD", "KRW", date(2026, 1, 1), Decimal(1300)),
+    FxRate("USD", "KRW", date(2026, 3, 1), Decimal(1400)),
+    FxRate("EUR", "USD", date(2026, 1, 1), Decimal("1.1")),
+]
+
+
+def _command(entry_date: date, debit_id: int, credit_id: int, amount: int) -> PostJournalEntryCommand:
+    return PostJournalEntryCommand(
+        entry_date=entry_date,
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+        ],
+    )
+
+
+_ACCOUNTS = (
+    ("1", AccountType.ASSET, "KRW"),
+    ("2", AccountType.ASSET, "USD"),
+    ("3", AccountType.EQUITY, "KRW"),
+    ("4", AccountType.EQUITY, "USD"),
+    ("5", AccountType.REVENUE, "USD"),
+)
+
+
+@pytest.fixture
+def accounts(session_factory):
+    """
+    원화 최상위 계정과목과 달러 최상위 계정과목을 두고 통화별로 균형 잡힌 분개를 기표합니다.
+
+    Returns:
+        코드별 계정과목 ID
+    """
+    chart_of_accounts = ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+        [
+            ChartOfAccount(
+                user_id=1,
+                code=code,
+                name=f"계정 {code}",
+                category=category,
+                description=None,
+                parent_chart_of_account_id=None,
+                currency=currency,
+            )
+            for code, category, currency in _ACCOUNTS
+        ]
+    )
+    ids = {chart_of_account.code: chart_of_account.id for chart_of_account in chart_of_accounts}
+    JournalService(JournalRepository(session_factory)).post_journal_entries(
+        1,
+        [
+            _command(date(2026, 1, 10), ids["1"], ids["3"], 50000),
+            _command(date(2026, 1, 10), ids["2"], ids["4"], 10000),
+        ],
+    )
+    return ids
+
+
+def test_save_fx_rates_upserts_by_pair_and_date(session_factory):
+    """
+    Test Case: 같은 통화쌍, 고시일의 환율은 덮어쓰고 환율 조회 구조로 읽음
+    """
+    repository = FxRateRepository(session_factory)
+
+    assert repository.save_fx_rates(_FX_RATES) == 3
+    assert repository.save_fx_rates([FxRate("USD", "KRW", date(2026, 3, 1), Decimal("1412.3456789012"))]) == 1
+    assert repository.save_fx_rates([]) == 0
+
+    table = repository.find_fx_rate_table()
+    assert len(table) == 3
+    assert table.rate("USD", "KRW", date(2026, 3, 2)) == Decimal("1412.3456789012")
+
+
+def test_cached_repository_invalidates_on_save(session_factory):
+    """
+    Test Case: 환율 조회 구조는 캐시에서 재사용하고, 환율을 저장하면 다시 읽음
+    """
+    repository = CachedFxRateRepository(FxRateRepository(session_factory), LRUCache(max_size=1, ttl_seconds=300))
+    repository.save_fx_rates(_FX_RATES[:1])
+
+    table = repository.find_fx_rate_table()
+    assert repository.find_fx_rate_table() is table
+
+    repository.save_fx_rates(_FX_RATES[1:])
+    assert repository.find_fx_rate_table() is not table
+    assert len(repository.find_fx_rate_table()) == 3
+
+
+def test_cached_repository_invalidates_after_commit(session_factory):
+    """
+    Test Case: 요청 단위 작업 안에서는 커밋된 뒤에 무효화하고, 커밋 전까지는 캐시를 읽거나 채우지 않음
+    """
+    callbacks = []
+    pending = []
+    repository = CachedFxRateRepository(
+        FxRateRepository(session_factory),
+        LRUCache(max_size=1, ttl_seconds=300),
+        after_commit=callbacks.append,
+        has_pending_writes=lambda: bool(pending),
+    )
+    repository.save_fx_rates(_FX_RATES[:1])
+    callbacks.pop()()
+    table = repository.find_fx_rate_table()
+
+    pending.append(True)
+    repository.save_fx_rates(_FX_RATES[1:])
+    assert len(repository.find_fx_rate_table()) == 3
+    assert repository.cache.get(FX_RATE_TABLE_CACHE_KEY) is table
+
+    pending.clear()
+    callbacks.pop()()
+    assert len(repository.find_fx_rate_table()) == 3
+
+
+def test_fx_rate_service_rounds_cross_rate():
+    """
+    Test Case: 교차 환율 응답은 환율 테이블의 소수 자릿수로 반올림
+    """
+
+    class FxRatePortStub:
+        def find_fx_rate_table(self):
+            return FxRateTable(_FX_RATES)
+
+    service = FxRateService(FxRatePortStub())
+
+    assert service.get_fx_rate("KRW", "EUR", date(2026, 1, 1)).rate == Decimal("0.0006993007")
+    assert service.convert_amounts([100, 100], ["USD", "EUR"], "KRW", date(2026, 1, 1)) == [1300, 1430]
+
+
+def test_balance_sheet_translates_accounts_at_as_of_rate(session_factory, accounts):
+    """
+    Test Case: 원화 계정과목과 달러 계정과목을 기준일 환율로 환산해 합산
+    """
+    fx_rate_repository = FxRateRepository(session_factory)
+    fx_rate_repository.save_fx_rates(_FX_RATES)
+    service = FinancialReportService(FinancialReportRepository(session_factory), fx_rate_port=fx_rate_repository)
+
+    # 100.00 달러: 1월 기준 130,000 원, 3월 기준 140,000 원
+    january = service.get_balance_sheet(1, date(2026, 1, 31))
+    assert [(line.code, line.amount) for line in january.assets] == [("1", 50000), ("2", 130000)]
+    assert (january.currency, january.total_assets) == ("KRW", 180000)
+    assert january.balanced
+
+    march = service.get_balance_sheet(1, date(2026, 3, 31))
+    assert [(line.code, line.amount) for line in march.assets] == [("1", 50000), ("2", 140000)]
+    assert march.total_equity == 190000
+
+    # 50,000 원 = 35.714... 달러 -> 3,571 센트
+    in_usd = service.get_balance_sheet(1, date(2026, 3, 31), currency="USD")
+    assert [(line.code, line.amount) for line in in_usd.assets] == [("1", 3571), ("2", 10000)]
+    assert (in_usd.currency, in_usd.translation_adjustment) == ("USD", 0)
+    assert in_usd.balanced
+
+
+def test_trial_balance_and_income_statement_translate_at_end_date_rate(session_factory, accounts):
+    """
+    Test Case: 시산표와 손익계산서도 통화가 다른 계정과목을 종료일 환율로 환산해 합산
+    """
+    fx_rate_repository = FxRateRepository(session_factory)
+    fx_rate_repository.save_fx_rates(_FX_RATES)
+    JournalService(JournalRepository(session_factory)).post_journal_entries(
+        1, [_command(date(2026, 2, 10), accounts["2"], accounts["5"], 5000)]
+    )
+    service = FinancialReportService(FinancialReportRepository(session_factory), fx_rate_port=fx_rate_repository)
+
+    trial_balance = service.get_trial_balance(1, date(2026, 1, 1), date(2026, 3, 31))
+    assert [(line.code, line.debit, line.credit) for line in trial_balance.lines] == [
+        ("1", 50000, 0),
+        ("2", 210000, 0),
+        ("3", 0, 50000),
+        ("4", 0, 140000),
+        ("5", 0, 70000),
+    ]
+    assert (trial_balance.currency, trial_balance.total_debit, trial_balance.total_credit) == ("KRW", 260000, 260000)
+
+    income_statement = service.get_income_statement(1, date(2026, 2, 1), date(2026, 2, 28), currency="USD")
+    assert (income_statement.currency, income_statement.net_income) == ("USD", 5000)
+    in_krw = service.get_income_statement(1, date(2026, 2, 1), date(2026, 2, 28))
+    assert (in_krw.currency, in_krw.net_income) == ("KRW", 65000)
+
+
+def test_post_journal_entries_rejects_lines_in_different_currencies(session_factory, accounts):
+    """
+    Test Case: 한 분개의 줄은 같은 통화의 계정과목이어야 함
+    """
+    service = JournalService(JournalRepository(session_factory))
+
+    with pytest.raises(ValueError, match=r"entries\[1\]: lines must share one currency. \(Currently: KRW, USD\)"):
+        service.post_journal_entries(
+            1,
+            [
+                _command(date(2026, 2, 1), accounts["2"], accounts["4"], 100),
+                _command(date(2026, 2, 1), accounts["1"], accounts["4"], 100),
+            ],
+        )
+
+
+def test_balance_sheet_rejects_unsupported_or_missing_rates(session_factory, accounts):
+    """
+    Test Case: 지원하지 않는 보고 통화, 환율 저장소 없음, 기준일 이전 환율 없음 검사
+    """
+    service = FinancialReportService(
+        FinancialReportRepository(session_factory), fx_rate_port=FxRateRepository(session_factory)
+    )
+
+    with pytest.raises(ValueError, match="currency must be one of"):
+        service.get_balance_sheet(1, date(2026, 3, 31), currency="XYZ")
+    with pytest.raises(ValueError, match="fx rates are not available"):
+        FinancialReportService(FinancialReportRepository(session_factory)).get_balance_sheet(1, date(2026, 3, 31))
+    with pytest.raises(ValueError, match="no USD/KRW fx rate"):
+        service.get_balance_sheet(1, date(2026, 3, 31))
+
+
+def test_async_service_converts_amounts(tmp_path, session_factory):
+    """
+    Test Case: 비동기 서비스로 환율 저장, 조회 및 일괄 환산
+    """
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "personal_cpa.db"))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        service = AsyncFxRateService(AsyncFxRateRepository(database.session))
+        try:
+            imported = await service.import_fx_rates(_FX_RATES)
+            fx_rate = await service.get_fx_rate("KRW", "USD", date(2026, 3, 1))
+            amounts = await service.convert_amounts([100, 130000], ["USD", "KRW"], "KRW", date(2026, 2, 1))
+            return imported, fx_rate, amounts
+        finally:
+            await database.dispose()
+
+    imported, fx_rate, amounts = asyncio.run(scenario())
+
+    assert imported == 3
+    assert fx_rate.rate == Decimal("0.0007142857")
+    assert amounts == [1300, 130000]
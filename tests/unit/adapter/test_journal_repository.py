@@ -0,0 +1,183 @@
+"""
+JournalRepository 테스트 모듈.
+
+SQLite 엔진 위에서 분개 서비스와 저장소의 기표/조회 동작을 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import AsyncJournalRepository, JournalRepository
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.journal import AsyncJournalService, JournalService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _chart_of_account(code: str, user_id: int = 1, is_hidden: bool = False) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=user_id,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+        is_hidden=is_hidden,
+    )
+
+
+def _command(entry_date: date, debit_id: int, credit_id: int, amount: int) -> PostJournalEntryCommand:
+    return PostJournalEntryCommand(
+        entry_date=entry_date,
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+        ],
+    )
+
+
+@pytest.fixture
+def accounts(session_factory):
+    """
+    유저 1의 계정과목 2개, 숨김 계정과목 1개, 유저 2의 계정과목 1개를 저장합니다.
+
+    Returns:
+        저장된 계정과목 목록 (cash, card, hidden, other_user)
+    """
+    return ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+        [
+            _chart_of_account("1"),
+            _chart_of_account("2"),
+            _chart_of_account("3", is_hidden=True),
+            _chart_of_account("1", 2),
+        ]
+    )
+
+
+def test_post_journal_entries_uses_one_statement_per_table(sqlite_engine, session_factory, accounts):
+    """
+    Test Case: 분개 수와 무관하게 분개/분개 줄/잔액 테이블마다 INSERT 문 1개로 저장하고 입력 순서대로 ID를 채움
+    """
+    cash, card = accounts[0].id, accounts[1].id
+    service = JournalService(JournalRepository(session_factory))
+    commands = [_command(date(2026, 1, 1 + index % 28), cash, card, 1000 + index) for index in range(200)]
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        posted = service.post_journal_entries(1, commands)
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    inserts = [statement.split()[2] for statement in statements if statement.startswith("INSERT")]
+    assert inserts == ["period_close_lock", "journal_entry", "journal_line", "account_balance"]
+    assert [entry.id for entry in posted] == sorted(entry.id for entry in posted)
+    found = service.get_journal_entry(1, posted[-1].id)
+    assert found is not None
+    assert found.amount == 1199
+    assert [(line.chart_of_account_id, line.debit, line.credit) for line in found.lines] == [
+        (cash, 1199, 0),
+        (card, 0, 1199),
+    ]
+    assert service.get_journal_entry(2, posted[-1].id) is None
+
+
+def test_post_journal_entries_rejects_hidden_or_foreign_accounts(session_factory, accounts):
+    """
+    Test Case: 숨김 계정과목 또는 다른 유저의 계정과목이 포함되면 아무것도 저장하지 않음
+    """
+    cash, card, hidden, other_user = (account.id for account in accounts)
+    service = JournalService(JournalRepository(session_factory))
+
+    for invalid_id in (hidden, other_user):
+        with pytest.raises(ValueError, match=rf"entries\[1\]: Chart of account with id {invalid_id}"):
+            service.post_journal_entries(
+                1, [_command(date(2026, 1, 1), cash, card, 100), _command(date(2026, 1, 1), cash, invalid_id, 100)]
+            )
+
+    assert service.get_ledger(1, cash, date(2026, 1, 1), date(2026, 12, 31), 100) == []
+
+
+def test_post_journal_entries_reports_unbalanced_entry_index(session_factory, accounts):
+    """
+    Test Case: 대차 불일치 분개의 요청 목록 위치를 오류 메시지에 포함
+    """
+    cash, card = accounts[0].id, accounts[1].id
+    service = JournalService(JournalRepository(session_factory))
+    unbalanced = PostJournalEntryCommand(
+        entry_date=date(2026, 1, 1),
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=cash, debit=100, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=card, debit=0, credit=90, description=None),
+        ],
+    )
+
+    with pytest.raises(ValueError, match=r"entries\[0\]: journal entry is not balanced"):
+        service.post_journal_entries(1, [unbalanced])
+
+
+def test_get_ledger_returns_period_lines_in_date_order(session_factory, accounts):
+    """
+    Test Case: 원장은 기간 안의 분개 줄만 거래일, 기표 순으로 반환
+    """
+    cash, card = accounts[0].id, accounts[1].id
+    service = JournalService(JournalRepository(session_factory))
+    service.post_journal_entries(
+        1,
+        [
+            _command(date(2026, 3, 1), cash, card, 300),
+            _command(date(2026, 1, 15), cash, card, 100),
+            _command(date(2026, 2, 1), card, cash, 200),
+            _command(date(2026, 1, 15), cash, card, 150),
+        ],
+    )
+
+    ledger = service.get_ledger(1, cash, date(2026, 1, 1), date(2026, 2, 28), 100)
+
+    assert [(line.entry_date, line.debit, line.credit) for line in ledger] == [
+        (date(2026, 1, 15), 100, 0),
+        (date(2026, 1, 15), 150, 0),
+        (date(2026, 2, 1), 0, 200),
+    ]
+    assert len(service.get_ledger(1, cash, date(2026, 1, 1), date(2026, 12, 31), 2)) == 2
+    assert service.get_ledger(2, cash, date(2026, 1, 1), date(2026, 12, 31), 100) == []
+    with pytest.raises(ValueError, match="must not be after"):
+        service.get_ledger(1, cash, date(2026, 2, 1), date(2026, 1, 1), 100)
+
+
+def test_async_service_posts_and_reads_journal_entries(tmp_path, accounts):
+    """
+    Test Case: 비동기 서비스로 기표한 분개를 상세/원장 조회
+    """
+    cash, card = accounts[0].id, accounts[1].id
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "personal_cpa.db"))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        service = AsyncJournalService(AsyncJournalRepository(database.session))
+        try:
+            posted = await service.post_journal_entries(1, [_command(date(2026, 1, 1), cash, card, 500)] * 3)
+            found = await service.get_journal_entry(1, posted[0].id)
+            ledger = await service.get_ledger(1, card, date(2026, 1, 1), date(2026, 1, 1), 10)
+        finally:
+            await database.dispose()
+        return posted, found, ledger
+
+    posted, found, ledger = asyncio.run(scenario())
+
+    assert [entry.id for entry in posted] == [1, 2, 3]
+    assert found is not None
+    assert found.amount == 500
+    assert [line.credit for line in ledger] == [500, 500, 500]
@@ -0,0 +1,112 @@
+"""
+요청 지표 테스트 모듈.
+
+라우트 템플릿별 집계, 누적 히스토그램 버킷, 처리 중 요청 수, 커넥션 풀과 유즈케이스 실행기 지표의
+Prometheus 텍스트 출력을 검증합니다.
+"""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+import pytest
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutorStats
+from personal_cpa.adapter.inbound.api.metrics import (
+    HttpMetrics,
+    MetricsMiddleware,
+    render_executor_metrics,
+    render_pool_metrics,
+)
+from personal_cpa.config import AppSettings
+from personal_cpa.database import Database
+
+
+def _app(metrics: HttpMetrics) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{code}")
+    async def get_item(code: str):
+        if code == "missing":
+            raise HTTPException(status_code=404)
+        return {"code": code, "in_flight": metrics.in_flight}
+
+    app.add_middleware(MetricsMiddleware, metrics=lambda: metrics)
+    return app
+
+
+def test_requests_are_labelled_by_route_template():
+    """
+    Test Case: 원래 URL 이 아닌 라우트 템플릿과 상태 코드로 집계하고, 매칭되지 않은 경로는 하나의 레이블로 묶음
+    """
+    metrics = HttpMetrics()
+    client = TestClient(_app(metrics))
+
+    assert client.get("/items/1").json()["in_flight"] == 1
+    client.get("/items/2")
+    client.get("/items/missing")
+    client.get("/unknown/path")
+
+    text = metrics.render()
+
+    assert 'personal_cpa_http_requests_total{method="GET",route="/items/{code}",status="200"} 2' in text
+    assert 'personal_cpa_http_requests_total{method="GET",route="/items/{code}",status="404"} 1' in text
+    assert 'personal_cpa_http_requests_total{method="GET",route="<unmatched>",status="404"} 1' in text
+    assert 'personal_cpa_http_request_duration_seconds_count{method="GET",route="/items/{code}"} 3' in text
+    assert "personal_cpa_http_requests_in_flight 0" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    Test Case: 버킷 상한과 같은 값은 해당 버킷에 포함되고, 버킷 값은 누적되어 +Inf 가 전체 개수와 같음
+    """
+    metrics = HttpMetrics(buckets=(0.1, 1))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        metrics.observe("POST", "/items", 201, seconds)
+
+    text = metrics.render()
+
+    assert 'personal_cpa_http_request_duration_seconds_bucket{method="POST",route="/items",le="0.1"} 2' in text
+    assert 'personal_cpa_http_request_duration_seconds_bucket{method="POST",route="/items",le="1"} 3' in text
+    assert 'personal_cpa_http_request_duration_seconds_bucket{method="POST",route="/items",le="+Inf"} 4' in text
+    assert 'personal_cpa_http_request_duration_seconds_sum{method="POST",route="/items"} 3.65' in text
+
+
+def test_buckets_must_be_increasing():
+    """
+    Test Case: 오름차순이 아닌 버킷은 오류
+    """
+    with pytest.raises(ValueError, match="strictly increasing"):
+        HttpMetrics(buckets=(1, 0.5))
+
+
+def test_pool_metrics_report_checked_out_connections(tmp_path):
+    """
+    Test Case: 세션이 커넥션을 쓰는 동안 사용 중으로, 세션 종료 후 대기 중으로 집계됨
+    """
+    database = Database(AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "metrics.db")))
+    with database.session() as session:
+        session.connection()
+        assert "personal_cpa_db_pool_checked_out 1" in render_pool_metrics(database.pool_stats())
+
+    stats = database.pool_stats()
+    text = render_pool_metrics(stats)
+
+    assert (stats.checked_out, stats.checked_in) == (0, 1)
+    assert f"personal_cpa_db_pool_size {stats.size}" in text
+
+
+def test_executor_metrics_report_queue_depth_and_workers():
+    """
+    Test Case: 작업 스레드 수, 실행/대기 중인 작업 수는 게이지로, 완료 수와 누적 대기 시간은 카운터로 내보냄
+    """
+    stats = UseCaseExecutorStats(
+        mode="threadpool", max_workers=4, running=4, queued=3, max_queued=7, completed=12, total_wait_seconds=0.5
+    )
+
+    text = render_executor_metrics(stats)
+
+    assert "# TYPE personal_cpa_executor_queued gauge\npersonal_cpa_executor_queued 3" in text
+    assert "personal_cpa_executor_running 4" in text
+    assert "personal_cpa_executor_max_workers 4" in text
+    assert "personal_cpa_executor_max_queued 7" in text
+    assert "# TYPE personal_cpa_executor_completed_total counter\npersonal_cpa_executor_completed_total 12" in text
+    assert "personal_cpa_executor_wait_seconds_total 0.5" in text
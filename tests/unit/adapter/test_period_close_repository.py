@@ -0,0 +1,325 @@
+"""
+PeriodCloseRepository 테스트 모듈.
+
+SQLite 엔진 위에서 기간 마감 작업이 유저 묶음별로 마감 잔액을 저장하고, 재무상태표가 마감 잔액과
+그 이후 변동분만으로 같은 결과를 만드는지 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+import threading
+
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from personal_cpa.adapter.inbound.api.routes import period_close
+from personal_cpa.adapter.inbound.api.unit_of_work import UnitOfWorkMiddleware
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository
+from personal_cpa.adapter.outbound.database.repository.period_close import (
+    AsyncPeriodCloseRepository,
+    PeriodCloseRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.report import (
+    AsyncFinancialReportRepository,
+    FinancialReportRepository,
+)
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.journal import JournalService
+from personal_cpa.application.service.period_close import AsyncPeriodCloseService, PeriodCloseService
+from personal_cpa.application.service.report import FinancialReportService
+from personal_cpa.config import AppSettings
+from personal_cpa.container import Container
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+_ACCOUNTS = [
+    ("1", AccountType.ASSET),
+    ("1_1", AccountType.ASSET),
+    ("2", AccountType.LIABILITY),
+    ("3", AccountType.EQUITY),
+    ("4", AccountType.REVENUE),
+    ("5", AccountType.EXPENSE),
+]
+
+
+def _command(entry_date: date, debit_id: int, credit_id: int, amount: int) -> PostJournalEntryCommand:
+    return PostJournalEntryCommand(
+        entry_date=entry_date,
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+        ],
+    )
+
+
+@pytest.fixture
+def accounts(session_factory):
+    """
+    유저 1~3의 계정과목을 저장하고 2026년 1~4월 분개를 기표합니다.
+
+    Returns:
+        유저 ID별 코드별 계정과목 ID
+    """
+    repository = ChartOfAccountRepository(session_factory)
+    journal_service = JournalService(JournalRepository(session_factory))
+    accounts = {}
+    for user_id in (1, 2, 3):
+        saved = repository.bulk_insert_chart_of_accounts(
+            [
+                ChartOfAccount(
+                    user_id=user_id,
+                    code=code,
+                    name=f"계정 {code}",
+                    category=category,
+                    description=None,
+                    parent_chart_of_account_id=None,
+                )
+                for code, category in _ACCOUNTS
+            ]
+        )
+        ids = {chart_of_account.code: chart_of_account.id for chart_of_account in saved}
+        journal_service.post_journal_entries(
+            user_id,
+            [
+                _command(date(2026, 1, 10), ids["1_1"], ids["3"], 10000 * user_id),
+                _command(date(2026, 1, 25), ids["5"], ids["1_1"], 3000),
+                _command(date(2026, 2, 3), ids["1_1"], ids["4"], 5000),
+                _command(date(2026, 3, 15), ids["5"], ids["2"], 1000),
+                _command(date(2026, 4, 1), ids["1_1"], ids["4"], 700),
+            ],
+        )
+        accounts[user_id] = ids
+    return accounts
+
+
+def _close_service(session_factory, batch_size: int = 100, use_balances: bool = True) -> PeriodCloseService:
+    return PeriodCloseService(
+        PeriodCloseRepository(session_factory),
+        FinancialReportRepository(session_factory),
+        use_balances=use_balances,
+        batch_size=batch_size,
+    )
+
+
+def test_run_period_close_closes_users_in_batches(session_factory, accounts):
+    """
+    Test Case: 유저를 묶음별로 마감하고 마감 잔액은 하위 계정과목을 포함한 누계
+    """
+    service = _close_service(session_factory, batch_size=2)
+
+    job = service.run_period_close(202602)
+
+    assert (job.done, job.last_user_id, job.closed_users) == (True, 3, 3)
+    assert service.get_period_close(202602) == job
+    report_repository = FinancialReportRepository(session_factory)
+    assert report_repository.find_closed_period(2, 202612) == 202602
+    source = report_repository.find_report_source(2, [], [], snapshot_period=202602)
+    ids = accounts[2]
+    assert source.snapshot_totals[ids["1"]] == (25000, 3000)
+    assert source.snapshot_totals[ids["4"]] == (0, 5000)
+    assert ids["2"] not in source.snapshot_totals
+
+
+def test_period_close_resumes_after_last_saved_batch(session_factory, accounts):
+    """
+    Test Case: 중단된 마감 작업은 마지막으로 저장한 묶음 다음 유저부터 이어서 처리
+    """
+    service = _close_service(session_factory, batch_size=2)
+    service.close_next_users(service.start_period_close(202602))
+
+    resumed = _close_service(session_factory, batch_size=2)
+    assert resumed.get_period_close(202602).last_user_id == 2
+    job = resumed.run_period_close(202602)
+
+    assert (job.done, job.closed_users) == (True, 3)
+    assert resumed.start_period_close(202602) == job
+
+
+@pytest.mark.parametrize("use_balances", [True, False])
+@pytest.mark.parametrize("as_of", [date(2026, 2, 28), date(2026, 3, 20), date(2026, 3, 31), date(2026, 5, 31)])
+def test_balance_sheet_from_snapshot_matches_full_history(session_factory, accounts, use_balances, as_of):
+    """
+    Test Case: 마감 잔액과 이후 변동분으로 만든 재무상태표가 전체 이력으로 만든 재무상태표와 같음
+    """
+    expected = {
+        user_id: FinancialReportService(
+            FinancialReportRepository(session_factory), use_balances=use_balances
+        ).get_balance_sheet(user_id, as_of)
+        for user_id in accounts
+    }
+
+    _close_service(session_factory, use_balances=use_balances).run_period_close(202601)
+    _close_service(session_factory, use_balances=use_balances).run_period_close(202602)
+
+    service = FinancialReportService(FinancialReportRepository(session_factory), use_balances=use_balances)
+    for user_id in accounts:
+        assert service.get_balance_sheet(user_id, as_of) == expected[user_id]
+
+
+def test_posting_into_closed_period_is_rejected(session_factory, accounts):
+    """
+    Test Case: 마감된 기간의 거래일로는 기표할 수 없고 그 이후 기간은 기표 가능
+    """
+    _close_service(session_factory).run_period_close(202602)
+    journal_service = JournalService(JournalRepository(session_factory))
+    ids = accounts[1]
+
+    with pytest.raises(ValueError, match=r"entries\[0\]: entry_date 2026-02-28 is in a closed period"):
+        journal_service.post_journal_entries(1, [_command(date(2026, 2, 28), ids["1_1"], ids["4"], 100)])
+
+    posted = journal_service.post_journal_entries(1, [_command(date(2026, 3, 1), ids["1_1"], ids["4"], 100)])
+    assert len(posted) == 1
+
+
+def test_posting_checked_before_close_is_rejected_when_saved_after_close(session_factory, accounts, monkeypatch):
+    """
+    Test Case: 기표 전 마감 기간 확인과 저장 사이에 같은 유저가 마감되면 저장 트랜잭션에서 다시 확인해 거부
+    """
+    close_service = _close_service(session_factory)
+    job = close_service.start_period_close(202602)
+    journal_repository = JournalRepository(session_factory)
+    find_closed_period = journal_repository.find_closed_period
+
+    def close_after_check(user_id):
+        closed_period = find_closed_period(user_id)
+        close_service.close_next_users(job)
+        return closed_period
+
+    monkeypatch.setattr(journal_repository, "find_closed_period", close_after_check)
+    ids = accounts[1]
+
+    with pytest.raises(ValueError, match=r"entries\[0\]: entry_date 2026-02-28 is in a closed period"):
+        JournalService(journal_repository).post_journal_entries(
+            1, [_command(date(2026, 2, 28), ids["1_1"], ids["4"], 100)]
+        )
+
+    assert FinancialReportRepository(session_factory).find_closed_period(1, 202612) == 202602
+
+
+def test_posting_during_close_waits_for_close_and_is_rejected(session_factory, accounts, monkeypatch):
+    """
+    Test Case: 마감 잔액을 계산하는 동안 같은 유저의 기표는 마감이 저장될 때까지 기다린 뒤 거부되고, 마감 잔액은 그대로
+    """
+    ids = accounts[1]
+    journal_service = JournalService(JournalRepository(session_factory))
+    outcomes = []
+
+    def post():
+        try:
+            journal_service.post_journal_entries(1, [_command(date(2026, 2, 28), ids["1_1"], ids["4"], 100)])
+        except ValueError as error:
+            outcomes.append(error)
+        else:
+            outcomes.append(None)
+
+    poster = threading.Thread(target=post)
+    close_user = PeriodCloseService._close_user
+
+    def close_user_while_posting(self, user_id, period):
+        if user_id == 1:
+            # 잠금이 없으면 기표가 이 사이에 커밋됨
+            poster.start()
+            poster.join(timeout=0.5)
+        return close_user(self, user_id, period)
+
+    monkeypatch.setattr(PeriodCloseService, "_close_user", close_user_while_posting)
+    _close_service(session_factory).run_period_close(202602)
+    poster.join()
+
+    assert len(outcomes) == 1
+    assert isinstance(outcomes[0], ValueError)
+    assert "is in a closed period" in str(outcomes[0])
+    source = FinancialReportRepository(session_factory).find_report_source(1, [], [], snapshot_period=202602)
+    assert source.snapshot_totals[ids["1"]] == (15000, 3000)
+
+
+@pytest.mark.parametrize(("period", "message"), [(202613, "YYYYMM"), (0, "YYYYMM"), (209912, "has not ended")])
+def test_start_period_close_rejects_invalid_or_open_period(session_factory, period, message):
+    """
+    Test Case: 유효하지 않거나 아직 끝나지 않은 기간은 마감할 수 없음
+    """
+    with pytest.raises(ValueError, match=message):
+        _close_service(session_factory).start_period_close(period)
+
+
+def test_async_service_runs_period_close(tmp_path, accounts):
+    """
+    Test Case: 비동기 서비스로 기간 마감 실행
+    """
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "personal_cpa.db"))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        service = AsyncPeriodCloseService(
+            AsyncPeriodCloseRepository(database.session), AsyncFinancialReportRepository(database.session), batch_size=2
+        )
+        try:
+            job = await service.run_period_close(202603)
+            closed_period = await AsyncFinancialReportRepository(database.session).find_closed_period(3, 202610)
+            return job, closed_period
+        finally:
+            await database.dispose()
+
+    job, closed_period = asyncio.run(scenario())
+
+    assert (job.done, job.closed_users) == (True, 3)
+    assert closed_period == 202603
+
+
+def test_period_close_route_commits_each_batch_and_resumes_after_failure(
+    tmp_path, session_factory, accounts, monkeypatch
+):
+    """
+    Test Case: 요청 단위 작업이 켜진 앱에서도 백그라운드 마감은 묶음마다 커밋하고, 실패 후 다시 시작하면 이어서 처리
+    """
+    container = Container()
+    container.app_settings.override(
+        providers.Object(
+            AppSettings(
+                DB_TYPE="sqlite",
+                DB_DATABASE=str(tmp_path / "personal_cpa.db"),
+                DB_REPLICAS=[],
+                DB_REQUEST_UNIT_OF_WORK=True,
+                PERIOD_CLOSE_BATCH_SIZE=1,
+            )
+        )
+    )
+    container.wire(modules=[period_close])
+    app = FastAPI()
+    app.include_router(period_close.router)
+    app.add_middleware(UnitOfWorkMiddleware, database=container.active_database, executor=container.use_case_executor)
+    client = TestClient(app)
+
+    close_user = PeriodCloseService._close_user
+
+    def fail_on_user_3(self, user_id, period):
+        if user_id == 3:
+            raise RuntimeError("failed")
+        return close_user(self, user_id, period)
+
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(PeriodCloseService, "_close_user", fail_on_user_3)
+            with pytest.raises(RuntimeError):
+                client.post("/period_closes/202601")
+
+        stopped = PeriodCloseRepository(session_factory).find_period_close_job(202601)
+        assert (stopped.done, stopped.last_user_id, stopped.closed_users) == (False, 2, 2)
+        report_repository = FinancialReportRepository(session_factory)
+        assert [report_repository.find_closed_period(user_id, 202612) for user_id in (1, 2, 3)] == [
+            202601,
+            202601,
+            None,
+        ]
+
+        assert client.post("/period_closes/202601").status_code == 202
+        resumed = client.get("/period_closes/202601").json()
+        assert (resumed["status"], resumed["last_user_id"], resumed["closed_users"]) == ("DONE", 3, 3)
+    finally:
+        container.unwire()
+        container.use_case_executor().shutdown()
@@ -0,0 +1,133 @@
+"""
+준비 상태(readiness) 확인 테스트 모듈.
+
+SQLite 데이터베이스로 `SELECT 1` 확인, 결과 캐시, 동시 프로브 병합, 장애 상황(데이터베이스 파일 삭제)과
+liveness/readiness 라우트의 응답을 검증합니다.
+"""
+
+import asyncio
+import shutil
+import threading
+import time
+
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from personal_cpa.adapter.inbound.api.readiness import ReadinessProbe
+from personal_cpa.adapter.inbound.api.routes import health
+from personal_cpa.config import AppSettings
+from personal_cpa.container import Container
+from personal_cpa.database import AsyncDatabase, Database
+
+
+def _settings(tmp_path, **overrides: object) -> AppSettings:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(exist_ok=True)
+    return AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(data_dir / "ready.db"), **overrides)
+
+
+def _simulate_outage(database: Database, tmp_path) -> None:
+    database._engine.dispose()
+    shutil.rmtree(tmp_path / "data")
+
+
+def test_probe_caches_result_until_expiry_and_reports_outage(tmp_path, fake_clock):
+    """
+    Test Case: 캐시 시간 안에는 데이터베이스를 다시 확인하지 않고, 만료 후 장애를 감지
+    """
+    database = Database(_settings(tmp_path))
+    probe = ReadinessProbe(database, cache_seconds=2, timeout_seconds=1, clock=fake_clock)
+
+    first = asyncio.run(probe.check())
+    assert first.ready and not first.cached
+    assert first.latency_seconds > 0
+
+    _simulate_outage(database, tmp_path)
+    fake_clock.now = 1.5
+    cached = asyncio.run(probe.check())
+    assert cached.ready and cached.cached
+    assert cached.age_seconds == 1.5
+
+    fake_clock.now = 2.0
+    failed = asyncio.run(probe.check())
+    assert not failed.ready and not failed.cached
+    assert "unable to open database file" in str(failed.error)
+
+
+def test_concurrent_probes_share_one_check(tmp_path):
+    """
+    Test Case: 동시에 들어온 프로브는 한 번의 `SELECT 1` 결과를 함께 사용
+    """
+    database = Database(_settings(tmp_path))
+    calls = []
+    ping = database.ping
+
+    def counting_ping() -> None:
+        calls.append(threading.current_thread().name)
+        ping()
+
+    database.ping = counting_ping  # type: ignore[method-assign]
+    probe = ReadinessProbe(database, cache_seconds=60, timeout_seconds=1)
+
+    async def run() -> list:
+        return await asyncio.gather(*(probe.check() for _ in range(20)))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result.ready for result in results)
+    assert sum(not result.cached for result in results) == 1
+
+
+def test_probe_times_out_slow_database(tmp_path):
+    """
+    Test Case: 확인이 대기 시간을 넘기면 준비되지 않은 것으로 판단
+    """
+    database = Database(_settings(tmp_path))
+    database.ping = lambda: time.sleep(0.3)  # type: ignore[method-assign]
+    probe = ReadinessProbe(database, cache_seconds=0, timeout_seconds=0.05)
+
+    result = asyncio.run(probe.check())
+
+    assert not result.ready
+    assert result.error == "database check timed out after 0.05s"
+
+
+def test_probe_checks_async_database(tmp_path):
+    """
+    Test Case: 비동기 데이터베이스는 이벤트 루프에서 바로 확인
+    """
+    database = AsyncDatabase(_settings(tmp_path))
+
+    async def run():
+        result = await ReadinessProbe(database, cache_seconds=0, timeout_seconds=1).check()
+        await database.dispose()
+        return result
+
+    assert asyncio.run(run()).ready
+
+
+def test_liveness_and_readiness_routes(tmp_path):
+    """
+    Test Case: liveness 는 데이터베이스와 무관하게 200, readiness 는 장애 시 503 과 실패 사유를 반환
+    """
+    container = Container()
+    container.app_settings.override(providers.Object(_settings(tmp_path, HEALTH_READINESS_CACHE_SECONDS=0)))
+    container.wire(modules=[health])
+    app = FastAPI()
+    app.include_router(health.router)
+    client = TestClient(app)
+
+    try:
+        ready = client.get("/health/ready")
+        assert ready.status_code == 200
+        assert ready.json()["status"] == "ready"
+
+        _simulate_outage(container.database(), tmp_path)
+        unavailable = client.get("/health/ready")
+        assert unavailable.status_code == 503
+        assert unavailable.json()["detail"]["database"]["ready"] is False
+        assert client.get("/health/live").json() == {"status": "ok"}
+    finally:
+        container.unwire()
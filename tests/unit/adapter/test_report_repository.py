@@ -0,0 +1,169 @@
+"""
+FinancialReportRepository 테스트 모듈.
+
+SQLite 엔진 위에서 재무 보고서 서비스가 월별 잔액과 분개 줄을 합쳐 만든 보고서를 검증합니다.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository
+from personal_cpa.adapter.outbound.database.repository.report import (
+    AsyncFinancialReportRepository,
+    FinancialReportRepository,
+)
+from personal_cpa.application.port.input.command.journal import PostJournalEntryCommand, PostJournalLineCommand
+from personal_cpa.application.service.journal import JournalService
+from personal_cpa.application.service.report import AsyncFinancialReportService, FinancialReportService
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+_ACCOUNTS = [
+    ("1", AccountType.ASSET),
+    ("1_1", AccountType.ASSET),
+    ("2", AccountType.LIABILITY),
+    ("3", AccountType.EQUITY),
+    ("4", AccountType.REVENUE),
+    ("5", AccountType.EXPENSE),
+    ("5_1", AccountType.EXPENSE),
+]
+
+
+def _command(entry_date: date, debit_id: int, credit_id: int, amount: int) -> PostJournalEntryCommand:
+    return PostJournalEntryCommand(
+        entry_date=entry_date,
+        description=None,
+        lines=[
+            PostJournalLineCommand(chart_of_account_id=debit_id, debit=amount, credit=0, description=None),
+            PostJournalLineCommand(chart_of_account_id=credit_id, debit=0, credit=amount, description=None),
+        ],
+    )
+
+
+@pytest.fixture
+def accounts(session_factory):
+    """
+    자산/부채/자본/수익/비용 계정과목을 저장하고 2026년 1~4월 분개를 기표합니다.
+
+    Returns:
+        코드별 계정과목 ID
+    """
+    saved = ChartOfAccountRepository(session_factory).bulk_insert_chart_of_accounts(
+        [
+            ChartOfAccount(
+                user_id=1,
+                code=code,
+                name=f"계정 {code}",
+                category=category,
+                description=None,
+                parent_chart_of_account_id=None,
+            )
+            for code, category in _ACCOUNTS
+        ]
+    )
+    ids = {chart_of_account.code: chart_of_account.id for chart_of_account in saved}
+    JournalService(JournalRepository(session_factory)).post_journal_entries(
+        1,
+        [
+            _command(date(2026, 1, 10), ids["1_1"], ids["3"], 10000),
+            _command(date(2026, 1, 25), ids["5_1"], ids["1_1"], 3000),
+            _command(date(2026, 2, 3), ids["1_1"], ids["4"], 5000),
+            _command(date(2026, 2, 28), ids["1_1"], ids["2"], 2000),
+            _command(date(2026, 3, 15), ids["5_1"], ids["2"], 1000),
+            _command(date(2026, 4, 1), ids["1_1"], ids["4"], 700),
+        ],
+    )
+    return ids
+
+
+def test_income_statement_and_balance_sheet_figures(session_factory, accounts):
+    """
+    Test Case: 기간 손익계산서와 기준일 재무상태표 금액 (하위 계정과목 포함, 이익잉여금 반영)
+    """
+    service = FinancialReportService(FinancialReportRepository(session_factory))
+
+    income_statement = service.get_income_statement(1, date(2026, 1, 1), date(2026, 2, 28))
+    assert (income_statement.total_revenue, income_statement.total_expense, income_statement.net_income) == (
+        5000,
+        3000,
+        2000,
+    )
+    assert [(line.code, line.amount) for line in income_statement.expenses] == [("5", 3000), ("5_1", 3000)]
+
+    balance_sheet = service.get_balance_sheet(1, date(2026, 2, 28))
+    assert [(line.code, line.amount) for line in balance_sheet.assets] == [("1", 14000), ("1_1", 14000)]
+    assert (balance_sheet.total_liabilities, balance_sheet.retained_earnings, balance_sheet.total_equity) == (
+        2000,
+        2000,
+        12000,
+    )
+    assert balance_sheet.balanced
+
+    trial_balance = service.get_trial_balance(1, date(2026, 1, 15), date(2026, 3, 20))
+    assert trial_balance.total_debit == trial_balance.total_credit == 11000
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date"),
+    [
+        (date(2026, 1, 1), date(2026, 4, 30)),
+        (date(2026, 1, 15), date(2026, 3, 20)),
+        (date(2026, 2, 1), date(2026, 2, 28)),
+        (date(2026, 2, 10), date(2026, 2, 27)),
+        (date(2025, 12, 1), date(2026, 5, 31)),
+    ],
+)
+def test_reports_from_monthly_balances_match_journal_lines(session_factory, accounts, start_date, end_date):
+    """
+    Test Case: 월별 잔액을 사용한 보고서와 분개 줄로만 계산한 보고서가 같음
+    """
+    with_balances = FinancialReportService(FinancialReportRepository(session_factory), use_balances=True)
+    from_lines = FinancialReportService(FinancialReportRepository(session_factory), use_balances=False)
+
+    assert with_balances.get_trial_balance(1, start_date, end_date) == from_lines.get_trial_balance(
+        1, start_date, end_date
+    )
+    assert with_balances.get_income_statement(1, start_date, end_date) == from_lines.get_income_statement(
+        1, start_date, end_date
+    )
+    assert with_balances.get_balance_sheet(1, end_date) == from_lines.get_balance_sheet(1, end_date)
+    assert with_balances.get_balance_sheet(1, start_date) == from_lines.get_balance_sheet(1, start_date)
+
+
+def test_trial_balance_rejects_reversed_range(session_factory, accounts):
+    """
+    Test Case: 시작일이 종료일보다 늦은 기간 검사
+    """
+    service = FinancialReportService(FinancialReportRepository(session_factory))
+
+    with pytest.raises(ValueError, match="must not be after"):
+        service.get_trial_balance(1, date(2026, 2, 1), date(2026, 1, 1))
+
+
+def test_async_service_builds_balance_sheet(tmp_path, accounts):
+    """
+    Test Case: 비동기 서비스로 기준일 재무상태표 조회
+    """
+    app_settings = AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "personal_cpa.db"))
+
+    async def scenario():
+        database = AsyncDatabase(app_settings)
+        service = AsyncFinancialReportService(AsyncFinancialReportRepository(database.session))
+        try:
+            return await service.get_balance_sheet(1, date(2026, 4, 30))
+        finally:
+            await database.dispose()
+
+    balance_sheet = asyncio.run(scenario())
+
+    assert (balance_sheet.total_assets, balance_sheet.total_liabilities, balance_sheet.retained_earnings) == (
+        14700,
+        3000,
+        1700,
+    )
+    assert balance_sheet.balanced
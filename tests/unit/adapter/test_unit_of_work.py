@@ -0,0 +1,257 @@
+"""
+요청 단위 작업(unit of work) 테스트 모듈.
+
+요청 안의 저장소 호출이 커넥션 하나를 함께 쓰고 한 번 커밋하는지, 오류 시 롤백하는지,
+미들웨어가 응답 전에 커밋하고 오류 응답은 롤백하는지, 캐시 무효화와 읽기 고정이 커밋된 뒤에 적용되는지 검증합니다.
+"""
+
+import asyncio
+import contextvars
+import threading
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import Engine, create_engine, event
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.unit_of_work import UnitOfWorkMiddleware
+from personal_cpa.adapter.outbound.cache.chart_of_account import CachedChartOfAccountRepository
+from personal_cpa.adapter.outbound.cache.lru import LRUCache
+from personal_cpa.adapter.outbound.database.model.base import Base
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import (
+    AsyncChartOfAccountRepository,
+    ChartOfAccountRepository,
+)
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase, Database, UnitOfWork
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _chart_of_account(code: str) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+    )
+
+
+def _settings(tmp_path) -> AppSettings:
+    path = tmp_path / "unit_of_work.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+    return AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(path))
+
+
+def _count_checkouts(engine: Engine) -> list[int]:
+    checkouts: list[int] = []
+    event.listen(engine, "checkout", lambda *_: checkouts.append(1))
+    return checkouts
+
+
+def test_unit_of_work_shares_one_connection_and_commits_once(tmp_path):
+    """
+    Test Case: 블록 안의 저장소 호출은 커넥션 하나를 함께 쓰고, 블록이 끝날 때 커밋
+    """
+    database = Database(_settings(tmp_path))
+    repository = ChartOfAccountRepository(database.session, database.read_session, database.record_write)
+    checkouts = _count_checkouts(database._engine)
+    commits = []
+    event.listen(database._engine, "commit", lambda *_: commits.append(1))
+
+    with database.unit_of_work():
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+        assert repository.find_chart_of_account_by_code(1, "1") is not None
+        repository.save_chart_of_accounts([_chart_of_account("2")])
+        assert len(repository.find_chart_of_accounts(1)) == 2
+        assert commits == []
+
+    assert (len(checkouts), len(commits)) == (1, 1)
+    assert len(ChartOfAccountRepository(database.session).find_chart_of_accounts(1)) == 2
+
+
+def test_unit_of_work_rolls_back_on_error(tmp_path):
+    """
+    Test Case: 블록에서 오류가 나면 블록 안의 저장을 모두 롤백
+    """
+    database = Database(_settings(tmp_path))
+    repository = ChartOfAccountRepository(database.session)
+
+    with pytest.raises(RuntimeError), database.unit_of_work():
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+        raise RuntimeError("failed")
+
+    assert repository.find_chart_of_accounts(1) == []
+
+
+def _replica_settings(tmp_path) -> AppSettings:
+    replica = tmp_path / "replica.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{replica}"))
+    return AppSettings(
+        DB_TYPE="sqlite", DB_DATABASE=_settings(tmp_path).DB_DATABASE, DB_REPLICAS=[{"database": str(replica)}]
+    )
+
+
+def test_unit_of_work_reads_own_uncommitted_writes_from_primary(tmp_path):
+    """
+    Test Case: 요청 단위 작업에 커밋되지 않은 쓰기가 있으면 그 요청의 조회는 복제본 대신 주 데이터베이스 세션을 씀
+    """
+    database = Database(_replica_settings(tmp_path))
+    repository = ChartOfAccountRepository(database.session, database.read_session, database.record_write)
+
+    with database.unit_of_work():
+        assert repository.find_chart_of_accounts(1) == []
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+        assert [coa.code for coa in repository.find_chart_of_accounts(1)] == ["1"]
+
+
+def test_async_unit_of_work_reads_own_uncommitted_writes_from_primary(tmp_path):
+    """
+    Test Case: 비동기 데이터베이스도 커밋되지 않은 쓰기가 있으면 주 데이터베이스 세션으로 조회
+    """
+    database = AsyncDatabase(_replica_settings(tmp_path))
+    repository = AsyncChartOfAccountRepository(database.session, database.read_session, database.record_write)
+
+    async def scenario() -> list[str]:
+        try:
+            async with database.unit_of_work():
+                await repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+                return [coa.code for coa in await repository.find_chart_of_accounts(1)]
+        finally:
+            await database.dispose()
+
+    assert asyncio.run(scenario()) == ["1"]
+
+
+def test_async_unit_of_work_shares_one_connection(tmp_path):
+    """
+    Test Case: 비동기 데이터베이스도 블록 안의 호출이 커넥션 하나를 함께 씀
+    """
+    database = AsyncDatabase(_settings(tmp_path))
+    repository = AsyncChartOfAccountRepository(database.session, database.read_session, database.record_write)
+    checkouts = _count_checkouts(database._engine.sync_engine)
+
+    async def scenario() -> int:
+        try:
+            async with database.unit_of_work():
+                await repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+                await repository.find_chart_of_account_by_code(1, "1")
+            return len(await repository.find_chart_of_accounts(1))
+        finally:
+            await database.dispose()
+
+    assert asyncio.run(scenario()) == 1
+    assert len(checkouts) == 2
+
+
+@pytest.mark.parametrize("execution_mode", ["inline", "threadpool"])
+def test_middleware_commits_before_response_and_rolls_back_error_responses(tmp_path, execution_mode):
+    """
+    Test Case: 성공 응답 전에 커밋하여 다음 요청이 데이터를 보고, 오류 응답을 낸 요청의 저장은 롤백
+    """
+    database = Database(_settings(tmp_path))
+    executor = UseCaseExecutor(mode=execution_mode, max_workers=2)
+    repository = ChartOfAccountRepository(database.session, database.read_session, database.record_write)
+    app = FastAPI()
+
+    @app.post("/{code}")
+    async def create(code: str, fail: bool = False):
+        await executor.run(repository.bulk_insert_chart_of_accounts, [_chart_of_account(code)])
+        if fail:
+            raise HTTPException(status_code=409)
+        return {"code": code}
+
+    @app.get("/")
+    async def codes():
+        return [coa.code for coa in await executor.run(repository.find_chart_of_accounts, 1)]
+
+    app.add_middleware(UnitOfWorkMiddleware, database=lambda: database, executor=lambda: executor)
+    client = TestClient(app)
+    checkouts = _count_checkouts(database._engine)
+
+    assert client.post("/1").status_code == 200
+    assert client.post("/2", params={"fail": True}).status_code == 409
+    assert client.get("/").json() == ["1"]
+    assert len(checkouts) == 3
+    executor.shutdown()
+
+
+def test_middleware_commits_once_and_closes_sync_session_off_event_loop(tmp_path, monkeypatch):
+    """
+    Test Case: 동기 데이터베이스는 응답 전에 실행기에서 한 번만 커밋하고, 세션도 이벤트 루프 밖에서 닫음
+    """
+    database = Database(_settings(tmp_path))
+    executor = UseCaseExecutor(mode="threadpool", max_workers=2)
+    repository = ChartOfAccountRepository(database.session, database.read_session, database.record_write)
+    commits: list[int] = []
+    commit = UnitOfWork.commit
+
+    def counting_commit(unit_of_work: UnitOfWork) -> None:
+        commits.append(1)
+        commit(unit_of_work)
+
+    monkeypatch.setattr(UnitOfWork, "commit", counting_commit)
+    loop_threads: list[int] = []
+    checkin_threads: list[int] = []
+    event.listen(database._engine, "checkin", lambda *_: checkin_threads.append(threading.get_ident()))
+    app = FastAPI()
+
+    @app.post("/{code}")
+    async def create(code: str):
+        loop_threads.append(threading.get_ident())
+        await executor.run(repository.bulk_insert_chart_of_accounts, [_chart_of_account(code)])
+        return {"code": code}
+
+    app.add_middleware(UnitOfWorkMiddleware, database=lambda: database, executor=lambda: executor)
+
+    assert TestClient(app).post("/1").status_code == 200
+    assert commits == [1]
+    assert checkin_threads and loop_threads[0] not in checkin_threads
+    executor.shutdown()
+
+
+def test_cache_is_invalidated_after_commit(tmp_path):
+    """
+    Test Case: 요청 단위 작업의 쓰기는 커밋된 뒤에 캐시를 무효화하고, 커밋 전에는 그 요청의 조회가 캐시를 거치지 않음
+    """
+    database = Database(_settings(tmp_path))
+    repository = CachedChartOfAccountRepository(
+        ChartOfAccountRepository(database.session, database.read_session, database.record_write),
+        LRUCache(max_size=8, ttl_seconds=300),
+        after_commit=database.after_commit,
+        has_pending_writes=database.has_pending_writes,
+    )
+    repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+
+    def codes() -> list[str]:
+        return [coa.code for coa in repository.find_chart_of_accounts(1)]
+
+    with database.unit_of_work():
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("2")])
+        assert codes() == ["1", "2"]
+        # 커밋 전의 동시 요청은 커밋된 데이터만 보고 캐시에 채움
+        assert contextvars.Context().run(codes) == ["1"]
+
+    assert codes() == ["1", "2"]
+    assert database.read_your_writes.is_pinned(1)
+
+
+def test_read_your_writes_pin_is_dropped_on_rollback(tmp_path):
+    """
+    Test Case: 롤백된 쓰기는 읽기 고정을 남기지 않고, 요청 단위 작업의 쓰기는 커밋된 뒤에 고정
+    """
+    database = Database(_settings(tmp_path))
+    repository = ChartOfAccountRepository(database.session, database.read_session, database.record_write)
+
+    with pytest.raises(RuntimeError), database.unit_of_work():
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+        raise RuntimeError("failed")
+    assert not database.read_your_writes.is_pinned(1)
+
+    with database.unit_of_work():
+        repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+        assert not database.read_your_writes.is_pinned(1)
+    assert database.read_your_writes.is_pinned(1)
@@ -0,0 +1,121 @@
+"""
+유즈케이스 실행기 테스트 모듈.
+
+inline/threadpool 모드별 실행 스레드, 스레드 풀 동시 실행 제한과 대기 통계,
+비동기 유즈케이스 처리와 contextvar 전파를 검증합니다.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def _current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+def test_inline_mode_runs_on_event_loop_thread():
+    """
+    Test Case: inline 모드는 이벤트 루프 스레드에서 실행하고 작업 스레드가 없음
+    """
+    executor = UseCaseExecutor(mode="inline", max_workers=4)
+
+    thread_name = asyncio.run(executor.run(_current_thread_name))
+
+    assert thread_name == threading.current_thread().name
+    assert executor.stats().max_workers == 0
+
+
+def test_threadpool_mode_runs_on_worker_thread_with_context():
+    """
+    Test Case: threadpool 모드는 작업 스레드에서 실행하고 contextvar를 전파함
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=2)
+
+    def use_case(suffix: str) -> str:
+        return f"{_current_thread_name()}:{request_id.get()}:{suffix}"
+
+    async def call() -> str:
+        request_id.set("req-1")
+        return await executor.run(use_case, "done")
+
+    try:
+        result = asyncio.run(call())
+    finally:
+        executor.shutdown()
+
+    assert result.startswith("use-case")
+    assert result.endswith(":req-1:done")
+
+
+def test_threadpool_mode_bounds_concurrency_and_records_wait():
+    """
+    Test Case: 동시 실행 수는 작업 스레드 수로 제한되고, 대기한 작업은 대기 통계에 집계됨
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def use_case() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    async def call() -> None:
+        await asyncio.gather(*(executor.run(use_case) for _ in range(6)))
+
+    try:
+        asyncio.run(call())
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert max_running == 2
+    assert stats.completed == 6
+    assert stats.queued == 0
+    assert stats.running == 0
+    assert stats.max_queued >= 4
+    assert stats.max_wait_seconds > 0
+    assert stats.to_dict()["average_wait_seconds"] > 0
+
+
+def test_async_use_case_is_awaited_on_event_loop():
+    """
+    Test Case: 비동기 유즈케이스는 스레드 풀을 거치지 않고 이벤트 루프에서 await 함
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=1)
+
+    async def use_case(value: int) -> tuple[str, int]:
+        return _current_thread_name(), value
+
+    try:
+        thread_name, value = asyncio.run(executor.run(use_case, 3))
+    finally:
+        executor.shutdown()
+
+    assert thread_name == threading.current_thread().name
+    assert value == 3
+    assert executor.stats().completed == 0
+
+
+def test_invalid_configuration_is_rejected():
+    """
+    Test Case: 지원하지 않는 실행 모드, 0 이하의 작업 스레드 수 검사
+    """
+    with pytest.raises(ValueError, match="Unsupported"):
+        UseCaseExecutor(mode="process", max_workers=1)  # pyright: ignore[reportArgumentType]
+
+    with pytest.raises(ValueError, match="max_workers"):
+        UseCaseExecutor(mode="threadpool", max_workers=0)
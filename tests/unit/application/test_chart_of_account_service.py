@@ -0,0 +1,331 @@
+"""
+ChartOfAccountService 테스트 모듈.
+
+저장소 호출 횟수를 기록하는 인메모리 포트를 사용하여 계정과목 일괄 생성 시
+조회가 한 번으로 묶이는지, 같은 요청 안의 상위 계정과목이 검증되는지 확인합니다.
+"""
+
+import pytest
+
+from personal_cpa.application.port.input.command.chart_of_account import (
+    CreateChartOfAccountCommand,
+    ImportChartOfAccountRow,
+)
+from personal_cpa.application.port.output.chart_of_account import ChartOfAccountPort
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+class InMemoryChartOfAccountPort(ChartOfAccountPort):
+    """
+    호출 횟수를 기록하는 인메모리 계정과목 저장소
+    """
+
+    def __init__(self, chart_of_accounts: list[ChartOfAccount] | None = None):
+        """
+        초기화
+
+        Args:
+            chart_of_accounts: 미리 저장해 둘 계정과목 목록
+        """
+        self.chart_of_accounts = list(chart_of_accounts or [])
+        self.calls: list[str] = []
+
+    def save_chart_of_accounts(self, chart_of_accounts):
+        """
+        계정과목 저장
+        """
+        self.calls.append("save_chart_of_accounts")
+        self.chart_of_accounts.extend(chart_of_accounts)
+        return chart_of_accounts
+
+    def bulk_insert_chart_of_accounts(self, chart_of_accounts):
+        """
+        계정과목 일괄 저장
+        """
+        self.calls.append("bulk_insert_chart_of_accounts")
+        self.chart_of_accounts.extend(chart_of_accounts)
+        return chart_of_accounts
+
+    def find_chart_of_accounts(self, user_id):
+        """
+        유저의 계정과목 목록 조회
+        """
+        self.calls.append("find_chart_of_accounts")
+        return [coa for coa in self.chart_of_accounts if coa.user_id == user_id]
+
+    def stream_chart_of_accounts(self, user_id, batch_size=1000):
+        """
+        유저의 계정과목 목록을 코드순으로 조회
+        """
+        self.calls.append("stream_chart_of_accounts")
+        yield from sorted((coa for coa in self.chart_of_accounts if coa.user_id == user_id), key=lambda coa: coa.code)
+
+    def find_chart_of_account_by_code(self, user_id, code):
+        """
+        코드로 계정과목 조회
+        """
+        self.calls.append("find_chart_of_account_by_code")
+        return next((coa for coa in self.find_chart_of_accounts(user_id) if coa.code == code), None)
+
+    def find_chart_of_accounts_by_codes(self, user_id, codes):
+        """
+        코드 목록으로 계정과목 조회
+        """
+        self.calls.append("find_chart_of_accounts_by_codes")
+        return [coa for coa in self.chart_of_accounts if coa.user_id == user_id and coa.code in codes]
+
+    def find_chart_of_account_subtree(self, user_id, code, max_depth=None):
+        """
+        코드 접두사로 하위 트리 조회
+        """
+        self.calls.append("find_chart_of_account_subtree")
+        return [
+            coa
+            for coa in self.chart_of_accounts
+            if coa.user_id == user_id
+            and (coa.code == code or coa.code.startswith(f"{code}_"))
+            and (max_depth is None or coa.depth <= code.count("_") + max_depth)
+        ]
+
+    def find_chart_of_account_ancestors(self, user_id, code):
+        """
+        코드 접두사로 상위 계정과목 조회
+        """
+        self.calls.append("find_chart_of_account_ancestors")
+        return [coa for coa in self.chart_of_accounts if coa.user_id == user_id and code.startswith(f"{coa.code}_")]
+
+    def modify_chart_of_account(self, user_id, code, chart_of_account):
+        """
+        사용하지 않음
+        """
+        raise NotImplementedError
+
+
+def _command(
+    code: str, parent_code: str | None = None, category: AccountType = AccountType.ASSET, currency: str = "KRW"
+):
+    return CreateChartOfAccountCommand(
+        code=code, name=f"계정 {code}", category=category, description=None, parent_code=parent_code, currency=currency
+    )
+
+
+def _stored(code: str, id: int, *, is_hidden: bool = False) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+        is_hidden=is_hidden,
+        id=id,
+    )
+
+
+def test_create_chart_of_accounts_resolves_codes_in_single_lookup():
+    """
+    Test Case: 계정과목 수와 무관하게 조회 1회, 저장 1회만 수행
+    """
+    port = InMemoryChartOfAccountPort([_stored("1", id=10)])
+    service = ChartOfAccountService(port)
+
+    commands = [_command(f"1_{index}", parent_code="1") for index in range(100)]
+    created = service.create_chart_of_accounts(1, commands)
+
+    assert port.calls == ["find_chart_of_accounts_by_codes", "bulk_insert_chart_of_accounts"]
+    assert len(created) == 100
+    assert {coa.parent_chart_of_account_id for coa in created} == {10}
+
+
+def test_create_chart_of_accounts_accepts_parent_created_earlier_in_batch():
+    """
+    Test Case: 같은 요청에서 먼저 생성되는 상위 계정과목 허용
+    """
+    port = InMemoryChartOfAccountPort()
+    service = ChartOfAccountService(port)
+
+    created = service.create_chart_of_accounts(1, [_command("1"), _command("1_1", "1"), _command("1_1_1", "1_1")])
+
+    assert [coa.code for coa in created] == ["1", "1_1", "1_1_1"]
+    assert all(coa.parent_chart_of_account_id is None for coa in created)
+
+
+def test_create_chart_of_accounts_rejects_parent_created_later_in_batch():
+    """
+    Test Case: 상위 계정과목이 하위 계정과목보다 뒤에 있으면 오류
+    """
+    service = ChartOfAccountService(InMemoryChartOfAccountPort())
+
+    with pytest.raises(ValueError, match="Parent chart of account with code 1 not found"):
+        service.create_chart_of_accounts(1, [_command("1_1", "1"), _command("1")])
+
+
+def test_create_chart_of_accounts_rejects_existing_and_duplicated_codes():
+    """
+    Test Case: 이미 존재하는 코드, 요청 안에서 중복된 코드 검사
+    """
+    service = ChartOfAccountService(InMemoryChartOfAccountPort([_stored("1", id=1)]))
+
+    with pytest.raises(ValueError, match="already exists"):
+        service.create_chart_of_accounts(1, [_command("1")])
+
+    with pytest.raises(ValueError, match="duplicated in the request"):
+        service.create_chart_of_accounts(1, [_command("2"), _command("2")])
+
+
+def test_create_chart_of_accounts_validates_in_batch_parent_category():
+    """
+    Test Case: 같은 요청의 상위 계정과목과 카테고리가 다르면 오류
+    """
+    service = ChartOfAccountService(InMemoryChartOfAccountPort())
+
+    with pytest.raises(ValueError, match="must match"):
+        service.create_chart_of_accounts(1, [_command("2"), _command("2_1", "2", category=AccountType.LIABILITY)])
+
+
+def test_create_chart_of_accounts_rejects_hidden_parent():
+    """
+    Test Case: 숨김 처리된 상위 계정과목 하위에는 생성 불가
+    """
+    service = ChartOfAccountService(InMemoryChartOfAccountPort([_stored("1", id=1, is_hidden=True)]))
+
+    with pytest.raises(ValueError, match="is hidden"):
+        service.create_chart_of_accounts(1, [_command("1_1", "1")])
+
+
+def test_create_chart_of_accounts_rejects_child_currency_different_from_parent():
+    """
+    Test Case: 저장된 상위 계정과목 또는 같은 요청의 상위 계정과목과 통화가 다르면 오류 (가져오기는 행별 오류)
+    """
+    port = InMemoryChartOfAccountPort([_stored("1", id=1)])
+    service = ChartOfAccountService(port)
+
+    with pytest.raises(ValueError, match="currency KRW must match the current account's currency USD"):
+        service.create_chart_of_accounts(1, [_command("1_1", "1", currency="USD")])
+    with pytest.raises(ValueError, match="currency USD must match the current account's currency KRW"):
+        service.create_chart_of_accounts(1, [_command("2", currency="USD"), _command("2_1", "2")])
+
+    result = service.import_chart_of_accounts(
+        1,
+        [
+            ImportChartOfAccountRow(line=1, code="3", command=_command("3", currency="USD")),
+            ImportChartOfAccountRow(line=2, code="3_1", command=_command("3_1", "3", currency="USD")),
+            ImportChartOfAccountRow(line=3, code="1_1", command=_command("1_1", "1", currency="USD")),
+        ],
+    )
+    assert (result.created, result.failed) == (2, 1)
+    assert [(error.line, error.code) for error in result.errors] == [(3, "1_1")]
+
+
+def _stored_tree(codes: list[str], hidden_codes: tuple[str, ...] = ()) -> list[ChartOfAccount]:
+    ids = {code: index for index, code in enumerate(codes, start=1)}
+    return [
+        ChartOfAccount(
+            user_id=1,
+            code=code,
+            name=f"계정 {code}",
+            category=AccountType.ASSET,
+            description=None,
+            parent_chart_of_account_id=ids.get(code.rpartition("_")[0]),
+            is_hidden=code in hidden_codes,
+            id=ids[code],
+        )
+        for code in codes
+    ]
+
+
+def test_get_chart_of_account_subtree_builds_only_requested_slice():
+    """
+    Test Case: 하위 트리 조회 1회로 요청한 깊이까지만 트리를 만들고, 잘린 계정과목의 하위 계정과목 수를 채움
+    """
+    port = InMemoryChartOfAccountPort(_stored_tree(["1", "2", "1_1", "1_2", "1_1_1", "1_1_2", "1_1_1_1", "2_1"]))
+    service = ChartOfAccountService(port)
+
+    tree = service.get_chart_of_account_subtree(1, "1", depth=1)
+
+    assert port.calls == ["find_chart_of_account_subtree"]
+    assert tree.code == "1"
+    assert tree.child_count == 2
+    assert [(child.code, child.child_count, child.has_children, child.children) for child in tree.children] == [
+        ("1_1", 2, True, []),
+        ("1_2", 0, False, []),
+    ]
+
+    tree = service.get_chart_of_account_subtree(1, "1_1", depth=2)
+    assert [child.code for child in tree.children] == ["1_1_1", "1_1_2"]
+    assert [grandchild.code for grandchild in tree.children[0].children] == ["1_1_1_1"]
+
+    tree = service.get_chart_of_account_subtree(1, "1", depth=0)
+    assert (tree.children, tree.child_count) == ([], 2)
+
+
+def test_get_chart_of_account_subtree_skips_hidden_accounts():
+    """
+    Test Case: 숨김 계정과목과 그 하위 계정과목은 트리와 하위 계정과목 수에서 제외
+    """
+    service = ChartOfAccountService(
+        InMemoryChartOfAccountPort(_stored_tree(["1", "1_1", "1_2", "1_1_1"], hidden_codes=("1_1",)))
+    )
+
+    tree = service.get_chart_of_account_subtree(1, "1", depth=2)
+
+    assert [child.code for child in tree.children] == ["1_2"]
+    assert tree.child_count == 1
+    assert service.get_chart_of_account_subtree(1, "1_1", depth=1) is None
+    assert service.get_chart_of_account_subtree(1, "9", depth=1) is None
+
+
+def test_get_chart_of_accounts_fills_child_count():
+    """
+    Test Case: 전체 트리 조회도 하위 계정과목 수를 채움
+    """
+    service = ChartOfAccountService(InMemoryChartOfAccountPort(_stored_tree(["1", "1_1", "1_2", "2"])))
+
+    roots = service.get_chart_of_accounts(1)
+
+    assert [(root.code, root.child_count, root.has_children) for root in roots] == [("1", 2, True), ("2", 0, False)]
+
+
+def _import_rows(codes: list[str]) -> list[ImportChartOfAccountRow]:
+    return [
+        ImportChartOfAccountRow(line=line, code=code, command=_command(code, code.rpartition("_")[0] or None))
+        for line, code in enumerate(codes, start=1)
+    ]
+
+
+def test_import_chart_of_accounts_orders_parents_before_children_and_commits_in_chunks():
+    """
+    Test Case: 파일 순서와 무관하게 상위 계정과목을 먼저 저장하고, 묶음마다 조회 1회 + 저장 1회로 커밋
+    """
+    port = InMemoryChartOfAccountPort()
+    service = ChartOfAccountService(port, import_chunk_size=2)
+
+    result = service.import_chart_of_accounts(1, _import_rows(["1_1_1", "2", "1_1", "1", "1_2"]))
+
+    assert (result.created, result.chunks, result.failed) == (5, 3, 0)
+    assert [coa.code for coa in port.chart_of_accounts] == ["2", "1", "1_1", "1_2", "1_1_1"]
+    assert port.calls == ["find_chart_of_accounts_by_codes", "bulk_insert_chart_of_accounts"] * 3
+
+
+def test_import_chart_of_accounts_reports_row_errors_without_aborting():
+    """
+    Test Case: 파싱 오류, 이미 존재하는 코드, 중복 코드, 실패한 상위 계정과목의 하위 계정과목을 행별 오류로 보고
+    """
+    port = InMemoryChartOfAccountPort([_stored("1", id=1)])
+    service = ChartOfAccountService(port)
+    rows = [
+        *_import_rows(["1", "2", "2", "2_1", "3"]),
+        ImportChartOfAccountRow(line=6, code="4", error="category: Input should be a valid integer"),
+        ImportChartOfAccountRow(line=7, code="4_1", command=_command("4_1", "4")),
+    ]
+
+    result = service.import_chart_of_accounts(1, rows)
+
+    assert (result.created, result.failed) == (3, 4)
+    assert [coa.code for coa in port.chart_of_accounts] == ["1", "2", "3", "2_1"]
+    assert [(error.line, error.code) for error in result.errors] == [(1, "1"), (3, "2"), (6, "4"), (7, "4_1")]
+    assert "already exists" in result.errors[0].message
+    assert "duplicated in the request" in result.errors[1].message
+    assert "Parent chart of account with code 4 not found" in result.errors[3].message
@@ -13,7 +13,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 
 from personal_cpa.config import AppSettings
-from personal_cpa.database import Database
+from personal_cpa.database import Database, WaitTrackingQueuePool
 
 # 테스트용 Base 모델
 Base = declarative_base()
@@ -89,11 +89,13 @@ def test_database_init(app_settings):
 
         mock_create_engine.assert_called_once_with(
             app_settings.database_url,
-            pool_size=app_settings.DB_POOL_CONNECTION_LIMIT,
-            max_overflow=app_settings.DB_POOL_MAX_IDLE,
-            pool_timeout=app_settings.DB_POOL_IDLE_TIMEOUT,
-            pool_pre_ping=True,
-            echo=True,
+            poolclass=WaitTrackingQueuePool,
+            pool_size=app_settings.DB_POOL.size,
+            max_overflow=app_settings.DB_POOL.max_overflow,
+            pool_timeout=app_settings.DB_POOL.timeout_seconds,
+            pool_recycle=app_settings.DB_POOL.recycle_seconds,
+            pool_pre_ping=app_settings.DB_POOL.pre_ping == "always",
+            pool_use_lifo=app_settings.DB_POOL.use_lifo,
         )
 
 
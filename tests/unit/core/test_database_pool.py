@@ -0,0 +1,115 @@
+"""
+DB 커넥션 풀 설정/통계 테스트 모듈.
+
+풀 설정 검증, 풀이 가득 찼을 때 설정한 대기 시간 안에 실패하는 동작(fail-fast)과 대기/시간 초과 집계를 검증합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from pydantic import ValidationError
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from personal_cpa.config import AppSettings, DatabasePoolSettings
+from personal_cpa.database import Database
+
+
+def _database(tmp_path, **pool: object) -> Database:
+    return Database(AppSettings(DB_TYPE="sqlite", DB_DATABASE=str(tmp_path / "pool.db"), DB_POOL=pool))
+
+
+@pytest.mark.parametrize(
+    ("pool", "message"),
+    [
+        ({"size": 0}, "greater than or equal to 1"),
+        ({"max_overflow": -1}, "greater than or equal to 0"),
+        ({"timeout_seconds": 60_000}, "less than or equal to 60"),
+        ({"recycle_seconds": 0}, "recycle_seconds must be positive"),
+        ({"recycle_seconds": -1, "pre_ping": "never"}, "requires recycle_seconds"),
+        ({"pre_ping": "sometimes"}, "'always' or 'never'"),
+    ],
+)
+def test_pool_settings_reject_invalid_values(pool, message):
+    """
+    Test Case: 잘못된 풀 설정은 설정을 읽는 시점(애플리케이션 시작)에 실패
+    """
+    with pytest.raises(ValidationError, match=message):
+        AppSettings(DB_POOL=pool)
+
+
+def test_pool_settings_map_to_engine_options():
+    """
+    Test Case: pre_ping 전략과 LIFO 설정이 엔진 옵션으로 변환됨
+    """
+    options = DatabasePoolSettings(size=2, pre_ping="always", recycle_seconds=-1, use_lifo=False).engine_options()
+
+    assert options == {
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_timeout": 5.0,
+        "pool_recycle": -1,
+        "pool_pre_ping": True,
+        "pool_use_lifo": False,
+    }
+
+
+def test_exhausted_pool_fails_fast_and_counts_timeouts(tmp_path):
+    """
+    Test Case: 풀이 가득 차면 커넥션을 기다리는 요청들이 설정한 대기 시간 안에 실패하고, 대기/시간 초과가 집계됨
+    """
+    database = _database(tmp_path, size=1, max_overflow=0, timeout_seconds=0.1)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold_connection() -> None:
+        with database.session() as session:
+            session.execute(text("SELECT 1"))
+            holding.set()
+            release.wait()
+
+    def checkout() -> float:
+        started = time.perf_counter()
+        with pytest.raises(PoolTimeoutError), database.session() as session:
+            session.execute(text("SELECT 1"))
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=9) as pool:
+        holder = pool.submit(hold_connection)
+        assert holding.wait(timeout=5)
+        elapsed = list(pool.map(lambda _: checkout(), range(8)))
+        release.set()
+        holder.result()
+
+    stats = database.pool_stats()
+    assert max(elapsed) < 1.0
+    assert (stats.waits, stats.timeouts) == (8, 8)
+    assert stats.wait_seconds >= 8 * 0.1
+    assert (stats.checked_out, stats.checked_in) == (0, 1)
+
+
+def test_waiting_checkout_succeeds_when_connection_returned(tmp_path):
+    """
+    Test Case: 대기 시간 안에 커넥션이 반환되면 대기만 집계하고 체크아웃은 성공
+    """
+    database = _database(tmp_path, size=1, max_overflow=0, timeout_seconds=5)
+    holding = threading.Event()
+
+    def hold_connection() -> None:
+        with database.session() as session:
+            session.execute(text("SELECT 1"))
+            holding.set()
+            time.sleep(0.05)
+
+    holder = threading.Thread(target=hold_connection)
+    holder.start()
+    assert holding.wait(timeout=5)
+    with database.session() as session:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+    holder.join()
+
+    stats = database.pool_stats()
+    assert (stats.waits, stats.timeouts) == (1, 0)
+    assert stats.wait_seconds > 0
@@ -0,0 +1,154 @@
+"""
+읽기 복제본 라우팅 테스트 모듈.
+
+SQLite 파일 두세 개를 주 데이터베이스/복제본 대용으로 사용하여, 저장소의 조회가 복제본으로 가고
+저장한 유저의 조회는 읽기 고정 시간 동안 주 데이터베이스로 가는지 검증합니다.
+(복제는 하지 않으므로 복제본에는 직접 넣은 행만 보입니다)
+"""
+
+import asyncio
+
+from sqlalchemy import create_engine
+
+from personal_cpa.adapter.outbound.database.model.base import Base
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import (
+    AsyncChartOfAccountRepository,
+    ChartOfAccountRepository,
+)
+from personal_cpa.adapter.outbound.database.repository.journal import JournalRepository
+from personal_cpa.config import AppSettings
+from personal_cpa.database import AsyncDatabase, Database
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+
+
+def _chart_of_account(code: str, user_id: int = 1) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=user_id,
+        code=code,
+        name=f"계정 {code}",
+        category=AccountType.ASSET,
+        description=None,
+        parent_chart_of_account_id=None,
+    )
+
+
+def _settings(tmp_path, replicas: int) -> AppSettings:
+    paths = [tmp_path / "primary.db", *(tmp_path / f"replica_{index}.db" for index in range(replicas))]
+    for path in paths:
+        Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+    return AppSettings(
+        DB_TYPE="sqlite",
+        DB_DATABASE=str(paths[0]),
+        DB_REPLICAS=[{"database": str(path)} for path in paths[1:]],
+        DB_READ_YOUR_WRITES_SECONDS=5,
+    )
+
+
+def _repository(database: Database) -> ChartOfAccountRepository:
+    return ChartOfAccountRepository(
+        database.session, read_session_factory=database.read_session, write_recorder=database.record_write
+    )
+
+
+def _replicate(settings: AppSettings, index: int, chart_of_account: ChartOfAccount) -> None:
+    replica = Database(settings.model_copy(update={"DB_DATABASE": settings.DB_REPLICAS[index].database}))
+    ChartOfAccountRepository(replica.session).save_chart_of_accounts([chart_of_account])
+
+
+def test_replica_urls_fall_back_to_primary_settings():
+    """
+    Test Case: 복제본 설정에 없는 항목은 주 데이터베이스 설정을 사용
+    """
+    settings = AppSettings(DB_TYPE="mysql", DB_HOST="primary", DB_PORT=3306, DB_REPLICAS=[{"host": "replica"}])
+
+    assert settings.replica_database_urls == [settings.database_url.replace("@primary:", "@replica:")]
+    assert settings.replica_async_database_urls[0].startswith("mysql+aiomysql://")
+
+
+def test_reads_use_replica_except_within_read_your_writes_window(tmp_path, fake_clock):
+    """
+    Test Case: 저장한 유저는 읽기 고정 시간 동안 주 데이터베이스에서, 그 밖의 조회는 복제본에서 읽음
+    """
+    settings = _settings(tmp_path, replicas=1)
+    repository = _repository(Database(settings, clock=fake_clock))
+
+    repository.save_chart_of_accounts([_chart_of_account("1")])
+    repository.save_chart_of_accounts([_chart_of_account("1", user_id=2)])
+    _replicate(settings, 0, _chart_of_account("9", user_id=3))
+
+    assert repository.find_chart_of_account_by_code(1, "1") is not None
+    assert [coa.code for coa in repository.find_chart_of_accounts(3)] == ["9"]
+
+    fake_clock.now = 5
+    assert repository.find_chart_of_account_by_code(1, "1") is None
+    assert repository.find_chart_of_accounts_by_codes(2, ["1"]) == []
+
+
+def test_journal_write_checks_read_primary_outside_read_your_writes_window(tmp_path, fake_clock):
+    """
+    Test Case: 분개 저장 전에 확인하는 계정과목은 읽기 고정 시간이 지나도 주 데이터베이스에서 읽음
+    """
+    settings = _settings(tmp_path, replicas=1)
+    database = Database(settings, clock=fake_clock)
+    [saved] = _repository(database).save_chart_of_accounts([_chart_of_account("1")])
+    journal_repository = JournalRepository(
+        database.session, read_session_factory=database.read_session, write_recorder=database.record_write
+    )
+
+    fake_clock.now = 5
+
+    assert journal_repository.find_postable_chart_of_account_ancestors(1, [saved.id]) == {saved.id: ()}
+    assert journal_repository.find_chart_of_account_currencies(1, [saved.id]) == {saved.id: saved.currency}
+    assert journal_repository.find_closed_period(1) is None
+
+
+def test_reads_rotate_across_replicas(tmp_path):
+    """
+    Test Case: 복제본이 여러 개면 조회마다 돌아가며 사용
+    """
+    settings = _settings(tmp_path, replicas=2)
+    repository = _repository(Database(settings))
+    _replicate(settings, 0, _chart_of_account("1"))
+    _replicate(settings, 1, _chart_of_account("2"))
+
+    codes = [[coa.code for coa in repository.find_chart_of_accounts(1)] for _ in range(4)]
+
+    assert codes == [["1"], ["2"], ["1"], ["2"]]
+
+
+def test_reads_use_primary_without_replicas(tmp_path):
+    """
+    Test Case: 복제본이 없으면 조회도 주 데이터베이스 사용
+    """
+    repository = _repository(Database(_settings(tmp_path, replicas=0)))
+
+    repository.bulk_insert_chart_of_accounts([_chart_of_account("1")])
+
+    assert repository.find_chart_of_account_by_code(1, "1") is not None
+
+
+def test_async_reads_use_replica_except_within_read_your_writes_window(tmp_path, fake_clock):
+    """
+    Test Case: 비동기 데이터베이스도 같은 방식으로 복제본/주 데이터베이스를 고름
+    """
+    settings = _settings(tmp_path, replicas=1)
+
+    async def scenario() -> tuple:
+        database = AsyncDatabase(settings, clock=fake_clock)
+        repository = AsyncChartOfAccountRepository(
+            database.session, read_session_factory=database.read_session, write_recorder=database.record_write
+        )
+        try:
+            await repository.save_chart_of_accounts([_chart_of_account("1")])
+            pinned = await repository.find_chart_of_account_by_code(1, "1")
+            fake_clock.now = 5
+            replica = await repository.find_chart_of_account_by_code(1, "1")
+            return pinned, replica
+        finally:
+            await database.dispose()
+
+    pinned, replica = asyncio.run(scenario())
+
+    assert pinned is not None
+    assert replica is None
@@ -0,0 +1,80 @@
+"""
+로깅 설정 테스트 모듈.
+
+큐 기반 비동기 로깅 파이프라인, JSON 출력 형식, SQL 로그 레벨 설정을 검증합니다.
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from personal_cpa.config import AppSettings, get_settings
+from personal_cpa.logger import setup_logging, stop_logging
+
+
+@pytest.fixture
+def restore_logging():
+    """
+    테스트가 바꾼 전역 로깅 설정을 애플리케이션 설정으로 되돌립니다.
+
+    Yields:
+        None
+    """
+    yield
+    setup_logging(get_settings())
+
+
+def test_async_pipeline_merges_arguments_on_caller_and_flushes_on_stop(tmp_path, restore_logging):
+    """
+    Test Case: 메시지 인자는 로그를 남긴 스레드에서 병합(이후 값이 바뀌어도 영향 없음)하고, 중지 시 큐에 남은 로그를 모두 기록
+    """
+    settings = AppSettings(LOG_FILE=str(tmp_path / "app.log"), LOG_LEVEL="INFO", LOG_ASYNC=True)
+    setup_logging(settings)
+    merging_threads = set()
+
+    class Message:
+        def __str__(self) -> str:
+            merging_threads.add(threading.current_thread().name)
+            return "merged"
+
+    logger = logging.getLogger(settings.APP_NAME)
+    logger.info("%s message", Message())
+    for index in range(100):
+        logger.info(f"message {index}")
+    stop_logging()
+
+    lines = (tmp_path / "app.log").read_text().splitlines()
+    assert len(lines) == 101
+    assert lines[0].endswith("merged message")
+    assert merging_threads == {threading.current_thread().name}
+
+
+def test_json_format_writes_one_object_per_line(tmp_path, restore_logging):
+    """
+    Test Case: JSON 형식은 한 줄에 하나의 객체를 쓰고, 예외는 별도 필드로 기록
+    """
+    settings = AppSettings(LOG_FILE=str(tmp_path / "app.log"), LOG_LEVEL="INFO", LOG_FORMAT="json")
+    setup_logging(settings)
+
+    logger = logging.getLogger(settings.APP_NAME)
+    logger.info("계정과목 생성")
+    logger.error("failed", exc_info=ValueError("invalid"))
+    stop_logging()
+
+    entries = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert [(entry["level"], entry["message"]) for entry in entries] == [("INFO", "계정과목 생성"), ("ERROR", "failed")]
+    assert "ValueError: invalid" in entries[1]["exception"]
+    assert "exception" not in entries[0]
+
+
+def test_db_echo_level_configures_sqlalchemy_logger(tmp_path, restore_logging):
+    """
+    Test Case: SQL 로그는 엔진 echo 대신 `sqlalchemy.engine` 로거 레벨로 설정
+    """
+    setup_logging(AppSettings(LOG_FILE=str(tmp_path / "app.log"), DB_ECHO_LEVEL="INFO"))
+    assert logging.getLogger("sqlalchemy.engine").level == logging.INFO
+
+    setup_logging(AppSettings(LOG_FILE=str(tmp_path / "app.log"), DB_ECHO_LEVEL="WARNING"))
+    assert logging.getLogger("sqlalchemy.engine").level == logging.WARNING
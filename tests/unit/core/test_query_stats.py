@@ -0,0 +1,125 @@
+"""
+SQL 실행 계측 테스트 모듈.
+
+`track_queries`의 SQL 문 수/DB 시간 집계, 예산 초과 시 실패, 스레드/비동기 엔진으로의 컨텍스트 전파와
+미들웨어의 응답 헤더를 검증합니다. 예산으로 계정과목 일괄 생성의 N+1 쿼리 회귀를 막는 테스트를 포함합니다.
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from personal_cpa.adapter.inbound.api.executor import UseCaseExecutor
+from personal_cpa.adapter.inbound.api.metrics import HttpMetrics, MetricsMiddleware
+from personal_cpa.adapter.outbound.database.repository.chart_of_account import ChartOfAccountRepository
+from personal_cpa.application.port.input.command.chart_of_account import CreateChartOfAccountCommand
+from personal_cpa.application.service.chart_of_account import ChartOfAccountService
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from personal_cpa.exceptions import QueryBudgetExceededError
+from personal_cpa.query_stats import track_queries
+
+
+def _command(code: str, parent_code: str | None = None) -> CreateChartOfAccountCommand:
+    return CreateChartOfAccountCommand(
+        code=code, name=f"계정 {code}", category=AccountType.ASSET, description=None, parent_code=parent_code
+    )
+
+
+def test_track_queries_counts_statements_and_time(sqlite_engine):
+    """
+    Test Case: 블록 안의 SQL 문만 집계하고, 실패한 SQL 문도 개수에 포함
+    """
+    with sqlite_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            with pytest.raises(Exception, match="no such table"):
+                connection.execute(text("SELECT * FROM missing_table"))
+
+    assert stats.statements == 2
+    assert stats.seconds > 0
+    assert not stats.over_budget
+
+
+def test_track_queries_fails_before_statement_over_budget(sqlite_engine):
+    """
+    Test Case: error 모드는 예산을 넘는 SQL 문을 실행하기 전에 실패하고, warn 모드는 집계만 함
+    """
+    with sqlite_engine.connect() as connection:
+        with pytest.raises(QueryBudgetExceededError, match="2 statements > 1"), track_queries(budget=1):
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        with track_queries(budget=1, mode="warn") as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert stats.over_budget
+
+
+def test_create_chart_of_accounts_stays_within_query_budget(session_factory):
+    """
+    Test Case: 계정과목 300개 일괄 생성이 계정과목 수와 무관한 SQL 문 수로 끝남 (N+1 회귀 방지)
+    """
+    service = ChartOfAccountService(ChartOfAccountRepository(session_factory))
+    commands = [_command("1"), *(_command(f"1_{index}", "1") for index in range(100))]
+    commands += [_command(f"1_{index}_{child}", f"1_{index}") for index in range(100) for child in range(2)]
+
+    with track_queries(budget=10) as stats:
+        service.create_chart_of_accounts(1, commands)
+
+    assert stats.statements <= 10
+
+
+def test_track_queries_follows_executor_threads_and_async_engine(sqlite_engine, tmp_path):
+    """
+    Test Case: threadpool 실행기의 작업 스레드와 비동기 엔진에서 실행한 SQL 문도 같은 집계로 모임
+    """
+    executor = UseCaseExecutor(mode="threadpool", max_workers=2)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+
+    def run_sync() -> None:
+        with sqlite_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def run() -> None:
+        await executor.run(run_sync)
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        await async_engine.dispose()
+
+    with track_queries() as stats:
+        asyncio.run(run())
+    executor.shutdown()
+
+    assert stats.statements == 2
+
+
+def test_middleware_reports_query_count_headers_and_enforces_budget(sqlite_engine):
+    """
+    Test Case: 응답 헤더와 라우트별 지표에 SQL 문 수를 싣고, error 모드에서 예산을 넘은 요청은 실패
+    """
+    app = FastAPI()
+
+    @app.get("/queries/{count}")
+    def run_queries(count: int):
+        with sqlite_engine.connect() as connection:
+            for _ in range(count):
+                connection.execute(text("SELECT 1"))
+        return {"count": count}
+
+    metrics = HttpMetrics()
+    app.add_middleware(MetricsMiddleware, metrics=lambda: metrics, query_budget=3, query_budget_mode="error")
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.get("/queries/3")
+    assert response.headers["x-db-query-count"] == "3"
+    assert float(response.headers["x-db-query-time-ms"]) > 0
+    assert client.get("/queries/4").status_code == 500
+
+    text_metrics = metrics.render()
+    assert 'personal_cpa_http_db_statements_total{method="GET",route="/queries/{count}"} 7' in text_metrics
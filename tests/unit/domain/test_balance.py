@@ -0,0 +1,125 @@
+from datetime import date
+
+import pytest
+
+from personal_cpa.domain.balance import (
+    ALL_PERIODS,
+    AccountBalance,
+    ancestor_chains,
+    last_full_period,
+    next_period,
+    period_end,
+    period_of,
+    rollup_balances,
+    split_by_period,
+    sum_journal_entries,
+    validate_period,
+)
+from personal_cpa.domain.journal import JournalEntry, JournalLine
+
+
+def test_period_of_returns_year_month():
+    """
+    Test Case: 거래일의 기간은 YYYYMM
+    """
+    assert period_of(date(2026, 1, 31)) == 202601
+    assert period_of(date(2026, 12, 1)) == 202612
+
+
+def test_period_end_next_period_and_last_full_period():
+    """
+    Test Case: 기간의 마지막 날, 다음 기간, 기준일까지 전체가 포함되는 마지막 기간
+    """
+    assert period_end(202602) == date(2026, 2, 28)
+    assert period_end(202612) == date(2026, 12, 31)
+    assert next_period(202611) == 202612
+    assert next_period(202612) == 202701
+    assert last_full_period(date(2026, 3, 31)) == 202603
+    assert last_full_period(date(2026, 3, 30)) == 202602
+    assert last_full_period(date(2026, 1, 15)) == 202512
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date", "period_range", "line_ranges"),
+    [
+        (date(2025, 1, 1), date(2025, 12, 31), (202501, 202512), []),
+        (
+            date(2025, 3, 15),
+            date(2025, 11, 10),
+            (202504, 202510),
+            [(date(2025, 3, 15), date(2025, 3, 31)), (date(2025, 11, 1), date(2025, 11, 10))],
+        ),
+        (date(2025, 12, 2), date(2026, 1, 31), (202601, 202601), [(date(2025, 12, 2), date(2025, 12, 31))]),
+        (date(2025, 1, 15), date(2025, 2, 10), None, [(date(2025, 1, 15), date(2025, 2, 10))]),
+    ],
+)
+def test_split_by_period_separates_whole_months(start_date, end_date, period_range, line_ranges):
+    """
+    Test Case: 날짜 범위를 월 전체가 포함되는 기간 범위와 나머지 날짜 범위로 나눔
+    """
+    assert split_by_period(start_date, end_date) == (period_range, line_ranges)
+
+
+@pytest.mark.parametrize("period", [202600, 202613, 2026, -1])
+def test_validate_period_rejects_invalid_period(period):
+    """
+    Test Case: YYYYMM 도 전체 기간(0)도 아닌 기간 검사
+    """
+    with pytest.raises(ValueError, match="period must be YYYYMM or 0"):
+        validate_period(period)
+
+
+def test_sum_journal_entries_adds_to_month_and_all_periods():
+    """
+    Test Case: 분개 줄을 월별 기간과 전체 기간에 모두 더함
+    """
+    entries = [
+        JournalEntry(
+            user_id=1,
+            entry_date=day,
+            description=None,
+            lines=(JournalLine(chart_of_account_id=1, debit=100), JournalLine(chart_of_account_id=2, credit=100)),
+        )
+        for day in (date(2026, 1, 1), date(2026, 1, 31), date(2026, 2, 1))
+    ]
+
+    totals = sum_journal_entries(entries)
+
+    assert totals[(1, 202601)] == [200, 0]
+    assert totals[(1, 202602)] == [100, 0]
+    assert totals[(1, ALL_PERIODS)] == [300, 0]
+    assert totals[(2, ALL_PERIODS)] == [0, 300]
+
+
+def test_ancestor_chains_lists_nearest_ancestor_first():
+    """
+    Test Case: 계정과목별 상위 계정과목 목록은 가까운 상위 계정과목부터
+    """
+    chains = ancestor_chains({1: None, 2: 1, 3: 2, 4: 1, 5: None})
+
+    assert chains == {1: (), 2: (1,), 3: (2, 1), 4: (1,), 5: ()}
+
+
+def test_ancestor_chains_rejects_cycle():
+    """
+    Test Case: 상위 계정과목 관계의 순환 검사
+    """
+    with pytest.raises(ValueError, match="has a cycle"):
+        ancestor_chains({1: 3, 2: 1, 3: 2})
+
+
+def test_rollup_balances_adds_totals_to_every_ancestor():
+    """
+    Test Case: 계정과목별 합계를 자신과 모든 상위 계정과목에 더하고 (계정과목, 기간)순으로 정렬
+    """
+    totals = {(3, 202601): [100, 0], (4, 202601): [0, 30]}
+
+    balances = rollup_balances(1, totals, {3: (2, 1), 4: (1,)})
+
+    assert balances == [
+        AccountBalance(user_id=1, chart_of_account_id=1, period=202601, debit=100, credit=30),
+        AccountBalance(user_id=1, chart_of_account_id=2, period=202601, debit=100, credit=0),
+        AccountBalance(user_id=1, chart_of_account_id=3, period=202601, debit=100, credit=0),
+        AccountBalance(user_id=1, chart_of_account_id=4, period=202601, debit=0, credit=30),
+    ]
+    assert balances[0].balance == 70
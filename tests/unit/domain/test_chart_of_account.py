@@ -1,7 +1,9 @@
 # ruff: noqa: ERA001
+import dataclasses
+
 import pytest
 
-from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.chart_of_account import ChartOfAccount, ChartOfAccountTree
 from personal_cpa.domain.enum.chart_of_account import AccountType
 
 
@@ -90,6 +92,61 @@ def test_chart_of_account_invalid_code_character_raises_value_error():
         )
 
 
+@pytest.mark.parametrize(
+    ("code", "message"),
+    [(" ", "code is not empty"), ("1 ", "code can only be a number OR"), ("1_", "code must not end with '_'")],
+)
+def test_chart_of_account_invalid_code_reports_reason(code, message):
+    """
+    Test Case: code 검사는 정규식 한 번으로 하되, 실패하면 위반 사유별 메시지를 유지
+    """
+    with pytest.raises(ValueError, match=message):
+        ChartOfAccount(
+            user_id=1,
+            name="현금",
+            code=code,
+            category=AccountType.ASSET,
+            description=None,
+            parent_chart_of_account_id=None,
+        )
+
+
+def test_chart_of_account_is_slotted_and_frozen():
+    """
+    Test Case: 인스턴스는 __dict__ 없이 슬롯에 저장되고 불변이며, 변경은 replace 로 새 인스턴스를 만들 때 재검증
+    """
+    account = ChartOfAccount(
+        user_id=1, name="현금", code="1_1", category=AccountType.ASSET, description=None, parent_chart_of_account_id=1
+    )
+
+    assert not hasattr(account, "__dict__")
+    assert not hasattr(ChartOfAccountTree(1, "1", "자산", AccountType.ASSET, [], None, None), "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        account.name = "예금"  # pyright: ignore[reportAttributeAccessIssue]
+    assert dataclasses.replace(account, id=3).id == 3
+    with pytest.raises(ValueError, match="name is not empty"):
+        dataclasses.replace(account, name=" ")
+
+
+def test_chart_of_account_trusted_skips_validation():
+    """
+    Test Case: 저장된 값용 trusted 생성자는 유효성 검사 없이 일반 생성자와 같은 인스턴스를 만듦
+    """
+    fields = {
+        "user_id": 1,
+        "code": "1_1",
+        "name": "현금",
+        "category": AccountType.ASSET,
+        "description": None,
+        "parent_chart_of_account_id": 1,
+        "is_hidden": True,
+        "id": 2,
+    }
+
+    assert ChartOfAccount.trusted(**fields) == ChartOfAccount(**fields)
+    assert ChartOfAccount.trusted(**{**fields, "code": "1_"}).code == "1_"
+
+
 # def test_chart_of_account_parent_type_match_ok():
 #     parent = ChartOfAccount(
 #         user_id=1,
@@ -0,0 +1,128 @@
+from datetime import date
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from personal_cpa.domain.fx_rate import FxRate, FxRateTable
+
+
+def _table() -> FxRateTable:
+    # 고시일 순서와 무관하게 통화쌍별로 정렬된다.
+    return FxRateTable(
+        [
+            FxRate("USD", "KRW", date(2026, 3, 1), Decimal(1400)),
+            FxRate("USD", "KRW", date(2026, 1, 1), Decimal(1300)),
+            FxRate("USD", "KRW", date(2026, 2, 1), Decimal(1350)),
+            FxRate("EUR", "USD", date(2026, 1, 1), Decimal("1.1")),
+            FxRate("KRW", "JPY", date(2026, 1, 1), Decimal("0.11")),
+        ]
+    )
+
+
+def test_fx_rate_validates_fields():
+    """
+    Test Case: 지원하지 않는 통화, 같은 통화쌍, 양수가 아닌 환율 검사
+    """
+    with pytest.raises(ValueError, match="currency must be one of"):
+        FxRate("XYZ", "KRW", date(2026, 1, 1), Decimal(1))
+    with pytest.raises(ValueError, match="must differ"):
+        FxRate("KRW", "KRW", date(2026, 1, 1), Decimal(1))
+    with pytest.raises(ValueError, match="must be positive"):
+        FxRate("USD", "KRW", date(2026, 1, 1), Decimal(0))
+
+
+def test_chart_of_account_validates_currency():
+    """
+    Test Case: 계정과목 통화 기본값과 지원하지 않는 통화 검사
+    """
+    chart_of_account = ChartOfAccount(
+        user_id=1, code="1", name="현금", category=AccountType.ASSET, description=None, parent_chart_of_account_id=None
+    )
+    assert chart_of_account.currency == "KRW"
+
+    with pytest.raises(ValueError, match="currency must be one of"):
+        ChartOfAccount(
+            user_id=1,
+            code="1",
+            name="현금",
+            category=AccountType.ASSET,
+            description=None,
+            parent_chart_of_account_id=None,
+            currency="usd",
+        )
+
+
+@pytest.mark.parametrize(
+    ("day", "expected"),
+    [
+        (date(2026, 1, 1), 1300),
+        (date(2026, 1, 31), 1300),
+        (date(2026, 2, 1), 1350),
+        (date(2026, 2, 28), 1350),
+        (date(2026, 12, 31), 1400),
+    ],
+)
+def test_rate_uses_latest_rate_on_or_before_day(day, expected):
+    """
+    Test Case: 기준일 이전의 가장 최근 고시일 환율 적용
+    """
+    assert _table().rate("USD", "KRW", day) == expected
+
+
+def test_rate_uses_inverse_and_cross_rates():
+    """
+    Test Case: 역방향 통화쌍의 역수와 한 통화를 거친 교차 환율
+    """
+    table = _table()
+
+    assert table.rate("KRW", "USD", date(2026, 1, 1)) == Fraction(1, 1300)
+    assert table.rate("EUR", "KRW", date(2026, 1, 1)) == Fraction(11, 10) * 1300
+    assert table.rate("USD", "JPY", date(2026, 1, 1)) == 1300 * Fraction(11, 100)
+    assert table.rate("KRW", "KRW", date(2026, 1, 1)) == 1
+    assert len(table) == 5
+
+
+def test_rate_without_quote_raises():
+    """
+    Test Case: 기준일 이전 고시가 없거나 두 통화를 잇지 못하면 예외
+    """
+    table = _table()
+
+    with pytest.raises(ValueError, match="no USD/KRW fx rate on or before 2025-12-31"):
+        table.rate("USD", "KRW", date(2025, 12, 31))
+    with pytest.raises(ValueError, match="no GBP/KRW fx rate"):
+        table.rate("GBP", "KRW", date(2026, 1, 1))
+
+
+def test_convert_scales_minor_units_and_rounds_half_even():
+    """
+    Test Case: 통화 최소 단위 자릿수를 맞추고 정확히 중간인 금액은 짝수 쪽으로 반올림
+    """
+    table = FxRateTable([FxRate("USD", "KRW", date(2026, 1, 1), Decimal("1300.5"))])
+
+    # 1 센트 = 13.005 원, 100 센트 = 1300.5 원 -> 1300 원, 300 센트 = 3901.5 원 -> 3902 원
+    assert table.convert(1, "USD", "KRW", date(2026, 1, 1)) == 13
+    assert table.convert(100, "USD", "KRW", date(2026, 1, 1)) == 1300
+    assert table.convert(300, "USD", "KRW", date(2026, 1, 1)) == 3902
+    assert table.convert(-300, "USD", "KRW", date(2026, 1, 1)) == -3902
+    # 1300.5 원 = 100 센트
+    assert table.convert(13005, "KRW", "USD", date(2026, 1, 1)) == 1000
+
+
+def test_convert_many_matches_convert():
+    """
+    Test Case: 일괄 환산 결과가 금액별 환산 결과와 같음
+    """
+    table = _table()
+    day = date(2026, 2, 15)
+    amounts = [0, 1, 99, 150, -12345, 10**12, 7, 5]
+    currencies = ["USD", "EUR", "JPY", "KRW", "USD", "EUR", "JPY", "KRW"]
+
+    assert table.convert_many(amounts, currencies, "USD", day) == [
+        table.convert(amount, currency, "USD", day) for amount, currency in zip(amounts, currencies, strict=True)
+    ]
+    with pytest.raises(ValueError, match="currency must be one of"):
+        table.convert_many([1], ["XYZ"], "KRW", day)
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+from personal_cpa.domain.journal import JournalEntry, JournalLine
+
+
+def _entry(*lines: JournalLine) -> JournalEntry:
+    return JournalEntry(user_id=1, entry_date=date(2026, 1, 1), description="점심", lines=lines)
+
+
+def test_journal_entry_balanced_instance():
+    """
+    Test Case: 차변 합계와 대변 합계가 같은 분개
+    """
+    entry = _entry(
+        JournalLine(chart_of_account_id=1, debit=7000),
+        JournalLine(chart_of_account_id=2, debit=3000),
+        JournalLine(chart_of_account_id=3, credit=10000),
+    )
+
+    assert entry.amount == 10000
+    assert len(entry.lines) == 3
+
+
+def test_journal_entry_unbalanced_raises_value_error():
+    """
+    Test Case: 대차 불일치 분개 검사
+    """
+    with pytest.raises(ValueError, match=r"not balanced. \(debit: 7000, credit: 10000\)"):
+        _entry(JournalLine(chart_of_account_id=1, debit=7000), JournalLine(chart_of_account_id=2, credit=10000))
+
+
+def test_journal_entry_single_line_raises_value_error():
+    """
+    Test Case: 분개 줄이 한 줄인 분개 검사
+    """
+    with pytest.raises(ValueError, match="at least two lines"):
+        _entry(JournalLine(chart_of_account_id=1, debit=7000))
+
+
+@pytest.mark.parametrize(
+    ("debit", "credit", "message"),
+    [
+        (-1, 0, "must not be negative"),
+        (0, -1, "must not be negative"),
+        (0, 0, "exactly one of debit or credit"),
+        (100, 100, "exactly one of debit or credit"),
+    ],
+)
+def test_journal_line_invalid_amount_raises_value_error(debit, credit, message):
+    """
+    Test Case: 분개 줄 금액 검사 (음수, 차변/대변 모두 0 또는 모두 양수)
+    """
+    with pytest.raises(ValueError, match=message):
+        JournalLine(chart_of_account_id=1, debit=debit, credit=credit)
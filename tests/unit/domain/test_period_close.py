@@ -0,0 +1,27 @@
+from personal_cpa.domain.enum.period_close import PeriodCloseStatus
+from personal_cpa.domain.period_close import ClosingBalance, PeriodCloseJob
+
+
+def test_period_close_job_advances_cursor_and_finishes():
+    """
+    Test Case: 마감 작업은 묶음마다 마지막 유저 ID와 마감한 유저 수를 갱신하고 완료 상태로 끝남
+    """
+    job = PeriodCloseJob(period=202601)
+    assert (job.status, job.last_user_id, job.closed_users, job.done) == (PeriodCloseStatus.RUNNING, 0, 0, False)
+
+    job = job.advance([3, 5]).advance([8])
+    assert (job.last_user_id, job.closed_users, job.done) == (8, 3, False)
+
+    finished = job.finish()
+    assert finished.done
+    assert (finished.last_user_id, finished.closed_users) == (8, 3)
+    assert not job.done
+
+
+def test_closing_balance_is_debit_minus_credit():
+    """
+    Test Case: 마감 잔액은 차변 누계 - 대변 누계
+    """
+    closing_balance = ClosingBalance(user_id=1, chart_of_account_id=2, period=202601, debit=700, credit=1000)
+
+    assert closing_balance.balance == -300
@@ -0,0 +1,82 @@
+from datetime import date
+
+from personal_cpa.domain.chart_of_account import ChartOfAccount
+from personal_cpa.domain.enum.chart_of_account import AccountType
+from personal_cpa.domain.report import AccountTree, BalanceSheet, IncomeStatement
+
+
+def _chart_of_account(id: int, code: str, category: AccountType, parent_id: int | None = None) -> ChartOfAccount:
+    return ChartOfAccount(
+        user_id=1,
+        code=code,
+        name=f"계정 {code}",
+        category=category,
+        description=None,
+        parent_chart_of_account_id=parent_id,
+        id=id,
+    )
+
+
+def _tree() -> AccountTree:
+    # 입력 순서와 무관하게 코드 기준 전위 순서로 정렬된다.
+    return AccountTree(
+        [
+            _chart_of_account(5, "4", AccountType.REVENUE),
+            _chart_of_account(3, "1_10", AccountType.ASSET, 1),
+            _chart_of_account(4, "1_2_1", AccountType.ASSET, 2),
+            _chart_of_account(2, "1_2", AccountType.ASSET, 1),
+            _chart_of_account(1, "1", AccountType.ASSET),
+            _chart_of_account(6, "5", AccountType.EXPENSE),
+        ]
+    )
+
+
+def test_account_tree_orders_accounts_parent_first():
+    """
+    Test Case: 계정과목을 코드 기준 전위 순서로 정렬하고 상위 계정과목 위치 배열을 계산
+    """
+    tree = _tree()
+
+    assert [chart_of_account.code for chart_of_account in tree.chart_of_accounts] == [
+        "1",
+        "1_2",
+        "1_2_1",
+        "1_10",
+        "4",
+        "5",
+    ]
+    assert tree.parent_index == [-1, 0, 1, 0, -1, -1]
+
+
+def test_account_tree_rollup_adds_subtree_and_rolled_totals():
+    """
+    Test Case: 계정과목 자신의 합계는 상위 계정과목 전체에 더하고, 이미 합산된 합계는 그 계정과목에만 더함
+    """
+    tree = _tree()
+
+    debits, credits = tree.rollup({4: (100, 0), 3: (10, 5), 5: (0, 110)}, {2: (1000, 0)})
+
+    assert debits == [110, 1100, 100, 10, 0, 0]
+    assert credits == [5, 0, 0, 5, 110, 0]
+    assert [line.code for line in tree.report_lines(debits, credits)] == ["1", "1_2", "1_2_1", "1_10", "4"]
+
+
+def test_statements_total_root_accounts_by_normal_side():
+    """
+    Test Case: 손익계산서/재무상태표 합계는 최상위 계정과목의 증가 방향 기준 금액으로 계산
+    """
+    tree = _tree()
+    debits, credits = tree.rollup({4: (300, 0), 5: (0, 500), 6: (200, 0)})
+    lines = tree.report_lines(debits, credits)
+
+    income_statement = IncomeStatement.from_lines(date(2026, 1, 1), date(2026, 1, 31), lines)
+    balance_sheet = BalanceSheet.from_lines(date(2026, 1, 31), lines)
+
+    assert (income_statement.total_revenue, income_statement.total_expense, income_statement.net_income) == (
+        500,
+        200,
+        300,
+    )
+    assert [line.code for line in balance_sheet.assets] == ["1", "1_2", "1_2_1"]
+    assert (balance_sheet.total_assets, balance_sheet.retained_earnings, balance_sheet.total_equity) == (300, 300, 300)
+    assert balance_sheet.balanced